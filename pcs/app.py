@@ -6,42 +6,17 @@ import sys
 from pcs import (
     settings,
     usage,
-    utils,
 )
 from pcs.cli.common import (
-    capabilities,
     completion,
     errors,
     parse_args,
-    routing,
 )
-from pcs.cli.reports import process_library_reports
-from pcs.cli.reports.output import (
-    deprecation_warning,
-    error,
-    print_to_stderr,
-)
-from pcs.cli.routing import (
-    acl,
-    alert,
-    booth,
-    client,
-    cluster,
-    config,
-    constraint,
-    dr,
-    host,
-    node,
-    pcsd,
-    prop,
-    qdevice,
-    quorum,
-    resource,
-    status,
-    stonith,
-    tag,
-)
-from pcs.lib.errors import LibraryError
+
+# Modules needed only for running commands are imported when a command is
+# run. Bash completion and version queries run pcs many times and they should
+# not wait for everything to be imported.
+# pylint: disable=import-outside-toplevel
 
 
 def _non_root_run(argv_cmd):
@@ -50,6 +25,8 @@ def _non_root_run(argv_cmd):
     are not root. If it required to run such command as root it will do that by
     sending it to the local pcsd and then it will exit.
     """
+    from pcs import utils
+
     options = []
     for option, value in utils.pcs_options.items():
         if parse_args.is_option_expecting_value(option):
@@ -118,20 +95,63 @@ usefile = False
 filename = ""
 
 
+def _is_version_query(argv):
+    """
+    Check whether pcs has been run only to print its version
+    """
+    return (
+        "--version" in argv
+        and set(argv) <= {"--version", "--full"}
+        and len(set(argv)) == len(argv)
+    )
+
+
+def _print_version(full):
+    print(settings.pcs_version)
+    if full:
+        from pcs.cli.common import capabilities
+
+        print(
+            " ".join(
+                sorted(
+                    [feat["id"] for feat in capabilities.get_pcs_capabilities()]
+                )
+            )
+        )
+
+
 def main(argv=None):
     # pylint: disable=global-statement
     # pylint: disable=too-many-branches
     # pylint: disable=too-many-locals
     # pylint: disable=too-many-statements
     if completion.has_applicable_environment(os.environ):
+        from pcs.cli.common import cib_id_cache
+
         print(
             completion.make_suggestions(
-                os.environ, usage.generate_completion_tree_from_usage()
+                os.environ,
+                usage.generate_completion_tree_from_usage(),
+                cib_id_cache.get_cib_id_cache().get_ids,
             )
         )
         sys.exit()
 
     argv = argv if argv else sys.argv[1:]
+    if _is_version_query(argv):
+        _print_version("--full" in argv)
+        sys.exit()
+
+    from pcs import utils
+    from pcs.cli.common import routing
+    from pcs.cli.reports import process_library_reports
+    from pcs.cli.reports.output import (
+        deprecation_warning,
+        error,
+        print_to_stderr,
+    )
+    from pcs.lib.errors import LibraryError
+
     utils.subprocess_setup()
     global filename, usefile
     utils.pcs_options = {}
@@ -208,18 +228,7 @@ def main(argv=None):
         elif opt == "--corosync_conf":
             settings.corosync_conf_file = val
         elif opt == "--version":
-            print(settings.pcs_version)
-            if full:
-                print(
-                    " ".join(
-                        sorted(
-                            [
-                                feat["id"]
-                                for feat in capabilities.get_pcs_capabilities()
-                            ]
-                        )
-                    )
-                )
+            _print_version(full)
             sys.exit()
         elif opt == "--fullhelp":
             usage.full_usage()
@@ -248,25 +257,46 @@ def main(argv=None):
 
     if (os.getuid() != 0) and (argv and argv[0] != "help") and not usefile:
         _non_root_run(argv)
+    # command modules are imported only when their command is run
     cmd_map = {
-        "resource": resource.resource_cmd,
-        "cluster": cluster.cluster_cmd,
-        "stonith": stonith.stonith_cmd,
-        "property": prop.property_cmd,
-        "constraint": constraint.constraint_cmd,
-        "acl": acl.acl_cmd,
-        "status": status.status_cmd,
-        "config": config.config_cmd,
-        "pcsd": pcsd.pcsd_cmd,
-        "node": node.node_cmd,
-        "quorum": quorum.quorum_cmd,
-        "qdevice": qdevice.qdevice_cmd,
-        "alert": alert.alert_cmd,
-        "booth": booth.booth_cmd,
-        "host": host.host_cmd,
-        "client": client.client_cmd,
-        "dr": dr.dr_cmd,
-        "tag": tag.tag_cmd,
+        "resource": routing.create_lazy_cmd(
+            "pcs.cli.routing.resource", "resource_cmd"
+        ),
+        "cluster": routing.create_lazy_cmd(
+            "pcs.cli.routing.cluster", "cluster_cmd"
+        ),
+        "stonith": routing.create_lazy_cmd(
+            "pcs.cli.routing.stonith", "stonith_cmd"
+        ),
+        "property": routing.create_lazy_cmd(
+            "pcs.cli.routing.prop", "property_cmd"
+        ),
+        "constraint": routing.create_lazy_cmd(
+            "pcs.cli.routing.constraint", "constraint_cmd"
+        ),
+        "acl": routing.create_lazy_cmd("pcs.cli.routing.acl", "acl_cmd"),
+        "status": routing.create_lazy_cmd(
+            "pcs.cli.routing.status", "status_cmd"
+        ),
+        "config": routing.create_lazy_cmd(
+            "pcs.cli.routing.config", "config_cmd"
+        ),
+        "pcsd": routing.create_lazy_cmd("pcs.cli.routing.pcsd", "pcsd_cmd"),
+        "node": routing.create_lazy_cmd("pcs.cli.routing.node", "node_cmd"),
+        "quorum": routing.create_lazy_cmd(
+            "pcs.cli.routing.quorum", "quorum_cmd"
+        ),
+        "qdevice": routing.create_lazy_cmd(
+            "pcs.cli.routing.qdevice", "qdevice_cmd"
+        ),
+        "alert": routing.create_lazy_cmd("pcs.cli.routing.alert", "alert_cmd"),
+        "booth": routing.create_lazy_cmd("pcs.cli.routing.booth", "booth_cmd"),
+        "host": routing.create_lazy_cmd("pcs.cli.routing.host", "host_cmd"),
+        "client": routing.create_lazy_cmd(
+            "pcs.cli.routing.client", "client_cmd"
+        ),
+        "dr": routing.create_lazy_cmd("pcs.cli.routing.dr", "dr_cmd"),
+        "tag": routing.create_lazy_cmd("pcs.cli.routing.tag", "tag_cmd"),
         "help": lambda lib, argv, modifiers: print(usage.main()),
     }
     try:
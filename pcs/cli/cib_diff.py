@@ -0,0 +1,143 @@
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pcs.common.pacemaker.cib_diff import (
+    CibConfigurationDiffDto,
+    CibElementChangeDto,
+    CibElementDto,
+)
+from pcs.common.str_tools import (
+    format_name_value_list,
+    indent,
+)
+
+_SECTION_LABELS = {
+    "crm_config": "Cluster Properties",
+    "nodes": "Nodes",
+    "resources": "Resources",
+    "constraints": "Constraints",
+    "rsc_defaults": "Resource Defaults",
+    "op_defaults": "Operation Defaults",
+    "acls": "ACLs",
+    "tags": "Tags",
+    "fencing-topology": "Fencing Levels",
+    "alerts": "Alerts",
+}
+
+
+def configuration_diff_dto_to_lines(
+    diff_dto: CibConfigurationDiffDto,
+) -> List[str]:
+    """
+    Return a compact description of a CIB configuration difference
+
+    Elements are grouped by configuration sections. Added and removed elements
+    are prefixed by '+' and '-' and they are nested in their added or removed
+    parents. Changed elements are prefixed by '~' followed by their changes.
+    """
+    section_lines: Dict[str, List[str]] = {}
+    for sign, element_list in (
+        ("-", diff_dto.removed),
+        ("+", diff_dto.added),
+    ):
+        for section, lines in _element_list_to_lines(sign, element_list):
+            section_lines.setdefault(section, []).extend(lines)
+    for change_dto in diff_dto.changed:
+        section_lines.setdefault(change_dto.after.section, []).extend(
+            _change_to_lines(change_dto)
+        )
+    if not section_lines:
+        return ["No differences"]
+    lines = []
+    section_order = list(_SECTION_LABELS)
+    for section, element_lines in sorted(
+        section_lines.items(),
+        key=lambda item: (
+            section_order.index(item[0])
+            if item[0] in section_order
+            else len(section_order)
+        ),
+    ):
+        lines.append(f"{_SECTION_LABELS.get(section, section)}:")
+        lines.extend(indent(element_lines))
+    return lines
+
+
+def _element_list_to_lines(
+    sign: str, element_list: Sequence[CibElementDto]
+) -> List[Tuple[str, List[str]]]:
+    # elements are listed in document order, so parents precede children
+    depth: Dict[str, int] = {}
+    result = []
+    for element in element_list:
+        depth[element.id] = (
+            depth[element.parent_id] + 1
+            if element.parent_id is not None and element.parent_id in depth
+            else 0
+        )
+        result.append(
+            (
+                element.section,
+                indent(
+                    [f"{sign} {_element_label(element)}"],
+                    indent_step=2 * depth[element.id],
+                ),
+            )
+        )
+    return result
+
+
+def _element_label(element: CibElementDto) -> str:
+    label = f"{element.tag} {element.id}"
+    if element.attributes:
+        label += ": " + " ".join(
+            format_name_value_list(list(element.attributes.items()))
+        )
+    return label
+
+
+def _value_change(before: Optional[str], after: Optional[str]) -> str:
+    return "{} -> {}".format(
+        "(unset)" if before is None else before,
+        "(unset)" if after is None else after,
+    )
+
+
+def _change_to_lines(change_dto: CibElementChangeDto) -> List[str]:
+    before, after = change_dto.before, change_dto.after
+    change_lines = []
+    if before.tag != after.tag:
+        change_lines.append(f"tag: {_value_change(before.tag, after.tag)}")
+    if before.parent_id != after.parent_id:
+        change_lines.append(
+            f"parent: {_value_change(before.parent_id, after.parent_id)}"
+        )
+    for name in list(before.attributes) + [
+        name for name in after.attributes if name not in before.attributes
+    ]:
+        value_before = before.attributes.get(name)
+        value_after = after.attributes.get(name)
+        if value_before != value_after:
+            change_lines.append(
+                f"{name}: {_value_change(value_before, value_after)}"
+            )
+    if before.members != after.members:
+        change_lines.append(
+            "members: {}".format(
+                _value_change(" ".join(before.members), " ".join(after.members))
+            )
+        )
+    label = f"~ {after.tag} {after.id}"
+    if "name" in after.attributes and before.attributes.get(
+        "name"
+    ) == after.attributes.get("name"):
+        # show a name of a changed nvpair
+        label += ": " + " ".join(
+            format_name_value_list([("name", after.attributes["name"])])
+        )
+    return [label] + indent(change_lines, indent_step=4)
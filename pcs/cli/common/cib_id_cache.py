@@ -0,0 +1,200 @@
+"""
+Ids of CIB objects for bash completion
+
+Bash completion runs pcs on every TAB press. Reading and parsing the whole CIB
+each time would make completion unusable on big clusters. Ids of objects are
+kept in a small file together with the CIB version they were read from, the
+CIB is read again only when its version changes.
+"""
+import json
+import os
+import os.path
+import subprocess
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    cast,
+)
+
+from pcs import settings
+from pcs.cli.common.completion import (
+    ID_TYPE_CONSTRAINT,
+    ID_TYPE_NODE,
+    ID_TYPE_RESOURCE,
+    ID_TYPE_STONITH,
+    ID_TYPE_TAG,
+)
+from pcs.common.cache_file import write_json_cache_file
+
+# pylint: disable=import-outside-toplevel
+
+_CACHE_VERSION = 1
+_CIBADMIN_TIMEOUT = 5
+
+_ID_XPATHS = {
+    ID_TYPE_RESOURCE: (
+        "./resources//*[self::group or self::clone or self::master"
+        " or self::bundle or self::primitive[not(@class='stonith')]]/@id"
+    ),
+    ID_TYPE_STONITH: "./resources//primitive[@class='stonith']/@id",
+    ID_TYPE_CONSTRAINT: "./constraints/*/@id",
+    ID_TYPE_TAG: "./tags/tag/@id",
+    ID_TYPE_NODE: "./nodes/node/@uname",
+}
+
+_IdsByType = Dict[str, List[str]]
+
+
+class CibIdCache:
+    def __init__(self, cache_path: Optional[str]) -> None:
+        """
+        cache_path -- file to store the ids in, None disables storing them
+        """
+        self._cache_path = cache_path
+
+    def get_ids(self, id_type: str) -> List[str]:
+        """
+        Return sorted ids of existing CIB objects of the specified type
+
+        id_type -- one of ID_TYPE_* constants
+        """
+        # The key is obtained before reading the CIB. If the CIB changes in
+        # the meantime, the ids are stored with an outdated key and read again
+        # next time.
+        key = _get_cib_key()
+        if key is None:
+            return []
+        ids_by_type = self._read(key)
+        if ids_by_type is None:
+            ids_by_type = _load_ids()
+            if ids_by_type is None:
+                return []
+            self._write(key, ids_by_type)
+        return ids_by_type.get(id_type, [])
+
+    def _read(self, key: List[Any]) -> Optional[_IdsByType]:
+        if not self._cache_path:
+            return None
+        try:
+            with open(self._cache_path, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            if data["version"] != _CACHE_VERSION or data["key"] != key:
+                return None
+            return {
+                str(id_type): [str(item) for item in id_list]
+                for id_type, id_list in data["ids"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # A missing or broken cache is not an error, the ids are simply
+            # read from the CIB.
+            return None
+
+    def _write(self, key: List[Any], ids_by_type: _IdsByType) -> None:
+        if not self._cache_path:
+            return
+        write_json_cache_file(
+            self._cache_path,
+            {
+                "version": _CACHE_VERSION,
+                "key": key,
+                "ids": ids_by_type,
+            },
+        )
+
+
+def _get_cib_key() -> Optional[List[Any]]:
+    """
+    Return a value which changes whenever the CIB configuration changes
+    """
+    # Pacemaker writes cib.xml whenever the configuration changes, so its
+    # stat is enough and it doesn't need to run anything. The file is only
+    # accessible to root and hacluster, other users ask the CIB for its
+    # version.
+    try:
+        cib_stat = os.stat(os.path.join(settings.cib_dir, "cib.xml"))
+        return [
+            "cib.xml",
+            cib_stat.st_ino,
+            cib_stat.st_mtime_ns,
+            cib_stat.st_size,
+        ]
+    except OSError:
+        pass
+    output = _run_cibadmin(["--query", "--xpath", "/cib", "--no-children"])
+    if output is None:
+        return None
+    from lxml import etree
+
+    try:
+        cib = etree.fromstring(output)
+    except etree.XMLSyntaxError:
+        return None
+    if cib.tag != "cib":
+        return None
+    return ["version", cib.get("admin_epoch"), cib.get("epoch")]
+
+
+def _load_ids() -> Optional[_IdsByType]:
+    output = _run_cibadmin(["--query", "--scope", "configuration"])
+    if output is None:
+        return None
+    from lxml import etree
+
+    try:
+        configuration = etree.fromstring(output)
+    except etree.XMLSyntaxError:
+        return None
+    return {
+        id_type: sorted(
+            {
+                str(value)
+                for value in cast(List[str], configuration.xpath(xpath))
+            }
+        )
+        for id_type, xpath in _ID_XPATHS.items()
+    }
+
+
+def _run_cibadmin(args: List[str]) -> Optional[bytes]:
+    try:
+        result = subprocess.run(
+            [settings.cibadmin] + args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=_CIBADMIN_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _get_user_cache_dir() -> Optional[str]:
+    # Relative paths are to be ignored according to the XDG Base Directory
+    # Specification.
+    cache_dir = os.environ.get("XDG_CACHE_HOME", "")
+    if os.path.isabs(cache_dir):
+        return cache_dir
+    home_dir = os.path.expanduser("~")
+    if os.path.isabs(home_dir):
+        return os.path.join(home_dir, ".cache")
+    return None
+
+
+def get_cib_id_cache() -> CibIdCache:
+    """
+    Return a cache of CIB ids of the current user configured by settings
+    """
+    # Each user has its own cache. The file is readable by its owner only and
+    # users running completion may see different parts of the CIB.
+    cache_dir = _get_user_cache_dir()
+    if not settings.completion_cib_id_cache_file or cache_dir is None:
+        return CibIdCache(None)
+    return CibIdCache(
+        os.path.join(cache_dir, settings.completion_cib_id_cache_file)
+    )
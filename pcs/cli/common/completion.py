@@ -1,3 +1,109 @@
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+ID_TYPE_RESOURCE = "resource"
+ID_TYPE_STONITH = "stonith"
+ID_TYPE_CONSTRAINT = "constraint"
+ID_TYPE_TAG = "tag"
+ID_TYPE_NODE = "node"
+
+IdGetter = Callable[[str], Iterable[str]]
+
+# Types of ids suggested for arguments of commands. The longest command
+# matching the typed words is used.
+_COMMAND_ID_TYPES: Dict[Tuple[str, ...], str] = {
+    **{
+        ("resource", command): ID_TYPE_RESOURCE
+        for command in (
+            "ban",
+            "cleanup",
+            "clear",
+            "clone",
+            "config",
+            "debug-demote",
+            "debug-monitor",
+            "debug-promote",
+            "debug-start",
+            "debug-stop",
+            "delete",
+            "disable",
+            "enable",
+            "failcount",
+            "manage",
+            "meta",
+            "move",
+            "move-with-constraint",
+            "promotable",
+            "refresh",
+            "relations",
+            "remove",
+            "restart",
+            "safe-disable",
+            "unclone",
+            "ungroup",
+            "unmanage",
+            "update",
+            "utilization",
+        )
+    },
+    ("resource", "group", "add"): ID_TYPE_RESOURCE,
+    ("resource", "group", "delete"): ID_TYPE_RESOURCE,
+    ("resource", "group", "remove"): ID_TYPE_RESOURCE,
+    ("resource", "op", "add"): ID_TYPE_RESOURCE,
+    ("resource", "op", "delete"): ID_TYPE_RESOURCE,
+    ("resource", "op", "remove"): ID_TYPE_RESOURCE,
+    **{
+        ("stonith", command): ID_TYPE_STONITH
+        for command in (
+            "cleanup",
+            "config",
+            "delete",
+            "disable",
+            "enable",
+            "failcount",
+            "meta",
+            "refresh",
+            "remove",
+            "update",
+            "update-scsi-devices",
+        )
+    },
+    ("stonith", "op", "add"): ID_TYPE_STONITH,
+    ("stonith", "op", "delete"): ID_TYPE_STONITH,
+    ("stonith", "op", "remove"): ID_TYPE_STONITH,
+    ("constraint", "delete"): ID_TYPE_CONSTRAINT,
+    ("constraint", "remove"): ID_TYPE_CONSTRAINT,
+    ("constraint", "ref"): ID_TYPE_RESOURCE,
+    ("constraint", "location"): ID_TYPE_RESOURCE,
+    ("constraint", "location", "delete"): ID_TYPE_CONSTRAINT,
+    ("constraint", "location", "remove"): ID_TYPE_CONSTRAINT,
+    ("constraint", "colocation", "add"): ID_TYPE_RESOURCE,
+    ("constraint", "colocation", "delete"): ID_TYPE_RESOURCE,
+    ("constraint", "colocation", "remove"): ID_TYPE_RESOURCE,
+    ("constraint", "order"): ID_TYPE_RESOURCE,
+    **{
+        ("tag", command): ID_TYPE_TAG
+        for command in ("config", "delete", "remove", "update")
+    },
+    **{
+        ("node", command): ID_TYPE_NODE
+        for command in (
+            "attribute",
+            "maintenance",
+            "standby",
+            "unmaintenance",
+            "unstandby",
+            "utilization",
+        )
+    },
+}
+
+
 def has_applicable_environment(environment):
     """
     dict environment - very likely os.environ
@@ -17,10 +123,13 @@ def has_applicable_environment(environment):
     )
 
 
-def make_suggestions(environment, suggestion_tree):
+def make_suggestions(
+    environment, suggestion_tree, get_ids: Optional[IdGetter] = None
+):
     """
     dict environment - very likely os.environ
     dict suggestion_tree - {'acl': {'role': {'create': ...}}}...
+    get_ids - returns existing ids of the given type, None disables ids
     """
     if not has_applicable_environment(environment):
         raise EnvironmentError("Environment is not completion read")
@@ -35,7 +144,10 @@ def make_suggestions(environment, suggestion_tree):
 
     return "\n".join(
         _find_suggestions(
-            suggestion_tree, typed_word_list, int(environment["COMP_CWORD"])
+            suggestion_tree,
+            typed_word_list,
+            int(environment["COMP_CWORD"]),
+            get_ids,
         )
     )
 
@@ -69,7 +181,12 @@ def _split_words(joined_words, word_lengths):
     return word_list
 
 
-def _find_suggestions(suggestion_tree, typed_word_list, word_under_cursor_idx):
+def _find_suggestions(
+    suggestion_tree,
+    typed_word_list,
+    word_under_cursor_idx,
+    get_ids: Optional[IdGetter] = None,
+):
     if not 1 <= word_under_cursor_idx <= len(typed_word_list):
         return []
 
@@ -82,6 +199,10 @@ def _find_suggestions(suggestion_tree, typed_word_list, word_under_cursor_idx):
     words_for_current_cursor_position = _get_subcommands(
         suggestion_tree, typed_word_list[1:word_under_cursor_idx]
     )
+    if get_ids is not None:
+        id_type = _get_id_type(typed_word_list[1:word_under_cursor_idx])
+        if id_type:
+            words_for_current_cursor_position.extend(sorted(get_ids(id_type)))
 
     return [
         word
@@ -97,3 +218,11 @@ def _get_subcommands(suggestion_tree, previous_subcommand_list):
             return []
         subcommand_tree = subcommand_tree[subcommand]
     return sorted(list(subcommand_tree.keys()))
+
+
+def _get_id_type(previous_word_list):
+    for length in range(len(previous_word_list), 0, -1):
+        id_type = _COMMAND_ID_TYPES.get(tuple(previous_word_list[:length]))
+        if id_type:
+            return id_type
+    return None
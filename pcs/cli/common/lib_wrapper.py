@@ -6,37 +6,8 @@ from typing import (
 )
 
 from pcs.cli.common import middleware
-from pcs.lib.commands import (
-    acl,
-    alert,
-    booth,
-    cib_options,
-    cluster,
-    dr,
-    fencing_topology,
-    node,
-    pcsd,
-    qdevice,
-    quorum,
-    remote_node,
-    resource,
-    resource_agent,
-    sbd,
-    scsi,
-    services,
-    status,
-    stonith,
-    stonith_agent,
-    tag,
-)
-from pcs.lib.commands.constraint import colocation as constraint_colocation
-from pcs.lib.commands.constraint import order as constraint_order
-from pcs.lib.commands.constraint import ticket as constraint_ticket
 from pcs.lib.env import LibraryEnvironment
 
-# Note: not properly typed
-_CACHE: Dict[Any, Any] = {}
-
 
 def wrapper(dictionary):
     return namedtuple("wrapper", dictionary.keys())(**dictionary)
@@ -53,6 +24,7 @@ def cli_env_to_lib_env(cli_env):
         booth_files_data=cli_env.booth,
         known_hosts_getter=cli_env.known_hosts_getter,
         request_timeout=cli_env.request_timeout,
+        cib_snapshot=cli_env.cib_snapshot,
     )
 
 
@@ -104,15 +76,14 @@ def bind_all(env, run_with_middleware, dictionary):
     )
 
 
-def get_module(env, middleware_factory, name):
-    if name not in _CACHE:
-        _CACHE[name] = load_module(env, middleware_factory, name)
-    return _CACHE[name]
-
-
 def load_module(env, middleware_factory, name):
     # pylint: disable=too-many-return-statements, too-many-branches
+    # Library commands are imported only when used, so that pcs does not spend
+    # time importing all of them on every run.
+    # pylint: disable=import-outside-toplevel
     if name == "acl":
+        from pcs.lib.commands import acl
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -136,6 +107,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "alert":
+        from pcs.lib.commands import alert
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -151,6 +124,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "booth":
+        from pcs.lib.commands import booth
+
         return bind_all(
             env,
             middleware.build(
@@ -178,6 +153,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "cluster":
+        from pcs.lib.commands import cluster
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -202,6 +179,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "dr":
+        from pcs.lib.commands import dr
+
         return bind_all(
             env,
             middleware.build(middleware_factory.corosync_conf_existing),
@@ -214,6 +193,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "remote_node":
+        from pcs.lib.commands import remote_node
+
         return bind_all(
             env,
             middleware.build(
@@ -229,6 +210,10 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint_colocation":
+        from pcs.lib.commands.constraint import (
+            colocation as constraint_colocation,
+        )
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -239,6 +224,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint_order":
+        from pcs.lib.commands.constraint import order as constraint_order
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -249,6 +236,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint_ticket":
+        from pcs.lib.commands.constraint import ticket as constraint_ticket
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -261,6 +250,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "fencing_topology":
+        from pcs.lib.commands import fencing_topology
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -276,6 +267,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "node":
+        from pcs.lib.commands import node
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -296,6 +289,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "pcsd":
+        from pcs.lib.commands import pcsd
+
         return bind_all(
             env,
             middleware.build(),
@@ -303,6 +298,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "qdevice":
+        from pcs.lib.commands import qdevice
+
         return bind_all(
             env,
             middleware.build(),
@@ -328,6 +325,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "quorum":
+        from pcs.lib.commands import quorum
+
         return bind_all(
             env,
             middleware.build(middleware_factory.corosync_conf_existing),
@@ -345,10 +344,13 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "resource_agent":
+        from pcs.lib.commands import resource_agent
+
         return bind_all(
             env,
             middleware.build(),
             {
+                "clear_metadata_cache": resource_agent.clear_metadata_cache,
                 "describe_agent": resource_agent.describe_agent,
                 "get_agent_default_operations": resource_agent.get_agent_default_operations,
                 "get_agent_metadata": resource_agent.get_agent_metadata,
@@ -364,6 +366,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "resource":
+        from pcs.lib.commands import resource
+
         return bind_all(
             env,
             middleware.build(
@@ -399,6 +403,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "cib_options":
+        from pcs.lib.commands import cib_options
+
         return bind_all(
             env,
             middleware.build(
@@ -417,6 +423,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "status":
+        from pcs.lib.commands import status
+
         return bind_all(
             env,
             middleware.build(
@@ -432,6 +440,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "stonith":
+        from pcs.lib.commands import stonith
+
         return bind_all(
             env,
             middleware.build(
@@ -450,6 +460,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "sbd":
+        from pcs.lib.commands import sbd
+
         return bind_all(
             env,
             middleware.build(),
@@ -470,6 +482,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "services":
+        from pcs.lib.commands import services
+
         return bind_all(
             env,
             middleware.build(),
@@ -482,6 +496,8 @@ def load_module(env, middleware_factory, name):
             },
         )
     if name == "scsi":
+        from pcs.lib.commands import scsi
+
         return bind_all(
             env,
             middleware.build(),
@@ -492,6 +508,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "stonith_agent":
+        from pcs.lib.commands import stonith_agent
+
         return bind_all(
             env,
             middleware.build(),
@@ -502,6 +520,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "tag":
+        from pcs.lib.commands import tag
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -521,6 +541,17 @@ class Library:
     def __init__(self, env, middleware_factory):
         self.env = env
         self.middleware_factory = middleware_factory
+        # Note: not properly typed
+        self._modules: Dict[Any, Any] = {}
 
     def __getattr__(self, name):
-        return get_module(self.env, self.middleware_factory, name)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        # Modules are bound to middleware, which may be replaced, e.g. to read
+        # checkpoints instead of the live CIB.
+        key = (name, self.middleware_factory)
+        if key not in self._modules:
+            self._modules[key] = load_module(
+                self.env, self.middleware_factory, name
+            )
+        return self._modules[key]
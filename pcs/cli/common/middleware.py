@@ -2,6 +2,7 @@ import fcntl
 from collections import namedtuple
 from functools import partial
 
+from pcs.cli.common.shared_cib import get_shared_cib
 from pcs.cli.reports.output import error
 
 
@@ -39,7 +40,11 @@ def cib(filename, touch_cib_file):
                 ) from e
             env.cib_data = original_content
 
-        result_of_next = next_in_line(env, *args, **kwargs)
+        env.cib_snapshot = get_shared_cib(filename)
+        try:
+            result_of_next = next_in_line(env, *args, **kwargs)
+        finally:
+            env.cib_snapshot = None
 
         if filename and env.cib_data != original_content:
             try:
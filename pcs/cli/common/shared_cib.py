@@ -0,0 +1,90 @@
+"""
+CIB loaded once and shared by all readers in one pcs process
+
+Commands displaying the whole configuration call many legacy functions and
+library commands, each of them loading and parsing the CIB on its own. While
+sharing is enabled, the CIB is loaded once for each of its sources (a live
+cluster or a file) and all the readers get it from here.
+
+Sharing may only be enabled for commands which do not modify the CIB, a
+modified CIB is not loaded again.
+"""
+import xml.dom.minidom
+import xml.etree.ElementTree
+from contextlib import contextmanager
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+)
+
+from pcs.lib.cib.snapshot import CibSnapshot
+
+# loads CIB from a file specified by its path or from a live cluster (None)
+CibXmlLoader = Callable[[Optional[str]], str]
+
+
+class SharedCib(CibSnapshot):
+    """
+    CibSnapshot providing views used by legacy code as well
+    """
+
+    def __init__(self, cib_xml: str):
+        super().__init__(cib_xml)
+        self._etree: Optional[xml.etree.ElementTree.Element] = None
+        self._dom: Optional[xml.dom.minidom.Document] = None
+
+    def get_etree(self) -> xml.etree.ElementTree.Element:
+        """
+        Return the CIB parsed by ElementTree, it must not be modified
+        """
+        if self._etree is None:
+            self._etree = xml.etree.ElementTree.fromstring(self.xml)
+        return self._etree
+
+    def get_dom(self) -> xml.dom.minidom.Document:
+        """
+        Return the CIB parsed by minidom, it must not be modified
+        """
+        if self._dom is None:
+            self._dom = xml.dom.minidom.parseString(self.xml)
+        return self._dom
+
+
+_loader: Optional[CibXmlLoader] = None
+_shared_cibs: Dict[Optional[str], SharedCib] = {}
+
+
+@contextmanager
+def shared_cib(load_cib_xml: CibXmlLoader) -> Iterator[None]:
+    """
+    Share loaded CIBs by all readers until the context is left
+
+    load_cib_xml -- loads a CIB which has not been loaded yet
+    """
+    # pylint: disable=global-statement
+    global _loader
+    if _loader is not None:
+        # already shared by an outer context
+        yield
+        return
+    _loader = load_cib_xml
+    try:
+        yield
+    finally:
+        _loader = None
+        _shared_cibs.clear()
+
+
+def get_shared_cib(cib_file: Optional[str]) -> Optional[SharedCib]:
+    """
+    Return a shared CIB or None if sharing is not enabled
+
+    cib_file -- path to a CIB file or None for the live cluster CIB
+    """
+    if _loader is None:
+        return None
+    if cib_file not in _shared_cibs:
+        _shared_cibs[cib_file] = SharedCib(_loader(cib_file))
+    return _shared_cibs[cib_file]
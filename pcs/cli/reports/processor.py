@@ -22,6 +22,10 @@ class ReportProcessorToConsole(ReportProcessor):
         self._ignore_severities: List[ReportItemSeverity] = []
         self.debug = debug
 
+    @property
+    def is_debug_enabled(self) -> bool:
+        return self.debug
+
     def _do_report(self, report_item: ReportItem) -> None:
         report_dto = report_item.to_dto()
         msg = report_item_msg_from_dto(report_dto.message).message
@@ -56,7 +56,10 @@ from pcs.common.str_tools import (
 from pcs.common.tools import format_os_error
 from pcs.lib import sbd as lib_sbd
 from pcs.lib.commands.remote_node import _destroy_pcmk_remote_env
-from pcs.lib.communication.nodes import CheckAuth
+from pcs.lib.communication.nodes import (
+    PACEMAKER_STATUS_REQUEST_WAIT,
+    CheckAuth,
+)
 from pcs.lib.communication.tools import RunRemotelyBase
 from pcs.lib.communication.tools import run as run_com_cmd
 from pcs.lib.communication.tools import run_and_raise
@@ -342,14 +345,11 @@ def start_cluster_nodes(nodes):
     # 17 - 24 nodes: 3 * timeout
     # and so on
     # Users can override this and set their own timeout by specifying
-    # the --request-timeout option (see utils.sendHTTPRequest).
+    # the --request-timeout option (see utils.send_http_request_to_nodes).
     timeout = int(
         settings.default_request_timeout * math.ceil(len(nodes) / 8.0)
     )
-    utils.read_known_hosts_file()  # cache known hosts
-    node_errors = parallel_for_nodes(
-        utils.startCluster, nodes, quiet=True, timeout=timeout
-    )
+    node_errors = parallel_for_nodes(utils.startCluster, nodes, timeout=timeout)
     if node_errors:
         utils.err(
             "unable to start all nodes\n" + "\n".join(node_errors.values())
@@ -397,28 +397,52 @@ def wait_for_local_node_started(stop_at, interval):
         )
 
 
-def wait_for_remote_node_started(node, stop_at, interval):
+def wait_for_remote_nodes_started(node_list, stop_at, interval):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
+
+    Return a dict mapping the nodes to (returncode, output) tuples
     """
-    while True:
-        time.sleep(interval)
-        code, output = utils.getPacemakerNodeStatus(node)
+    result_dict = {}
+
+    def get_wait():
+        # Nodes supporting it respond once pacemaker starts or once the wait
+        # time passes. Each node is asked again as soon as it responds.
+        return min(
+            PACEMAKER_STATUS_REQUEST_WAIT,
+            max(
+                0,
+                math.ceil((stop_at - datetime.datetime.now()).total_seconds()),
+            ),
+        )
+
+    def process_result(node, result):
+        code, output = result
         # HTTP error, permission denied or unable to auth
         # there is no point in trying again as it won't get magically fixed
         if code in [1, 3, 4]:
-            return 1, output
+            result_dict[node] = (1, output)
+            return True
         if code == 0:
             try:
                 node_status = json.loads(output)
                 if is_node_fully_started(node_status):
-                    return 0, "Started"
+                    result_dict[node] = (0, "Started")
+                    return True
             except (ValueError, KeyError):
                 # this won't get fixed either
-                return 1, "Unable to get node status"
+                result_dict[node] = (1, "Unable to get node status")
+                return True
         if datetime.datetime.now() > stop_at:
-            return 1, "Waiting timeout"
+            result_dict[node] = (1, "Waiting timeout")
+            return True
+        return False
+
+    utils.poll_pacemaker_node_status(
+        node_list, get_wait, process_result, interval
+    )
+    return result_dict
 
 
 def wait_for_nodes_started(node_list, timeout=None):
@@ -438,9 +462,8 @@ def wait_for_nodes_started(node_list, timeout=None):
         else:
             print_to_stderr(output)
     else:
-        utils.read_known_hosts_file()  # cache known hosts
         node_errors = parallel_for_nodes(
-            wait_for_remote_node_started, node_list, stop_at, interval
+            wait_for_remote_nodes_started, node_list, stop_at, interval
         )
         if node_errors:
             utils.err("unable to verify all nodes have started")
@@ -524,7 +547,7 @@ def stop_cluster_nodes(nodes):
 
     was_error = False
     node_errors = parallel_for_nodes(
-        utils.repeat_if_timeout(utils.stopPacemaker), nodes, quiet=True
+        utils.stopPacemaker, nodes, repeat_if_timeout=15
     )
     accessible_nodes = [node for node in nodes if node not in node_errors]
     if node_errors:
@@ -539,9 +562,7 @@ def stop_cluster_nodes(nodes):
             "{0}: Not stopping cluster - node is unreachable".format(node)
         )
 
-    node_errors = parallel_for_nodes(
-        utils.stopCorosync, accessible_nodes, quiet=True
-    )
+    node_errors = parallel_for_nodes(utils.stopCorosync, accessible_nodes)
     if node_errors:
         utils.err(
             "unable to stop all nodes\n" + "\n".join(node_errors.values())
@@ -627,7 +648,11 @@ def enable_cluster_nodes(nodes):
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    error_list = utils.map_for_error_list(utils.enableCluster, nodes)
+    error_list = [
+        output
+        for retval, output in utils.enableCluster(nodes).values()
+        if retval != 0
+    ]
     if error_list:
         utils.err("unable to enable all nodes\n" + "\n".join(error_list))
 
@@ -637,7 +662,11 @@ def disable_cluster_nodes(nodes):
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    error_list = utils.map_for_error_list(utils.disableCluster, nodes)
+    error_list = [
+        output
+        for retval, output in utils.disableCluster(nodes).values()
+        if retval != 0
+    ]
     if error_list:
         utils.err("unable to disable all nodes\n" + "\n".join(error_list))
 
@@ -648,17 +677,14 @@ def destroy_cluster(argv):
       * --request-timeout - timeout for HTTP requests
     """
     if argv:
-        utils.read_known_hosts_file()  # cache known hosts
         # stop pacemaker and resources while cluster is still quorate
         nodes = argv
         node_errors = parallel_for_nodes(
-            utils.repeat_if_timeout(utils.stopPacemaker), nodes, quiet=True
+            utils.stopPacemaker, nodes, repeat_if_timeout=15
         )
         # proceed with destroy regardless of errors
         # destroy will stop any remaining cluster daemons
-        node_errors = parallel_for_nodes(
-            utils.destroyCluster, nodes, quiet=True
-        )
+        node_errors = parallel_for_nodes(utils.destroyCluster, nodes)
         if node_errors:
             utils.err(
                 "unable to destroy cluster\n" + "\n".join(node_errors.values())
@@ -0,0 +1,43 @@
+"""
+Files caching data of pcs on a local host
+
+Cache files are optimizations only. Failing to store or read them must not
+break a running command, they are simply recreated.
+"""
+import json
+import os
+import os.path
+import tempfile
+from typing import Any
+
+
+def write_json_cache_file(path: str, data: Any) -> bool:
+    """
+    Store data in a cache file, return False if the file cannot be written
+
+    The file is accessible only by its owner, as cached data may come from
+    files which are not accessible by all users. The file is replaced
+    atomically, concurrent readers never see a partially written file.
+
+    path -- path of the cache file, missing directories are created
+    data -- data to be stored as JSON
+    """
+    dir_path = os.path.dirname(path)
+    tmp_path = None
+    try:
+        os.makedirs(dir_path, mode=0o700, exist_ok=True)
+        # mkstemp creates the file with 0600 permissions
+        fd, tmp_path = tempfile.mkstemp(
+            dir=dir_path, prefix=os.path.basename(path) + ".", suffix=".tmp"
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            json.dump(data, cache_file)
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return False
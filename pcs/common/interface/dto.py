@@ -1,16 +1,26 @@
+import collections.abc
+from copy import deepcopy
 from dataclasses import (
+    InitVar,
     asdict,
     fields,
     is_dataclass,
 )
+from enum import Enum
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
     NewType,
+    Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    get_args,
+    get_origin,
+    get_type_hints,
 )
 
 import dacite
@@ -30,6 +40,16 @@ T = TypeVar("T")
 ToDictMetaKey = NewType("ToDictMetaKey", str)
 META_NAME = ToDictMetaKey("META_NAME")
 
+# NOTE: all enum types has to be listed here in key cast
+# see: https://github.com/konradhalas/dacite#casting
+_CAST_TYPES = (
+    types.CibRuleInEffectStatus,
+    types.CibRuleExpressionType,
+    types.CorosyncTransportType,
+    types.DrRole,
+    types.ResourceRelationType,
+)
+
 
 class DataTransferObject:
     pass
@@ -72,6 +92,13 @@ def _convert_dict(
 
 
 def to_dict(obj: DataTransferObject) -> DtoPayload:
+    encoder = _get_encoder(obj.__class__)
+    if encoder is not None:
+        try:
+            return encoder(obj)
+        except (_CodecMismatch, KeyError, TypeError):
+            # let the generic conversion produce the result or the error
+            pass
     return _convert_dict(obj.__class__, asdict(obj))
 
 
@@ -99,23 +126,381 @@ def _convert_payload(klass: Type[DtoType], data: DtoPayload) -> DtoPayload:
 
 
 def from_dict(cls: Type[DtoType], data: DtoPayload) -> DtoType:
+    decoder = _get_decoder(cls, True)
+    if decoder is not None:
+        try:
+            return decoder(data)
+        except (_CodecMismatch, KeyError, TypeError):
+            # let dacite produce the result or the error
+            pass
     return dacite.from_dict(
         data_class=cls,
         data=_convert_payload(cls, data),
-        # NOTE: all enum types has to be listed here in key cast
-        # see: https://github.com/konradhalas/dacite#casting
-        config=dacite.Config(
-            cast=[
-                types.CibRuleInEffectStatus,
-                types.CibRuleExpressionType,
-                types.CorosyncTransportType,
-                types.DrRole,
-                types.ResourceRelationType,
-            ]
-        ),
+        config=dacite.Config(cast=list(_CAST_TYPES)),
     )
 
 
+# Compiled codecs
+#
+# _convert_dict and _convert_payload above find out how to convert each field
+# by inspecting its type for every single value, dacite does even more of
+# that. The codecs
+# below do the inspection once per class and keep a list of fields with
+# a converter for each of them. A codec only handles values for which it
+# produces exactly the same result as the generic conversion. Anything else
+# makes it raise _CodecMismatch, or KeyError and TypeError for malformed
+# payloads, and the generic conversion is used instead. That way the generic
+# conversion keeps defining both the result and the errors, the codecs only
+# make the common case fast. Other errors, e.g. raised by DTOs themselves, are
+# not hidden.
+
+_Converter = Callable[[Any], Any]
+
+# types which dataclasses.asdict returns without making a copy
+_ATOMIC_TYPES = frozenset((type(None), bool, int, float, str, bytes))
+
+
+class _CodecMismatch(Exception):
+    """
+    A value cannot be converted by a compiled codec
+    """
+
+
+class _UnsupportedType(Exception):
+    """
+    A compiled codec cannot be created for a type
+    """
+
+
+# sentinel for a type whose argument cannot be inspected by _is_compatible_type
+_INCOMPATIBLE = object()
+
+
+def _get_dataclass_arg(_type: Any, arg_index: int) -> Any:
+    """
+    Return the argument of _type which _convert_dict and _convert_payload use
+    for converting items of a list or a dict, None if they don't convert them
+    """
+    try:
+        if _is_compatible_type(_type, arg_index):
+            return _type.__args__[arg_index]
+    except IndexError:
+        return _INCOMPATIBLE
+    return None
+
+
+def _is_dataclass_instance(value: Any) -> bool:
+    return is_dataclass(value) and not isinstance(value, type)
+
+
+def _copy_value(value: Any) -> Any:
+    # Mimics what dataclasses.asdict does with values of fields
+    if type(value) in _ATOMIC_TYPES or isinstance(value, Enum):
+        return value
+    if _is_dataclass_instance(value):
+        return {
+            _field.name: _copy_value(getattr(value, _field.name))
+            for _field in fields(value)
+        }
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[_copy_value(item) for item in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_copy_value(item) for item in value)
+    if isinstance(value, dict):
+        return type(value)(
+            (_copy_value(key), _copy_value(item)) for key, item in value.items()
+        )
+    return deepcopy(value)
+
+
+def _lazy(get_converter: Callable[[], Optional[_Converter]]) -> _Converter:
+    """
+    Defer compiling a codec of a nested class until it is needed
+
+    DTOs may refer to themselves, compiling their codecs eagerly would never
+    end.
+    """
+    converter: Optional[_Converter] = None
+
+    def convert(value: Any) -> Any:
+        nonlocal converter
+        if converter is None:
+            converter = get_converter()
+            if converter is None:
+                raise _CodecMismatch()
+        return converter(value)
+
+    return convert
+
+
+def _instance_encoder(klass: Type) -> _Converter:
+    encode = _lazy(lambda: _get_encoder(klass))
+
+    def encode_instance(value: Any) -> Any:
+        if not isinstance(value, klass):
+            raise _CodecMismatch()
+        return encode(value)
+
+    return encode_instance
+
+
+def _compile_field_encoder(field_type: Any) -> _Converter:
+    if is_dataclass(field_type):
+        return _instance_encoder(field_type)
+    item_type = _get_dataclass_arg(field_type, 0)
+    value_type = _get_dataclass_arg(field_type, 1)
+    if item_type is None and value_type is None:
+        return _copy_value
+    encode_item = (
+        _instance_encoder(item_type)
+        if item_type not in (None, _INCOMPATIBLE)
+        else None
+    )
+    encode_value = (
+        _instance_encoder(value_type)
+        if value_type not in (None, _INCOMPATIBLE)
+        else None
+    )
+
+    def encode(value: Any) -> Any:
+        if isinstance(value, list):
+            if item_type is _INCOMPATIBLE:
+                raise _CodecMismatch()
+            if encode_item is not None:
+                return [encode_item(item) for item in value]
+        elif isinstance(value, dict) or _is_dataclass_instance(value):
+            if value_type is _INCOMPATIBLE:
+                raise _CodecMismatch()
+            if encode_value is not None:
+                if not isinstance(value, dict):
+                    raise _CodecMismatch()
+                return {
+                    _copy_value(key): encode_value(item)
+                    for key, item in value.items()
+                }
+        return _copy_value(value)
+
+    return encode
+
+
+_ENCODER_CACHE: Dict[Any, Optional[_Converter]] = {}
+_DECODER_CACHE: Dict[Tuple[Any, bool], Optional[_Converter]] = {}
+
+
+def _get_encoder(klass: Any) -> Optional[_Converter]:
+    """
+    Return a function converting instances of klass to dicts like to_dict
+    """
+    if klass not in _ENCODER_CACHE:
+        _ENCODER_CACHE[klass] = _compile_encoder(klass)
+    return _ENCODER_CACHE[klass]
+
+
+def _compile_encoder(klass: Any) -> Optional[_Converter]:
+    if not is_dataclass(klass):
+        return None
+    field_list = tuple(
+        (
+            _field.name,
+            _field.metadata.get(META_NAME, _field.name),
+            _compile_field_encoder(_field.type),
+        )
+        for _field in fields(klass)
+    )
+
+    def encode(obj: Any) -> DtoPayload:
+        return {
+            key: encode_field(getattr(obj, name))
+            for name, key, encode_field in field_list
+        }
+
+    return encode
+
+
+def _check_type(klass: Type) -> _Converter:
+    def check(data: Any) -> Any:
+        if type(data) is not klass:
+            raise _CodecMismatch()
+        return data
+
+    return check
+
+
+def _check_instance(klass: Type) -> _Converter:
+    def check(data: Any) -> Any:
+        if not isinstance(data, klass):
+            raise _CodecMismatch()
+        return data
+
+    return check
+
+
+def _cast_enum(klass: Type[Enum]) -> _Converter:
+    def cast(data: Any) -> Any:
+        try:
+            return klass(data)
+        except ValueError as e:
+            raise _CodecMismatch() from e
+
+    return cast
+
+
+def _compile_value_decoder(value_type: Any, rename: bool) -> _Converter:
+    """
+    Return a function building a value of value_type the same way dacite does
+
+    rename -- the value is a DTO, or a list or a dict of DTOs, with its keys
+        renamed by META_NAME
+    """
+    # pylint: disable=too-many-return-statements
+    if value_type is Any:
+        return lambda data: data
+    if hasattr(value_type, "__supertype__"):
+        # NewType
+        if value_type.__supertype__ not in _ATOMIC_TYPES:
+            raise _UnsupportedType()
+        return _check_type(value_type.__supertype__)
+    if isinstance(value_type, type):
+        if is_dataclass(value_type):
+            decode = _lazy(lambda: _get_decoder(value_type, rename))
+
+            def decode_dataclass(data: Any) -> Any:
+                if type(data) is not dict:
+                    raise _CodecMismatch()
+                return decode(data)
+
+            return decode_dataclass
+        if issubclass(value_type, Enum):
+            if issubclass(value_type, _CAST_TYPES):
+                return _cast_enum(value_type)
+            return _check_instance(value_type)
+        if value_type in _ATOMIC_TYPES:
+            return _check_type(value_type)
+        raise _UnsupportedType()
+
+    origin = get_origin(value_type)
+    args = get_args(value_type)
+    if origin is Union:
+        if len(args) != 2 or args[1] is not type(None):
+            raise _UnsupportedType()
+        decode_optional = _compile_value_decoder(args[0], False)
+        return lambda data: None if data is None else decode_optional(data)
+    if origin in (list, collections.abc.Sequence) and len(args) == 1:
+        decode_item = _compile_value_decoder(args[0], rename)
+
+        def decode_list(data: Any) -> Any:
+            if type(data) is not list:
+                raise _CodecMismatch()
+            return [decode_item(item) for item in data]
+
+        return decode_list
+    if (
+        origin in (dict, collections.abc.Mapping)
+        and len(args) == 2
+        and args[0] in (str, Any)
+    ):
+        check_key = _compile_value_decoder(args[0], False)
+        decode_value = _compile_value_decoder(args[1], rename)
+
+        def decode_dict(data: Any) -> Any:
+            if type(data) is not dict:
+                raise _CodecMismatch()
+            return {
+                check_key(key): decode_value(item) for key, item in data.items()
+            }
+
+        return decode_dict
+    raise _UnsupportedType()
+
+
+def _reject(data_type: Type, decode: _Converter) -> _Converter:
+    def check(data: Any) -> Any:
+        if isinstance(data, data_type):
+            raise _CodecMismatch()
+        return decode(data)
+
+    return check
+
+
+def _compile_field_decoder(
+    raw_type: Any, value_type: Any, rename: bool
+) -> _Converter:
+    if not rename:
+        return _compile_value_decoder(value_type, False)
+    # keys of nested DTOs are renamed only where _convert_payload does it
+    if is_dataclass(raw_type):
+        return _compile_value_decoder(value_type, True)
+    item_type = _get_dataclass_arg(raw_type, 0)
+    dict_value_type = _get_dataclass_arg(raw_type, 1)
+    origin = get_origin(value_type)
+    renames_list = origin in (list, collections.abc.Sequence) and is_dataclass(
+        item_type
+    )
+    renames_dict = origin in (
+        dict,
+        collections.abc.Mapping,
+    ) and is_dataclass(dict_value_type)
+    decode = _compile_value_decoder(value_type, renames_list or renames_dict)
+    # _convert_payload renames items of lists and dicts the decoder doesn't
+    # expect, leave such values to dacite
+    if item_type is not None and not renames_list:
+        decode = _reject(list, decode)
+    if dict_value_type is not None and not renames_dict:
+        decode = _reject(dict, decode)
+    return decode
+
+
+def _get_decoder(klass: Any, rename: bool) -> Optional[_Converter]:
+    """
+    Return a function building instances of klass from dicts like from_dict
+
+    rename -- the keys of the dicts are renamed by META_NAME
+    """
+    if (klass, rename) not in _DECODER_CACHE:
+        _DECODER_CACHE[(klass, rename)] = _compile_decoder(klass, rename)
+    return _DECODER_CACHE[(klass, rename)]
+
+
+def _compile_decoder(klass: Any, rename: bool) -> Optional[_Converter]:
+    if not is_dataclass(klass) or not isinstance(klass, type):
+        return None
+    try:
+        hints = get_type_hints(klass)
+        if any(isinstance(hint, InitVar) for hint in hints.values()):
+            return None
+        field_list = []
+        for _field in fields(klass):
+            if not _field.init:
+                return None
+            field_list.append(
+                (
+                    _field.name,
+                    (
+                        _field.metadata.get(META_NAME, _field.name)
+                        if rename
+                        else _field.name
+                    ),
+                    _compile_field_decoder(
+                        _field.type, hints[_field.name], rename
+                    ),
+                )
+            )
+    except (_UnsupportedType, NameError, TypeError, KeyError):
+        return None
+
+    def decode(data: Any) -> Any:
+        if type(data) is not dict:
+            raise _CodecMismatch()
+        return klass(
+            **{
+                name: decode_field(data[key])
+                for name, key, decode_field in field_list
+            }
+        )
+
+    return decode
+
+
 class ImplementsToDto:
     def to_dto(self) -> Any:
         raise NotImplementedError()
@@ -1,7 +1,10 @@
+import asyncio
 import base64
 import io
 import re
+import select
 from collections import namedtuple
+from time import monotonic
 from urllib.parse import urlencode
 
 # We should ignore SIGPIPE when using pycurl.NOSIGNAL - see the libcurl tutorial
@@ -256,12 +259,97 @@ class Response:
         )
 
 
+class ConnectionPoolStats:
+    """
+    Counters of requests and connections made by a ConnectionPool
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.connections = 0
+
+    @property
+    def reused_connections(self):
+        """
+        Number of requests which did not need a new connection (handshake)
+        """
+        return max(0, self.requests - self.connections)
+
+    def __repr__(self):
+        return str(
+            "ConnectionPoolStats(requests={0}, connections={1}, "
+            "reused_connections={2})"
+        ).format(self.requests, self.connections, self.reused_connections)
+
+
+class ConnectionPool:
+    """
+    Keeps open connections to hosts across Communicator runs
+
+    Curl easy handles attached to the pool share a connection cache, a DNS
+    cache and TLS sessions. Connections to a host opened by one Communicator
+    run are reused by the following runs, so that TCP and TLS handshakes are
+    not repeated for each request.
+    """
+
+    def __init__(self):
+        self._share = pycurl.CurlShare()
+        for lock_data in (
+            pycurl.LOCK_DATA_DNS,
+            pycurl.LOCK_DATA_SSL_SESSION,
+            pycurl.LOCK_DATA_CONNECT,
+        ):
+            try:
+                self._share.setopt(pycurl.SH_SHARE, lock_data)
+            except pycurl.error:
+                # not supported by libcurl, e.g. LOCK_DATA_CONNECT is new in
+                # libcurl 7.57.0
+                pass
+        self._stats = ConnectionPoolStats()
+
+    @property
+    def stats(self):
+        return self._stats
+
+    def attach(self, handle):
+        """
+        Make a curl easy handle use the connections of the pool
+
+        pycurl.Curl handle -- curl easy handle
+        """
+        handle.setopt(pycurl.SHARE, self._share)
+
+    def count_response(self, response):
+        """
+        Update statistics based on a finished request
+
+        Response response -- response of a request made by an attached handle
+        """
+        if not response.was_connected:
+            return
+        self._stats.requests += 1
+        self._stats.connections += response.handle.getinfo(pycurl.NUM_CONNECTS)
+
+
 class NodeCommunicatorFactory:
-    def __init__(self, communicator_logger, user, groups, request_timeout):
+    def __init__(
+        self,
+        communicator_logger,
+        user,
+        groups,
+        request_timeout,
+        connection_pool=None,
+    ):
+        # pylint: disable=too-many-arguments
         self._logger = communicator_logger
         self._user = user
         self._groups = groups
         self._request_timeout = request_timeout
+        self._connection_pool = connection_pool
+
+    @property
+    def connection_pool(self):
+        return self._connection_pool
 
     def get_communicator(self, request_timeout=None):
         return self.get_simple_communicator(request_timeout=request_timeout)
@@ -269,13 +357,31 @@ class NodeCommunicatorFactory:
     def get_simple_communicator(self, request_timeout=None):
         timeout = request_timeout if request_timeout else self._request_timeout
         return Communicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            connection_pool=self._connection_pool,
+        )
+
+    def get_async_communicator(self, request_timeout=None):
+        timeout = request_timeout if request_timeout else self._request_timeout
+        return AsyncCommunicator(
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            connection_pool=self._connection_pool,
         )
 
     def get_multiaddress_communicator(self, request_timeout=None):
         timeout = request_timeout if request_timeout else self._request_timeout
         return MultiaddressCommunicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            connection_pool=self._connection_pool,
         )
 
 
@@ -286,9 +392,20 @@ class Communicator:
     only in a single thread. Use an unique instance for each thread.
     """
 
+    # Maximal time to wait for sockets when curl did not ask for a timer. Curl
+    # sets a timer whenever it has something to do, so this is only a safety
+    # net.
     curl_multi_select_timeout_default = 0.8  # in seconds
 
-    def __init__(self, communicator_logger, user, groups, request_timeout=None):
+    def __init__(
+        self,
+        communicator_logger,
+        user,
+        groups,
+        request_timeout=None,
+        connection_pool=None,
+    ):
+        # pylint: disable=too-many-arguments
         self._logger = communicator_logger
         self._auth_cookies = _get_auth_cookies(user, groups)
         self._request_timeout = (
@@ -296,7 +413,16 @@ class Communicator:
             if request_timeout is not None
             else settings.default_request_timeout
         )
+        self._connection_pool = connection_pool
+        # Curl tells us which sockets it waits for and when it wants to be
+        # woken up. We wait for exactly these events instead of polling.
+        self._poll = select.poll()
+        self._timer_deadline = None
         self._multi_handle = pycurl.CurlMulti()
+        self._multi_handle.setopt(
+            pycurl.M_SOCKETFUNCTION, self._socket_callback
+        )
+        self._multi_handle.setopt(pycurl.M_TIMERFUNCTION, self._timer_callback)
         self._is_running = False
         # This is used just for storing references of curl easy handles.
         # We need to have references for all the handles, so they don't be
@@ -320,6 +446,8 @@ class Communicator:
                 self._auth_cookies,
                 self._request_timeout,
             )
+            if self._connection_pool is not None:
+                self._connection_pool.attach(handle)
             self._easy_handle_list.append(handle)
             self._multi_handle.add_handle(handle)
             if self._is_running:
@@ -356,23 +484,56 @@ class Communicator:
 
         finished_count = 0
         while finished_count < len(self._easy_handle_list):
-            self.__multi_perform()
             self.__wait_for_multi_handle()
-            response_list = self.__get_all_ready_responses()
+            response_list = self._get_all_ready_responses()
             for response in response_list:
                 # free up memory for next usage of this Communicator instance
                 self._multi_handle.remove_handle(response.handle)
+                if self._connection_pool is not None:
+                    self._connection_pool.count_response(response)
                 self._logger.log_response(response)
                 yield response
                 # if something was added to the queue in the meantime, run it
                 # immediately, so we don't need to wait until all responses will
                 # be processed
-                self.__multi_perform()
+                self.__process_timeout()
             finished_count += len(response_list)
         self._easy_handle_list = []
         self._is_running = False
 
-    def __get_all_ready_responses(self):
+    def _socket_callback(self, what, sock_fd, multi, socketp):
+        """
+        Called by curl when it wants to wait for another socket event
+
+        int what -- pycurl.POLL_* constant
+        int sock_fd -- socket file descriptor
+        """
+        # pylint: disable=unused-argument
+        if what == pycurl.POLL_REMOVE:
+            try:
+                self._poll.unregister(sock_fd)
+            except KeyError:
+                pass
+            return
+        event_mask = 0
+        if what in (pycurl.POLL_IN, pycurl.POLL_INOUT):
+            event_mask |= select.POLLIN | select.POLLPRI
+        if what in (pycurl.POLL_OUT, pycurl.POLL_INOUT):
+            event_mask |= select.POLLOUT
+        # register modifies an already registered descriptor
+        self._poll.register(sock_fd, event_mask)
+
+    def _timer_callback(self, timeout_ms):
+        """
+        Called by curl when it wants to be woken up after a timeout
+
+        int timeout_ms -- timeout in milliseconds, -1 deletes the timer
+        """
+        self._timer_deadline = (
+            None if timeout_ms < 0 else monotonic() + timeout_ms / 1000.0
+        )
+
+    def _get_all_ready_responses(self):
         response_list = []
         repeat = True
         while repeat:
@@ -387,32 +548,47 @@ class Communicator:
             repeat = num_queued > 0
         return response_list
 
-    def __multi_perform(self):
-        # run all internal operation required by libcurl
-        status, num_to_process = self._multi_handle.perform()
-        # if perform returns E_CALL_MULTI_PERFORM it requires to call perform
-        # once again right away
+    def _socket_action(self, sock_fd, event_mask):
+        status, dummy_running = self._multi_handle.socket_action(
+            sock_fd, event_mask
+        )
+        # if socket_action returns E_CALL_MULTI_PERFORM it requires to be
+        # called once again right away
         while status == pycurl.E_CALL_MULTI_PERFORM:
-            status, num_to_process = self._multi_handle.perform()
-        return num_to_process
+            status, dummy_running = self._multi_handle.socket_action(
+                sock_fd, event_mask
+            )
+
+    def __process_timeout(self):
+        if (
+            self._timer_deadline is not None
+            and self._timer_deadline <= monotonic()
+        ):
+            self._timer_deadline = None
+            self._socket_action(pycurl.SOCKET_TIMEOUT, 0)
 
     def __wait_for_multi_handle(self):
-        # try to wait until there is something to do for us
-        need_to_wait = True
-        while need_to_wait:
-            timeout = self._multi_handle.timeout()
-            if timeout == 0:
-                # if timeout == 0 then there is something to precess already
-                return
-            timeout = (
-                timeout / 1000.0
-                if timeout > 0
-                # curl don't have timeout set, so we can use our default
-                else self.curl_multi_select_timeout_default
-            )
-            # when value returned from select is -1, it timed out, so we can
-            # wait
-            need_to_wait = self._multi_handle.select(timeout) == -1
+        # wait until a socket is ready or curl's timer expires
+        if self._timer_deadline is None:
+            timeout = self.curl_multi_select_timeout_default
+        else:
+            timeout = max(0.0, self._timer_deadline - monotonic())
+        event_list = self._poll.poll(timeout * 1000)
+        for sock_fd, poll_events in event_list:
+            event_mask = 0
+            if poll_events & (select.POLLIN | select.POLLPRI):
+                event_mask |= pycurl.CSELECT_IN
+            if poll_events & select.POLLOUT:
+                event_mask |= pycurl.CSELECT_OUT
+            if poll_events & (
+                select.POLLERR | select.POLLHUP | select.POLLNVAL
+            ):
+                event_mask |= pycurl.CSELECT_ERR
+            self._socket_action(sock_fd, event_mask)
+        if not event_list and self._timer_deadline is None:
+            # nothing happened for a while, let curl check its transfers
+            self._timer_deadline = monotonic()
+        self.__process_timeout()
 
 
 class MultiaddressCommunicator(Communicator):
@@ -438,6 +614,120 @@ class MultiaddressCommunicator(Communicator):
                 yield response
 
 
+class AsyncCommunicator(Communicator):
+    """
+    Class with same interface as Communicator except start_loop is an
+    asynchronous generator. The requests are driven by the running asyncio
+    event loop, so waiting for responses does not block other tasks.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loop = None
+        self._timer_handle = None
+        self._watched_sockets = {}
+        self._wakeup = None
+
+    async def start_loop(self):
+        """
+        Returns asynchronous generator. It yields responses the same way as
+        Communicator.start_loop does.
+
+        USAGE:
+        com = AsyncCommunicator(...)
+        com.add_requests([
+            Request(...), ...
+        ])
+        async for response in com.start_loop():
+            # do something with response
+            # if needed, add some new requests to the queue
+            com.add_requests([Request(...)])
+        """
+        if self._is_running:
+            raise AssertionError("Method start_loop already running")
+        self._is_running = True
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        for handle in self._easy_handle_list:
+            self._logger.log_request_start(handle.request_obj)
+        # curl may have asked for a timer before the loop was running
+        self._schedule_timer()
+
+        try:
+            finished_count = 0
+            while finished_count < len(self._easy_handle_list):
+                response_list = self._get_all_ready_responses()
+                if not response_list:
+                    await self._wakeup.wait()
+                    self._wakeup.clear()
+                    continue
+                for response in response_list:
+                    self._multi_handle.remove_handle(response.handle)
+                    if self._connection_pool is not None:
+                        self._connection_pool.count_response(response)
+                    self._logger.log_response(response)
+                    yield response
+                finished_count += len(response_list)
+        finally:
+            self._cancel_timer()
+            for sock_fd in list(self._watched_sockets):
+                self._unwatch_socket(sock_fd)
+            self._loop = None
+            self._easy_handle_list = []
+            self._is_running = False
+
+    def _socket_callback(self, what, sock_fd, multi, socketp):
+        # pylint: disable=unused-argument
+        self._unwatch_socket(sock_fd)
+        if what == pycurl.POLL_REMOVE or self._loop is None:
+            return
+        if what in (pycurl.POLL_IN, pycurl.POLL_INOUT):
+            self._loop.add_reader(
+                sock_fd, self._on_socket_event, sock_fd, pycurl.CSELECT_IN
+            )
+        if what in (pycurl.POLL_OUT, pycurl.POLL_INOUT):
+            self._loop.add_writer(
+                sock_fd, self._on_socket_event, sock_fd, pycurl.CSELECT_OUT
+            )
+        self._watched_sockets[sock_fd] = what
+
+    def _timer_callback(self, timeout_ms):
+        super()._timer_callback(timeout_ms)
+        self._schedule_timer()
+
+    def _unwatch_socket(self, sock_fd):
+        what = self._watched_sockets.pop(sock_fd, None)
+        if what is None or self._loop is None:
+            return
+        if what in (pycurl.POLL_IN, pycurl.POLL_INOUT):
+            self._loop.remove_reader(sock_fd)
+        if what in (pycurl.POLL_OUT, pycurl.POLL_INOUT):
+            self._loop.remove_writer(sock_fd)
+
+    def _schedule_timer(self):
+        self._cancel_timer()
+        if self._loop is None or self._timer_deadline is None:
+            return
+        self._timer_handle = self._loop.call_later(
+            max(0.0, self._timer_deadline - monotonic()), self._on_timeout
+        )
+
+    def _cancel_timer(self):
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+
+    def _on_timeout(self):
+        self._timer_handle = None
+        self._timer_deadline = None
+        self._socket_action(pycurl.SOCKET_TIMEOUT, 0)
+        self._wakeup.set()
+
+    def _on_socket_event(self, sock_fd, event_mask):
+        self._socket_action(sock_fd, event_mask)
+        self._wakeup.set()
+
+
 class CommunicatorLoggerInterface:
     def log_request_start(self, request):
         raise NotImplementedError()
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import (
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+from pcs.common.interface.dto import DataTransferObject
+
+
+@dataclass(frozen=True)
+class CibElementDto(DataTransferObject):
+    # id of the element, elements without an id get an id derived from their
+    # parent's id, e.g. "tag1/obj_ref[0]"
+    id: str  # pylint: disable=invalid-name
+    tag: str
+    # name of the configuration section the element is placed in
+    section: str
+    parent_id: Optional[str]
+    attributes: Mapping[str, str]
+    # ids of members of groups in their order, empty for other elements
+    members: Sequence[str]
+
+
+@dataclass(frozen=True)
+class CibElementChangeDto(DataTransferObject):
+    before: CibElementDto
+    after: CibElementDto
+
+
+@dataclass(frozen=True)
+class CibConfigurationDiffDto(DataTransferObject):
+    added: Sequence[CibElementDto]
+    removed: Sequence[CibElementDto]
+    changed: Sequence[CibElementChangeDto]
@@ -4,6 +4,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
 from pcs.common.interface.dto import (
@@ -80,6 +81,30 @@ def get_severity(
     return ReportItemSeverity(ReportItemSeverity.ERROR, force_code)
 
 
+_PAYLOAD_ATTR_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _get_payload_attr_names(message_class: type) -> Tuple[str, ...]:
+    """
+    Return names of attributes of a report message to be put to its payload
+    """
+    if message_class in _PAYLOAD_ATTR_NAMES:
+        return _PAYLOAD_ATTR_NAMES[message_class]
+    attr_names: Tuple[str, ...] = tuple()
+    if hasattr(message_class, "__annotations__"):
+        try:
+            annotations = message_class.__annotations__
+        except AttributeError as e:
+            raise AssertionError() from e
+        attr_names = tuple(
+            attr_name
+            for attr_name in annotations.keys()
+            if not attr_name.startswith("_") and attr_name not in ("message",)
+        )
+    _PAYLOAD_ATTR_NAMES[message_class] = attr_names
+    return attr_names
+
+
 @dataclass(frozen=True, init=False)
 class ReportItemMessage(ImplementsToDto):
     _code = MessageCode("")
@@ -94,19 +119,12 @@ class ReportItemMessage(ImplementsToDto):
 
     def to_dto(self) -> ReportItemMessageDto:
         payload: Dict[str, Any] = {}
-        if hasattr(self.__class__, "__annotations__"):
-            try:
-                annotations = self.__class__.__annotations__
-            except AttributeError as e:
-                raise AssertionError() from e
-            for attr_name in annotations.keys():
-                if attr_name.startswith("_") or attr_name in ("message",):
-                    continue
-                attr_val = getattr(self, attr_name)
-                if hasattr(attr_val, "to_dto"):
-                    payload[attr_name] = attr_val.to_dto()
-                else:
-                    payload[attr_name] = attr_val
+        for attr_name in _get_payload_attr_names(self.__class__):
+            attr_val = getattr(self, attr_name)
+            if hasattr(attr_val, "to_dto"):
+                payload[attr_name] = attr_val.to_dto()
+            else:
+                payload[attr_name] = attr_val
 
         return ReportItemMessageDto(
             code=self.code,
@@ -15,6 +15,16 @@ class ReportProcessor(abc.ABC):
     def has_errors(self) -> bool:
         return self._has_errors
 
+    @property
+    def is_debug_enabled(self) -> bool:
+        """
+        Tell whether debug reports are processed
+
+        Callers may skip creating debug reports, which are expensive to build,
+        if this is False.
+        """
+        return True
+
     def report(self, report_item: ReportItem) -> "ReportProcessor":
         if _is_error(report_item):
             self._has_errors = True
@@ -1,8 +1,10 @@
 import os.path
 import re
 from typing import (
+    Dict,
     Iterable,
     List,
+    Mapping,
     Optional,
 )
 
@@ -11,6 +13,22 @@ from ..interfaces import (
     ExecutorInterface,
     ServiceManagerInterface,
 )
+from ..types import ServiceState
+
+# UnitFileState values for which 'systemctl is-enabled' exits with 0
+_ENABLED_UNIT_FILE_STATES = frozenset(
+    [
+        "alias",
+        "enabled",
+        "enabled-runtime",
+        "generated",
+        "indirect",
+        "static",
+        "transient",
+    ]
+)
+# ActiveState values for which 'systemctl is-active' exits with 0
+_ACTIVE_STATES = frozenset(["active", "reloading"])
 
 
 class SystemdDriver(ServiceManagerInterface):
@@ -108,6 +126,41 @@ class SystemdDriver(ServiceManagerInterface):
         )
         return result.retval == 0
 
+    def get_states(self, services: Iterable[str]) -> Mapping[str, ServiceState]:
+        service_list = list(dict.fromkeys(services))
+        if not service_list:
+            return {}
+        result = self._executor.run(
+            [
+                self._systemctl_bin,
+                "show",
+                "--property=ActiveState,UnitFileState",
+            ]
+            + [_format_service_name(service, None) for service in service_list]
+        )
+        if result.retval == 0:
+            # systemctl prints properties of units in the order of the units
+            # specified, units are separated by an empty line
+            unit_list = _parse_show_output(result.stdout)
+            if len(unit_list) == len(service_list):
+                return {
+                    service: ServiceState(
+                        enabled=(
+                            unit.get("UnitFileState")
+                            in _ENABLED_UNIT_FILE_STATES
+                        ),
+                        running=unit.get("ActiveState") in _ACTIVE_STATES,
+                    )
+                    for service, unit in zip(service_list, unit_list)
+                }
+        return {
+            service: ServiceState(
+                enabled=self.is_enabled(service),
+                running=self.is_running(service),
+            )
+            for service in service_list
+        }
+
     def is_installed(self, service: str) -> bool:
         return service in self.get_available_services()
 
@@ -136,6 +189,22 @@ class SystemdDriver(ServiceManagerInterface):
         ) and os.path.isfile(self._systemctl_bin)
 
 
+def _parse_show_output(output: str) -> List[Dict[str, str]]:
+    unit_list: List[Dict[str, str]] = []
+    unit: Dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            if unit:
+                unit_list.append(unit)
+            unit = {}
+            continue
+        name, dummy_sep, value = line.partition("=")
+        unit[name.strip()] = value.strip()
+    if unit:
+        unit_list.append(unit)
+    return unit_list
+
+
 def _format_service_name(service: str, instance: Optional[str]) -> str:
     instance_str = f"@{instance}" if instance else ""
     return f"{service}{instance_str}.service"
@@ -1,6 +1,8 @@
 import os.path
 from typing import (
+    Iterable,
     List,
+    Mapping,
     Optional,
 )
 
@@ -9,6 +11,7 @@ from ..interfaces import (
     ExecutorInterface,
     ServiceManagerInterface,
 )
+from ..types import ServiceState
 
 
 class SysVInitRhelDriver(ServiceManagerInterface):
@@ -59,6 +62,16 @@ class SysVInitRhelDriver(ServiceManagerInterface):
             == 0
         )
 
+    def get_states(self, services: Iterable[str]) -> Mapping[str, ServiceState]:
+        # there is no way to check more services at once
+        return {
+            service: ServiceState(
+                enabled=self.is_enabled(service),
+                running=self.is_running(service),
+            )
+            for service in services
+        }
+
     def is_installed(self, service: str) -> bool:
         return service in self.get_available_services()
 
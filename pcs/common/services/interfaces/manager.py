@@ -1,8 +1,12 @@
 from typing import (
+    Iterable,
     List,
+    Mapping,
     Optional,
 )
 
+from ..types import ServiceState
+
 
 class ServiceManagerInterface:
     def start(self, service: str, instance: Optional[str] = None) -> None:
@@ -65,6 +69,16 @@ class ServiceManagerInterface:
         """
         raise NotImplementedError()
 
+    def get_states(self, services: Iterable[str]) -> Mapping[str, ServiceState]:
+        """
+        services -- names of services to be checked
+
+        Returns enabled and running state of each specified service. Unlike
+        calling is_enabled and is_running for each service, this allows an init
+        system to check all services at once.
+        """
+        raise NotImplementedError()
+
     def is_installed(self, service: str) -> bool:
         """
         service -- name of service to be checked
@@ -1,11 +1,9 @@
 import datetime
-import difflib
 import grp
 import json
 import os
 import os.path
 import pwd
-import re
 import shutil
 import sys
 import tarfile
@@ -26,6 +24,7 @@ from pcs import (
     usage,
     utils,
 )
+from pcs.cli.cib_diff import configuration_diff_dto_to_lines
 from pcs.cli.common import middleware
 from pcs.cli.common.errors import CmdLineInputError
 from pcs.cli.constraint import command as constraint_command
@@ -35,11 +34,21 @@ from pcs.cli.reports.output import (
     print_to_stderr,
     warn,
 )
+from pcs.common.interface import dto
 from pcs.common.reports import constraints as constraints_reports
-from pcs.common.str_tools import indent
+from pcs.common.str_tools import (
+    format_list,
+    indent,
+)
+from pcs.lib.cib.checkpoint_index import (
+    CheckpointIndex,
+    get_changed_resources,
+)
+from pcs.lib.cib.configuration_diff import diff_configuration
 from pcs.lib.commands import quorum as lib_quorum
 from pcs.lib.errors import LibraryError
 from pcs.lib.node import get_existing_nodes_names
+from pcs.lib.pacemaker.live import get_cib
 
 # pylint: disable=too-many-branches, too-many-locals, too-many-statements
 
@@ -77,6 +86,16 @@ def config_show(lib, argv, modifiers):
 
 
 def _config_show_cib_lines(lib):
+    """
+    Commandline options:
+      * -f - CIB file
+    """
+    # all the parts of the configuration are read from one loaded CIB
+    with utils.shared_cib():
+        return _config_show_shared_cib_lines(lib)
+
+
+def _config_show_shared_cib_lines(lib):
     """
     Commandline options:
       * -f - CIB file
@@ -86,9 +105,8 @@ def _config_show_cib_lines(lib):
     utils.pcs_options["--full"] = 1
     # get latest modifiers object after updating pcs_options
     modifiers = utils.get_input_modifiers()
-    cib_xml = utils.get_cib()
-    cib_etree = utils.get_cib_etree(cib_xml=cib_xml)
-    cib_dom = utils.get_cib_dom(cib_xml=cib_xml)
+    cib_etree = utils.get_cib_etree()
+    cib_dom = utils.get_cib_dom()
 
     resource_lines = []
     stonith_lines = []
@@ -343,9 +361,10 @@ def config_restore_remote(infile_name, infile_obj):
         utils.err("no nodes found in the tarball")
 
     err_msgs = []
+    status_dict = utils.checkStatus(node_list)
     for node in node_list:
         try:
-            retval, output = utils.checkStatus(node)
+            retval, output = status_dict[node]
             if retval != 0:
                 err_msgs.append(output)
                 continue
@@ -373,8 +392,9 @@ def config_restore_remote(infile_name, infile_obj):
     # Temporarily disable config files syncing thread in pcsd so it will not
     # rewrite restored files. 10 minutes should be enough time to restore.
     # If node returns HTTP 404 it does not support config syncing at all.
+    pause_dict = utils.pauseConfigSyncing(node_list, 10 * 60)
     for node in node_list:
-        retval, output = utils.pauseConfigSyncing(node, 10 * 60)
+        retval, output = pause_dict[node]
         if not (retval == 0 or "(HTTP error: 404)" in output):
             utils.err(output)
 
@@ -385,9 +405,10 @@ def config_restore_remote(infile_name, infile_obj):
         with open(infile_name, "rb") as tarball:
             tarball_data = tarball.read()
 
+    restore_dict = utils.restoreConfig(node_list, tarball_data)
     error_list = []
     for node in node_list:
-        retval, error = utils.restoreConfig(node, tarball_data)
+        retval, error = restore_dict[node]
         if retval != 0:
             error_list.append(error)
     if error_list:
@@ -399,10 +420,11 @@ def config_restore_local(infile_name, infile_obj):
     Commandline options: no options
     """
     service_manager = utils.get_service_manager()
-    if (
-        service_manager.is_running("corosync")
-        or service_manager.is_running("pacemaker")
-        or service_manager.is_running("pacemaker_remote")
+    if any(
+        state.running
+        for state in service_manager.get_states(
+            ["corosync", "pacemaker", "pacemaker_remote"]
+        ).values()
     ):
         utils.err(
             "Cluster is currently running on this node. You need to stop "
@@ -639,40 +661,74 @@ def config_backup_version():
     return 1
 
 
+def _parse_checkpoint_time(value):
+    for time_format in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.datetime.strptime(value, time_format).timestamp()
+        except ValueError:
+            pass
+    raise CmdLineInputError(
+        f"Unable to parse time '{value}', use format 'YYYY-M-D H:M:S'"
+    )
+
+
 def config_checkpoint_list(lib, argv, modifiers):
     """
-    Options: no options
+    Options:
+      * --from - list checkpoints created at the specified time or later
+      * --to - list checkpoints created at the specified time or earlier
     """
     del lib
-    modifiers.ensure_only_supported()
+    modifiers.ensure_only_supported("--from", "--to")
+    resource_id_set = set()
     if argv:
-        raise CmdLineInputError()
+        if argv[0] != "resource" or len(argv) < 2:
+            raise CmdLineInputError()
+        resource_id_set = set(argv[1:])
+    time_from = (
+        _parse_checkpoint_time(modifiers.get("--from"))
+        if modifiers.is_specified("--from")
+        else None
+    )
+    time_to = (
+        _parse_checkpoint_time(modifiers.get("--to"))
+        if modifiers.is_specified("--to")
+        else None
+    )
+
     try:
-        file_list = os.listdir(settings.cib_dir)
+        checkpoint_list = CheckpointIndex(
+            settings.cib_checkpoint_index_file
+        ).update(settings.cib_dir)
     except OSError as e:
         utils.err("unable to list checkpoints: %s" % e)
-    cib_list = []
-    cib_name_re = re.compile(r"^cib-(\d+)\.raw$")
-    for filename in file_list:
-        match = cib_name_re.match(filename)
-        if not match:
-            continue
-        file_path = os.path.join(settings.cib_dir, filename)
-        try:
-            if os.path.isfile(file_path):
-                cib_list.append(
-                    (float(os.path.getmtime(file_path)), match.group(1))
-                )
-        except OSError:
-            pass
-    cib_list.sort()
-    if not cib_list:
+    if not checkpoint_list:
         print_to_stderr("No checkpoints available")
         return
-    for cib_info in cib_list:
+
+    selected_list = []
+    previous = None
+    for checkpoint in checkpoint_list:
+        if (
+            (time_from is None or checkpoint.mtime >= time_from)
+            and (time_to is None or checkpoint.mtime <= time_to)
+            and (
+                not resource_id_set
+                or get_changed_resources(previous, checkpoint) & resource_id_set
+            )
+        ):
+            selected_list.append(checkpoint)
+        previous = checkpoint
+    if not selected_list:
+        print_to_stderr("No checkpoints match the specified criteria")
+        return
+    for checkpoint in selected_list:
         print(
             "checkpoint %s: date %s"
-            % (cib_info[1], datetime.datetime.fromtimestamp(round(cib_info[0])))
+            % (
+                checkpoint.number,
+                datetime.datetime.fromtimestamp(round(checkpoint.mtime)),
+            )
         )
 
 
@@ -716,40 +772,73 @@ def config_checkpoint_view(lib, argv, modifiers):
     print("\n".join(lines))
 
 
+def _load_checkpoint_cib(checkpoint):
+    """
+    Return a parsed CIB of a checkpoint or None if it cannot be loaded
+
+    checkpoint -- checkpoint number or 'live' for the current configuration
+    """
+    if checkpoint == "live":
+        cib_xml = utils.get_cib()
+    else:
+        try:
+            with open(
+                os.path.join(settings.cib_dir, f"cib-{checkpoint}.raw"),
+                encoding="utf-8",
+            ) as cib_file:
+                cib_xml = cib_file.read()
+        except OSError:
+            return None
+    try:
+        return get_cib(cib_xml)
+    except LibraryError:
+        return None
+
+
 def config_checkpoint_diff(lib, argv, modifiers):
     """
     Commandline options:
       * -f - CIB file
+      * --output-format - supported formats: text, json
     """
-    modifiers.ensure_only_supported("-f")
+    del lib
+    modifiers.ensure_only_supported("-f", "--output-format")
     if len(argv) != 2:
         print_to_stderr(usage.config(["checkpoint diff"]))
         sys.exit(1)
 
+    output_format = modifiers.get("--output-format")
+    supported_formats = ["text", "json"]
+    if output_format not in supported_formats:
+        raise CmdLineInputError(
+            (
+                "Unknown value '{}' for '--output-format' option. Supported "
+                "values are: {}"
+            ).format(output_format, format_list(supported_formats))
+        )
+
     if argv[0] == argv[1]:
         utils.err("cannot diff a checkpoint against itself")
 
     errors = []
-    checkpoints_lines = []
+    cib_list = []
     for checkpoint in argv:
-        if checkpoint == "live":
-            lines = _config_show_cib_lines(lib)
-            if not lines:
-                errors.append("unable to read live configuration")
-            else:
-                checkpoints_lines.append(lines)
-        else:
-            loaded, lines = _checkpoint_to_lines(lib, checkpoint)
-            if not loaded:
-                errors.append(
-                    "unable to read checkpoint '{0}'".format(checkpoint)
-                )
-            else:
-                checkpoints_lines.append(lines)
+        cib = _load_checkpoint_cib(checkpoint)
+        if cib is None:
+            errors.append(
+                "unable to read live configuration"
+                if checkpoint == "live"
+                else "unable to read checkpoint '{0}'".format(checkpoint)
+            )
+        cib_list.append(cib)
 
     if errors:
         utils.err("\n".join(errors))
 
+    diff_dto = diff_configuration(*cib_list)
+    if output_format == "json":
+        print(json.dumps(dto.to_dict(diff_dto)))
+        return
     print(
         "Differences between {0} (-) and {1} (+):".format(
             *[
@@ -760,16 +849,7 @@ def config_checkpoint_diff(lib, argv, modifiers):
             ]
         )
     )
-    print(
-        "\n".join(
-            [
-                line.rstrip()
-                for line in difflib.Differ().compare(
-                    checkpoints_lines[0], checkpoints_lines[1]
-                )
-            ]
-        )
-    )
+    print("\n".join(configuration_diff_dto_to_lines(diff_dto)))
 
 
 def config_checkpoint_restore(lib, argv, modifiers):
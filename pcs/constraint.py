@@ -1,7 +1,6 @@
 import sys
 import xml.dom.minidom
 from collections import defaultdict
-from enum import Enum
 from os.path import isfile
 from xml.dom.minidom import parseString
 
@@ -31,8 +30,16 @@ from pcs.common.reports import ReportItem
 from pcs.common.reports.constraints import colocation as colocation_format
 from pcs.common.reports.constraints import order as order_format
 from pcs.common.str_tools import format_list
+from pcs.common.types import CibRuleInEffectStatus
 from pcs.lib.cib.constraint.order import ATTRIB as order_attrib
+from pcs.lib.cib.rule import (
+    RuleInEffectEval,
+    RuleInEffectEvalAllAtOnce,
+    RuleInEffectEvalDummy,
+)
+from pcs.lib.errors import LibraryError
 from pcs.lib.node import get_existing_nodes_names
+from pcs.lib.pacemaker.live import get_cib
 from pcs.lib.pacemaker.values import (
     SCORE_INFINITY,
     sanitize_id,
@@ -64,10 +71,12 @@ RULE_NOT_IN_EFFECT = "not yet in effect"
 RULE_UNKNOWN_STATUS = "unknown status"
 
 
-class CrmRuleReturnCode(Enum):
-    IN_EFFECT = 0
-    EXPIRED = 110
-    TO_BE_IN_EFFECT = 111
+_RULE_STATUS_MAP = {
+    CibRuleInEffectStatus.IN_EFFECT: RULE_IN_EFFECT,
+    CibRuleInEffectStatus.EXPIRED: RULE_EXPIRED,
+    CibRuleInEffectStatus.NOT_YET_IN_EFFECT: RULE_NOT_IN_EFFECT,
+    CibRuleInEffectStatus.UNKNOWN: RULE_UNKNOWN_STATUS,
+}
 
 
 def constraint_location_cmd(lib, argv, modifiers):
@@ -663,12 +672,12 @@ def location_lines(
     all_loc_constraints = constraintsElement.getElementsByTagName(
         "rsc_location"
     )
-    cib = utils.get_cib()
 
     if not isfile(settings.crm_rule):
         if verify_expiration:
             warn(CRM_RULE_MISSING_MSG)
         verify_expiration = False
+    rule_evaluator = _get_rule_evaluator(verify_expiration)
 
     all_lines.append("Location Constraints:")
     for rsc_loc in all_loc_constraints:
@@ -761,7 +770,7 @@ def location_lines(
             )
         all_lines += _show_location_rules(
             ruleshash,
-            cib,
+            rule_evaluator,
             show_detail=showDetail,
             show_expired=show_expired,
             verify_expiration=verify_expiration,
@@ -784,7 +793,7 @@ def location_lines(
             miniruleshash[rsc] = ruleshash[rsc]
             rsc_lines += _show_location_rules(
                 miniruleshash,
-                cib,
+                rule_evaluator,
                 show_detail=showDetail,
                 show_expired=show_expired,
                 verify_expiration=verify_expiration,
@@ -835,7 +844,7 @@ def _hashtable_to_lines(hash_label, hash_type, hash_key, show_detail):
 
 def _show_location_rules(
     ruleshash,
-    cib,
+    rule_evaluator,
     show_detail,
     show_expired=False,
     verify_expiration=True,
@@ -888,7 +897,9 @@ def _show_location_rules(
             for rule in constrainthash[constraint_id]:
                 rule_status = RULE_UNKNOWN_STATUS
                 if verify_expiration:
-                    rule_status = _get_rule_status(rule.getAttribute("id"), cib)
+                    rule_status = _RULE_STATUS_MAP[
+                        rule_evaluator.get_rule_status(rule.getAttribute("id"))
+                    ]
                     if rule_status != RULE_EXPIRED:
                         is_constraint_expired = False
 
@@ -934,17 +945,21 @@ def _verify_score(score):
         )
 
 
-def _get_rule_status(rule_id, cib):
-    _, _, retval = utils.cmd_runner().run(
-        [settings.crm_rule, "--check", "--rule", rule_id, "--xml-text", "-"],
-        cib,
-    )
-    translation_map = {
-        CrmRuleReturnCode.IN_EFFECT.value: RULE_IN_EFFECT,
-        CrmRuleReturnCode.EXPIRED.value: RULE_EXPIRED,
-        CrmRuleReturnCode.TO_BE_IN_EFFECT.value: RULE_NOT_IN_EFFECT,
-    }
-    return translation_map.get(retval, RULE_UNKNOWN_STATUS)
+def _get_rule_evaluator(verify_expiration: bool) -> RuleInEffectEval:
+    """
+    Commandline options:
+      * -f - CIB file
+    """
+    if not verify_expiration:
+        return RuleInEffectEvalDummy()
+    try:
+        cib = get_cib(utils.get_cib())
+    except LibraryError as e:
+        process_library_reports(list(e.args))
+        return RuleInEffectEvalDummy()
+    # Evaluate all the rules in one pass instead of running crm_rule for each
+    # of them.
+    return RuleInEffectEvalAllAtOnce(cib, utils.cmd_runner())
 
 
 def location_prefer(lib, argv, modifiers):
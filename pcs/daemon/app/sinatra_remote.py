@@ -1,3 +1,7 @@
+import asyncio
+import json
+from time import monotonic
+
 from tornado.locks import Lock
 
 from pcs.daemon import ruby_pcsd
@@ -5,6 +9,11 @@ from pcs.daemon.app.sinatra_common import Sinatra
 from pcs.daemon.auth import authorize_user
 from pcs.daemon.http_server import HttpsServerManage
 
+# the longest time a pacemaker status request is postponed, in seconds
+PACEMAKER_STATUS_MAX_WAIT = 60
+# how often the status of pacemaker is checked while postponing a request
+PACEMAKER_STATUS_INTERVAL = 1
+
 
 class SinatraRemote(Sinatra):
     """
@@ -71,6 +80,79 @@ class SetCerts(SinatraRemote):
         self.send_sinatra_result(result)
 
 
+class RunTransaction(SinatraRemote):
+    """
+    RunTransaction handles url for running several actions in one request. If
+    the actions included setting new certificate and key successfully, it
+    will take care of notify of http sever about this change.
+    """
+
+    def initialize(
+        self,
+        ruby_pcsd_wrapper: ruby_pcsd.Wrapper,
+        https_server_manage: HttpsServerManage,
+    ):
+        # pylint: disable=arguments-differ, attribute-defined-outside-init
+        super().initialize(ruby_pcsd_wrapper)
+        self.__https_server_manage = https_server_manage
+
+    async def handle_sinatra_request(self):
+        result = await self.ruby_pcsd_wrapper.request_remote(self.request)
+        if result.status == 200 and _certs_set_in_transaction(result.body):
+            self.__https_server_manage.reload_certs()
+        self.send_sinatra_result(result)
+
+
+def _certs_set_in_transaction(body):
+    try:
+        result_list = json.loads(body)["results"]
+        return any(
+            result["action"] == "set_certs" and result["code"] == 200
+            for result in result_list
+        )
+    except (ValueError, TypeError, KeyError):
+        return False
+
+
+class PacemakerNodeStatus(SinatraRemote):
+    """
+    PacemakerNodeStatus handles url for getting status of pacemaker on the
+    local node. If the request contains a "wait" argument, the response is
+    postponed until pacemaker is fully started or until the specified number
+    of seconds passes. Nodes waiting for a cluster to start keep one request
+    per node open instead of repeatedly asking for the status.
+    """
+
+    async def handle_sinatra_request(self):
+        stop_at = monotonic() + self.__get_wait()
+        while True:
+            result = await self.ruby_pcsd_wrapper.request_remote(self.request)
+            remaining = stop_at - monotonic()
+            if (
+                result.status != 200
+                or remaining <= 0
+                or _pacemaker_started(result.body)
+            ):
+                break
+            await asyncio.sleep(min(PACEMAKER_STATUS_INTERVAL, remaining))
+        self.send_sinatra_result(result)
+
+    def __get_wait(self):
+        try:
+            wait = int(self.get_argument("wait", "0"))
+        except ValueError:
+            return 0
+        return max(0, min(wait, PACEMAKER_STATUS_MAX_WAIT))
+
+
+def _pacemaker_started(body):
+    try:
+        status = json.loads(body)
+        return bool(status["online"] and not status["pending"])
+    except (ValueError, TypeError, KeyError):
+        return False
+
+
 class Auth(SinatraRemote):
     async def auth(self):
         user_auth_info = await authorize_user(
@@ -100,11 +182,21 @@ def get_routes(
         # Urls protected by tokens. It is still done by ruby pcsd.
         (r"/run_pcs", SinatraRemote, ruby_wrapper),
         (r"/remote/set_certs", SetCerts, {**ruby_wrapper, **server_manage}),
+        (
+            r"/remote/run_transaction",
+            RunTransaction,
+            {**ruby_wrapper, **server_manage},
+        ),
         (
             r"/remote/(set_sync_options|set_configs)",
             SyncConfigMutualExclusive,
             {**ruby_wrapper, **lock},
         ),
+        (
+            r"/remote/pacemaker_node_status",
+            PacemakerNodeStatus,
+            ruby_wrapper,
+        ),
         (r"/remote/auth", Auth, ruby_wrapper),
         (r"/remote/.*", SinatraRemote, ruby_wrapper),
         (r"/api/.*", SinatraRemote, ruby_wrapper),
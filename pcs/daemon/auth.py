@@ -2,6 +2,7 @@ import grp
 import pwd
 from collections import namedtuple
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from ctypes import (
     CDLL,
     CFUNCTYPE,
@@ -17,9 +18,11 @@ from ctypes import (
     sizeof,
 )
 from ctypes.util import find_library
+from time import monotonic
 
 from tornado.gen import coroutine
 
+from pcs import settings
 from pcs.daemon import log
 
 # pylint: disable=invalid-name, too-few-public-methods
@@ -188,25 +191,146 @@ def authorize_user_sync(username, password) -> UserAuthInfo:
     return check_user_groups_sync(username, LoginLogger())
 
 
-# TODO async/await version - how to do it?
-# When async/await is used then the problem is:
-# "TypeError: object Future can't be used in 'await' expression" is raised even
-# if the function "convert_yielded" is used according to
-# http://www.tornadoweb.org/en/stable/guide/coroutines.html#python-3-5-async-and-await
+class AuthWorkerPool:
+    """
+    Long-lived pool of processes running PAM authentication
+
+    PAM modules may leak memory or get stuck, so the calls are isolated in
+    worker processes. The processes are reused for a limited number of
+    requests only, then the pool is replaced by a new one. A broken pool
+    (e.g. a worker killed by a signal) is replaced as well.
+    """
+
+    def __init__(self, max_workers, max_requests):
+        """
+        int max_workers -- number of worker processes
+        int max_requests -- number of requests after which the pool is
+            replaced, 0 means the pool is never replaced
+        """
+        self._max_workers = max(1, max_workers)
+        self._max_requests = max(0, max_requests)
+        self._executor = None
+        self._requests = 0
+
+    def _get_executor(self):
+        if self._executor is None or (
+            self._max_requests and self._requests >= self._max_requests
+        ):
+            self.recycle()
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        self._requests += 1
+        return self._executor
+
+    def recycle(self):
+        """
+        Drop the current workers, running requests are finished
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = None
+        self._requests = 0
+
+    # TODO async/await version - how to do it?
+    # When async/await is used then the problem is:
+    # "TypeError: object Future can't be used in 'await' expression" is raised
+    # even if the function "convert_yielded" is used according to
+    # http://www.tornadoweb.org/en/stable/guide/coroutines.html#python-3-5-async-and-await
+    @coroutine
+    def run(self, sync_fn, *args):
+        try:
+            result = yield self._get_executor().submit(sync_fn, *args)
+        except BrokenProcessPool:
+            log.pcsd.warning("Authentication worker failed, restarting workers")
+            self.recycle()
+            result = yield self._get_executor().submit(sync_fn, *args)
+        return result
+
+
+class UserGroupsCache:
+    """
+    Keeps results of user groups checks for a short time
+
+    Every request within an authenticated session checks the user's groups.
+    Caching the result for a few seconds saves a worker process call for
+    each request of a page.
+    """
+
+    def __init__(self, ttl_seconds):
+        """
+        int ttl_seconds -- validity of cached results, 0 disables the cache
+        """
+        self._ttl = ttl_seconds
+        self._cache = {}
+
+    def get(self, username):
+        if username not in self._cache:
+            return None
+        expires, user_auth_info = self._cache[username]
+        if expires <= monotonic():
+            del self._cache[username]
+            return None
+        return user_auth_info
+
+    def put(self, user_auth_info):
+        if self._ttl <= 0:
+            return
+        now = monotonic()
+        # drop expired records so that the cache does not grow unbounded
+        for username in [
+            username
+            for username, (expires, _) in self._cache.items()
+            if expires <= now
+        ]:
+            del self._cache[username]
+        self._cache[user_auth_info.name] = (now + self._ttl, user_auth_info)
+
+    def clear(self):
+        self._cache.clear()
+
+
+_worker_pool = AuthWorkerPool(
+    settings.pcsd_auth_workers, settings.pcsd_auth_worker_max_requests
+)
+_groups_cache = UserGroupsCache(settings.pcsd_auth_groups_cache_ttl_seconds)
+
+
+def configure(workers, worker_max_requests, groups_cache_ttl):
+    """
+    Set up the authentication workers and the user groups cache
+
+    int workers -- number of authentication worker processes
+    int worker_max_requests -- number of requests after which the workers are
+        replaced
+    int groups_cache_ttl -- seconds for which user groups are cached
+    """
+    # pylint: disable=global-statement
+    global _worker_pool, _groups_cache
+    _worker_pool.recycle()
+    _worker_pool = AuthWorkerPool(workers, worker_max_requests)
+    _groups_cache = UserGroupsCache(groups_cache_ttl)
+
+
 @coroutine
 def run_in_process(sync_fn, *args):
-    with ProcessPoolExecutor(max_workers=1) as pool:
-        result = yield pool.submit(sync_fn, *args)
+    result = yield _worker_pool.run(sync_fn, *args)
     return result
 
 
 @coroutine
 def authorize_user(username, password) -> UserAuthInfo:
     user = yield run_in_process(authorize_user_sync, username, password)
+    if user.is_authorized:
+        # groups of a freshly logged in user are used by the next requests
+        _groups_cache.put(user)
     return user
 
 
 @coroutine
 def check_user_groups(username) -> UserAuthInfo:
-    user = yield run_in_process(check_user_groups_sync, username, PlainLogger())
+    user = _groups_cache.get(username)
+    if user is None:
+        user = yield run_in_process(
+            check_user_groups_sync, username, PlainLogger()
+        )
+        _groups_cache.put(user)
     return user
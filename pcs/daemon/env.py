@@ -25,6 +25,10 @@ NOTIFY_SOCKET = "NOTIFY_SOCKET"
 PCSD_DEBUG = "PCSD_DEBUG"
 PCSD_DISABLE_GUI = "PCSD_DISABLE_GUI"
 PCSD_SESSION_LIFETIME = "PCSD_SESSION_LIFETIME"
+PCSD_AUTH_WORKERS = "PCSD_AUTH_WORKERS"
+PCSD_AUTH_WORKER_MAX_REQUESTS = "PCSD_AUTH_WORKER_MAX_REQUESTS"
+PCSD_AUTH_GROUPS_CACHE_TTL = "PCSD_AUTH_GROUPS_CACHE_TTL"
+PCSD_INTERNAL_WORKERS = "PCSD_INTERNAL_WORKERS"
 PCSD_DEV = "PCSD_DEV"
 PCSD_STATIC_FILES_DIR = "PCSD_STATIC_FILES_DIR"
 
@@ -39,6 +43,10 @@ Env = namedtuple(
         PCSD_DEBUG,
         PCSD_DISABLE_GUI,
         PCSD_SESSION_LIFETIME,
+        PCSD_AUTH_WORKERS,
+        PCSD_AUTH_WORKER_MAX_REQUESTS,
+        PCSD_AUTH_GROUPS_CACHE_TTL,
+        PCSD_INTERNAL_WORKERS,
         PCSD_STATIC_FILES_DIR,
         PCSD_DEV,
         "has_errors",
@@ -57,6 +65,10 @@ def prepare_env(environ, logger=None):
         loader.pcsd_debug(),
         loader.pcsd_disable_gui(),
         loader.session_lifetime(),
+        loader.auth_workers(),
+        loader.auth_worker_max_requests(),
+        loader.auth_groups_cache_ttl(),
+        loader.internal_workers(),
         loader.pcsd_static_files_dir(),
         loader.pcsd_dev(),
         loader.has_errors(),
@@ -160,6 +172,28 @@ class EnvLoader:
             )
             return session_lifetime
 
+    def auth_workers(self):
+        return self.__int_from_environ(
+            PCSD_AUTH_WORKERS, settings.pcsd_auth_workers, minimum=1
+        )
+
+    def auth_worker_max_requests(self):
+        return self.__int_from_environ(
+            PCSD_AUTH_WORKER_MAX_REQUESTS,
+            settings.pcsd_auth_worker_max_requests,
+        )
+
+    def auth_groups_cache_ttl(self):
+        return self.__int_from_environ(
+            PCSD_AUTH_GROUPS_CACHE_TTL,
+            settings.pcsd_auth_groups_cache_ttl_seconds,
+        )
+
+    def internal_workers(self):
+        return self.__int_from_environ(
+            PCSD_INTERNAL_WORKERS, settings.pcsd_internal_workers
+        )
+
     def pcsd_debug(self):
         return self.__has_true_in_environ(PCSD_DEBUG)
 
@@ -184,5 +218,19 @@ class EnvLoader:
             self.errors.append(f"{description} '{in_pcsd_path}' does not exist")
         return in_pcsd_path
 
+    def __int_from_environ(self, environ_key, default, minimum=0):
+        value = self.environ.get(environ_key, default)
+        try:
+            int_value = int(value)
+            if int_value >= minimum:
+                return int_value
+        except ValueError:
+            pass
+        self.errors.append(
+            f"Invalid {environ_key} value '{value}'"
+            f" (it must be an integer greater than or equal to {minimum})"
+        )
+        return value
+
     def __has_true_in_environ(self, environ_key):
         return self.environ.get(environ_key, "").lower() == "true"
@@ -0,0 +1,33 @@
+import multiprocessing
+
+from pcs.daemon import log
+
+
+def _run(socket_path: str, max_children: int) -> None:
+    # The library is imported in the worker process only, pcsd itself does not
+    # need it.
+    # pylint: disable=import-outside-toplevel
+    from pcs import pcs_internal
+
+    pcs_internal.run_worker(socket_path, max_children)
+
+
+def start(socket_path: str, max_children: int) -> multiprocessing.Process:
+    """
+    Start a resident pcs_internal worker serving library commands to pcsd
+
+    socket_path -- path of a unix socket the worker listens on
+    max_children -- maximal number of commands running at the same time
+    """
+    process = multiprocessing.get_context("fork").Process(
+        target=_run,
+        args=(socket_path, max_children),
+        name="pcs_internal worker",
+        # terminate the worker when pcsd exits
+        daemon=True,
+    )
+    process.start()
+    log.pcsd.info(
+        "Started pcs_internal worker (pid %s) on '%s'", process.pid, socket_path
+    )
+    return process
@@ -9,6 +9,8 @@ from tornado.web import Application
 
 from pcs import settings
 from pcs.daemon import (
+    auth,
+    internal_worker,
     log,
     ruby_pcsd,
     session,
@@ -108,6 +110,15 @@ def main():
     if env.PCSD_DEBUG:
         log.enable_debug()
 
+    auth.configure(
+        env.PCSD_AUTH_WORKERS,
+        env.PCSD_AUTH_WORKER_MAX_REQUESTS,
+        env.PCSD_AUTH_GROUPS_CACHE_TTL,
+    )
+    if env.PCSD_INTERNAL_WORKERS > 0:
+        internal_worker.start(
+            settings.pcs_internal_socket, env.PCSD_INTERNAL_WORKERS
+        )
     sync_config_lock = Lock()
     ruby_pcsd_wrapper = ruby_pcsd.Wrapper(
         settings.pcsd_ruby_socket,
@@ -0,0 +1,233 @@
+"""
+Index of CIB checkpoints stored by pacemaker
+
+Pacemaker keeps a history of CIBs in cib-N.raw files and there may be
+thousands of them. The index stores basic information about each checkpoint,
+so that checkpoints can be listed and searched without reading and parsing
+them again. Only new and modified checkpoints are read when the index is
+updated.
+"""
+import hashlib
+import json
+import os
+import os.path
+import re
+import stat
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+)
+
+from lxml import etree
+
+from pcs.common.cache_file import write_json_cache_file
+
+_INDEX_VERSION = 1
+_CHECKPOINT_NAME_RE = re.compile(r"^cib-(\d+)\.raw$")
+_RESOURCE_TAGS = ("primitive", "group", "clone", "master", "bundle")
+
+
+@dataclass(frozen=True)
+class CheckpointInfo:
+    # pylint: disable=too-many-instance-attributes
+    name: str
+    number: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    # CIB version, None if the checkpoint cannot be parsed
+    admin_epoch: Optional[int]
+    epoch: Optional[int]
+    num_updates: Optional[int]
+    # digests of resources by their ids
+    resource_digests: Mapping[str, str]
+
+    @property
+    def mtime(self) -> float:
+        return self.mtime_ns / 1e9
+
+
+class CheckpointIndex:
+    def __init__(self, index_path: Optional[str]) -> None:
+        """
+        index_path -- file to store the index in, None disables storing it
+        """
+        self._index_path = index_path
+
+    def update(self, cib_dir: str) -> List[CheckpointInfo]:
+        """
+        Return all checkpoints in a directory sorted by their mtime
+
+        Checkpoints not changed since the last call are not read again.
+
+        cib_dir -- directory containing the checkpoints
+        """
+        stored = self._read()
+        by_sha256 = {info.sha256: info for info in stored.values()}
+        checkpoint_list = []
+        changed = False
+        for name in os.listdir(cib_dir):
+            match = _CHECKPOINT_NAME_RE.match(name)
+            if not match:
+                continue
+            path = os.path.join(cib_dir, name)
+            try:
+                file_stat = os.stat(path)
+                if not stat.S_ISREG(file_stat.st_mode):
+                    continue
+                info = stored.get(name)
+                if (
+                    info is None
+                    or info.mtime_ns != file_stat.st_mtime_ns
+                    or info.size != file_stat.st_size
+                ):
+                    info = _load_checkpoint(
+                        name, match.group(1), path, file_stat, by_sha256
+                    )
+                    changed = True
+            except OSError:
+                continue
+            checkpoint_list.append(info)
+        checkpoint_list.sort(key=lambda info: (info.mtime_ns, info.name))
+        if changed or len(checkpoint_list) != len(stored):
+            self._write(checkpoint_list)
+        return checkpoint_list
+
+    def _read(self) -> Dict[str, CheckpointInfo]:
+        if not self._index_path:
+            return {}
+        try:
+            with open(self._index_path, encoding="utf-8") as index_file:
+                data = json.load(index_file)
+            if data["version"] != _INDEX_VERSION:
+                return {}
+            return {
+                item["name"]: _info_from_dict(item)
+                for item in data["checkpoints"]
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            # A missing or broken index is not an error, it is simply built
+            # again.
+            return {}
+
+    def _write(self, checkpoint_list: Iterable[CheckpointInfo]) -> None:
+        if not self._index_path:
+            return
+        write_json_cache_file(
+            self._index_path,
+            {
+                "version": _INDEX_VERSION,
+                "checkpoints": [asdict(info) for info in checkpoint_list],
+            },
+        )
+
+
+def get_changed_resources(
+    previous: Optional[CheckpointInfo], current: CheckpointInfo
+) -> Set[str]:
+    """
+    Return ids of resources added, removed or changed in a checkpoint
+
+    previous -- the checkpoint preceding the current one, None if there is none
+    current -- the checkpoint to get the changed resources of
+    """
+    if previous is None:
+        return set(current.resource_digests)
+    return {
+        resource_id
+        for resource_id in set(previous.resource_digests)
+        | set(current.resource_digests)
+        if previous.resource_digests.get(resource_id)
+        != current.resource_digests.get(resource_id)
+    }
+
+
+def _load_checkpoint(
+    name: str,
+    number: str,
+    path: str,
+    file_stat: os.stat_result,
+    by_sha256: Mapping[str, CheckpointInfo],
+) -> CheckpointInfo:
+    with open(path, "rb") as checkpoint_file:
+        content = checkpoint_file.read()
+    sha256 = hashlib.sha256(content).hexdigest()
+    known = by_sha256.get(sha256)
+    if known is not None:
+        # the same content has already been parsed, e.g. in a rotated file
+        return CheckpointInfo(
+            name,
+            number,
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            sha256,
+            known.admin_epoch,
+            known.epoch,
+            known.num_updates,
+            known.resource_digests,
+        )
+    try:
+        # it raises on a huge xml without the flag huge_tree=True
+        cib = etree.fromstring(content, etree.XMLParser(huge_tree=True))
+    except etree.XMLSyntaxError:
+        return CheckpointInfo(
+            name,
+            number,
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            sha256,
+            None,
+            None,
+            None,
+            {},
+        )
+    return CheckpointInfo(
+        name,
+        number,
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        sha256,
+        _get_int(cib.get("admin_epoch")),
+        _get_int(cib.get("epoch")),
+        _get_int(cib.get("num_updates")),
+        {
+            str(resource_el.get("id")): hashlib.sha256(
+                etree.tostring(resource_el, with_tail=False)
+            ).hexdigest()[:16]
+            for resource_el in cib.iterfind("./configuration/resources//*")
+            if resource_el.tag in _RESOURCE_TAGS and resource_el.get("id")
+        },
+    )
+
+
+def _get_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _info_from_dict(data: Mapping[str, Any]) -> CheckpointInfo:
+    return CheckpointInfo(
+        str(data["name"]),
+        str(data["number"]),
+        int(data["mtime_ns"]),
+        int(data["size"]),
+        str(data["sha256"]),
+        data["admin_epoch"],
+        data["epoch"],
+        data["num_updates"],
+        {
+            str(resource_id): str(digest)
+            for resource_id, digest in data["resource_digests"].items()
+        },
+    )
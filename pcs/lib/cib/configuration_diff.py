@@ -0,0 +1,116 @@
+"""
+Structural difference of configuration sections of two CIBs
+
+Elements are paired by their ids, so the difference is computed in linear time
+and it does not depend on how the configuration would be rendered.
+"""
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from lxml.etree import _Element
+
+from pcs.common.pacemaker.cib_diff import (
+    CibConfigurationDiffDto,
+    CibElementChangeDto,
+    CibElementDto,
+)
+
+# The id attribute of these elements refers to another element, it is not an
+# id of the element itself.
+_REFERENCE_TAGS = frozenset(["obj_ref", "resource_ref", "role"])
+_RESERVED = CibElementDto("", "", "", None, {}, [])
+
+
+def _element_id(element: _Element) -> Optional[str]:
+    if element.tag in _REFERENCE_TAGS:
+        return None
+    element_id = element.get("id")
+    return str(element_id) if element_id is not None else None
+
+
+def index_configuration(cib: _Element) -> Dict[str, CibElementDto]:
+    """
+    Return all elements of the CIB configuration section by their ids
+
+    cib -- the whole CIB
+    """
+    index: Dict[str, CibElementDto] = {}
+    configuration = cib.find("configuration")
+    if configuration is None:
+        return index
+    for section_el in configuration:
+        if not isinstance(section_el.tag, str):
+            # skip comments and processing instructions
+            continue
+        _index_element(index, section_el, str(section_el.tag), None)
+    return index
+
+
+def _index_element(
+    index: Dict[str, CibElementDto],
+    element: _Element,
+    section: str,
+    parent_id: Optional[str],
+    default_id: Optional[str] = None,
+) -> str:
+    own_id = _element_id(element)
+    element_id = own_id or default_id or str(element.tag)
+    if element_id in index:
+        # ids are unique in a valid CIB, keep both elements anyway
+        element_id = f"{parent_id}/{element_id}"
+    # reserve the id before the children are indexed to keep document order
+    index[element_id] = _RESERVED
+    members = []
+    tag_counter: Dict[str, int] = {}
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue
+        position = tag_counter.get(child.tag, 0)
+        tag_counter[child.tag] = position + 1
+        child_id = _index_element(
+            index,
+            child,
+            section,
+            element_id,
+            default_id=f"{element_id}/{child.tag}[{position}]",
+        )
+        if element.tag == "group" and child.tag == "primitive":
+            # order of resources in a group matters
+            members.append(child_id)
+    attributes: Dict[str, str] = dict(element.attrib)  # type: ignore
+    if own_id is not None:
+        del attributes["id"]
+    index[element_id] = CibElementDto(
+        element_id, str(element.tag), section, parent_id, attributes, members
+    )
+    return element_id
+
+
+def diff_configuration(
+    cib_before: _Element, cib_after: _Element
+) -> CibConfigurationDiffDto:
+    """
+    Return added, removed and changed elements of the CIB configuration
+
+    cib_before -- the whole original CIB
+    cib_after -- the whole new CIB
+    """
+    index_before = index_configuration(cib_before)
+    index_after = index_configuration(cib_after)
+    added: List[CibElementDto] = []
+    changed: List[CibElementChangeDto] = []
+    for element_id, element_after in index_after.items():
+        element_before = index_before.get(element_id)
+        if element_before is None:
+            added.append(element_after)
+        elif element_before != element_after:
+            changed.append(CibElementChangeDto(element_before, element_after))
+    removed = [
+        element_before
+        for element_id, element_before in index_before.items()
+        if element_id not in index_after
+    ]
+    return CibConfigurationDiffDto(added, removed, changed)
@@ -14,7 +14,10 @@ from lxml.etree import (
 from pcs.common import reports
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports.item import ReportItem
-from pcs.lib.cib import resource
+from pcs.lib.cib import (
+    resource,
+    xpath,
+)
 from pcs.lib.cib.constraint import resource_set
 from pcs.lib.cib.tools import (
     find_element_by_tag_and_id,
@@ -138,9 +141,7 @@ def check_is_without_duplication(
             # The xpath method has a complicated return value, but we know our
             # xpath expression returns only elements.
             List[_Element],
-            constraint_section.xpath(
-                ".//*[local-name()=$tag_name]", tag_name=element.tag
-            ),
+            xpath.DESCENDANTS_BY_TAG(constraint_section, tag_name=element.tag),
         )
         if (
             element is not duplicate_element
@@ -16,6 +16,7 @@ from pcs.lib import validate
 from pcs.lib.booth.config_validators import validate_ticket_name
 from pcs.lib.cib import tools
 from pcs.lib.cib.constraint import constraint
+from pcs.lib.cib.constraint_graph import ConstraintGraph
 from pcs.lib.errors import LibraryError
 from pcs.lib.xml_tools import remove_when_pointless
 
@@ -170,11 +171,13 @@ def create_plain(constraint_section, options):
 
 
 def remove_plain(constraint_section, ticket_key, resource_id):
-    ticket_element_list = constraint_section.xpath(
-        ".//rsc_ticket[@ticket=$ticket and @rsc=$resource]",
-        ticket=ticket_key,
-        resource=resource_id,
-    )
+    ticket_element_list = [
+        ticket_element
+        for ticket_element in ConstraintGraph(
+            constraint_section
+        ).get_plain_constraints(resource_id, [TAG_NAME])
+        if ticket_element.get("ticket") == ticket_key
+    ]
 
     for ticket_element in ticket_element_list:
         ticket_element.getparent().remove(ticket_element)
@@ -183,11 +186,15 @@ def remove_plain(constraint_section, ticket_key, resource_id):
 
 
 def remove_with_resource_set(constraint_section, ticket_key, resource_id):
-    ref_element_list = constraint_section.xpath(
-        ".//rsc_ticket[@ticket=$ticket]/resource_set/resource_ref[@id=$resource]",
-        ticket=ticket_key,
-        resource=resource_id,
-    )
+    ref_element_list = [
+        ref_element
+        for ticket_element in ConstraintGraph(
+            constraint_section
+        ).get_set_constraints(resource_id, [TAG_NAME])
+        if ticket_element.get("ticket") == ticket_key
+        for ref_element in ticket_element.iterfind("resource_set/resource_ref")
+        if ref_element.get("id") == resource_id
+    ]
 
     for ref_element in ref_element_list:
         set_element = ref_element.getparent()
@@ -0,0 +1,224 @@
+"""
+References between constraints, tags and resources
+
+Constraints reference resources and tags either directly by their attributes
+or by resource sets. Tags reference resources by obj_ref elements. Resources
+are nested in groups, clones and bundles. The references are read in one pass
+over each of the constraints, tags and resources sections, so that looking
+them up for many resources does not search the sections for each resource
+again.
+
+The graph is a snapshot of the sections, it is not updated when they change.
+"""
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from lxml.etree import _Element
+
+from pcs.lib.cib.const import (
+    TAG_RESOURCE_BUNDLE,
+    TAG_RESOURCE_CLONE,
+    TAG_RESOURCE_GROUP,
+    TAG_RESOURCE_MASTER,
+    TAG_RESOURCE_PRIMITIVE,
+)
+
+# attributes of constraints without resource sets referencing resources
+_REFERENCE_ATTRIBUTES = {
+    "rsc_colocation": ("rsc", "with-rsc"),
+    "rsc_location": ("rsc",),
+    "rsc_order": ("first", "then"),
+    "rsc_ticket": ("rsc",),
+}
+
+_RESOURCE_TAGS = frozenset(
+    (
+        TAG_RESOURCE_BUNDLE,
+        TAG_RESOURCE_CLONE,
+        TAG_RESOURCE_GROUP,
+        TAG_RESOURCE_MASTER,
+        TAG_RESOURCE_PRIMITIVE,
+    )
+)
+
+
+# (position of a constraint in the constraints section, constraint element)
+_Entry = Tuple[int, _Element]
+
+
+class ConstraintGraph:
+    """
+    Constraints and tags by ids of resources and tags they reference, parents
+    and children of resources
+    """
+
+    def __init__(
+        self,
+        constraints_section: Optional[_Element] = None,
+        tags_section: Optional[_Element] = None,
+        resources_section: Optional[_Element] = None,
+    ):
+        """
+        constraints_section -- the constraints element of a CIB
+        tags_section -- the tags element of a CIB
+        resources_section -- the resources element of a CIB
+        """
+        self._plain: Dict[str, List[_Entry]] = {}
+        self._with_sets: Dict[str, List[_Entry]] = {}
+        self._tags: Dict[str, _Element] = {}
+        self._tags_by_member: Dict[str, List[_Element]] = {}
+        self._resources: Dict[str, _Element] = {}
+        self._parents: Dict[str, _Element] = {}
+        self._children: Dict[str, List[_Element]] = {}
+        if constraints_section is not None:
+            self._add_constraints(constraints_section)
+        if tags_section is not None:
+            self._add_tags(tags_section)
+        if resources_section is not None:
+            self._add_resources(resources_section, None)
+
+    def _add_constraints(self, constraints_section: _Element) -> None:
+        for position, constraint_el in enumerate(constraints_section):
+            attribute_list = _REFERENCE_ATTRIBUTES.get(str(constraint_el.tag))
+            if attribute_list is None:
+                continue
+            if constraint_el.find(".//resource_set") is not None:
+                referenced_ids = {
+                    str(resource_ref.get("id"))
+                    for resource_ref in constraint_el.iterfind(
+                        "resource_set/resource_ref"
+                    )
+                }
+                index = self._with_sets
+            else:
+                referenced_ids = {
+                    str(constraint_el.get(attribute))
+                    for attribute in attribute_list
+                    if constraint_el.get(attribute) is not None
+                }
+                index = self._plain
+            for element_id in referenced_ids:
+                index.setdefault(element_id, []).append(
+                    (position, constraint_el)
+                )
+
+    def _add_tags(self, tags_section: _Element) -> None:
+        for tag_el in tags_section.iterfind("tag"):
+            self._tags[str(tag_el.get("id"))] = tag_el
+            for member_id in dict.fromkeys(
+                str(obj_ref.get("id")) for obj_ref in tag_el.iterfind("obj_ref")
+            ):
+                self._tags_by_member.setdefault(member_id, []).append(tag_el)
+
+    def _add_resources(
+        self, parent_el: _Element, parent_resource_el: Optional[_Element]
+    ) -> None:
+        for resource_el in parent_el:
+            if resource_el.tag not in _RESOURCE_TAGS:
+                continue
+            resource_id = str(resource_el.get("id"))
+            self._resources[resource_id] = resource_el
+            if parent_resource_el is not None:
+                self._parents[resource_id] = parent_resource_el
+                self._children.setdefault(
+                    str(parent_resource_el.get("id")), []
+                ).append(resource_el)
+            self._add_resources(resource_el, resource_el)
+
+    def get_plain_constraints(
+        self, element_id: str, constraint_tags: Optional[Iterable[str]] = None
+    ) -> List[_Element]:
+        """
+        Return constraints without resource sets referencing an element
+
+        element_id -- id of a referenced resource or tag
+        constraint_tags -- return only constraints of these types
+        """
+        return _get_elements(self._plain.get(element_id, []), constraint_tags)
+
+    def get_set_constraints(
+        self, element_id: str, constraint_tags: Optional[Iterable[str]] = None
+    ) -> List[_Element]:
+        """
+        Return constraints referencing an element in their resource sets
+
+        element_id -- id of a referenced resource or tag
+        constraint_tags -- return only constraints of these types
+        """
+        return _get_elements(
+            self._with_sets.get(element_id, []), constraint_tags
+        )
+
+    def get_constraints(
+        self, element_id: str, constraint_tags: Optional[Iterable[str]] = None
+    ) -> List[_Element]:
+        """
+        Return all constraints referencing an element in document order
+
+        element_id -- id of a referenced resource or tag
+        constraint_tags -- return only constraints of these types
+        """
+        return _get_elements(
+            sorted(
+                self._plain.get(element_id, [])
+                + self._with_sets.get(element_id, []),
+                key=lambda entry: entry[0],
+            ),
+            constraint_tags,
+        )
+
+    def get_tag(self, tag_id: str) -> Optional[_Element]:
+        """
+        Return a tag element
+
+        tag_id -- id of the tag
+        """
+        return self._tags.get(tag_id)
+
+    def get_tags(self, element_id: str) -> List[_Element]:
+        """
+        Return tags referencing an element in document order
+
+        element_id -- id of a referenced resource
+        """
+        return list(self._tags_by_member.get(element_id, []))
+
+    def get_resource(self, resource_id: str) -> Optional[_Element]:
+        """
+        Return a resource element
+
+        resource_id -- id of the resource
+        """
+        return self._resources.get(resource_id)
+
+    def get_parent_resource(self, resource_id: str) -> Optional[_Element]:
+        """
+        Return a group, clone or bundle the resource is placed in directly
+
+        resource_id -- id of the resource
+        """
+        return self._parents.get(resource_id)
+
+    def get_inner_resources(self, resource_id: str) -> List[_Element]:
+        """
+        Return resources placed directly in a group, clone or bundle
+
+        resource_id -- id of the group, clone or bundle
+        """
+        return list(self._children.get(resource_id, []))
+
+
+def _get_elements(
+    entry_list: Iterable[_Entry], tag_list: Optional[Iterable[str]]
+) -> List[_Element]:
+    tag_set = None if tag_list is None else frozenset(tag_list)
+    return [
+        element
+        for dummy_position, element in entry_list
+        if tag_set is None or element.tag in tag_set
+    ]
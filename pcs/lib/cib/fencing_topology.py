@@ -23,6 +23,7 @@ from pcs.common.reports import (
 from pcs.common.reports import codes as report_codes
 from pcs.common.reports import has_errors
 from pcs.common.reports.item import ReportItem
+from pcs.lib.cib import xpath
 from pcs.lib.cib.resource.stonith import is_stonith_resource
 from pcs.lib.cib.tools import find_unique_id
 from pcs.lib.errors import LibraryError
@@ -456,8 +457,8 @@ def _find_level_elements(
         filter(None, [xpath_level, xpath_devices, xpath_target])
     )
     if xpath_attrs:
-        return tree.xpath(
-            f"fencing-level[{xpath_attrs}]",
+        return xpath.get_xpath(f"fencing-level[{xpath_attrs}]")(
+            tree,
             var_devices=(",".join(devices) if devices else ""),
             var_level=level,
             **xpath_vars,
@@ -0,0 +1,187 @@
+"""
+Index of ids of CIB configuration elements.
+
+Looking an id up by an XPath query means walking the whole CIB. Commands
+working with many ids (e.g. creating many resources, each of them with
+operations and nvsets) would be quadratic in the CIB size. One index is kept
+for each CIB, it is built by one walk through the CIB and it is used by
+IdProvider and by all id lookups of pcs.lib.cib.tools.
+
+lxml provides no hooks for tree mutations, so the index is kept up to date by
+the library:
+* Elements may be removed from the CIB or their ids may change after the
+  index has been built. Elements found in the index are therefore always
+  checked to be still present in the CIB with the same id.
+* New elements get their ids from IdProvider or from the deprecated id
+  functions of pcs.lib.cib.tools, which register the ids in the index, or
+  they are added to the index directly by add_element. Only registered ids
+  missing in the index are searched for in the CIB, other misses are trusted.
+"""
+from collections import OrderedDict
+from typing import (
+    Dict,
+    List,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from lxml.etree import (
+    _Element,
+    _ElementTree,
+)
+
+from pcs.lib.cib import xpath
+
+# (element, True if the id is the value of a remote-node nvpair)
+_IndexEntry = Tuple[_Element, bool]
+
+# lxml elements cannot be weakly referenced, indexes of the most recently used
+# CIBs are kept instead
+_INDEX_CACHE_SIZE = 4
+_index_cache: "OrderedDict[_Element, CibIdIndex]" = OrderedDict()
+
+
+def get_id_index(cib_element: Union[_Element, _ElementTree]) -> "CibIdIndex":
+    """
+    Return the id index of a CIB
+
+    cib_element -- any element of the CIB or its element tree
+    """
+    if isinstance(cib_element, _ElementTree):
+        cib = cib_element.getroot()
+    else:
+        cib = cib_element.getroottree().getroot()
+    index = _index_cache.pop(cib, None)
+    if index is None:
+        index = CibIdIndex(cib)
+    _index_cache[cib] = index
+    while len(_index_cache) > _INDEX_CACHE_SIZE:
+        _index_cache.popitem(last=False)
+    return index
+
+
+class CibIdIndex:
+    """
+    Maps ids to configuration elements of a CIB
+    """
+
+    def __init__(self, cib: _Element):
+        """
+        cib -- root element of a CIB
+        """
+        self._cib = cib
+        self._index: Dict[str, List[_IndexEntry]] = {}
+        self._index_built = False
+        # ids which elements added to the CIB may have
+        self._registered_ids: Set[str] = set()
+        # ids booked for elements which are being created
+        self._booked_ids: Set[str] = set()
+
+    def get_elements(self, element_id: str) -> List[_Element]:
+        """
+        Return elements with the specified id
+
+        element_id -- id to look for
+        """
+        self._build_index()
+        entry_list = [
+            (element, is_remote_node)
+            for element, is_remote_node in self._index.get(element_id, [])
+            if self._is_valid(element, element_id, is_remote_node)
+        ]
+        if not entry_list and element_id in self._registered_ids:
+            # The element may have been created after the id was registered.
+            entry_list = [
+                (element, element.get("id") != element_id)
+                for element in cast(
+                    List[_Element],
+                    xpath.ELEMENTS_BY_ID(self._cib, check_id=element_id),
+                )
+            ]
+        if entry_list:
+            self._index[element_id] = entry_list
+        else:
+            self._index.pop(element_id, None)
+        return [element for element, dummy_remote in entry_list]
+
+    def is_id_used(self, element_id: str) -> bool:
+        """
+        Check whether an id is used by an element or booked for a new one
+
+        element_id -- id to check
+        """
+        return element_id in self._booked_ids or bool(
+            self.get_elements(element_id)
+        )
+
+    def book_id(self, element_id: str) -> None:
+        """
+        Mark an id as used by an element which is being created
+
+        element_id -- id of the element
+        """
+        self._booked_ids.add(element_id)
+        self._registered_ids.add(element_id)
+
+    def register_id(self, element_id: str) -> None:
+        """
+        Let the index know an element with the id may be added to the CIB
+
+        element_id -- id of the element
+        """
+        self._registered_ids.add(element_id)
+
+    def add_element(self, element: _Element) -> None:
+        """
+        Put an element added to the CIB to the index
+
+        element -- the added element, its descendants are not indexed
+        """
+        element_id = element.get("id")
+        if not element_id or not self._index_built:
+            return
+        entry_list = self._index.setdefault(str(element_id), [])
+        if (element, False) not in entry_list:
+            entry_list.append((element, False))
+
+    def _build_index(self) -> None:
+        if self._index_built:
+            return
+        for element in cast(List[_Element], xpath.ID_ELEMENTS(self._cib)):
+            self._index.setdefault(str(element.get("id")), []).append(
+                (element, False)
+            )
+        for nvpair in cast(
+            List[_Element], xpath.REMOTE_NODE_NVPAIRS(self._cib)
+        ):
+            primitive = cast(
+                _Element, cast(_Element, nvpair.getparent()).getparent()
+            )
+            self._index.setdefault(str(nvpair.get("value")), []).append(
+                (primitive, True)
+            )
+        self._index_built = True
+
+    def _is_valid(
+        self, element: _Element, element_id: str, is_remote_node: bool
+    ) -> bool:
+        if is_remote_node:
+            if not xpath.REMOTE_NODE_NVPAIR_BY_VALUE(element, id=element_id):
+                return False
+        elif element.get("id") != element_id:
+            return False
+        return _is_in_configuration(self._cib, element)
+
+
+def _is_in_configuration(cib: _Element, element: _Element) -> bool:
+    if element.tag in xpath.NOT_ID_TAGS:
+        return False
+    ancestor_list = list(element.iterancestors())
+    if not ancestor_list or ancestor_list[-1] is not cib:
+        return False
+    if cib.tag != "cib":
+        return True
+    # elements directly in cib are not searched, nor is the status section
+    return len(ancestor_list) > 1 and ancestor_list[-2].tag != "status"
@@ -8,6 +8,7 @@ from typing import (
 from lxml import etree
 from lxml.etree import _Element
 
+from pcs.lib.cib import xpath
 from pcs.lib.cib.tools import create_subelement_id
 from pcs.lib.xml_tools import (
     append_when_useful,
@@ -46,7 +47,7 @@ def set_nvpair_in_nvset(nvset_element, name, value, id_provider):
     value -- value of nvpair
     IdProvider id_provider -- elements' ids generator
     """
-    nvpair_list = nvset_element.xpath("./nvpair[@name=$name]", name=name)
+    nvpair_list = xpath.NVPAIR_BY_NAME(nvset_element, name=name)
     if not nvpair_list:
         if value:
             _append_new_nvpair(nvset_element, name, value, id_provider)
@@ -190,16 +191,8 @@ def get_value(
     name -- nvpair name
     default -- default return value
     """
-    value_list = context_element.xpath(
-        """
-            ./*[local-name()=$tag_name]
-            /nvpair[
-                @name=$name and string-length(@value) > 0
-            ]
-            /@value
-        """,
-        tag_name=tag_name,
-        name=name,
+    value_list = xpath.NVSET_VALUES_BY_NAME(
+        context_element, tag_name=tag_name, name=name
     )
     return cast(List[str], value_list)[0] if value_list else default
 
@@ -229,16 +222,8 @@ def has_meta_attribute(resource_el, name):
     """
     return (
         len(
-            resource_el.xpath(
-                """
-                    ./*[local-name()=$tag_name]
-                    /nvpair[
-                        @name=$name and string-length(@value) > 0
-                    ]
-                    /@value
-                """,
-                tag_name=META_ATTRIBUTES_TAG,
-                name=name,
+            xpath.NVSET_VALUES_BY_NAME(
+                resource_el, tag_name=META_ATTRIBUTES_TAG, name=name
             )
         )
         > 0
@@ -0,0 +1,390 @@
+"""
+Native computation of CIB differences in the pacemaker v2 patchset format.
+
+The produced patchset is equivalent to the output of 'crm_diff --no-version'
+and can be pushed to a cluster by 'cibadmin --patch'. Differences which
+cannot be safely expressed by this module (e.g. changes involving comments,
+siblings which cannot be addressed unambiguously by a path) are signalled by
+raising PatchsetNotSupported, so that callers can fall back to crm_diff.
+"""
+import copy
+from bisect import bisect_left
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from lxml import etree
+from lxml.etree import _Element
+
+from pcs.lib.xml_tools import etree_to_str
+
+# attributes carrying a CIB version, they are not part of a diff
+_VERSION_ATTRS = ("admin_epoch", "epoch", "num_updates")
+
+# Elements with many children, e.g. CIB sections, are likely to contain a
+# change. They are walked rather than compared in their serialized form.
+_SERIALIZED_COMPARE_MAX_CHILDREN = 32
+
+_ChildKey = Tuple[str, Optional[str]]
+
+
+class PatchsetNotSupported(Exception):
+    """
+    The difference of CIBs cannot be expressed by the native patchset engine
+    """
+
+
+class _PatchsetBuilder:
+    def __init__(self) -> None:
+        self._delete_list: List[_Element] = []
+        self._change_list: List[_Element] = []
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._delete_list and not self._change_list
+
+    def to_element(self) -> _Element:
+        patchset = etree.Element("diff", format="2")
+        patchset.extend(self._delete_list)
+        patchset.extend(self._change_list)
+        return patchset
+
+    def delete(self, path: str) -> None:
+        self._delete_list.append(
+            etree.Element("change", operation="delete", path=path)
+        )
+
+    def create(self, parent_path: str, position: int, element: _Element):
+        change = etree.Element(
+            "change",
+            operation="create",
+            path=parent_path,
+            position=str(position),
+        )
+        new_element = copy.deepcopy(element)
+        new_element.tail = None
+        change.append(new_element)
+        self._change_list.append(change)
+
+    def modify(
+        self,
+        path: str,
+        tag: str,
+        old_attrs: Dict[str, str],
+        new_attrs: Dict[str, str],
+        result_attrs: Dict[str, str],
+    ) -> None:
+        change = etree.Element("change", operation="modify", path=path)
+        change_list = etree.SubElement(change, "change-list")
+        for name, value in new_attrs.items():
+            if old_attrs.get(name) != value:
+                etree.SubElement(
+                    change_list,
+                    "change-attr",
+                    name=name,
+                    operation="set",
+                    value=value,
+                )
+        for name in old_attrs:
+            if name not in new_attrs:
+                etree.SubElement(
+                    change_list, "change-attr", name=name, operation="unset"
+                )
+        etree.SubElement(
+            etree.SubElement(change, "change-result"), tag, result_attrs
+        )
+        self._change_list.append(change)
+
+
+def create_patchset(cib_old: _Element, cib_new: _Element) -> Optional[_Element]:
+    """
+    Return a v2 patchset transforming cib_old to cib_new, None if they match
+
+    cib_old -- original CIB
+    cib_new -- modified CIB
+    """
+    builder = _PatchsetBuilder()
+    _diff_root(cib_old, cib_new, builder)
+    return None if builder.is_empty else builder.to_element()
+
+
+def create_patchset_xml(cib_old: _Element, cib_new: _Element) -> str:
+    """
+    Return a verified v2 patchset of two CIBs as a string, empty if they match
+
+    The patchset is applied to cib_old and the result is compared to cib_new.
+    PatchsetNotSupported is raised if they do not match. Note that cib_old is
+    modified in the process.
+
+    cib_old -- original CIB, it gets the patchset applied
+    cib_new -- modified CIB
+    """
+    patchset = create_patchset(cib_old, cib_new)
+    if patchset is None:
+        return ""
+    apply_patchset(cib_old, patchset)
+    if create_patchset(cib_old, cib_new) is not None:
+        raise PatchsetNotSupported("patchset verification failed")
+    return etree_to_str(patchset)
+
+
+def apply_patchset(cib: _Element, patchset: _Element) -> None:
+    """
+    Apply a v2 patchset to a CIB the same way pacemaker does
+
+    cib -- CIB to be modified
+    patchset -- patchset to be applied
+    """
+    create_list: List[Tuple[int, _Element, _Element]] = []
+    for change in patchset.iterchildren("change"):
+        operation = change.get("operation")
+        target = _find_by_path(cib, str(change.get("path", "")))
+        if target is None:
+            if operation == "delete":
+                continue
+            raise PatchsetNotSupported(
+                "path '{0}' not found".format(change.get("path"))
+            )
+        if operation == "delete":
+            parent = target.getparent()
+            if parent is None:
+                raise PatchsetNotSupported("cannot delete the root element")
+            parent.remove(target)
+        elif operation == "modify":
+            result_list = change.find("change-result")
+            if result_list is None or len(result_list) < 1:
+                raise PatchsetNotSupported("missing change-result")
+            result_attrs = {
+                str(name): str(value)
+                for name, value in result_list[0].attrib.items()
+            }
+            if target.getparent() is None:
+                # pacemaker keeps the version of the CIB being patched
+                for name in _VERSION_ATTRS:
+                    if name in target.attrib:
+                        result_attrs[name] = str(target.attrib[name])
+            target.attrib.clear()
+            for name, value in result_attrs.items():
+                target.set(name, value)
+        elif operation == "create":
+            create_list.append(
+                (int(str(change.get("position", "0"))), target, change[0])
+            )
+        else:
+            raise PatchsetNotSupported(
+                "unsupported operation '{0}'".format(operation)
+            )
+    # the sort is stable, so creates in one parent stay in order
+    for position, parent, element in sorted(
+        create_list, key=lambda item: item[0]
+    ):
+        new_element = copy.deepcopy(element)
+        new_element.tail = None
+        children = list(parent)
+        if position < len(children):
+            children[position].addprevious(new_element)
+        else:
+            parent.append(new_element)
+
+
+def _find_by_path(cib: _Element, path: str) -> Optional[_Element]:
+    step_list = path.split("/")[1:]
+    if not step_list:
+        return None
+    element: Optional[_Element] = None
+    for step in step_list:
+        tag, dummy_sep, id_part = step.partition("[@id='")
+        element_id = id_part[:-2] if id_part else None
+        candidates: Iterable[_Element]
+        if element is None:
+            candidates = [cib]
+        else:
+            candidates = element.iterchildren(tag)
+        element = None
+        for candidate in candidates:
+            if candidate.tag == tag and (
+                element_id is None or candidate.get("id") == element_id
+            ):
+                element = candidate
+                break
+        if element is None:
+            return None
+    return element
+
+
+def _get_path_step(element: _Element) -> str:
+    element_id = element.get("id")
+    if element_id is None:
+        return "/{0}".format(element.tag)
+    if "'" in element_id:
+        raise PatchsetNotSupported("id cannot be used in a path")
+    return "/{0}[@id='{1}']".format(element.tag, element_id)
+
+
+def _get_attrs(element: _Element) -> Dict[str, str]:
+    attrs = {str(name): str(value) for name, value in element.attrib.items()}
+    for name in attrs:
+        if name.startswith("{"):
+            raise PatchsetNotSupported("namespaced attributes")
+    return attrs
+
+
+def _diff_root(old: _Element, new: _Element, builder: _PatchsetBuilder):
+    if old.tag != new.tag:
+        raise PatchsetNotSupported("root elements differ")
+    old_attrs = _get_attrs(old)
+    new_attrs = _get_attrs(new)
+    # Version attributes are never part of the diff, 'crm_diff --no-version'
+    # strips them from both the change list and the result.
+    for name in _VERSION_ATTRS:
+        old_attrs.pop(name, None)
+        new_attrs.pop(name, None)
+    path = _get_path_step(new)
+    if old_attrs != new_attrs:
+        builder.modify(path, str(new.tag), old_attrs, new_attrs, new_attrs)
+    # CIB sections are walked directly, they are likely to contain a change
+    _diff_children(old, new, path, builder, compare_serialized=False)
+
+
+def _diff_element(
+    old: _Element,
+    new: _Element,
+    path: str,
+    builder: _PatchsetBuilder,
+    compare_serialized: bool = True,
+) -> None:
+    # Most of a CIB stays untouched. Comparing serialized subtrees is much
+    # faster than walking them element by element.
+    if (
+        compare_serialized
+        and len(new) <= _SERIALIZED_COMPARE_MAX_CHILDREN
+        and etree.tostring(old, with_tail=False)
+        == etree.tostring(new, with_tail=False)
+    ):
+        return
+    if (old.text or "").strip() != (new.text or "").strip():
+        raise PatchsetNotSupported("text content changed")
+    old_attrs = _get_attrs(old)
+    new_attrs = _get_attrs(new)
+    if old_attrs != new_attrs:
+        builder.modify(path, str(new.tag), old_attrs, new_attrs, new_attrs)
+    _diff_children(old, new, path, builder)
+
+
+def _split_children(
+    element: _Element,
+) -> Tuple[List[_Element], List[_Element]]:
+    child_list = list(element)
+    element_list = [child for child in child_list if isinstance(child.tag, str)]
+    return child_list, element_list
+
+
+def _get_child_index(
+    element_list: List[_Element],
+) -> Dict[_ChildKey, int]:
+    index: Dict[_ChildKey, int] = {}
+    for position, child in enumerate(element_list):
+        if str(child.tag).startswith("{"):
+            raise PatchsetNotSupported("namespaced elements")
+        key = (str(child.tag), child.get("id"))
+        if key in index:
+            # a path would not address the element unambiguously
+            raise PatchsetNotSupported("ambiguous siblings")
+        index[key] = position
+    return index
+
+
+def _get_stable_positions(position_list: List[int]) -> List[bool]:
+    """
+    Mark items of the longest increasing subsequence of the positions
+
+    Elements in the subsequence keep their relative order and do not need to be
+    moved.
+    """
+    tail_values: List[int] = []
+    tail_indexes: List[int] = []
+    predecessors: List[int] = []
+    for index, position in enumerate(position_list):
+        insert_at = bisect_left(tail_values, position)
+        predecessors.append(tail_indexes[insert_at - 1] if insert_at else -1)
+        if insert_at == len(tail_values):
+            tail_values.append(position)
+            tail_indexes.append(index)
+        else:
+            tail_values[insert_at] = position
+            tail_indexes[insert_at] = index
+    stable = [False] * len(position_list)
+    index = tail_indexes[-1] if tail_indexes else -1
+    while index >= 0:
+        stable[index] = True
+        index = predecessors[index]
+    return stable
+
+
+def _diff_children(
+    old: _Element,
+    new: _Element,
+    path: str,
+    builder: _PatchsetBuilder,
+    compare_serialized: bool = True,
+) -> None:
+    old_children, old_elements = _split_children(old)
+    new_children, new_elements = _split_children(new)
+    old_index = _get_child_index(old_elements)
+    new_index = _get_child_index(new_elements)
+
+    if len(old_children) != len(old_elements) or len(new_children) != len(
+        new_elements
+    ):
+        # Comments take part in positions of elements in pacemaker. Allow them
+        # only if nothing is added, removed or reordered around them.
+        if [_get_child_signature(child) for child in old_children] != [
+            _get_child_signature(child) for child in new_children
+        ]:
+            raise PatchsetNotSupported("comments")
+
+    matched_old_positions: List[int] = []
+    matched_new_positions: List[int] = []
+    for key, new_position in new_index.items():
+        old_position = old_index.get(key)
+        if old_position is not None:
+            matched_old_positions.append(old_position)
+            matched_new_positions.append(new_position)
+
+    kept_positions: Dict[int, int] = {}
+    for old_position, new_position, stable in zip(
+        matched_old_positions,
+        matched_new_positions,
+        _get_stable_positions(matched_old_positions),
+    ):
+        # Moved elements are deleted and created in their new place. The
+        # resulting CIB is the same as if they were moved.
+        if stable:
+            kept_positions[new_position] = old_position
+    kept_old_positions = set(kept_positions.values())
+
+    for old_position, child in enumerate(old_elements):
+        if old_position not in kept_old_positions:
+            builder.delete(path + _get_path_step(child))
+
+    for new_position, child in enumerate(new_elements):
+        if new_position in kept_positions:
+            _diff_element(
+                old_elements[kept_positions[new_position]],
+                child,
+                path + _get_path_step(child),
+                builder,
+                compare_serialized,
+            )
+        else:
+            builder.create(path, new_position, child)
+
+
+def _get_child_signature(child: _Element) -> Tuple[str, Optional[str]]:
+    if isinstance(child.tag, str):
+        return (child.tag, child.get("id"))
+    return (str(child.tag), child.text)
@@ -4,6 +4,7 @@ from pcs.common import reports
 from pcs.common.reports.item import ReportItem
 from pcs.lib import validate
 from pcs.lib.cib.const import TAG_RESOURCE_BUNDLE as TAG
+from pcs.lib.cib.id_index import get_id_index
 from pcs.lib.cib.nvpair import (
     META_ATTRIBUTES_TAG,
     append_new_meta_attributes,
@@ -130,6 +131,7 @@ def append_new(
     dict meta_attributes -- meta attributes
     """
     bundle_element = etree.SubElement(parent_element, TAG, {"id": bundle_id})
+    get_id_index(bundle_element).add_element(bundle_element)
     _append_container(bundle_element, container_type, container_options)
     if network_options or port_map:
         _append_network(
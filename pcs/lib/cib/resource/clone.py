@@ -19,6 +19,7 @@ from pcs.common.reports import ReportItemList
 from pcs.lib.cib import nvpair
 from pcs.lib.cib.const import TAG_RESOURCE_CLONE as TAG_CLONE
 from pcs.lib.cib.const import TAG_RESOURCE_MASTER as TAG_MASTER
+from pcs.lib.cib.id_index import get_id_index
 from pcs.lib.cib.tools import IdProvider
 from pcs.lib.pacemaker.values import (
     is_true,
@@ -96,6 +97,7 @@ def append_new(
         if clone_id is None
         else clone_id,
     )
+    get_id_index(clone_element).add_element(clone_element)
     clone_element.append(primitive_element)
 
     if options:
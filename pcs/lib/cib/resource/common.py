@@ -9,7 +9,10 @@ from typing import (
 from lxml.etree import _Element
 
 from pcs.common.reports.item import ReportItemList
-from pcs.lib.cib import nvpair
+from pcs.lib.cib import (
+    nvpair,
+    xpath,
+)
 from pcs.lib.cib.tools import ElementSearcher
 from pcs.lib.xml_tools import find_parent
 
@@ -250,26 +253,10 @@ def find_resources_to_manage(resource_el):
         [resource_el]  # the resource itself
         +
         # its parents
-        find_parent(resource_el, "resources").xpath(
-            # a master or a clone which contains a group, a primitve, or a
-            # grouped primitive with the specified id
-            # OR
-            # a group (in a clone, master, etc. - hence //) which contains a
-            # primitive with the specified id
-            # OR
-            # a bundle which contains a primitive with the specified id
-            """
-                (./master|./clone)[(group|group/primitive|primitive)[@id=$r]]
-                |
-                //group[primitive[@id=$r]]
-                |
-                ./bundle[primitive[@id=$r]]
-            """,
-            r=res_id,
-        )
+        xpath.RESOURCE_PARENTS(find_parent(resource_el, "resources"), r=res_id)
         +
         # its children
-        resource_el.xpath("(./group|./primitive|./group/primitive)")
+        xpath.RESOURCE_CHILDREN(resource_el)
     )
 
 
@@ -9,6 +9,7 @@ from lxml.etree import (
 )
 
 from pcs.lib.cib.const import TAG_RESOURCE_GROUP as TAG
+from pcs.lib.cib.id_index import get_id_index
 
 
 def is_group(resource_el: _Element) -> bool:
@@ -16,7 +17,9 @@ def is_group(resource_el: _Element) -> bool:
 
 
 def append_new(resources_section: _Element, group_id: str) -> _Element:
-    return SubElement(resources_section, TAG, id=group_id)
+    group_el = SubElement(resources_section, TAG, id=group_id)
+    get_id_index(group_el).add_element(group_el)
+    return group_el
 
 
 def get_inner_resources(
@@ -13,6 +13,7 @@ from lxml.etree import _Element
 from pcs.common import reports
 from pcs.lib import validate
 from pcs.lib.cib.const import TAG_RESOURCE_PRIMITIVE as TAG
+from pcs.lib.cib.id_index import get_id_index
 from pcs.lib.cib.nvpair import (
     INSTANCE_ATTRIBUTES_TAG,
     append_new_instance_attributes,
@@ -218,6 +219,7 @@ def append_new(
     if provider:
         attributes["provider"] = provider
     primitive_element = etree.SubElement(resources_section, TAG, attributes)
+    get_id_index(primitive_element).add_element(primitive_element)
 
     if instance_attributes:
         append_new_instance_attributes(
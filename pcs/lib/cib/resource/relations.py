@@ -20,6 +20,7 @@ from pcs.common.pacemaker.resource.relations import (
     ResourceRelationType,
 )
 from pcs.lib.cib import tools
+from pcs.lib.cib.constraint_graph import ConstraintGraph
 from pcs.lib.cib.resource import common
 
 IdRelationMap = Mapping[str, RelationEntityDto]
@@ -139,7 +140,10 @@ class ResourceRelationsFetcher:
     def __init__(self, cib: _Element):
         self._cib = cib
         self._resources_section = tools.get_resources(self._cib)
-        self._constraints_section = tools.get_constraints(self._cib)
+        self._constraint_graph = ConstraintGraph(
+            tools.get_constraints(self._cib),
+            resources_section=self._resources_section,
+        )
 
     def get_relations(
         self, resource_id: str
@@ -171,9 +175,7 @@ class ResourceRelationsFetcher:
     def _get_resource_el(self, res_id: str) -> _Element:
         # client of this class should ensure that res_id really exists in CIB,
         # so here we don't need to handle possible reports
-        resource_el, dummy_report_list = common.find_one_resource(
-            self._resources_section, res_id
-        )
+        resource_el = self._constraint_graph.get_resource(res_id)
         if resource_el is None:
             # Two reasons for raising an error:
             # 1) pcs would fail anyway, it's better to fail here and be able to
@@ -206,36 +208,27 @@ class ResourceRelationsFetcher:
         # special type of relation, group (note that a group can be a resource
         # and a relation)
         if common.is_wrapper_resource(resource_el):
-            relations.append(_get_inner_resources_relation(resource_el))
+            relations.append(
+                _get_inner_resources_relation(
+                    resource_el,
+                    self._constraint_graph.get_inner_resources(resource_id),
+                )
+            )
 
         # handle resources in a wrapper resource (group/bundle/clone relation)
-        parent_el = common.get_parent_resource(resource_el)
+        parent_el = self._constraint_graph.get_parent_resource(resource_id)
         if parent_el is not None:
             relations.append(_get_outer_resource_relation(parent_el))
         return relations
 
     def _get_ordering_coinstraints(self, resource_id: str) -> List[_Element]:
-        return cast(
-            List[_Element],
-            self._constraints_section.xpath(
-                """
-                .//rsc_order[
-                    not (descendant::resource_set)
-                    and
-                    (@first=$resource_id or @then=$resource_id)
-                ]
-                """,
-                resource_id=resource_id,
-            ),
+        return self._constraint_graph.get_plain_constraints(
+            resource_id, ["rsc_order"]
         )
 
     def _get_ordering_set_constraints(self, resource_id: str) -> List[_Element]:
-        return cast(
-            List[_Element],
-            self._constraints_section.xpath(
-                ".//rsc_order[./resource_set/resource_ref[@id=$resource_id]]",
-                resource_id=resource_id,
-            ),
+        return self._constraint_graph.get_set_constraints(
+            resource_id, ["rsc_order"]
         )
 
 
@@ -252,15 +245,13 @@ def _get_resource_relation_type(res_el: _Element) -> ResourceRelationType:
 # relation obj to RelationEntityDto obj
 def _get_inner_resources_relation(
     parent_resource_el: _Element,
+    inner_resource_list: Iterable[_Element],
 ) -> RelationEntityDto:
     attrs = cast(Mapping[str, str], parent_resource_el.attrib)
     return RelationEntityDto(
         INNER_RESOURCE_ID_TEMPLATE.format(attrs["id"]),
         ResourceRelationType.INNER_RESOURCES,
-        [
-            str(res.attrib["id"])
-            for res in common.get_inner_resources(parent_resource_el)
-        ],
+        [str(res.attrib["id"]) for res in inner_resource_list],
         dict(attrs),
     )
 
@@ -2,6 +2,7 @@ from .cib_to_dto import rule_element_to_dto
 from .expression_part import BoolExpr as RuleRoot
 from .in_effect import (
     RuleInEffectEval,
+    RuleInEffectEvalAllAtOnce,
     RuleInEffectEvalDummy,
     RuleInEffectEvalOneByOne,
 )
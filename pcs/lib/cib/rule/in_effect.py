@@ -1,3 +1,14 @@
+import datetime
+from collections import defaultdict
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from dateutil import parser as dateutil_parser
+from dateutil.relativedelta import relativedelta
 from lxml.etree import _Element
 
 from pcs.common.types import CibRuleInEffectStatus
@@ -49,8 +60,165 @@ class RuleInEffectEvalOneByOne(RuleInEffectEval):
         return get_rule_in_effect_status(self._runner, self._cib_xml, rule_id)
 
 
-# TODO Implement this once the pacemaker tool is capable of evaluating more
-# than one rule per go. If we can eval all rules by running the tool once, it
-# would be a significant speedup comparing to running the tool for each rule.
-# class RuleInEffectEvalAllAtOnce(RuleInEffectEval):
-#     pass
+class RuleInEffectEvalAllAtOnce(RuleInEffectEval):
+    """
+    Evaluate rules natively, run a pacemaker tool only for rules which cannot
+    be evaluated natively.
+
+    Rules are evaluated the same way as the pacemaker tool does it. Only rules
+    containing exactly one date expression can be evaluated. Rules without any
+    date expression are evaluated to UNKNOWN status right away.
+    """
+
+    def __init__(
+        self,
+        cib: _Element,
+        runner: CommandRunner,
+        now: Optional[datetime.datetime] = None,
+    ):
+        """
+        cib -- the whole cib containing the rule expressions
+        runner -- a class for running external processes
+        now -- point in time to evaluate the rules at, current time by default
+        """
+        self._runner = runner
+        self._cib = cib
+        self._now = (
+            now if now is not None else datetime.datetime.now().astimezone()
+        )
+        self._fallback_eval: Optional[RuleInEffectEvalOneByOne] = None
+        self._status_cache: Dict[str, CibRuleInEffectStatus] = {}
+        self._rule_index: Dict[str, List[_Element]] = defaultdict(list)
+        for rule_el in cib.iter("rule"):
+            self._rule_index[str(rule_el.get("id", ""))].append(rule_el)
+
+    def get_rule_status(self, rule_id: str) -> CibRuleInEffectStatus:
+        if rule_id not in self._status_cache:
+            status = None
+            rule_el_list = self._rule_index.get(rule_id, [])
+            if len(rule_el_list) == 1:
+                status = _eval_rule(rule_el_list[0], self._now)
+            if status is None:
+                status = self._get_fallback_eval().get_rule_status(rule_id)
+            self._status_cache[rule_id] = status
+        return self._status_cache[rule_id]
+
+    def _get_fallback_eval(self) -> RuleInEffectEvalOneByOne:
+        # the fallback serializes the whole cib, only create it when needed
+        if self._fallback_eval is None:
+            self._fallback_eval = RuleInEffectEvalOneByOne(
+                self._cib, self._runner
+            )
+        return self._fallback_eval
+
+
+def _eval_rule(
+    rule_el: _Element, now: datetime.datetime
+) -> Optional[CibRuleInEffectStatus]:
+    """
+    Evaluate a rule, return None if it cannot be evaluated natively
+    """
+    date_expr_list = list(rule_el.iter("date_expression"))
+    if not date_expr_list:
+        # Pacemaker is only able to evaluate rules with date expressions
+        return CibRuleInEffectStatus.UNKNOWN
+    if len(date_expr_list) > 1:
+        return None
+    try:
+        return _eval_date_expr(date_expr_list[0], now)
+    except ValueError:
+        return None
+
+
+def _eval_date_expr(
+    expr_el: _Element, now: datetime.datetime
+) -> Optional[CibRuleInEffectStatus]:
+    operation = expr_el.get("operation", "in_range")
+    if operation == "date_spec":
+        return _eval_date_spec(expr_el, now)
+    start = _parse_date(expr_el.get("start"))
+    end = _parse_date(expr_el.get("end"))
+    if operation == "gt":
+        if start is None:
+            return None
+        return (
+            CibRuleInEffectStatus.IN_EFFECT
+            if now > start
+            else CibRuleInEffectStatus.NOT_YET_IN_EFFECT
+        )
+    if operation == "lt":
+        if end is None:
+            return None
+        return (
+            CibRuleInEffectStatus.IN_EFFECT
+            if now < end
+            else CibRuleInEffectStatus.EXPIRED
+        )
+    if operation == "in_range":
+        duration_el = expr_el.find("./duration")
+        if end is None and start is not None and duration_el is not None:
+            end = start + _parse_duration(duration_el)
+        if start is None and end is None:
+            return None
+        if start is not None and now < start:
+            return CibRuleInEffectStatus.NOT_YET_IN_EFFECT
+        if end is not None and now > end:
+            return CibRuleInEffectStatus.EXPIRED
+        return CibRuleInEffectStatus.IN_EFFECT
+    return None
+
+
+def _eval_date_spec(
+    expr_el: _Element, now: datetime.datetime
+) -> Optional[CibRuleInEffectStatus]:
+    # Only date-specs limited by years are evaluated by pacemaker.
+    date_spec_el = expr_el.find("./date_spec")
+    if date_spec_el is None:
+        return None
+    spec = {
+        str(name): str(value)
+        for name, value in date_spec_el.attrib.items()
+        if name != "id"
+    }
+    if list(spec) != ["years"]:
+        return None
+    low, high = _parse_range(spec["years"])
+    if low is not None and now.year < low:
+        return CibRuleInEffectStatus.NOT_YET_IN_EFFECT
+    if high is not None and now.year > high:
+        return CibRuleInEffectStatus.EXPIRED
+    return CibRuleInEffectStatus.IN_EFFECT
+
+
+def _parse_date(date: Optional[str]) -> Optional[datetime.datetime]:
+    if date is None:
+        return None
+    parsed_date = dateutil_parser.isoparse(date)
+    # dates without a timezone are in local time, the same as in pacemaker
+    if parsed_date.tzinfo is None:
+        parsed_date = parsed_date.astimezone()
+    return parsed_date
+
+
+def _parse_duration(duration_el: _Element) -> relativedelta:
+    def get_part(name: str) -> int:
+        return int(str(duration_el.get(name, "0")))
+
+    return relativedelta(
+        years=get_part("years"),
+        months=get_part("months"),
+        weeks=get_part("weeks"),
+        days=get_part("days"),
+        hours=get_part("hours"),
+        minutes=get_part("minutes"),
+        seconds=get_part("seconds"),
+    )
+
+
+def _parse_range(value: str) -> Tuple[Optional[int], Optional[int]]:
+    low, separator, high = value.partition("-")
+    if not separator:
+        high = low
+    if not low and not high:
+        raise ValueError(value)
+    return (int(low) if low else None, int(high) if high else None)
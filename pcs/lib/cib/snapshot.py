@@ -0,0 +1,37 @@
+from copy import deepcopy
+from typing import Optional
+
+from lxml.etree import _Element
+
+from pcs.lib.pacemaker.live import get_cib
+
+
+class CibSnapshot:
+    """
+    CIB loaded once and shared by several readers
+    """
+
+    def __init__(self, cib_xml: str):
+        """
+        cib_xml -- CIB as loaded from a file or a live cluster
+        """
+        self._xml = cib_xml
+        self._tree: Optional[_Element] = None
+
+    @property
+    def xml(self) -> str:
+        return self._xml
+
+    def get_tree(self) -> _Element:
+        """
+        Return the parsed CIB, which is shared and must not be modified
+        """
+        if self._tree is None:
+            self._tree = get_cib(self._xml)
+        return self._tree
+
+    def get_copy(self) -> _Element:
+        """
+        Return the parsed CIB which may be modified by the caller
+        """
+        return deepcopy(self.get_tree())
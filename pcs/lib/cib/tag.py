@@ -22,6 +22,9 @@ from pcs.common.reports import (
     ReportItem,
     ReportItemList,
 )
+from pcs.lib.cib import xpath
+from pcs.lib.cib.constraint_graph import ConstraintGraph
+from pcs.lib.cib.id_index import get_id_index
 from pcs.lib.cib.resource.common import find_resources
 from pcs.lib.cib.tools import (
     ElementSearcher,
@@ -171,11 +174,9 @@ def validate_remove_tag(
             )
         ]
     report_list = []
+    constraint_graph = ConstraintGraph(constraint_section)
     for tag_id in to_remove_tag_list:
-        constraint_list = find_constraints_referencing_tag(
-            constraint_section,
-            tag_id,
-        )
+        constraint_list = constraint_graph.get_constraints(tag_id)
         if constraint_list:
             report_list.append(
                 ReportItem.error(
@@ -468,9 +469,7 @@ class ValidateTagUpdateByIds:
             return None
         xpath_result = cast(
             List[_Element],
-            self._tag_element.xpath(
-                f"./{TAG_OBJREF}[@id=$obj_ref_id]", obj_ref_id=obj_ref_id
-            ),
+            xpath.TAG_OBJ_REF_BY_ID(self._tag_element, obj_ref_id=obj_ref_id),
         )
         return xpath_result[0] if xpath_result else None
 
@@ -485,39 +484,7 @@ def find_constraints_referencing_tag(
     constraints_section -- element constraints
     tag_id -- tag id
     """
-    constraint_list = constraints_section.xpath(
-        """
-        ./rsc_colocation[
-            not (descendant::resource_set)
-            and
-            (@rsc=$tag_id or @with-rsc=$tag_id)
-        ]
-        |
-        ./rsc_location[
-            not (descendant::resource_set)
-            and
-            @rsc=$tag_id
-        ]
-        |
-        ./rsc_order[
-            not (descendant::resource_set)
-            and
-            (@first=$tag_id or @then=$tag_id)
-        ]
-        |
-        ./rsc_ticket[
-            not (descendant::resource_set)
-            and
-            @rsc=$tag_id
-        ]
-        |
-        (./rsc_colocation|./rsc_location|./rsc_order|./rsc_ticket)[
-            ./resource_set/resource_ref[@id=$tag_id]
-        ]
-        """,
-        tag_id=tag_id,
-    )
-    return cast(List[_Element], constraint_list)
+    return ConstraintGraph(constraints_section).get_constraints(tag_id)
 
 
 def find_tag_elements_by_ids(
@@ -557,6 +524,7 @@ def create_tag(
     idref_list -- reference ids which we want to tag
     """
     tag_el = etree.SubElement(tags_section, TAG_TAG, id=tag_id)
+    get_id_index(tag_el).add_element(tag_el)
     for ref_id in idref_list:
         etree.SubElement(tag_el, TAG_OBJREF, id=ref_id)
     return tag_el
@@ -649,13 +617,17 @@ def tag_element_to_dict(
 
 
 def expand_tag(
-    some_or_tag_el: _Element, only_expand_types: Iterable[str] = None
+    some_or_tag_el: _Element,
+    only_expand_types: Iterable[str] = None,
+    constraint_graph: Optional[ConstraintGraph] = None,
 ) -> List[_Element]:
     """
     Substitute a tag element with elements which the tag refers to.
 
     some_or_tag_el -- an already expanded element or a tag element to expand
     only_expand_types -- if specified, return only elements of these types
+    constraint_graph -- resources of the CIB, used to find the referred
+        resources when expanding many tags
     """
     if some_or_tag_el.tag != TAG_TAG:
         return [some_or_tag_el]
@@ -669,7 +641,15 @@ def expand_tag(
         str(obj_ref.get("id", ""))
         for obj_ref in some_or_tag_el.iterfind(TAG_OBJREF)
     ]:
-        if only_expand_types:
+        resource_el = (
+            constraint_graph.get_resource(element_id)
+            if constraint_graph is not None
+            else None
+        )
+        if resource_el is not None:
+            if not only_expand_types or resource_el.tag in only_expand_types:
+                expanded_elements.append(resource_el)
+        elif only_expand_types:
             searcher = ElementSearcher(
                 only_expand_types, element_id, conf_section
             )
@@ -3,9 +3,7 @@ from typing import (
     Iterable,
     List,
     Pattern,
-    Set,
     Tuple,
-    cast,
 )
 
 from lxml.etree import (
@@ -23,16 +21,17 @@ from pcs.common.reports.item import (
     ReportItemList,
 )
 from pcs.common.tools import Version
-from pcs.lib.cib import sections
+from pcs.lib.cib import (
+    sections,
+    xpath,
+)
+from pcs.lib.cib.id_index import get_id_index
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker.values import (
     sanitize_id,
     validate_id,
 )
-from pcs.lib.xml_tools import (
-    get_root,
-    get_sub_element,
-)
+from pcs.lib.xml_tools import get_sub_element
 
 _VERSION_FORMAT = r"(?P<major>\d+)\.(?P<minor>\d+)(\.(?P<rev>\d+))?$"
 
@@ -50,8 +49,7 @@ class IdProvider:
         """
         cib_element -- any element of the xml to check against
         """
-        self._cib = get_root(cib_element)
-        self._booked_ids: Set[str] = set()
+        self._id_index = get_id_index(cib_element)
 
     def allocate_id(self, proposed_id: str) -> str:
         """
@@ -59,8 +57,12 @@ class IdProvider:
 
         string proposed_id -- requested id
         """
-        final_id = find_unique_id(self._cib, proposed_id, self._booked_ids)
-        self._booked_ids.add(final_id)
+        counter = 1
+        final_id = proposed_id
+        while self._id_index.is_id_used(final_id):
+            final_id = "{0}-{1}".format(proposed_id, counter)
+            counter += 1
+        self._id_index.book_id(final_id)
         return final_id
 
     def book_ids(self, *id_list: str) -> ReportItemList:
@@ -72,13 +74,13 @@ class IdProvider:
         for _id in id_list:
             if _id in reported_ids:
                 continue
-            if _id in self._booked_ids or does_id_exist(self._cib, _id):
+            if self._id_index.is_id_used(_id):
                 report_list.append(
                     ReportItem.error(reports.messages.IdAlreadyExists(_id))
                 )
                 reported_ids.add(_id)
                 continue
-            self._booked_ids.add(_id)
+            self._id_index.book_id(_id)
         return report_list
 
 
@@ -200,15 +202,34 @@ class ElementSearcher:
 
     def _execute(self):
         self._executed = True
-        for tag in self._tag_list:
-            element_list = self._context_element.xpath(
-                ".//*[local-name()=$tag_name and @id=$element_id]",
-                tag_name=tag,
-                element_id=self._element_id,
+        if any(tag in xpath.NOT_ID_TAGS for tag in self._tag_list):
+            # such elements are not indexed
+            for tag in self._tag_list:
+                element_list = xpath.DESCENDANTS_BY_TAG_AND_ID(
+                    self._context_element,
+                    tag_name=tag,
+                    element_id=self._element_id,
+                )
+                if element_list:
+                    self._element = element_list[0]
+                    return
+            return
+        element_list = [
+            element
+            for element in get_id_index(self._context_element).get_elements(
+                self._element_id
+            )
+            if element.get("id") == self._element_id
+            and any(
+                ancestor is self._context_element
+                for ancestor in element.iterancestors()
             )
-            if element_list:
-                self._element = element_list[0]
-                return
+        ]
+        for tag in self._tag_list:
+            for element in element_list:
+                if element.tag == tag:
+                    self._element = element
+                    return
 
 
 def get_configuration_elements_by_id(
@@ -223,49 +244,7 @@ def get_configuration_elements_by_id(
         searched
     check_id -- id to find
     """
-    # do not search in /cib/status, it may contain references to previously
-    # existing and deleted resources and thus preventing creating them again
-
-    # pacemaker creates an implicit resource for the pacemaker_remote
-    # connection, which will be named the same as the value of the remote-node
-    # attribute of the explicit resource. So the value of nvpair named
-    # "remote-node" is considered to be id
-    return cast(
-        List[_Element],
-        get_root(tree).xpath(
-            """
-            (
-                /cib/*[name()!="status"]
-                |
-                /*[name()!="cib"]
-            )
-            //*[
-                (
-                    name()!="acl_target"
-                    and
-                    name()!="role"
-                    and
-                    name()!="obj_ref"
-                    and
-                    name()!="resource_ref"
-                    and
-                    @id=$check_id
-                ) or (
-                    name()="primitive"
-                    and
-                    meta_attributes[
-                        nvpair[
-                            @name="remote-node"
-                            and
-                            @value=$check_id
-                        ]
-                    ]
-                )
-            ]
-            """,
-            check_id=check_id,
-        ),
-    )
+    return get_id_index(tree).get_elements(check_id)
 
 
 def get_element_by_id(cib: _Element, element_id: str) -> _Element:
@@ -314,7 +293,12 @@ def does_id_exist(tree, check_id):
     tree cib -- etree node
     check_id -- id to check
     """
-    return len(get_configuration_elements_by_id(tree, check_id)) > 0
+    id_index = get_id_index(tree)
+    if id_index.get_elements(check_id):
+        return True
+    # the caller is likely to create an element with the id
+    id_index.register_id(check_id)
+    return False
 
 
 # DEPRECATED, use IdProvider instead
@@ -339,11 +323,14 @@ def find_unique_id(tree, check_id, reserved_ids=None):
     """
     if not reserved_ids:
         reserved_ids = set()
+    id_index = get_id_index(tree)
     counter = 1
     temp_id = check_id
-    while temp_id in reserved_ids or does_id_exist(tree, temp_id):
+    while temp_id in reserved_ids or id_index.is_id_used(temp_id):
         temp_id = "{0}-{1}".format(check_id, counter)
         counter += 1
+    # the caller is going to create an element with the id
+    id_index.register_id(temp_id)
     return temp_id
 
 
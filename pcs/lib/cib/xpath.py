@@ -0,0 +1,115 @@
+"""
+Compiled XPath queries for searching the CIB
+
+lxml parses and compiles an expression passed to the xpath method of an
+element every time the method is called. Queries run repeatedly, typically in
+loops over resources or ids, are compiled only once here. Values are passed to
+the queries as XPath variables, e.g. NVPAIR_BY_NAME(nvset_el, name="target").
+"""
+from functools import lru_cache
+
+from lxml import etree
+
+# elements with id attributes which do not serve as ids
+NOT_ID_TAGS = ("acl_target", "role", "obj_ref", "resource_ref")
+
+# Do not search in /cib/status, it may contain references to previously
+# existing and deleted resources and thus preventing creating them again.
+_CONFIGURATION = '(/cib/*[name()!="status"] | /*[name()!="cib"])//'
+
+# {0} is a condition on the id attribute
+_ID_ELEMENTS_TEMPLATE = _CONFIGURATION + "*[{{0}} and {0}]".format(
+    " and ".join(f'name()!="{tag}"' for tag in NOT_ID_TAGS)
+)
+
+# Pacemaker creates an implicit resource for the pacemaker_remote connection,
+# which will be named the same as the value of the remote-node attribute of
+# the explicit resource. So the value of nvpair named "remote-node" is
+# considered to be id.
+_REMOTE_NODE_NVPAIRS = (
+    _CONFIGURATION
+    + 'primitive/meta_attributes/nvpair[@name="remote-node" and @value]'
+)
+
+# all configuration elements with an id
+ID_ELEMENTS = etree.XPath(_ID_ELEMENTS_TEMPLATE.format("@id"))
+
+# all remote-node nvpairs in the configuration
+REMOTE_NODE_NVPAIRS = etree.XPath(_REMOTE_NODE_NVPAIRS)
+
+# configuration elements with an id $check_id, primitives with a remote-node
+# named $check_id
+ELEMENTS_BY_ID = etree.XPath(
+    """
+    {0}
+    |
+    {1}[@value=$check_id]/../..
+    """.format(
+        _ID_ELEMENTS_TEMPLATE.format("@id=$check_id"),
+        _REMOTE_NODE_NVPAIRS,
+    )
+)
+
+# remote-node nvpair named $id of a primitive
+REMOTE_NODE_NVPAIR_BY_VALUE = etree.XPath(
+    'meta_attributes/nvpair[@name="remote-node" and @value=$id]'
+)
+
+# descendants with a tag $tag_name
+DESCENDANTS_BY_TAG = etree.XPath(".//*[local-name()=$tag_name]")
+
+# descendants with a tag $tag_name and an id $element_id
+DESCENDANTS_BY_TAG_AND_ID = etree.XPath(
+    ".//*[local-name()=$tag_name and @id=$element_id]"
+)
+
+# nvpair named $name in a nvset element
+NVPAIR_BY_NAME = etree.XPath("./nvpair[@name=$name]")
+
+# non-empty values of nvpairs named $name in nvsets with a tag $tag_name
+NVSET_VALUES_BY_NAME = etree.XPath(
+    """
+    ./*[local-name()=$tag_name]
+    /nvpair[
+        @name=$name and string-length(@value) > 0
+    ]
+    /@value
+    """
+)
+
+# obj_ref with an id $obj_ref_id in a tag
+TAG_OBJ_REF_BY_ID = etree.XPath("./obj_ref[@id=$obj_ref_id]")
+
+# parents of a resource $r, to be evaluated in the resources section:
+# a master or a clone which contains a group, a primitve, or a grouped
+# primitive with the specified id
+# OR
+# a group (in a clone, master, etc. - hence //) which contains a primitive with
+# the specified id
+# OR
+# a bundle which contains a primitive with the specified id
+RESOURCE_PARENTS = etree.XPath(
+    """
+    (./master|./clone)[(group|group/primitive|primitive)[@id=$r]]
+    |
+    //group[primitive[@id=$r]]
+    |
+    ./bundle[primitive[@id=$r]]
+    """
+)
+
+# groups and primitives in a resource
+RESOURCE_CHILDREN = etree.XPath("(./group|./primitive|./group/primitive)")
+
+
+@lru_cache(maxsize=256)
+def get_xpath(expression: str) -> etree.XPath:
+    """
+    Return a compiled query for an expression built at runtime
+
+    Expressions differing only in values would fill the cache, pass the values
+    as XPath variables.
+
+    expression -- XPath expression
+    """
+    return etree.XPath(expression)
@@ -5,6 +5,7 @@ import time
 from typing import (
     Any,
     Container,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -56,6 +57,7 @@ from pcs.lib.communication.corosync import (
     ReloadCorosyncConf,
 )
 from pcs.lib.communication.nodes import (
+    PACEMAKER_STATUS_REQUEST_WAIT,
     CheckPacemakerStarted,
     DistributeFilesWithoutForces,
     EnableCluster,
@@ -63,9 +65,13 @@ from pcs.lib.communication.nodes import (
     GetOnlineTargets,
     RemoveFilesWithoutForces,
     RemoveNodesFromCib,
+    RunTransaction,
     SendPcsdSslCertAndKey,
     StartCluster,
     UpdateKnownHosts,
+    WaitForPacemakerStarted,
+    is_pacemaker_wait_supported,
+    is_transaction_supported,
 )
 from pcs.lib.communication.sbd import (
     CheckSbd,
@@ -73,7 +79,10 @@ from pcs.lib.communication.sbd import (
     EnableSbdService,
     SetSbdConfig,
 )
-from pcs.lib.communication.tools import AllSameDataMixin
+from pcs.lib.communication.tools import (
+    AllSameDataMixin,
+    RunRemotelyBase,
+)
 from pcs.lib.communication.tools import run as run_com
 from pcs.lib.communication.tools import run_and_raise
 from pcs.lib.corosync import (
@@ -324,10 +333,9 @@ def setup(
     # Validate the nodes
     com_cmd: AllSameDataMixin = GetHostInfo(report_processor)
     com_cmd.set_targets(target_list)
+    host_info_dict = run_com(env.get_node_communicator(), com_cmd)
     report_processor.report_list(
-        _host_check_cluster_setup(
-            run_com(env.get_node_communicator(), com_cmd), force
-        )
+        _host_check_cluster_setup(host_info_dict, force)
     )
 
     # If there is an error reading the file, this will report it and exit
@@ -340,10 +348,20 @@ def setup(
     # Validation done. If errors occured, an exception has been raised and we
     # don't get below this line.
 
+    # Prepare the nodes. If the nodes support it, the preparation is sent to
+    # each node in one request instead of waiting for all nodes after each
+    # step.
+    node_actions = _NodeActionBatch(
+        env,
+        is_transaction_supported(
+            host_info_dict, [target.label for target in target_list]
+        ),
+    )
+
     # Destroy cluster on all nodes.
     com_cmd = cluster.Destroy(env.report_processor)
     com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    node_actions.add(com_cmd)
 
     # Distribute auth tokens.
     com_cmd = UpdateKnownHosts(
@@ -354,7 +372,7 @@ def setup(
         known_hosts_to_remove=[],
     )
     com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    node_actions.add(com_cmd)
 
     # TODO This should be in the file distribution call but so far we don't
     # have a call which allows to save and delete files at the same time.
@@ -363,7 +381,7 @@ def setup(
         {"pcsd settings": {"type": "pcsd_settings"}},
     )
     com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    node_actions.add(com_cmd)
 
     if not no_keys_sync:
         # Distribute configuration files except corosync.conf. Sending
@@ -384,7 +402,7 @@ def setup(
         )
         com_cmd = DistributeFilesWithoutForces(env.report_processor, actions)
         com_cmd.set_targets(target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        node_actions.add(com_cmd)
 
         # Distribute and reload pcsd SSL certificate
         if sync_ssl_certs:
@@ -406,7 +424,9 @@ def setup(
                 env.report_processor, ssl_cert, ssl_key
             )
             com_cmd.set_targets(target_list)
-            run_and_raise(env.get_node_communicator(), com_cmd)
+            node_actions.add(com_cmd)
+
+    node_actions.run()
 
     # Create and distribute corosync.conf. Once a node saves corosync.conf it
     # is considered to be in a cluster.
@@ -429,7 +449,20 @@ def setup(
         ),
     )
     com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    commit_command_list: List[RunRemotelyBase] = [com_cmd]
+    if enable:
+        com_cmd = EnableCluster(env.report_processor)
+        com_cmd.set_targets(target_list)
+        commit_command_list.append(com_cmd)
+    if node_actions.use_transaction:
+        # Nodes enable the cluster in the same request once they have saved
+        # corosync.conf.
+        for commit_cmd in commit_command_list:
+            node_actions.add(commit_cmd)
+        node_actions.run()
+        commit_command_list = []
+    else:
+        run_and_raise(env.get_node_communicator(), commit_command_list.pop(0))
 
     if env.report_processor.report(
         ReportItem.info(reports.messages.ClusterSetupSuccess())
@@ -437,16 +470,17 @@ def setup(
         raise LibraryError()
 
     # Optionally enable and start cluster services.
-    if enable:
-        com_cmd = EnableCluster(env.report_processor)
-        com_cmd.set_targets(target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+    for commit_cmd in commit_command_list:
+        run_and_raise(env.get_node_communicator(), commit_cmd)
     if start:
         _start_cluster(
             env.communicator_factory,
             env.report_processor,
             target_list,
             wait_timeout=wait_timeout,
+            long_poll=is_pacemaker_wait_supported(
+                host_info_dict, [target.label for target in target_list]
+            ),
         )
 
 
@@ -1096,9 +1130,10 @@ def add_nodes(
     # Validate new nodes. All new nodes have to be online.
     com_cmd = GetHostInfo(report_processor)
     com_cmd.set_targets(new_nodes_target_list)
+    host_info_dict = run_com(env.get_node_communicator(), com_cmd)
     report_processor.report_list(
         _host_check_cluster_setup(
-            run_com(env.get_node_communicator(), com_cmd),
+            host_info_dict,
             force,
             # version of services may not be the same across the existing
             # cluster nodes, so it's not easy to make this check properly
@@ -1143,6 +1178,16 @@ def add_nodes(
     # command cannot be run again. So we need to minimize the amout of actions
     # (and therefore possible failures) after adding the nodes to corosync.
 
+    # If the new nodes support it, all the actions changing only the new nodes
+    # are sent to each new node in one request instead of waiting for all new
+    # nodes after each step.
+    node_actions = _NodeActionBatch(
+        env,
+        is_transaction_supported(
+            host_info_dict, [target.label for target in new_nodes_target_list]
+        ),
+    )
+
     # distribute auth tokens of all cluster nodes (including the new ones) to
     # all new nodes
     com_cmd = UpdateKnownHosts(
@@ -1153,7 +1198,7 @@ def add_nodes(
         known_hosts_to_remove=[],
     )
     com_cmd.set_targets(new_nodes_target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    node_actions.add(com_cmd)
 
     # qdevice setup
     if qdevice_model == "net":
@@ -1187,15 +1232,15 @@ def add_nodes(
                     device_list=new_node["devices"],
                 ),
             )
-        run_and_raise(env.get_node_communicator(), com_cmd_sbd_cfg)
+        node_actions.add(com_cmd_sbd_cfg)
 
         com_cmd = EnableSbdService(env.report_processor)
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        node_actions.add(com_cmd)
     else:
         com_cmd = DisableSbdService(env.report_processor)
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        node_actions.add(com_cmd)
 
     # booth setup
     booth_sync.send_all_config_to_node(
@@ -1313,7 +1358,7 @@ def add_nodes(
             env.report_processor, files_action
         )
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        node_actions.add(com_cmd)
 
     # Distribute and reload pcsd SSL certificate
     if sync_ssl_certs:
@@ -1358,7 +1403,9 @@ def add_nodes(
 
         com_cmd = SendPcsdSslCertAndKey(env.report_processor, ssl_cert, ssl_key)
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        node_actions.add(com_cmd)
+
+    node_actions.run()
 
     # When corosync >= 2 is in use, the procedure for adding a node is:
     # 1. add the new node to corosync.conf on all existing nodes
@@ -1395,6 +1442,10 @@ def add_nodes(
             env.report_processor,
             new_nodes_target_list,
             wait_timeout=wait_timeout,
+            long_poll=is_pacemaker_wait_supported(
+                host_info_dict,
+                [target.label for target in new_nodes_target_list],
+            ),
         )
 
 
@@ -1410,11 +1461,51 @@ def _ensure_live_env(env: LibraryEnvironment):
         )
 
 
+class _NodeActionBatch:
+    """
+    Run communication commands changing nodes one by one or in a transaction
+
+    In a transaction, all the commands are sent to each node in one request and
+    a node stops at its first failed action. Otherwise, each command is run on
+    all nodes and it must succeed on all of them before the next one is run.
+    """
+
+    def __init__(self, env: LibraryEnvironment, use_transaction: bool):
+        """
+        use_transaction -- run the commands in a transaction
+        """
+        self._env = env
+        self.use_transaction = use_transaction
+        self._command_list: List[RunRemotelyBase] = []
+
+    def add(self, com_cmd: RunRemotelyBase) -> None:
+        """
+        Add a command, it is run immediately if not running in a transaction
+
+        com_cmd -- communication command with targets already set
+        """
+        if self.use_transaction:
+            self._command_list.append(com_cmd)
+        else:
+            run_and_raise(self._env.get_node_communicator(), com_cmd)
+
+    def run(self) -> None:
+        """
+        Run commands added to the transaction, raise LibraryError on errors
+        """
+        if not self._command_list:
+            return
+        com_cmd = RunTransaction(self._env.report_processor, self._command_list)
+        self._command_list = []
+        run_and_raise(self._env.get_node_communicator(), com_cmd)
+
+
 def _start_cluster(
     communicator_factory,
     report_processor: ReportProcessor,
     target_list,
     wait_timeout=False,
+    long_poll=False,
 ):
     # Large clusters take longer time to start up. So we make the timeout
     # longer for each 8 nodes:
@@ -1433,13 +1524,25 @@ def _start_cluster(
         communicator_factory.get_communicator(request_timeout=timeout), com_cmd
     )
     if wait_timeout is not False:
+        if long_poll:
+            # nodes hold the requests up to PACEMAKER_STATUS_REQUEST_WAIT
+            # seconds
+            wait_communicator = communicator_factory.get_communicator(
+                request_timeout=(
+                    PACEMAKER_STATUS_REQUEST_WAIT
+                    + settings.default_request_timeout
+                )
+            )
+        else:
+            wait_communicator = communicator_factory.get_communicator()
         if report_processor.report_list(
             _wait_for_pacemaker_to_start(
-                communicator_factory.get_communicator(),
+                wait_communicator,
                 report_processor,
                 target_list,
                 # wait_timeout is either None or a timeout
                 timeout=wait_timeout,
+                long_poll=long_poll,
             )
         ).has_errors:
             raise LibraryError()
@@ -1450,6 +1553,7 @@ def _wait_for_pacemaker_to_start(
     report_processor: ReportProcessor,
     target_list,
     timeout=None,
+    long_poll=False,
 ):
     timeout = 60 * 15 if timeout is None else timeout
     interval = 2
@@ -1463,14 +1567,23 @@ def _wait_for_pacemaker_to_start(
     )
     error_report_list = []
     has_errors = False
+    # Nodes holding the requests until pacemaker starts are asked right away.
+    # Only the nodes which were not reachable are asked again after a while.
+    sleep_before_check = not long_poll
     while target_list:
         if time.time() > stop_at:
             error_report_list.append(
                 ReportItem.error(reports.messages.WaitForNodeStartupTimedOut())
             )
             break
-        time.sleep(interval)
-        com_cmd = CheckPacemakerStarted(report_processor)
+        if sleep_before_check:
+            time.sleep(interval)
+        com_cmd: CheckPacemakerStarted
+        if long_poll:
+            com_cmd = WaitForPacemakerStarted(report_processor, stop_at)
+            sleep_before_check = True
+        else:
+            com_cmd = CheckPacemakerStarted(report_processor)
         com_cmd.set_targets(target_list)
         target_list = run_com(node_communicator, com_cmd)
         has_errors = has_errors or com_cmd.has_errors
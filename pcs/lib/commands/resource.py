@@ -32,6 +32,7 @@ from pcs.common.tools import (
 )
 from pcs.lib.cib import resource
 from pcs.lib.cib import status as cib_status
+from pcs.lib.cib.constraint_graph import ConstraintGraph
 from pcs.lib.cib.tag import (
     TAG_TAG,
     expand_tag,
@@ -69,6 +70,7 @@ from pcs.lib.pacemaker.live import (
     simulate_cib,
 )
 from pcs.lib.pacemaker.state import (
+    ClusterStateIndex,
     ResourceNotFound,
     ensure_resource_state,
     get_resource_state,
@@ -115,11 +117,11 @@ def _get_resource_state_wait(
     wait_timeout: int = -1,
     wait_for_resource_ids: Optional[Iterable[str]] = None,
     resource_state_reporter: Callable[
-        [_Element, str], ReportItem
+        [ClusterStateIndex, str], ReportItem
     ] = info_resource_state,
 ):
     if wait_timeout >= 0 and wait_for_resource_ids:
-        state = env.get_cluster_state()
+        state = env.get_cluster_state_index()
         if env.report_processor.report_list(
             [
                 resource_state_reporter(state, res_id)
@@ -134,7 +136,7 @@ def _push_cib_wait(
     wait_timeout: int = -1,
     wait_for_resource_ids: Optional[Iterable[str]] = None,
     resource_state_reporter: Callable[
-        [_Element, str], ReportItem
+        [ClusterStateIndex, str], ReportItem
     ] = info_resource_state,
 ) -> None:
     env.push_cib(wait_timeout=wait_timeout)
@@ -1053,7 +1055,7 @@ def _disable_validate_and_edit_cib(
             resource_el_list,
             resource.common.disable,
             IdProvider(cib),
-            env.get_cluster_state(),
+            env.get_cluster_state_index(),
         )
     ).has_errors:
         raise LibraryError()
@@ -1292,7 +1294,7 @@ def enable(
             to_enable_set,
             resource.common.enable,
             IdProvider(cib),
-            env.get_cluster_state(),
+            env.get_cluster_state_index(),
         )
     ).has_errors:
         raise LibraryError()
@@ -2288,11 +2290,19 @@ def _find_resources_expand_tags(
         resource_tags=resource.common.ALL_RESOURCE_XML_TAGS + [TAG_TAG],
     )
 
+    # the graph is built only if there are tags to expand
+    constraint_graph = None
     resource_set = set()
     for el in rsc_or_tag_el_list:
+        if el.tag == TAG_TAG and constraint_graph is None:
+            constraint_graph = ConstraintGraph(
+                resources_section=get_resources(cib)
+            )
         resource_set.update(
             expand_tag(
-                el, only_expand_types=resource.common.ALL_RESOURCE_XML_TAGS
+                el,
+                only_expand_types=resource.common.ALL_RESOURCE_XML_TAGS,
+                constraint_graph=constraint_graph,
             )
         )
     if not additional_search:
@@ -32,6 +32,9 @@ from pcs.lib.resource_agent import (
     ResourceAgentNameDto,
     StandardProviderTuple,
     find_one_resource_agent_by_type,
+    get_index_cache,
+    get_metadata_cache,
+    list_all_resource_agents,
     list_resource_agents,
     list_resource_agents_ocf_providers,
     list_resource_agents_standards,
@@ -42,6 +45,18 @@ from pcs.lib.resource_agent import (
 from pcs.lib.resource_agent.name import name_to_void_metadata
 
 
+def clear_metadata_cache(lib_env: LibraryEnvironment) -> None:
+    """
+    Remove all cached resource and stonith agents metadata and names
+
+    Cached metadata are invalidated automatically once an agent is updated.
+    This forces reloading them from all agents.
+    """
+    # pylint: disable=unused-argument
+    get_metadata_cache().clear()
+    get_index_cache().clear()
+
+
 def list_standards(lib_env: LibraryEnvironment) -> List[str]:
     """
     List resource agents standards (ocf, lsb, ... ) on the local host
@@ -101,13 +116,9 @@ def list_agents(
     search -- return only agents which name contains this string
     """
     runner = lib_env.cmd_runner()
-
-    # list agents for all standards and providers
-    agent_names = []
-    for std_prov in list_resource_agents_standards_and_providers(runner):
-        if std_prov.is_stonith:
-            continue
-        agent_names.extend(_get_agent_names(runner, std_prov))
+    agent_names = [
+        name for name in list_all_resource_agents(runner) if not name.is_stonith
+    ]
     return _complete_agent_list(
         runner,
         lib_env.report_processor,
@@ -132,10 +143,7 @@ def get_agents_list(lib_env: LibraryEnvironment) -> ListResourceAgentNameDto:
     """
     List all resource agents on the local host
     """
-    runner = lib_env.cmd_runner()
-    agent_names = []
-    for std_prov in list_resource_agents_standards_and_providers(runner):
-        agent_names.extend(_get_agent_names(runner, std_prov))
+    agent_names = list_all_resource_agents(lib_env.cmd_runner())
     return ListResourceAgentNameDto(
         names=[
             name.to_dto()
@@ -61,6 +61,11 @@ def get_services_info(
     for services not specified in `services`
     """
     service_set = set(services)
+    state_dict = (
+        env.service_manager.get_states(sorted(service_set))
+        if enabled or running
+        else {}
+    )
     return ServicesInfoResultDto(
         [
             ServiceStatusDto(
@@ -71,12 +76,12 @@ def get_services_info(
                     else None
                 ),
                 (
-                    env.service_manager.is_enabled(service)
+                    state_dict[service].enabled
                     if enabled and service in service_set
                     else None
                 ),
                 (
-                    env.service_manager.is_running(service)
+                    state_dict[service].running
                     if running and service in service_set
                     else None
                 ),
@@ -17,6 +17,7 @@ from pcs.common.node_communicator import Communicator
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports.item import ReportItem
 from pcs.common.services.interfaces import ServiceManagerInterface
+from pcs.common.services.types import ServiceState
 from pcs.common.str_tools import (
     format_list,
     indent,
@@ -120,13 +121,15 @@ def full_cluster_status_plaintext(
     # get extra info if live
     if live:
         service_manager = env.service_manager
-        try:
-            is_sbd_running = service_manager.is_running(
-                get_sbd_service_name(service_manager)
-            )
-        except LibraryError:
-            pass
-        local_services_status = _get_local_services_status(service_manager)
+        sbd_service_name = get_sbd_service_name(service_manager)
+        local_services_status = _get_local_services_status(
+            service_manager, sbd_service_name
+        )
+        is_sbd_running = any(
+            status.running
+            for status in local_services_status
+            if status.service == sbd_service_name
+        )
         if verbose and corosync_conf:
             node_name_list, node_names_report_list = get_existing_nodes_names(
                 corosync_conf
@@ -230,7 +233,7 @@ def _stonith_warnings(cib: _Element, is_sbd_running: bool) -> List[str]:
 
 
 def _get_local_services_status(
-    service_manager: ServiceManagerInterface,
+    service_manager: ServiceManagerInterface, sbd_service_name: str
 ) -> List[_ServiceStatus]:
     service_def = [
         # (service name, display even if not enabled nor running)
@@ -238,22 +241,37 @@ def _get_local_services_status(
         ("pacemaker", True),
         ("pacemaker_remote", False),
         ("pcsd", True),
-        (get_sbd_service_name(service_manager), False),
+        (sbd_service_name, False),
     ]
-    service_status_list = []
-    for service, display_always in service_def:
-        try:
-            service_status_list.append(
-                _ServiceStatus(
-                    service,
-                    display_always,
+    state_dict: Mapping[str, ServiceState]
+    try:
+        # get states of all services at once, it is much faster
+        state_dict = service_manager.get_states(
+            [service for service, dummy_display in service_def]
+        )
+    except LibraryError:
+        # check the services one by one, so that a failure for one of them
+        # does not hide the others
+        single_state_dict = {}
+        for service, dummy_display in service_def:
+            try:
+                single_state_dict[service] = ServiceState(
                     service_manager.is_enabled(service),
                     service_manager.is_running(service),
                 )
-            )
-        except LibraryError:
-            pass
-    return service_status_list
+            except LibraryError:
+                pass
+        state_dict = single_state_dict
+    return [
+        _ServiceStatus(
+            service,
+            display_always,
+            state_dict[service].enabled,
+            state_dict[service].running,
+        )
+        for service, display_always in service_def
+        if service in state_dict
+    ]
 
 
 def _format_local_services_status(
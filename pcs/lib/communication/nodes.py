@@ -1,7 +1,13 @@
 import json
+import math
+import time
 
 from pcs.common import reports
-from pcs.common.node_communicator import RequestData
+from pcs.common.node_communicator import (
+    Request,
+    RequestData,
+    Response,
+)
 from pcs.common.reports import ReportItemSeverity
 from pcs.common.reports import codes as report_codes
 from pcs.common.reports.item import ReportItem
@@ -16,6 +22,13 @@ from pcs.lib.communication.tools import (
 )
 from pcs.lib.node_communication import response_to_report_item
 
+# pcsd capability of running requests in a transaction
+_TRANSACTION_CAPABILITY = "pcs.remote.transaction"
+_PACEMAKER_WAIT_CAPABILITY = "pcs.remote.pacemaker-node-status.wait"
+# the longest time a node is asked to hold a pacemaker status request, nodes
+# cap the requested time by their own limit
+PACEMAKER_STATUS_REQUEST_WAIT = 30
+
 
 class GetOnlineTargets(
     AllSameDataMixin, AllAtOnceStrategyMixin, RunRemotelyBase
@@ -436,8 +449,7 @@ class CheckPacemakerStarted(
                 if parsed_response.get(
                     "pending", True
                 ) or not parsed_response.get("online", False):
-                    self._not_yet_started_target_list.append(target)
-                    return
+                    return self._on_not_started(target)
                 report = ReportItem.info(
                     reports.messages.ClusterStartSuccess(target.label)
                 )
@@ -453,6 +465,10 @@ class CheckPacemakerStarted(
                     response, severity=ReportItemSeverity.WARNING
                 )
         self._report(report)
+        return None
+
+    def _on_not_started(self, target):
+        self._not_yet_started_target_list.append(target)
 
     def before(self):
         self._not_yet_started_target_list = []
@@ -461,6 +477,41 @@ class CheckPacemakerStarted(
         return self._not_yet_started_target_list
 
 
+class WaitForPacemakerStarted(CheckPacemakerStarted):
+    """
+    Wait until pacemaker is fully started on nodes or until a time passes
+
+    Each node holds a request until pacemaker is started on it or until its
+    wait time passes. A node with pacemaker not started yet is asked again
+    right after it responds, so there is only one request per node at a time.
+    Returns nodes which have not started before the time passed or which are
+    not reachable.
+    """
+
+    def __init__(self, report_processor, stop_at):
+        """
+        float stop_at -- time.time() after which the nodes are not asked again
+        """
+        super().__init__(report_processor)
+        self._stop_at = stop_at
+
+    def _get_wait(self):
+        return min(
+            PACEMAKER_STATUS_REQUEST_WAIT,
+            max(0, math.ceil(self._stop_at - time.time())),
+        )
+
+    def _get_request_data(self):
+        return RequestData(
+            "remote/pacemaker_node_status", [("wait", self._get_wait())]
+        )
+
+    def _on_not_started(self, target):
+        if self._get_wait() > 0:
+            return [Request(target, self._get_request_data())]
+        return super()._on_not_started(target)
+
+
 class UpdateKnownHosts(
     SimpleResponseProcessingNoResponseOnSuccessMixin,
     AllSameDataMixin,
@@ -552,6 +603,157 @@ class SendPcsdSslCertAndKey(
         )
 
 
+class RunTransaction(RunRemotelyBase):
+    """
+    Run requests of several communication commands in one request to each node
+
+    The requests are run on each node in the order of the commands and each
+    node stops at the first failed request. Responses to the requests are
+    processed by the commands as if the requests were sent separately. Only
+    commands sending at most one request to each node without any follow-up
+    requests are supported.
+    """
+
+    _report_pcsd_too_old_on_404 = True
+
+    def __init__(self, report_processor, command_list):
+        """
+        list command_list -- communication commands with targets already set
+        """
+        super().__init__(report_processor)
+        self._command_list = command_list
+        self._action_list_by_target = {}
+
+    def get_initial_request_list(self):
+        self._action_list_by_target = {}
+        target_list = []
+        for command in self._command_list:
+            for request in command.get_initial_request_list():
+                label = request.target.label
+                if label not in self._action_list_by_target:
+                    self._action_list_by_target[label] = []
+                    target_list.append(request.target)
+                self._action_list_by_target[label].append((command, request))
+        return [
+            Request(target, self._get_request_data(target.label))
+            for target in target_list
+        ]
+
+    def _get_request_data(self, target_label):
+        action_list = [
+            dict(
+                action=_get_remote_action_name(request.action),
+                data=request.data,
+            )
+            for dummy_command, request in self._action_list_by_target[
+                target_label
+            ]
+        ]
+        return RequestData(
+            "remote/run_transaction",
+            [("data_json", json.dumps(dict(actions=action_list)))],
+        )
+
+    def _process_response(self, response):
+        report = self._get_response_report(response)
+        if report:
+            self._report(report)
+            return
+        target = response.request.target
+        try:
+            result_list = [
+                (int(result["code"]), str(result["output"]))
+                for result in json.loads(response.data)["results"]
+            ]
+        except (ValueError, TypeError, KeyError):
+            self._report(
+                ReportItem.error(
+                    reports.messages.InvalidResponseFormat(target.label)
+                )
+            )
+            return
+        # The node does not return results of actions following a failed one.
+        for (command, request), (code, output) in zip(
+            self._action_list_by_target[target.label], result_list
+        ):
+            command.on_response(_ActionResponse(request, code, output))
+
+    def before(self):
+        for command in self._command_list:
+            command.before()
+
+    def on_complete(self):
+        return [command.on_complete() for command in self._command_list]
+
+    @property
+    def has_errors(self):
+        return super().has_errors or any(
+            command.has_errors for command in self._command_list
+        )
+
+
+def is_transaction_supported(host_info_dict, target_label_list):
+    """
+    Check if all nodes are able to run requests in a transaction
+
+    dict host_info_dict -- responses of GetHostInfo by node labels
+    list target_label_list -- labels of the nodes to check
+    """
+    return _is_capability_supported(
+        host_info_dict, target_label_list, _TRANSACTION_CAPABILITY
+    )
+
+
+def is_pacemaker_wait_supported(host_info_dict, target_label_list):
+    """
+    Check if all nodes are able to hold requests until pacemaker starts
+
+    dict host_info_dict -- responses of GetHostInfo by node labels
+    list target_label_list -- labels of the nodes to check
+    """
+    return _is_capability_supported(
+        host_info_dict, target_label_list, _PACEMAKER_WAIT_CAPABILITY
+    )
+
+
+def _is_capability_supported(host_info_dict, target_label_list, capability):
+    return bool(target_label_list) and all(
+        isinstance(host_info_dict.get(label), dict)
+        and capability in host_info_dict[label].get("pcsd_capabilities", [])
+        for label in target_label_list
+    )
+
+
+class _ActionResponse(Response):
+    """
+    Response to a request which has been run in a transaction
+    """
+
+    def __init__(self, request, response_code, data):
+        super().__init__(None, True)
+        self._request = request
+        self._response_code = response_code
+        self._data = data
+        self._debug = ""
+
+    @property
+    def request(self):
+        return self._request
+
+    @property
+    def response_code(self):
+        return self._response_code
+
+
+def _get_remote_action_name(action):
+    prefix = "remote/"
+    if not action.startswith(prefix):
+        raise AssertionError(
+            f"Action '{action}' cannot be run in a transaction"
+        )
+    return action[len(prefix) :]
+
+
 def _force(force_code, is_forced):
     if is_forced:
         return dict(
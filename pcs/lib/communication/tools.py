@@ -79,6 +79,53 @@ def run_and_raise(communicator, cmd):
     return to_return
 
 
+async def iter_responses_async(communicator, cmd):
+    """
+    Run communication command asynchronously. Returns asynchronous generator
+    yielding responses as they arrive, after they have been processed by the
+    communication command. Method on_complete() of the command is not called.
+
+    AsyncCommunicator communicator -- object used for communication
+    CommunicationCommandInterface cmd
+    """
+    cmd.before()
+    communicator.add_requests(cmd.get_initial_request_list())
+    async for response in communicator.start_loop():
+        extra_requests = cmd.on_response(response)
+        if extra_requests:
+            communicator.add_requests(extra_requests)
+        yield response
+
+
+async def run_async(communicator, cmd):
+    """
+    Run communication command asynchronously. Returns return value of method
+    on_complete() of communcation command after run.
+
+    AsyncCommunicator communicator -- object used for communication
+    CommunicationCommandInterface cmd
+    """
+    async for dummy_response in iter_responses_async(communicator, cmd):
+        pass
+    return cmd.on_complete()
+
+
+async def run_and_raise_async(communicator, cmd):
+    """
+    Run communication command asynchronously. Returns return value of method
+    on_complete() of communcation command after run.
+    Raises LibraryError (with no report item) when some errors occured while
+    running communication command.
+
+    AsyncCommunicator communicator -- object used for communication
+    CommunicationCommandInterface cmd
+    """
+    to_return = await run_async(communicator, cmd)
+    if cmd.has_errors:
+        raise LibraryError()
+    return to_return
+
+
 class RunRemotelyBase(CommunicationCommandInterface):
     """
     Abstract class for communication commands. This class provides methods for
@@ -156,6 +203,9 @@ class StrategyBase:
     """
     Abstract base class of the communication strategies. Always use at most one
     strategy mixin in the communication commands classes.
+
+    The strategies only decide which requests to send next, so they work the
+    same way with run and run_async.
     """
 
     def _prepare_initial_requests(self):
@@ -168,6 +168,13 @@ class QuorumStatus:
         """
         return self._data["quorum"]
 
+    @property
+    def node_names(self):
+        """
+        Names of nodes which are members of the partition
+        """
+        return [node_info["name"] for node_info in self._data["node_list"]]
+
     @property
     def qdevice_votes(self):
         """
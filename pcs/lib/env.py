@@ -1,3 +1,4 @@
+import time
 from typing import (
     Mapping,
     Optional,
@@ -7,12 +8,15 @@ from typing import (
 
 from lxml.etree import _Element
 
+from pcs import settings
 from pcs.common import (
     file_type_codes,
     reports,
 )
 from pcs.common.node_communicator import (
+    AsyncCommunicator,
     Communicator,
+    ConnectionPool,
     NodeCommunicatorFactory,
 )
 from pcs.common.reports import ReportProcessor
@@ -20,6 +24,10 @@ from pcs.common.reports.item import ReportItem
 from pcs.common.services.interfaces import ServiceManagerInterface
 from pcs.common.tools import Version
 from pcs.lib.booth.env import BoothEnv
+from pcs.lib.cib.patchset import (
+    PatchsetNotSupported,
+    create_patchset_xml,
+)
 from pcs.lib.communication import qdevice
 from pcs.lib.communication.corosync import (
     CheckCorosyncOffline,
@@ -55,6 +63,7 @@ from pcs.lib.pacemaker.live import (
     replace_cib_configuration,
     wait_for_idle,
 )
+from pcs.lib.pacemaker.state import ClusterStateIndex
 from pcs.lib.pacemaker.values import get_valid_timeout_seconds
 from pcs.lib.services import get_service_manager
 from pcs.lib.tools import create_tmp_cib
@@ -95,6 +104,7 @@ class LibraryEnvironment:
         booth_files_data=None,
         known_hosts_getter=None,
         request_timeout=None,
+        cib_snapshot=None,
     ):
         # pylint: disable=too-many-arguments
         self._logger = logger
@@ -102,6 +112,8 @@ class LibraryEnvironment:
         self._user_login = user_login
         self._user_groups = [] if user_groups is None else user_groups
         self._cib_data = cib_data
+        # pcs.lib.cib.snapshot.CibSnapshot, used instead of loading the CIB
+        self._cib_snapshot = cib_snapshot
         self._corosync_conf_data = corosync_conf_data
         self._booth_files_data = booth_files_data or {}
         self._request_timeout = request_timeout
@@ -114,11 +126,16 @@ class LibraryEnvironment:
         self._cib_data_tmp_file = None
         self.__loaded_cib_diff_source = None
         self.__loaded_cib_to_modify = None
+        self._loaded_cluster_state: Optional[_Element] = None
+        self._loaded_cluster_state_index: Optional[ClusterStateIndex] = None
+        self._cluster_state_loaded_at = 0.0
         self._communicator_factory = NodeCommunicatorFactory(
             LibCommunicatorLogger(self.logger, self.report_processor),
             self.user_login,
             self.user_groups,
             self._request_timeout,
+            # connections are kept open for all requests of a command
+            ConnectionPool(),
         )
         self.__loaded_booth_env = None
         self.__loaded_dr_env = None
@@ -157,8 +174,12 @@ class LibraryEnvironment:
         if self.__loaded_cib_diff_source is not None:
             raise AssertionError("CIB has already been loaded")
 
-        self.__loaded_cib_diff_source = get_cib_xml(self.cmd_runner())
-        self.__loaded_cib_to_modify = get_cib(self.__loaded_cib_diff_source)
+        if self._cib_snapshot is not None:
+            self.__loaded_cib_diff_source = self._cib_snapshot.xml
+            self.__loaded_cib_to_modify = self._cib_snapshot.get_copy()
+        else:
+            self.__loaded_cib_diff_source = get_cib_xml(self.cmd_runner())
+            self.__loaded_cib_to_modify = get_cib(self.__loaded_cib_diff_source)
 
         if (
             nice_to_have_version is not None
@@ -198,7 +219,41 @@ class LibraryEnvironment:
         return self.__loaded_cib_to_modify
 
     def get_cluster_state(self):
-        return get_cluster_status_dom(self.cmd_runner())
+        """
+        Return the cluster status
+
+        The status is reused for a short time so that checking several
+        resources does not run crm_mon repeatedly. It is read again once the
+        CIB has been pushed or the cluster has been waited for.
+        """
+        now = time.monotonic()
+        if (
+            self._loaded_cluster_state is None
+            or now - self._cluster_state_loaded_at
+            >= settings.pacemaker_status_cache_ttl_seconds
+        ):
+            self._loaded_cluster_state = get_cluster_status_dom(
+                self.cmd_runner()
+            )
+            self._loaded_cluster_state_index = None
+            self._cluster_state_loaded_at = now
+        return self._loaded_cluster_state
+
+    def get_cluster_state_index(self) -> ClusterStateIndex:
+        """
+        Return an index of resources of the cluster status
+
+        The index is kept together with the status returned by
+        get_cluster_state and it is dropped once the status is read again.
+        """
+        cluster_state = self.get_cluster_state()
+        if self._loaded_cluster_state_index is None:
+            self._loaded_cluster_state_index = ClusterStateIndex(cluster_state)
+        return self._loaded_cluster_state_index
+
+    def _drop_cluster_state(self) -> None:
+        self._loaded_cluster_state = None
+        self._loaded_cluster_state_index = None
 
     def wait_for_idle(self, timeout: int = 0) -> None:
         """
@@ -207,6 +262,8 @@ class LibraryEnvironment:
         timeout -- timeout in seconds, if less than 0 wait will be skipped, if 0
             wait indefinitely
         """
+        # the cluster is going to settle down to a new state
+        self._drop_cluster_state()
         if timeout < 0:
             # timeout is turned off
             return
@@ -269,17 +326,32 @@ class LibraryEnvironment:
         )
 
     def __main_push_cib_diff(self, cmd_runner):
-        cib_diff_xml = diff_cibs_xml(
-            cmd_runner,
-            self.report_processor,
-            self.__loaded_cib_diff_source,
-            etree_to_str(self.__loaded_cib_to_modify),
-        )
+        cib_diff_xml = self.__get_cib_diff_xml(cmd_runner)
         if cib_diff_xml:
             push_cib_diff_xml(cmd_runner, cib_diff_xml)
 
+    def __get_cib_diff_xml(self, cmd_runner) -> str:
+        # Compute the diff natively, it saves writing both CIBs to temporary
+        # files and running crm_diff. The patchset gets verified, crm_diff is
+        # used for changes which cannot be expressed by the native engine.
+        try:
+            return create_patchset_xml(
+                get_cib(self.__loaded_cib_diff_source),
+                self.__loaded_cib_to_modify,
+            )
+        except PatchsetNotSupported:
+            return diff_cibs_xml(
+                cmd_runner,
+                self.report_processor,
+                self.__loaded_cib_diff_source,
+                etree_to_str(self.__loaded_cib_to_modify),
+            )
+
     def __do_push_cib(self, push_strategy, wait_timeout: int):
         push_strategy()
+        # the pushed CIB differs from the snapshot, load it again if needed
+        self._cib_snapshot = None
+        self._drop_cluster_state()
         self._cib_upgrade_reported = False
         self.__loaded_cib_diff_source = None
         self.__loaded_cib_to_modify = None
@@ -474,6 +546,14 @@ class LibraryEnvironment:
             request_timeout=request_timeout
         )
 
+    def get_async_node_communicator(
+        self,
+        request_timeout: Optional[int] = None,
+    ) -> AsyncCommunicator:
+        return self.communicator_factory.get_async_communicator(
+            request_timeout=request_timeout
+        )
+
     def get_node_target_factory(self) -> NodeTargetLibFactory:
         return NodeTargetLibFactory(
             self.__get_known_hosts(), self.report_processor
@@ -1,8 +1,12 @@
 import signal
 import subprocess
-from logging import Logger
+from logging import (
+    DEBUG,
+    Logger,
+)
 from shlex import quote as shell_quote
 from typing import (
+    Any,
     Dict,
     Mapping,
     Optional,
@@ -61,40 +65,46 @@ class CommandRunner:
         env_vars.update(dict(env_extend) if env_extend else {})
 
         log_args = " ".join([shell_quote(x) for x in args])
-        self._logger.debug(
-            "Running: {args}\nEnvironment:{env_vars}{stdin_string}".format(
-                args=log_args,
-                stdin_string=(
-                    ""
-                    if not stdin_string
-                    else (
-                        "\n--Debug Input Start--\n{0}\n--Debug Input End--"
-                    ).format(stdin_string)
-                ),
-                env_vars=(
-                    ""
-                    if not env_vars
-                    else (
-                        "\n"
-                        + "\n".join(
-                            [
-                                "  {0}={1}".format(key, val)
-                                for key, val in sorted(env_vars.items())
-                            ]
+        # Inputs and outputs may be huge (e.g. CIB). Do not build debug
+        # messages containing their copies unless someone uses them.
+        log_debug = self._logger.isEnabledFor(DEBUG)
+        report_debug = self._reporter.is_debug_enabled
+        if log_debug:
+            self._logger.debug(
+                "Running: {args}\nEnvironment:{env_vars}{stdin_string}".format(
+                    args=log_args,
+                    stdin_string=(
+                        ""
+                        if not stdin_string
+                        else (
+                            "\n--Debug Input Start--\n{0}\n--Debug Input End--"
+                        ).format(_limit_debug_output(stdin_string))
+                    ),
+                    env_vars=(
+                        ""
+                        if not env_vars
+                        else (
+                            "\n"
+                            + "\n".join(
+                                [
+                                    "  {0}={1}".format(key, val)
+                                    for key, val in sorted(env_vars.items())
+                                ]
+                            )
                         )
-                    )
-                ),
+                    ),
+                )
             )
-        )
-        self._reporter.report(
-            ReportItem.debug(
-                reports.messages.RunExternalProcessStarted(
-                    log_args,
-                    stdin_string,
-                    env_vars,
+        if report_debug:
+            self._reporter.report(
+                ReportItem.debug(
+                    reports.messages.RunExternalProcessStarted(
+                        log_args,
+                        _limit_debug_output(stdin_string),
+                        env_vars,
+                    )
                 )
             )
-        )
 
         try:
             # pylint: disable=subprocess-popen-preexec-fn, consider-using-with
@@ -130,28 +140,49 @@ class CommandRunner:
                 )
             ) from e
 
-        self._logger.debug(
-            (
-                "Finished running: {args}\nReturn value: {retval}"
-                + "\n--Debug Stdout Start--\n{out_std}\n--Debug Stdout End--"
-                + "\n--Debug Stderr Start--\n{out_err}\n--Debug Stderr End--"
-            ).format(
-                args=log_args, retval=retval, out_std=out_std, out_err=out_err
+        if log_debug:
+            self._logger.debug(
+                (
+                    "Finished running: {args}\nReturn value: {retval}"
+                    + "\n--Debug Stdout Start--\n{out_std}\n--Debug Stdout End--"
+                    + "\n--Debug Stderr Start--\n{out_err}\n--Debug Stderr End--"
+                ).format(
+                    args=log_args,
+                    retval=retval,
+                    out_std=_limit_debug_output(out_std),
+                    out_err=_limit_debug_output(out_err),
+                )
             )
-        )
-        self._reporter.report(
-            ReportItem.debug(
-                reports.messages.RunExternalProcessFinished(
-                    log_args,
-                    retval,
-                    out_std,
-                    out_err,
+        if report_debug:
+            self._reporter.report(
+                ReportItem.debug(
+                    reports.messages.RunExternalProcessFinished(
+                        log_args,
+                        retval,
+                        _limit_debug_output(out_std),
+                        _limit_debug_output(out_err),
+                    )
                 )
             )
-        )
         return out_std, out_err, retval
 
 
+def _limit_debug_output(output: Any) -> Any:
+    """
+    Shorten process input or output to be put to debug messages
+
+    output -- string or bytes, None if there was no input / output
+    """
+    limit = settings.external_process_debug_output_max_chars
+    if output is None or limit is None or len(output) <= limit:
+        return output
+    if isinstance(output, bytes):
+        return output[:limit]
+    return "{0}\n... ({1} characters truncated)".format(
+        output[:limit], len(output) - limit
+    )
+
+
 def kill_services(runner, services):
     """
     Kill specified services in local system
@@ -6,6 +6,11 @@ from collections import defaultdict
 from typing import (
     Any,
     Dict,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    Union,
 )
 
 from lxml import etree
@@ -19,16 +24,12 @@ from pcs.lib.pacemaker.values import (
     is_false,
     is_true,
 )
-from pcs.lib.xml_tools import find_parent
 
 
 class ResourceNotFound(Exception):
     pass
 
 
-_id_xpath_predicate = "(@id=$id or starts-with(@id, concat($id, ':')))"
-
-
 class _Attrs:
     def __init__(self, owner_name, attrib, required_attrs):
         """
@@ -167,44 +168,280 @@ class ClusterState(_Element):
     }
 
 
+class PrimitiveInstance:
+    """
+    An instance of a primitive resource in the cluster status
+
+    Cloned and bundled primitives are represented by several instances.
+    """
+
+    __slots__ = (
+        "id",
+        "role",
+        "failed",
+        "unmanaged",
+        "parent_unmanaged",
+        "node_names",
+        "position",
+    )
+
+    def __init__(
+        self,
+        resource_id: str,
+        role: str,
+        failed: bool,
+        unmanaged: bool,
+        parent_unmanaged: bool,
+        node_names: Sequence[str],
+        position: int,
+    ):
+        # pylint: disable=too-many-arguments
+        self.id = resource_id  # pylint: disable=invalid-name
+        self.role = role
+        self.failed = failed
+        # the instance is explicitly marked as unmanaged
+        self.unmanaged = unmanaged
+        # the closest clone or bundle the instance is placed in is unmanaged
+        self.parent_unmanaged = parent_unmanaged
+        self.node_names = node_names
+        # position in the cluster status, keeps the document order
+        self.position = position
+
+
+class ClusterStateIndex:
+    """
+    Primitive resource instances of a cluster status indexed by resource ids
+
+    The cluster status is read in one pass, queries do not search the xml.
+    """
+
+    def __init__(self, cluster_state: etree._Element):
+        """
+        cluster_state -- status of the cluster
+        """
+        # primitives by their ids, an instance "R:1" is available as "R" too
+        self._primitives: Dict[str, List[PrimitiveInstance]] = {}
+        # members of groups by group ids, "G:1" is available as "G" too
+        self._groups: Dict[str, List[List[PrimitiveInstance]]] = {}
+        # primitives and members of groups placed directly in clones
+        self._clone_primitives: Dict[str, List[PrimitiveInstance]] = {}
+        self._clone_groups: Dict[str, List[List[PrimitiveInstance]]] = {}
+        # primitives placed directly in replicas of bundles
+        self._bundle_primitives: Dict[str, List[PrimitiveInstance]] = {}
+        # clones and bundles: unmanaged flag and all their primitives
+        self._parents: Dict[str, Tuple[bool, List[PrimitiveInstance]]] = {}
+        self._by_node: Dict[str, List[PrimitiveInstance]] = {}
+        self._position = 0
+        self._index_children(cluster_state, False)
+
+    def get_primitives_for_state_check(
+        self, resource_id: str, expected_running: bool
+    ) -> List[PrimitiveInstance]:
+        """
+        Return not failed primitive instances relevant for a resource state
+
+        Only the last member of a group is relevant if the group is expected
+        to be running, only the first one if it is expected to be stopped.
+
+        resource_id -- id of the resource to get the primitives of
+        expected_running -- is the resource expected to be running
+        """
+        member_index = -1 if expected_running else 0
+        primitive_list = list(self._primitives.get(resource_id, []))
+        primitive_list.extend(self._clone_primitives.get(resource_id, []))
+        primitive_list.extend(self._bundle_primitives.get(resource_id, []))
+        for member_list in self._groups.get(
+            resource_id, []
+        ) + self._clone_groups.get(resource_id, []):
+            if member_list:
+                primitive_list.append(member_list[member_index])
+        return [
+            primitive
+            for primitive in _unique_in_document_order(primitive_list)
+            if not primitive.failed
+        ]
+
+    def is_resource_managed(self, resource_id: str) -> bool:
+        """
+        Check if the resource is managed
+
+        resource_id -- id of the resource
+        """
+        primitive_list = list(self._primitives.get(resource_id, []))
+        for member_list in self._groups.get(resource_id, []):
+            primitive_list.extend(member_list)
+        if primitive_list:
+            return not any(
+                primitive.unmanaged or primitive.parent_unmanaged
+                for primitive in primitive_list
+            )
+        if resource_id in self._parents:
+            unmanaged, primitive_list = self._parents[resource_id]
+            return not unmanaged and not any(
+                primitive.unmanaged for primitive in primitive_list
+            )
+        raise ResourceNotFound(resource_id)
+
+    def get_node_primitives(self, node_name: str) -> List[PrimitiveInstance]:
+        """
+        Return primitive instances placed on a node
+
+        node_name -- name of the node
+        """
+        return list(self._by_node.get(node_name, []))
+
+    def _index_children(
+        self, element: etree._Element, parent_unmanaged: bool
+    ) -> List[PrimitiveInstance]:
+        primitive_list = []
+        for child in element:
+            primitive_list.extend(self._index_element(child, parent_unmanaged))
+        return primitive_list
+
+    def _index_element(
+        self, element: etree._Element, parent_unmanaged: bool
+    ) -> List[PrimitiveInstance]:
+        if element.tag == "resource":
+            return [self._index_primitive(element, parent_unmanaged)]
+        if element.tag == "group":
+            return self._index_group(element, parent_unmanaged)[0]
+        if element.tag == "clone":
+            return self._index_clone(element)
+        if element.tag == "bundle":
+            return self._index_bundle(element)
+        return self._index_children(element, parent_unmanaged)
+
+    def _index_primitive(
+        self, element: etree._Element, parent_unmanaged: bool
+    ) -> PrimitiveInstance:
+        primitive = PrimitiveInstance(
+            str(element.get("id", "")),
+            str(element.get("role", "")),
+            is_true(element.get("failed", "")),
+            is_false(element.get("managed", "")),
+            parent_unmanaged,
+            [str(node.get("name")) for node in element.iterfind(".//node")],
+            self._position,
+        )
+        self._position += 1
+        if element.get("id") is not None:
+            for key in _get_id_keys(primitive.id):
+                self._primitives.setdefault(key, []).append(primitive)
+        for node_name in primitive.node_names:
+            self._by_node.setdefault(node_name, []).append(primitive)
+        return primitive
+
+    def _index_group(
+        self, element: etree._Element, parent_unmanaged: bool
+    ) -> Tuple[List[PrimitiveInstance], List[PrimitiveInstance]]:
+        primitive_list = []
+        member_list = []
+        for child in element:
+            child_primitive_list = self._index_element(child, parent_unmanaged)
+            primitive_list.extend(child_primitive_list)
+            if child.tag == "resource":
+                member_list.extend(child_primitive_list)
+        if element.get("id") is not None:
+            for key in _get_id_keys(str(element.get("id"))):
+                self._groups.setdefault(key, []).append(member_list)
+        return primitive_list, member_list
+
+    def _index_clone(self, element: etree._Element) -> List[PrimitiveInstance]:
+        unmanaged = is_false(element.get("managed", ""))
+        primitive_list = []
+        clone_primitive_list = []
+        clone_group_list = []
+        for child in element:
+            if child.tag == "group":
+                child_primitive_list, member_list = self._index_group(
+                    child, unmanaged
+                )
+                clone_group_list.append(member_list)
+            else:
+                child_primitive_list = self._index_element(child, unmanaged)
+                if child.tag == "resource":
+                    clone_primitive_list.extend(child_primitive_list)
+            primitive_list.extend(child_primitive_list)
+        if element.get("id") is not None:
+            element_id = str(element.get("id"))
+            self._clone_primitives.setdefault(element_id, []).extend(
+                clone_primitive_list
+            )
+            self._clone_groups.setdefault(element_id, []).extend(
+                clone_group_list
+            )
+            self._parents.setdefault(element_id, (unmanaged, primitive_list))
+        return primitive_list
+
+    def _index_bundle(self, element: etree._Element) -> List[PrimitiveInstance]:
+        unmanaged = is_false(element.get("managed", ""))
+        primitive_list = []
+        bundle_primitive_list = []
+        for child in element:
+            if child.tag != "replica":
+                primitive_list.extend(self._index_element(child, unmanaged))
+                continue
+            for replica_child in child:
+                child_primitive_list = self._index_element(
+                    replica_child, unmanaged
+                )
+                primitive_list.extend(child_primitive_list)
+                if replica_child.tag == "resource":
+                    bundle_primitive_list.extend(child_primitive_list)
+        if element.get("id") is not None:
+            element_id = str(element.get("id"))
+            self._bundle_primitives.setdefault(element_id, []).extend(
+                bundle_primitive_list
+            )
+            self._parents.setdefault(element_id, (unmanaged, primitive_list))
+        return primitive_list
+
+
+def _get_id_keys(element_id: str) -> List[str]:
+    # An id matches itself and all its prefixes followed by a colon, so that
+    # instances of clones, e.g. "R:0" and "R:1", are found as "R".
+    parts = element_id.split(":")
+    return [":".join(parts[:length]) for length in range(1, len(parts) + 1)]
+
+
+def _unique_in_document_order(
+    primitive_list: Iterable[PrimitiveInstance],
+) -> List[PrimitiveInstance]:
+    return sorted(
+        {
+            primitive.position: primitive for primitive in primitive_list
+        }.values(),
+        key=lambda primitive: primitive.position,
+    )
+
+
+def get_cluster_state_index(
+    cluster_state: Union[etree._Element, ClusterStateIndex],
+) -> ClusterStateIndex:
+    """
+    Return an index of resources of a cluster status
+
+    cluster_state -- status of the cluster or its already built index
+    """
+    if isinstance(cluster_state, ClusterStateIndex):
+        return cluster_state
+    return ClusterStateIndex(cluster_state)
+
+
 def _get_primitives_for_state_check(
     cluster_state, resource_id, expected_running
 ):
-    primitives = cluster_state.xpath(
-        """
-        .//resource[{predicate_id}]
-        |
-        .//group[{predicate_id}]/resource[{predicate_position}]
-        |
-        .//clone[@id=$id]/resource
-        |
-        .//clone[@id=$id]/group/resource[{predicate_position}]
-        |
-        .//bundle[@id=$id]/replica/resource
-    """.format(
-            predicate_id=_id_xpath_predicate,
-            predicate_position=("last()" if expected_running else "1"),
-        ),
-        id=resource_id,
-    )
-    return [
-        element
-        for element in primitives
-        if not is_true(element.attrib.get("failed", ""))
-    ]
+    return get_cluster_state_index(
+        cluster_state
+    ).get_primitives_for_state_check(resource_id, expected_running)
 
 
-def _get_primitive_roles_with_nodes(primitive_el_list):
-    # Clone resources are represented by multiple primitive elements.
+def _get_primitive_roles_with_nodes(primitive_list):
+    # Clone resources are represented by multiple primitive instances.
     roles_with_nodes = defaultdict(set)
-    for resource_element in primitive_el_list:
-        if resource_element.attrib["role"] in const.PCMK_ROLES_RUNNING:
-            roles_with_nodes[resource_element.attrib["role"]].update(
-                [
-                    node.attrib["name"]
-                    for node in resource_element.findall(".//node")
-                ]
-            )
+    for primitive in primitive_list:
+        if primitive.role in const.PCMK_ROLES_RUNNING:
+            roles_with_nodes[primitive.role].update(primitive.node_names)
     return {role: sorted(nodes) for role, nodes in roles_with_nodes.items()}
 
 
@@ -262,44 +499,9 @@ def is_resource_managed(cluster_state, resource_id):
     """
     Check if the resource is managed
 
-    etree cluster_state -- status of the cluster
+    etree cluster_state -- status of the cluster or its index
     string resource_id -- id of the resource
     """
-    primitive_list = cluster_state.xpath(
-        """
-        .//resource[{predicate_id}]
-        |
-        .//group[{predicate_id}]/resource
-        """.format(
-            predicate_id=_id_xpath_predicate
-        ),
-        id=resource_id,
-    )
-    if primitive_list:
-        for primitive in primitive_list:
-            if is_false(primitive.attrib.get("managed", "")):
-                return False
-            parent = find_parent(primitive, ["clone", "bundle"])
-            if parent is not None and is_false(
-                parent.attrib.get("managed", "")
-            ):
-                return False
-        return True
-
-    parent_list = cluster_state.xpath(
-        """
-        .//clone[@id=$resource_id]
-        |
-        .//bundle[@id=$resource_id]
-        """,
-        resource_id=resource_id,
+    return get_cluster_state_index(cluster_state).is_resource_managed(
+        resource_id
     )
-    for parent in parent_list:
-        if is_false(parent.attrib.get("managed", "")):
-            return False
-        for primitive in parent.xpath(".//resource"):
-            if is_false(primitive.attrib.get("managed", "")):
-                return False
-        return True
-
-    raise ResourceNotFound(resource_id)
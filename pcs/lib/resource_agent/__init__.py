@@ -6,6 +6,12 @@ from pcs.common.resource_agent.dto import (
     ResourceAgentParameterDto,
 )
 
+from .cache import (
+    ResourceAgentIndexCache,
+    ResourceAgentMetadataCache,
+    get_index_cache,
+    get_metadata_cache,
+)
 from .error import (
     AgentNameGuessFoundMoreThanOne,
     AgentNameGuessFoundNone,
@@ -21,6 +27,7 @@ from .facade import (
 )
 from .list import (
     find_one_resource_agent_by_type,
+    list_all_resource_agents,
     list_resource_agents,
     list_resource_agents_ocf_providers,
     list_resource_agents_standards,
@@ -0,0 +1,353 @@
+import hashlib
+import json
+import os
+import os.path
+from collections import OrderedDict
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from lxml import etree
+from lxml.etree import _Element
+
+from pcs import settings
+from pcs.common.cache_file import write_json_cache_file
+from pcs.common.tools import xml_fromstring
+from pcs.lib.xml_tools import etree_to_str
+
+from .types import ResourceAgentName
+
+_CacheKey = List[Tuple[str, int, int]]
+
+_CACHE_FILE_SUFFIX = ".json"
+_INDEX_FILE_NAME = "agents.index"
+
+
+class ResourceAgentMetadataCache:
+    """
+    Keeps validated agents metadata in memory and on disk
+
+    A cached entry is valid as long as the agent executable and crm_resource
+    are not changed (their mtime and size match). Agents without a known
+    executable (e.g. systemd, lsb) are never cached.
+    """
+
+    def __init__(self, cache_dir: Optional[str], max_entries: int) -> None:
+        """
+        cache_dir -- directory to store the cache in, None disables the cache
+        max_entries -- maximal number of agents kept in the cache
+        """
+        self._cache_dir = cache_dir
+        self._max_entries = max_entries
+        self._memory: "OrderedDict[str, Tuple[_CacheKey, _Element]]" = (
+            OrderedDict()
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._cache_dir) and self._max_entries > 0
+
+    def get(self, agent_name: ResourceAgentName) -> Optional[_Element]:
+        """
+        Return cached metadata of an agent, None if they are not cached
+
+        agent_name -- name of an agent whose metadata we want to get
+        """
+        if not self.enabled:
+            return None
+        key = _get_cache_key(agent_name)
+        if key is None:
+            return None
+        memory_entry = self._memory.get(agent_name.full_name)
+        if memory_entry is not None and memory_entry[0] == key:
+            self._memory.move_to_end(agent_name.full_name)
+            return memory_entry[1]
+        metadata = self._read_file(agent_name, key)
+        if metadata is not None:
+            self._remember(agent_name, key, metadata)
+        return metadata
+
+    def put(self, agent_name: ResourceAgentName, metadata: _Element) -> None:
+        """
+        Store validated metadata of an agent
+
+        agent_name -- name of an agent the metadata belong to
+        metadata -- metadata XML document, already validated
+        """
+        if not self.enabled:
+            return
+        key = _get_cache_key(agent_name)
+        if key is None:
+            return
+        self._remember(agent_name, key, metadata)
+        self._write_file(agent_name, key, metadata)
+
+    def clear(self) -> None:
+        """
+        Remove all cached metadata
+        """
+        self._memory.clear()
+        for path in self._list_files():
+            _remove_file(path)
+
+    def _remember(
+        self, agent_name: ResourceAgentName, key: _CacheKey, metadata: _Element
+    ) -> None:
+        self._memory[agent_name.full_name] = (key, metadata)
+        self._memory.move_to_end(agent_name.full_name)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _get_file_path(self, agent_name: ResourceAgentName) -> str:
+        return os.path.join(
+            str(self._cache_dir),
+            hashlib.sha256(agent_name.full_name.encode("utf-8")).hexdigest()
+            + _CACHE_FILE_SUFFIX,
+        )
+
+    def _list_files(self) -> List[str]:
+        try:
+            return [
+                os.path.join(str(self._cache_dir), name)
+                for name in os.listdir(str(self._cache_dir))
+                if name.endswith(_CACHE_FILE_SUFFIX)
+            ]
+        except OSError:
+            return []
+
+    def _read_file(
+        self, agent_name: ResourceAgentName, key: _CacheKey
+    ) -> Optional[_Element]:
+        try:
+            with open(self._get_file_path(agent_name), encoding="utf-8") as f:
+                data = json.load(f)
+            if (
+                data["agent"] != agent_name.full_name
+                or _key_from_json(data["key"]) != key
+            ):
+                return None
+            return xml_fromstring(data["metadata"])
+        except (OSError, ValueError, KeyError, TypeError, etree.XMLSyntaxError):
+            # A missing, outdated or broken cache file is not an error, the
+            # metadata are simply loaded from the agent.
+            return None
+
+    def _write_file(
+        self, agent_name: ResourceAgentName, key: _CacheKey, metadata: _Element
+    ) -> None:
+        if not write_json_cache_file(
+            self._get_file_path(agent_name),
+            {
+                "agent": agent_name.full_name,
+                "key": key,
+                "metadata": etree_to_str(metadata),
+            },
+        ):
+            return
+        self._prune_files()
+
+    def _prune_files(self) -> None:
+        mtime_path_list = []
+        for path in self._list_files():
+            try:
+                mtime_path_list.append((os.stat(path).st_mtime_ns, path))
+            except OSError:
+                continue
+        if len(mtime_path_list) <= self._max_entries:
+            return
+        mtime_path_list.sort()
+        for dummy_mtime, path in mtime_path_list[: -self._max_entries]:
+            _remove_file(path)
+
+
+def _get_agent_executable(agent_name: ResourceAgentName) -> Optional[str]:
+    if "/" in agent_name.type or "/" in (agent_name.provider or ""):
+        return None
+    if agent_name.is_stonith:
+        return os.path.join(settings.fence_agent_binaries, agent_name.type)
+    if agent_name.standard == "ocf" and agent_name.provider:
+        return os.path.join(
+            settings.ocf_root,
+            "resource.d",
+            agent_name.provider,
+            agent_name.type,
+        )
+    return None
+
+
+def _get_cache_key(agent_name: ResourceAgentName) -> Optional[_CacheKey]:
+    agent_executable = _get_agent_executable(agent_name)
+    if agent_executable is None:
+        return None
+    key = []
+    # crm_resource is a part of the key, its upgrade may change the metadata
+    for path in (agent_executable, settings.crm_resource_binary):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key.append((path, stat.st_mtime_ns, stat.st_size))
+    return key
+
+
+def _key_from_json(data: List[List]) -> _CacheKey:
+    return [(str(path), int(mtime), int(size)) for path, mtime, size in data]
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class ResourceAgentIndexCache:
+    """
+    Keeps names of all agents installed on the local host on disk
+
+    The names are valid as long as directories containing agents of all
+    standards and crm_resource are not changed. Only agents of standards with
+    known directories can be cached.
+    """
+
+    def __init__(self, cache_dir: Optional[str]) -> None:
+        """
+        cache_dir -- directory to store the cache in, None disables the cache
+        """
+        self._cache_dir = cache_dir
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._cache_dir)
+
+    def get_key(self) -> Optional[_CacheKey]:
+        """
+        Return a current state of agents directories
+
+        The key is to be obtained before listing agents and passed to the put
+        method afterwards. That way, agents installed in the meantime are not
+        missed.
+        """
+        if not self.enabled:
+            return None
+        return _get_index_key()
+
+    def get(self) -> Optional[List[ResourceAgentName]]:
+        """
+        Return cached names of all agents, None if they are not cached
+        """
+        key = self.get_key()
+        if key is None:
+            return None
+        try:
+            with open(self._get_file_path(), encoding="utf-8") as f:
+                data = json.load(f)
+            if _key_from_json(data["key"]) != key:
+                return None
+            return [
+                ResourceAgentName(str(standard), provider, str(agent_type))
+                for standard, provider, agent_type in data["agents"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(
+        self, key: Optional[_CacheKey], agent_names: List[ResourceAgentName]
+    ) -> None:
+        """
+        Store names of all agents
+
+        key -- state of agents directories before the agents were listed
+        agent_names -- names of all agents of all standards and providers
+        """
+        if key is None or any(
+            _get_standard_dirs(name.standard) is None for name in agent_names
+        ):
+            return
+        write_json_cache_file(
+            self._get_file_path(),
+            {
+                "key": key,
+                "agents": [
+                    [name.standard, name.provider, name.type]
+                    for name in agent_names
+                ],
+            },
+        )
+
+    def clear(self) -> None:
+        """
+        Remove cached names of agents
+        """
+        if self.enabled:
+            _remove_file(self._get_file_path())
+
+    def _get_file_path(self) -> str:
+        return os.path.join(str(self._cache_dir), _INDEX_FILE_NAME)
+
+
+def _get_standard_dirs(standard: str) -> Optional[List[str]]:
+    if standard == "ocf":
+        ocf_dir = os.path.join(settings.ocf_root, "resource.d")
+        try:
+            provider_list = sorted(os.listdir(ocf_dir))
+        except OSError:
+            provider_list = []
+        return [ocf_dir] + [
+            os.path.join(ocf_dir, provider) for provider in provider_list
+        ]
+    if standard == "stonith":
+        return [settings.fence_agent_binaries]
+    if standard == "lsb":
+        return [settings.lsb_init_dir]
+    if standard == "systemd":
+        return list(settings.systemd_unit_path)
+    if standard == "service":
+        return [settings.lsb_init_dir] + list(settings.systemd_unit_path)
+    return None
+
+
+def _get_index_key() -> Optional[_CacheKey]:
+    try:
+        stat = os.stat(settings.crm_resource_binary)
+    except OSError:
+        return None
+    key = [(settings.crm_resource_binary, stat.st_mtime_ns, stat.st_size)]
+    dir_set = set()
+    for standard in ("ocf", "stonith", "service"):
+        dir_set.update(_get_standard_dirs(standard) or [])
+    for path in sorted(dir_set):
+        try:
+            key.append((path, os.stat(path).st_mtime_ns, 0))
+        except OSError:
+            # a directory created later invalidates the cache
+            key.append((path, -1, 0))
+    return key
+
+
+_metadata_cache: Dict[
+    Tuple[Optional[str], int], ResourceAgentMetadataCache
+] = {}
+
+
+def get_metadata_cache() -> ResourceAgentMetadataCache:
+    """
+    Return a process-wide metadata cache configured by settings
+    """
+    config = (
+        settings.resource_agent_metadata_cache_dir,
+        settings.resource_agent_metadata_cache_max_entries,
+    )
+    if config not in _metadata_cache:
+        _metadata_cache[config] = ResourceAgentMetadataCache(*config)
+    return _metadata_cache[config]
+
+
+def get_index_cache() -> ResourceAgentIndexCache:
+    """
+    Return an agents index cache configured by settings
+    """
+    return ResourceAgentIndexCache(settings.resource_agent_metadata_cache_dir)
@@ -14,6 +14,10 @@ from pcs.lib import validate
 from pcs.lib.external import CommandRunner
 
 from . import const
+from .cache import (
+    ResourceAgentMetadataCache,
+    get_metadata_cache,
+)
 from .error import (
     ResourceAgentError,
     resource_agent_error_to_report_item,
@@ -199,10 +203,21 @@ class ResourceAgentFacadeFactory:
     """
 
     def __init__(
-        self, runner: CommandRunner, report_processor: reports.ReportProcessor
+        self,
+        runner: CommandRunner,
+        report_processor: reports.ReportProcessor,
+        metadata_cache: Optional[ResourceAgentMetadataCache] = None,
     ) -> None:
+        """
+        runner -- external processes runner
+        report_processor -- tool for warning/info/error reporting
+        metadata_cache -- agents metadata cache, the process-wide one if None
+        """
         self._runner = runner
         self._report_processor = report_processor
+        self._metadata_cache = (
+            get_metadata_cache() if metadata_cache is None else metadata_cache
+        )
         self._fenced_metadata: Optional[ResourceAgentMetadata] = None
 
     def facade_from_parsed_name(
@@ -213,10 +228,12 @@ class ResourceAgentFacadeFactory:
 
         name -- agent name to get a facade for
         """
+        metadata_dom = self._metadata_cache.get(name)
+        if metadata_dom is None:
+            metadata_dom = load_metadata(self._runner, name)
+            self._metadata_cache.put(name, metadata_dom)
         return self._facade_from_metadata(
-            ocf_version_to_ocf_unified(
-                parse_metadata(name, load_metadata(self._runner, name))
-            )
+            ocf_version_to_ocf_unified(parse_metadata(name, metadata_dom))
         )
 
     def void_facade_from_parsed_name(
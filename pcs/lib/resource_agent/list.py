@@ -5,6 +5,7 @@ from pcs.common import reports
 from pcs.common.str_tools import split_multiline
 from pcs.lib.external import CommandRunner
 
+from .cache import get_index_cache
 from .error import (
     AgentNameGuessFoundMoreThanOne,
     AgentNameGuessFoundNone,
@@ -102,6 +103,30 @@ def list_resource_agents(
     )
 
 
+def list_all_resource_agents(runner: CommandRunner) -> List[ResourceAgentName]:
+    """
+    Return names of agents of all standards and providers on the local host
+
+    The names are cached and the cache is invalidated once agents directories
+    change, so that crm_resource is not run for each standard and provider
+    over and over.
+    """
+    index_cache = get_index_cache()
+    agent_names = index_cache.get()
+    if agent_names is not None:
+        return agent_names
+    key = index_cache.get_key()
+    agent_names = [
+        ResourceAgentName(
+            std_provider.standard, std_provider.provider, agent_type
+        )
+        for std_provider in list_resource_agents_standards_and_providers(runner)
+        for agent_type in list_resource_agents(runner, std_provider)
+    ]
+    index_cache.put(key, agent_names)
+    return agent_names
+
+
 ### find an agent by its name
 
 
@@ -141,15 +166,8 @@ def _find_all_resource_agents_by_type(
     type_ -- last part of an agent name
     """
     type_lower = type_.lower()
-    possible_names = []
-    for std_provider in list_resource_agents_standards_and_providers(runner):
-        for existing_type in list_resource_agents(runner, std_provider):
-            if type_lower == existing_type.lower():
-                possible_names.append(
-                    ResourceAgentName(
-                        std_provider.standard,
-                        std_provider.provider,
-                        existing_type,
-                    )
-                )
-    return possible_names
+    return [
+        name
+        for name in list_all_resource_agents(runner)
+        if name.type.lower() == type_lower
+    ]
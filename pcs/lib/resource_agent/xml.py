@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import (
     List,
     Optional,
@@ -93,6 +94,16 @@ def _get_ocf_version(metadata: _Element) -> str:
     return const.OCF_1_0 if version is None else version.strip()
 
 
+@lru_cache()
+def _get_relaxng(schema_path: str) -> etree.RelaxNG:
+    """
+    Return a compiled RNG schema, it is compiled only once per process
+
+    schema_path -- path to the RNG schema file
+    """
+    return etree.RelaxNG(file=schema_path)
+
+
 def _metadata_xml_to_dom(metadata: str) -> _Element:
     """
     Parse metadata string to XML document and validate against RNG schema
@@ -102,9 +113,9 @@ def _metadata_xml_to_dom(metadata: str) -> _Element:
     dom = xml_fromstring(metadata)
     ocf_version = _get_ocf_version(dom)
     if ocf_version == const.OCF_1_0:
-        etree.RelaxNG(file=settings.path.ocf_1_0_schema).assertValid(dom)
+        _get_relaxng(settings.path.ocf_1_0_schema).assertValid(dom)
     elif ocf_version == const.OCF_1_1:
-        etree.RelaxNG(file=settings.path.ocf_1_1_schema).assertValid(dom)
+        _get_relaxng(settings.path.ocf_1_1_schema).assertValid(dom)
     return dom
 
 
@@ -1,5 +1,7 @@
 from typing import (
+    Iterable,
     List,
+    Mapping,
     Optional,
     Sequence,
 )
@@ -9,6 +11,7 @@ from pcs.common import (
     reports,
     services,
 )
+from pcs.common.services.types import ServiceState
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
 
@@ -64,6 +67,12 @@ class _NoOpDriver(services.interfaces.ServiceManagerInterface):
     def is_running(self, service: str, instance: Optional[str] = None) -> bool:
         return False
 
+    def get_states(self, services: Iterable[str]) -> Mapping[str, ServiceState]:
+        return {
+            service: ServiceState(enabled=False, running=False)
+            for service in services
+        }
+
     def is_installed(self, service: str) -> bool:
         return True
 
@@ -1,9 +1,13 @@
 import json
 import logging
+import os
+import signal
+import socketserver
 import sys
 from typing import (
     Any,
     Dict,
+    List,
     Mapping,
     Optional,
 )
@@ -65,6 +69,7 @@ SUPPORTED_COMMANDS = {
     "node.standby_unstandby_list",
     "qdevice.client_net_import_certificate",
     "qdevice.qdevice_net_sign_certificate_request",
+    "resource_agent.clear_metadata_cache",
     "resource_agent.describe_agent",
     "resource_agent.get_agents_list",
     "resource_agent.get_agent_metadata",
@@ -103,6 +108,10 @@ SUPPORTED_COMMANDS = {
 }
 
 
+class _InputError(Exception):
+    pass
+
+
 def _convert_input_data(cmd: str, data: Dict[str, Any]) -> Mapping[str, Any]:
     if cmd == "resource_agent.get_agent_metadata":
         try:
@@ -110,38 +119,38 @@ def _convert_input_data(cmd: str, data: Dict[str, Any]) -> Mapping[str, Any]:
                 ResourceAgentNameDto, data["agent_name"]
             )
         except (DaciteError, KeyError) as e:
-            _exit(
-                communication.const.COM_STATUS_INPUT_ERROR,
-                status_msg=str(e),
-            )
+            raise _InputError(str(e)) from e
     return data
 
 
-def _exit(
+def _get_result(
     status: communication.types.CommunicationResultStatus,
     status_msg: Optional[str] = None,
     report_list: Optional[ReportItemList] = None,
     data: Any = None,
-) -> None:
-    json.dump(
-        dto.to_dict(
-            communication.dto.InternalCommunicationResultDto(
-                status,
-                status_msg,
-                [report.to_dto() for report in (report_list or [])],
-                data,
-            )
-        ),
-        sys.stdout,
+) -> Dict[str, Any]:
+    return dto.to_dict(
+        communication.dto.InternalCommunicationResultDto(
+            status,
+            status_msg,
+            [report.to_dto() for report in (report_list or [])],
+            data,
+        )
     )
+
+
+def _exit(result: Dict[str, Any]) -> None:
+    json.dump(result, sys.stdout)
     sys.exit(0)
 
 
 def get_cli_env(
     options: communication.dto.InternalCommunicationRequestOptionsDto,
+    user: Optional[str],
+    groups: Optional[List[str]],
 ) -> Env:
     env = Env()
-    env.user, env.groups = utils.get_cib_user_groups()
+    env.user, env.groups = user, groups
     env.known_hosts_getter = utils.read_known_hosts_file
     # Debug messages always go to the processor. The parameter only affects if
     # they will be printed to stdout. We are not printing the messages. Instead
@@ -155,40 +164,40 @@ def get_cli_env(
 
 
 class LibraryReportProcessor(ReportProcessor):
-    processed_items: ReportItemList = []
+    def __init__(self) -> None:
+        super().__init__()
+        self.processed_items: ReportItemList = []
 
     def _do_report(self, report_item: ReportItem) -> None:
         self.processed_items.append(report_item)
 
 
-def main() -> None:
-    # pylint: disable=broad-except
-    argv = sys.argv[1:]
-    if argv:
-        _exit(
-            communication.const.COM_STATUS_INPUT_ERROR,
-            status_msg="No arguments allowed",
-        )
-
-    utils.subprocess_setup()
-    logging.basicConfig()
+def run_command(
+    request_data: Any, user: Optional[str], groups: Optional[List[str]]
+) -> Dict[str, Any]:
+    """
+    Run a library command and return its result
 
+    request_data -- InternalCommunicationRequestDto as a dict
+    user -- user running the command, used for accessing the CIB
+    groups -- groups of the user
+    """
+    # pylint: disable=broad-except
     try:
         input_dto = dto.from_dict(
-            communication.dto.InternalCommunicationRequestDto,
-            json.load(sys.stdin),
+            communication.dto.InternalCommunicationRequestDto, request_data
         )
-        cli_env = get_cli_env(input_dto.options)
+        cli_env = get_cli_env(input_dto.options, user, groups)
         lib = Library(cli_env, utils.get_middleware_factory())
         if input_dto.cmd not in SUPPORTED_COMMANDS:
-            _exit(
+            return _get_result(
                 communication.const.COM_STATUS_UNKNOWN_CMD,
                 status_msg=f"Unknown command '{input_dto.cmd}'",
             )
         for sub_cmd in input_dto.cmd.split("."):
             lib = getattr(lib, sub_cmd)
         output_data = lib(**_convert_input_data(input_dto.cmd, input_dto.cmd_data))  # type: ignore
-        _exit(
+        return _get_result(
             communication.const.COM_STATUS_SUCCESS,
             report_list=cli_env.report_processor.processed_items,
             data=(
@@ -198,23 +207,118 @@ def main() -> None:
             ),
         )
     except LibraryError as e:
-        _exit(
+        return _get_result(
             communication.const.COM_STATUS_ERROR,
             report_list=(
                 cli_env.report_processor.processed_items + list(e.args)
             ),
             data=e.output,
         )
-    except json.JSONDecodeError as e:
-        _exit(
-            communication.const.COM_STATUS_INPUT_ERROR,
-            status_msg=f"Unable to parse input data: {e.msg}",
-        )
-    except DaciteError as e:
-        _exit(
+    except (DaciteError, _InputError) as e:
+        return _get_result(
             communication.const.COM_STATUS_INPUT_ERROR,
             status_msg=str(e),
         )
     except Exception as e:
         # TODO: maybe add traceback?
-        _exit(communication.const.COM_STATUS_EXCEPTION, status_msg=str(e))
+        return _get_result(
+            communication.const.COM_STATUS_EXCEPTION, status_msg=str(e)
+        )
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    if argv:
+        _exit(
+            _get_result(
+                communication.const.COM_STATUS_INPUT_ERROR,
+                status_msg="No arguments allowed",
+            )
+        )
+
+    utils.subprocess_setup()
+    logging.basicConfig()
+
+    try:
+        request_data = json.load(sys.stdin)
+    except json.JSONDecodeError as e:
+        _exit(
+            _get_result(
+                communication.const.COM_STATUS_INPUT_ERROR,
+                status_msg=f"Unable to parse input data: {e.msg}",
+            )
+        )
+    _exit(run_command(request_data, *utils.get_cib_user_groups()))
+
+
+class _WorkerRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Runs one library command in a process forked from the worker
+
+    A request is a JSON object with keys "user", "groups" and "request", which
+    holds the same data as pcs_internal reads from its standard input. The
+    response is the same as pcs_internal writes to its standard output.
+    """
+
+    def handle(self) -> None:
+        try:
+            message = json.loads(self.rfile.read())
+            if not isinstance(message, dict) or "request" not in message:
+                raise _InputError("Invalid request format")
+            result = run_command(
+                message["request"],
+                message.get("user") or None,
+                message.get("groups") or None,
+            )
+        except json.JSONDecodeError as e:
+            result = _get_result(
+                communication.const.COM_STATUS_INPUT_ERROR,
+                status_msg=f"Unable to parse input data: {e.msg}",
+            )
+        except _InputError as e:
+            result = _get_result(
+                communication.const.COM_STATUS_INPUT_ERROR,
+                status_msg=str(e),
+            )
+        self.wfile.write(json.dumps(result).encode("utf-8"))
+
+
+class _WorkerServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    pass
+
+
+def run_worker(socket_path: str, max_children: int) -> None:
+    """
+    Serve library commands over a unix socket until terminated
+
+    Everything needed for running the commands is imported in advance. Each
+    command runs in its own process forked from the worker, so the commands
+    run concurrently and they do not share any state.
+
+    socket_path -- path of the socket to listen on
+    max_children -- maximal number of commands running at the same time
+    """
+    utils.subprocess_setup()
+    logging.basicConfig()
+    # import modules of all supported library commands
+    lib = Library(Env(), utils.get_middleware_factory())
+    for group in {cmd.split(".")[0] for cmd in SUPPORTED_COMMANDS}:
+        getattr(lib, group)
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    # the socket is only accessible by root, as it trusts the user specified
+    # in the requests
+    old_umask = os.umask(0o077)
+    try:
+        server = _WorkerServer(socket_path, _WorkerRequestHandler)
+    finally:
+        os.umask(old_umask)
+    server.max_children = max_children
+    # remove the socket when terminated by pcsd
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
@@ -183,8 +183,9 @@ def _check_nodes(node_list, prefix=""):
     status_desc_map = {online_code: "Online", 3: "Unable to authenticate"}
     status_list = []
 
-    def report(node, returncode, output):
-        del output
+    result_dict = utils.checkAuthorization(node_list)
+    for node in node_list:
+        returncode, dummy_output = result_dict[node]
         print(
             "{0}{1}: {2}".format(
                 prefix, node, status_desc_map.get(returncode, "Offline")
@@ -192,11 +193,6 @@ def _check_nodes(node_list, prefix=""):
         )
         status_list.append(returncode)
 
-    utils.read_known_hosts_file()  # cache known hosts
-    utils.run_parallel(
-        utils.create_task_list(report, utils.checkAuthorization, node_list)
-    )
-
     return any(status != online_code for status in status_list)
 
 
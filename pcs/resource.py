@@ -67,6 +67,7 @@ from pcs.common.str_tools import (
     format_optional,
     indent,
 )
+from pcs.lib.cib.constraint_graph import ConstraintGraph
 from pcs.lib.cib.resource import (
     bundle,
     guest_node,
@@ -1840,21 +1841,15 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
         get_resources(xml_etree), resource_id
     )
     if resource_el is not None:
-        tag_obj_ref_list = []
+        constraint_graph = ConstraintGraph(tags_section=get_tags(xml_etree))
+        tag_id_set = set()
         for el in find_resources_to_delete(resource_el):
-            xpath_result = get_tags(xml_etree).xpath(
-                ".//tag/obj_ref[@id=$id]",
-                id=el.get("id", ""),
-            )
-            if xpath_result:
-                tag_obj_ref_list.extend(xpath_result)
-        if tag_obj_ref_list:
-            tag_id_list = sorted(
-                {
-                    obj_ref.getparent().get("id", "")
-                    for obj_ref in tag_obj_ref_list
-                }
+            tag_id_set.update(
+                tag.get("id", "")
+                for tag in constraint_graph.get_tags(el.get("id", ""))
             )
+        if tag_id_set:
+            tag_id_list = sorted(tag_id_set)
             utils.err(
                 "Unable to remove resource '{resource}' because it is "
                 "referenced in {tags}: {tag_id_list}".format(
@@ -0,0 +1,243 @@
+"""
+Cluster status provided by the SNMP agent
+
+The status is read natively from corosync and pacemaker. It used to be
+provided by pcsd, which meant running a ruby interpreter and several pcs
+processes on every update.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from lxml.etree import _Element
+
+from pcs.lib.corosync import config_parser
+from pcs.lib.corosync.config_facade import ConfigFacade as CorosyncConfigFacade
+from pcs.lib.corosync.live import (
+    QuorumStatus,
+    QuorumStatusException,
+    get_local_corosync_conf,
+    get_quorum_status_text,
+)
+from pcs.lib.errors import LibraryError
+from pcs.lib.external import CommandRunner
+from pcs.lib.node import get_existing_nodes_names
+from pcs.lib.pacemaker.live import get_cluster_status_dom
+from pcs.lib.pacemaker.state import ClusterState
+from pcs.lib.pacemaker.values import is_true
+
+logger = logging.getLogger("pcs.snmp.cluster_status")
+logger.addHandler(logging.NullHandler())
+
+
+@dataclass(frozen=True)
+class ClusterStatus:
+    # pylint: disable=too-many-instance-attributes
+    cluster_name: str
+    quorate: bool
+    known_nodes: List[str]
+    corosync_nodes_online: List[str]
+    corosync_nodes_offline: List[str]
+    pcmk_nodes_online: List[str]
+    pcmk_nodes_standby: List[str]
+    pcmk_nodes_offline: List[str]
+    all_resources: List[str]
+    running_resources: List[str]
+    stopped_resources: List[str]
+    failed_resources: List[str]
+
+
+class ClusterStatusProvider:
+    """
+    Reads the cluster status and keeps it for a specified time
+
+    The status is read at most once per the time, no matter how often it is
+    requested.
+    """
+
+    def __init__(
+        self,
+        runner_factory: Callable[[], CommandRunner],
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        runner_factory -- creates a runner for reading the status
+        ttl -- time in seconds for which the read status is provided
+        clock -- returns current time in seconds
+        """
+        self._runner_factory = runner_factory
+        self._ttl = ttl
+        self._clock = clock
+        self._status: Optional[ClusterStatus] = None
+        self._read_at = 0.0
+
+    def get_status(self) -> ClusterStatus:
+        """
+        Return the cluster status, read it if the kept one has expired
+        """
+        now = self._clock()
+        if self._status is None or now - self._read_at >= self._ttl:
+            self._status = get_cluster_status(self._runner_factory())
+            self._read_at = now
+        return self._status
+
+
+def get_cluster_status(runner: CommandRunner) -> ClusterStatus:
+    """
+    Read the cluster status from the local node
+
+    runner -- a class for running external processes
+    """
+    corosync_conf = CorosyncConfigFacade(
+        config_parser.Parser.parse(get_local_corosync_conf().encode("utf-8"))
+    )
+    corosync_nodes, _ = get_existing_nodes_names(corosync_conf)
+    try:
+        quorum_status: Optional[QuorumStatus] = QuorumStatus.from_string(
+            get_quorum_status_text(runner)
+        )
+    except QuorumStatusException as e:
+        logger.debug("Unable to read quorum status: %s", e.reason)
+        quorum_status = None
+    try:
+        cluster_state_dom: Optional[_Element] = get_cluster_status_dom(runner)
+    except LibraryError:
+        logger.debug("Unable to read pacemaker status")
+        cluster_state_dom = None
+    return build_cluster_status(
+        corosync_conf.get_cluster_name(),
+        corosync_nodes,
+        quorum_status,
+        cluster_state_dom,
+    )
+
+
+def build_cluster_status(
+    cluster_name: str,
+    corosync_nodes: List[str],
+    quorum_status: Optional[QuorumStatus],
+    cluster_state_dom: Optional[_Element],
+) -> ClusterStatus:
+    """
+    Put the cluster status together from data read from the cluster
+
+    cluster_name -- name of the cluster from corosync.conf
+    corosync_nodes -- names of nodes in corosync.conf
+    quorum_status -- corosync quorum status, None if not available
+    cluster_state_dom -- pacemaker status, None if not available
+    """
+    if quorum_status is not None:
+        member_names = set(quorum_status.node_names)
+        corosync_online = sorted(
+            node for node in corosync_nodes if node in member_names
+        )
+        corosync_offline = sorted(
+            node for node in corosync_nodes if node not in member_names
+        )
+    else:
+        corosync_online, corosync_offline = [], sorted(corosync_nodes)
+
+    pcmk_online: List[str] = []
+    pcmk_standby: List[str] = []
+    pcmk_offline: List[str] = []
+    resource_status: Dict[str, Tuple[bool, bool]] = {}
+    if cluster_state_dom is not None:
+        pcmk_online, pcmk_standby, pcmk_offline = _get_pacemaker_nodes(
+            cluster_state_dom
+        )
+        resource_status = _get_primitives_status(cluster_state_dom)
+
+    known_nodes: List[str] = []
+    for node in (
+        corosync_online
+        + corosync_offline
+        + pcmk_online
+        + pcmk_offline
+        + pcmk_standby
+    ):
+        if node not in known_nodes:
+            known_nodes.append(node)
+
+    return ClusterStatus(
+        cluster_name=cluster_name,
+        quorate=quorum_status is not None and quorum_status.is_quorate,
+        known_nodes=known_nodes,
+        corosync_nodes_online=corosync_online,
+        corosync_nodes_offline=corosync_offline,
+        pcmk_nodes_online=pcmk_online,
+        pcmk_nodes_standby=pcmk_standby,
+        pcmk_nodes_offline=pcmk_offline,
+        all_resources=list(resource_status),
+        running_resources=[
+            res_id
+            for res_id, (running, disabled) in resource_status.items()
+            if running and not disabled
+        ],
+        stopped_resources=[
+            res_id
+            for res_id, (_, disabled) in resource_status.items()
+            if disabled
+        ],
+        failed_resources=[
+            res_id
+            for res_id, (running, disabled) in resource_status.items()
+            if not running and not disabled
+        ],
+    )
+
+
+def _get_pacemaker_nodes(
+    cluster_state_dom: _Element,
+) -> Tuple[List[str], List[str], List[str]]:
+    online, standby, offline = [], [], []
+    for node in ClusterState(cluster_state_dom).node_section.nodes:
+        if node.attrs.type == "remote":
+            continue
+        if not node.attrs.online:
+            offline.append(node.attrs.name)
+        elif node.attrs.standby:
+            standby.append(node.attrs.name)
+        else:
+            online.append(node.attrs.name)
+    return online, standby, offline
+
+
+def _get_primitives_status(
+    cluster_state_dom: _Element,
+) -> Dict[str, Tuple[bool, bool]]:
+    """
+    Return (running, disabled) flags of primitive resources by their ids
+
+    Instances of cloned primitives are merged together. Bundled primitives are
+    not provided as they are not a part of the MIB.
+    """
+    resource_status: Dict[str, Tuple[bool, bool]] = {}
+    for resource_el in cast(
+        List[_Element],
+        cluster_state_dom.xpath(
+            "resources//resource"
+            "[not(parent::replica) and not(@orphaned='true')]"
+        ),
+    ):
+        res_id = str(resource_el.get("id", "")).split(":")[0]
+        running, disabled = resource_status.get(res_id, (False, False))
+        resource_status[res_id] = (
+            running or is_true(resource_el.get("active", "false")),
+            disabled
+            or (
+                str(resource_el.get("target_role", "")).lower() == "stopped"
+                and not str(resource_el.get("resource_agent", "")).startswith(
+                    "stonith:"
+                )
+            ),
+        )
+    return resource_status
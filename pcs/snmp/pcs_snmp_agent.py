@@ -8,6 +8,7 @@ import pyagentx
 
 import pcs.utils
 from pcs.snmp import settings
+from pcs.snmp.cluster_status import ClusterStatusProvider
 from pcs.snmp.updaters.v1 import ClusterPcsV1Updater
 
 logger = logging.getLogger("pcs.snmp")
@@ -44,6 +45,27 @@ def get_update_interval():
     return interval
 
 
+def get_status_cache_ttl():
+    ttl = os.environ.get("PCS_SNMP_AGENT_STATUS_CACHE_TTL")
+    if not ttl:
+        return settings.DEFAULT_STATUS_CACHE_TTL
+    try:
+        ttl = float(ttl)
+    except ValueError:
+        ttl = -1
+    if ttl < 0:
+        logger.warning(
+            "Invalid status cache TTL value: '%s' is not >= 0",
+            os.environ.get("PCS_SNMP_AGENT_STATUS_CACHE_TTL"),
+        )
+        logger.debug(
+            "Using default status cache TTL: %s",
+            str(settings.DEFAULT_STATUS_CACHE_TTL),
+        )
+        return settings.DEFAULT_STATUS_CACHE_TTL
+    return ttl
+
+
 def setup_logging(debug=False):
     level = logging.INFO
     if debug:
@@ -69,6 +91,11 @@ class PcsAgent(pyagentx.Agent):
     def setup(self):
         update_interval = get_update_interval()
         logger.info("Update interval set to: %s", str(update_interval))
+        status_cache_ttl = get_status_cache_ttl()
+        logger.info("Status cache TTL set to: %s", str(status_cache_ttl))
+        ClusterPcsV1Updater.status_provider = ClusterStatusProvider(
+            pcs.utils.cmd_runner, status_cache_ttl
+        )
         self.register(
             settings.PCS_OID + ".1",
             ClusterPcsV1Updater,
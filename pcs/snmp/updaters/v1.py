@@ -1,12 +1,18 @@
 import logging
+from typing import Iterable
 
+from pcs import settings
+from pcs.common import file_type_codes
+from pcs.common.reports.item import ReportItem
+from pcs.lib.corosync import config_parser
+from pcs.lib.errors import LibraryError
 from pcs.snmp.agentx.types import (
     IntegerType,
     Oid,
     StringType,
 )
 from pcs.snmp.agentx.updater import AgentxUpdaterBase
-from pcs.utils import run_pcsdcli
+from pcs.snmp.cluster_status import ClusterStatusProvider
 
 logger = logging.getLogger("pcs.snmp.updaters.v1")
 logger.addHandler(logging.NullHandler())
@@ -43,137 +49,57 @@ _cluster_v1_oid_tree = Oid(
 
 class ClusterPcsV1Updater(AgentxUpdaterBase):
     _oid_tree = Oid(0, "pcs_v1", member_list=[_cluster_v1_oid_tree])
+    # set by the agent before the updater is started
+    status_provider: ClusterStatusProvider
 
     def update(self):
-        # pylint: disable=too-many-locals
-        output, ret_val = run_pcsdcli("node_status")
-        if ret_val != 0 or output["status"] != "ok":
-            logger.error(
-                "Unable to obtain cluster status.\nPCSD return code: %s\n"
-                "PCSD output: %s\n",
-                ret_val,
-                output,
+        try:
+            status = self.status_provider.get_status()
+        except LibraryError as e:
+            _log_status_error(e.args)
+            return
+        except config_parser.CorosyncConfParserException as e:
+            _log_status_error(
+                config_parser.Parser.exception_to_report_list(
+                    e,
+                    file_type_codes.COROSYNC_CONF,
+                    settings.corosync_conf_file,
+                    force_code=None,
+                    is_forced_or_warning=False,
+                )
             )
             return
-        data = output["data"]
         self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterName",
-            data.get("cluster_name", ""),
+            "pcmkPcsV1Cluster.pcmkPcsV1ClusterName", status.cluster_name
         )
         self.set_value(
             "pcmkPcsV1Cluster.pcmkPcsV1ClusterQuorate",
-            _bool_to_int(data.get("node", {}).get("quorum")),
-        )
-
-        # nodes
-        known_nodes = data.get("known_nodes", [])
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterNodesNum", len(known_nodes)
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterNodesNames", known_nodes
-        )
-
-        corosync_nodes_online = data.get("corosync_online")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOnlineNum",
-            len(corosync_nodes_online),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOnlineNames",
-            corosync_nodes_online,
-        )
-
-        corosync_nodes_offline = data.get("corosync_offline")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOfflineNum",
-            len(corosync_nodes_offline),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOfflineNames",
-            corosync_nodes_offline,
-        )
-
-        pcmk_nodes_online = data.get("pacemaker_online")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOnlineNum",
-            len(pcmk_nodes_online),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOnlineNames",
-            pcmk_nodes_online,
-        )
-
-        pcmk_nodes_standby = data.get("pacemaker_standby")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesStandbyNum",
-            len(pcmk_nodes_standby),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesStandbyNames",
-            pcmk_nodes_standby,
-        )
-
-        pcmk_nodes_offline = data.get("pacemaker_offline")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOfflineNum",
-            len(pcmk_nodes_offline),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOfflineNames",
-            pcmk_nodes_offline,
+            _bool_to_int(status.quorate),
         )
+        for name, value_list in (
+            ("Nodes", status.known_nodes),
+            ("CorosyncNodesOnline", status.corosync_nodes_online),
+            ("CorosyncNodesOffline", status.corosync_nodes_offline),
+            ("PcmkNodesOnline", status.pcmk_nodes_online),
+            ("PcmkNodesStandby", status.pcmk_nodes_standby),
+            ("PcmkNodesOffline", status.pcmk_nodes_offline),
+        ):
+            self._set_list(name, "Names", value_list)
+        for name, value_list in (
+            ("AllResources", status.all_resources),
+            ("RunningResources", status.running_resources),
+            ("StoppedResources", status.stopped_resources),
+            ("FailedResources", status.failed_resources),
+        ):
+            self._set_list(name, "Ids", value_list)
 
-        # resources
-        primitive_list = []
-        for resource in data.get("resource_list", []):
-            primitive_list.extend(_get_primitives(resource))
-
-        primitive_id_list = _get_resource_id_list(primitive_list)
+    def _set_list(self, name, list_suffix, value_list):
         self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterAllResourcesNum",
-            len(primitive_id_list),
+            f"pcmkPcsV1Cluster.pcmkPcsV1Cluster{name}Num", len(value_list)
         )
         self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterAllResourcesIds",
-            primitive_id_list,
-        )
-        running_primitive_id_list = _get_resource_id_list(
-            primitive_list, _res_in_status(["running"])
-        )
-
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterRunningResourcesNum",
-            len(running_primitive_id_list),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterRunningResourcesIds",
-            running_primitive_id_list,
-        )
-
-        disabled_primitive_id_list = _get_resource_id_list(
-            primitive_list, _res_in_status(["disabled"])
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterStoppedResourcesNum",
-            len(disabled_primitive_id_list),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterStoppedResourcesIds",
-            disabled_primitive_id_list,
-        )
-
-        failed_primitive_id_list = _get_resource_id_list(
-            primitive_list,
-            lambda res: not _res_in_status(["running", "disabled"])(res),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterFailedResourcesNum",
-            len(failed_primitive_id_list),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterFailedResourcesIds",
-            failed_primitive_id_list,
+            f"pcmkPcsV1Cluster.pcmkPcsV1Cluster{name}{list_suffix}",
+            value_list,
         )
 
 
@@ -181,26 +107,8 @@ def _bool_to_int(value):
     return 1 if value else 0
 
 
-def _get_primitives(resource):
-    res_type = resource["class_type"]
-    if res_type == "primitive":
-        return [resource]
-    if res_type == "group":
-        primitive_list = []
-        for primitive in resource["members"]:
-            primitive_list.extend(_get_primitives(primitive))
-        return primitive_list
-    # check master-slave type
-    if res_type in ["clone", "master"]:
-        return _get_primitives(resource["member"])
-    return []
-
-
-def _get_resource_id_list(resource_list, predicate=None):
-    if predicate is None:
-        predicate = lambda _: True
-    return [resource["id"] for resource in resource_list if predicate(resource)]
-
-
-def _res_in_status(status_list):
-    return lambda res: res["status"] in status_list
+def _log_status_error(report_list: Iterable[ReportItem]) -> None:
+    logger.error(
+        "Unable to obtain cluster status: %s",
+        "; ".join(report_item.message.message for report_item in report_list),
+    )
@@ -6,7 +6,7 @@ from typing import (
 )
 
 from pcs.cli.common.output import format_with_indentation
-from pcs.cli.reports.output import print_to_stderr
+from pcs.cli.common.tools import print_to_stderr
 from pcs.common.str_tools import (
     indent,
     outdent,
@@ -2633,15 +2633,28 @@ Commands:
         If --local is specified only the files on the current node will
         be restored.
 
-    checkpoint
-        List all available configuration checkpoints.
+    checkpoint [list] [--from "YYYY-M-D H:M:S"] [--to "YYYY-M-D H:M:S"]
+            [resource <resource id>...]
+        List all available configuration checkpoints. If --from or --to is
+        specified, only checkpoints created in the specified time range are
+        listed. If resource ids are specified, only checkpoints in which any of
+        the resources was added, removed or changed compared to the previous
+        checkpoint are listed. All resources are considered changed in the
+        oldest checkpoint. Information about checkpoints is cached, so that
+        only new and modified checkpoints are read.
 
     checkpoint view <checkpoint_number>
         Show specified configuration checkpoint.
 
     checkpoint diff <checkpoint_number> <checkpoint_number>
+            [--output-format <text|json>]
         Show differences between the two specified checkpoints. Use checkpoint
         number 'live' to compare a checkpoint to the current live configuration.
+        Configuration elements are matched by their ids and added (+), removed
+        (-) and changed (~) elements are listed. There are 2 formats of output
+        available: 'text' and 'json'. Format 'text' is the default and it is a
+        compact human-readable list of differences. Format 'json' is
+        a machine-readable list of differences.
 
     checkpoint restore <checkpoint_number>
         Restore cluster configuration to specified checkpoint.
@@ -10,7 +10,6 @@ import subprocess
 import sys
 import tarfile
 import tempfile
-import threading
 import time
 import xml.dom.minidom
 import xml.etree.ElementTree as ET
@@ -27,6 +26,7 @@ from xml.dom.minidom import Document as DomDocument
 from xml.dom.minidom import parseString
 
 import pcs.cli.booth.env
+import pcs.cli.common.shared_cib
 import pcs.lib.corosync.config_parser as corosync_conf_parser
 from pcs import (
     settings,
@@ -51,6 +51,13 @@ from pcs.common import file_type_codes
 from pcs.common import pacemaker as common_pacemaker
 from pcs.common import pcs_pycurl as pycurl
 from pcs.common.host import PcsKnownHost
+from pcs.common.node_communicator import (
+    ConnectionPool,
+    NodeCommunicatorFactory,
+    Request,
+    RequestData,
+    RequestTarget,
+)
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports.item import ReportItemList
 from pcs.common.reports.messages import CibUpgradeFailedToMinimalRequiredVersion
@@ -60,6 +67,7 @@ from pcs.common.tools import (
     Version,
     timeout_to_seconds,
 )
+from pcs.lib.communication.nodes import PACEMAKER_STATUS_REQUEST_WAIT
 from pcs.lib.corosync.config_facade import ConfigFacade as corosync_conf_facade
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
@@ -69,6 +77,7 @@ from pcs.lib.external import (
 )
 from pcs.lib.file.instance import FileInstance as LibFileInstance
 from pcs.lib.interface.config import ParserErrorException
+from pcs.lib.node_communication import LibCommunicatorLogger
 from pcs.lib.pacemaker.live import get_cluster_status_dom
 from pcs.lib.pacemaker.state import ClusterState
 from pcs.lib.pacemaker.values import is_boolean
@@ -169,24 +178,24 @@ def cluster_upgrade_to_version(required_version: Version) -> Any:
     return dom
 
 
-# Check status of node
-def checkStatus(node):
+# Check status of nodes
+def checkStatus(node_list):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    return sendHTTPRequest(
-        node, "remote/status", urlencode({"version": "2"}), False, False
+    return send_http_request_to_nodes(
+        node_list, "remote/status", urlencode({"version": "2"})
     )
 
 
 # Check and see if we're authorized (faster than a status check)
-def checkAuthorization(node):
+def checkAuthorization(node_list):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    return sendHTTPRequest(node, "remote/check_auth", None, False, False)
+    return send_http_request_to_nodes(node_list, "remote/check_auth")
 
 
 def get_uid_gid_file_name(uid, gid):
@@ -344,30 +353,6 @@ def read_known_hosts_file():
     return data
 
 
-def repeat_if_timeout(send_http_request_function, repeat_count=15):
-    """
-    Commandline options: no options
-    NOTE: callback send_http_request_function may use --request-timeout
-    """
-
-    def repeater(node, *args, **kwargs):
-        repeats_left = repeat_count
-        while True:
-            retval, output = send_http_request_function(node, *args, **kwargs)
-            if (
-                retval != 2
-                or "Operation timed out" not in output
-                or repeats_left < 1
-            ):
-                # did not timed out OR repeat limit exceeded
-                return retval, output
-            repeats_left = repeats_left - 1
-            if "--debug" in pcs_options:
-                print_to_stderr(f"{node}: {output}, trying again...")
-
-    return repeater
-
-
 # Set the corosync.conf file on the specified node
 def getCorosyncConfig(node):
     """
@@ -388,54 +373,77 @@ def setCorosyncConfig(node, config):
         err("Unable to set corosync config: {0}".format(data))
 
 
-def getPacemakerNodeStatus(node):
+def poll_pacemaker_node_status(node_list, get_wait, process_result, interval):
     """
+    Ask the nodes for their pacemaker status, ask each node again as soon as it
+    responds until its status is accepted
+
     Commandline options:
       * --request-timeout - timeout for HTTP requests
-    """
-    return sendHTTPRequest(
-        node, "remote/pacemaker_node_status", None, False, False
+
+    callable get_wait -- returns the number of seconds the nodes are asked to
+        hold the next request for until pacemaker is started on them
+    callable process_result -- takes a node and a tuple (status, data) with
+        the same meaning as in sendHTTPRequest, returns True to accept it
+    interval -- minimal number of seconds between two requests to one node
+    """
+
+    def get_data():
+        wait = get_wait()
+        return urlencode({"wait": wait}) if wait else None
+
+    poll_http_request_to_nodes(
+        node_list,
+        "remote/pacemaker_node_status",
+        get_data,
+        process_result,
+        interval,
+        timeout=settings.default_request_timeout
+        + PACEMAKER_STATUS_REQUEST_WAIT,
     )
 
 
-def startCluster(node, quiet=False, timeout=None):
+def startCluster(node_list, timeout=None):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    return sendHTTPRequest(
-        node,
-        "remote/cluster_start",
-        printResult=False,
-        printSuccess=not quiet,
-        timeout=timeout,
+    return send_http_request_to_nodes(
+        node_list, "remote/cluster_start", timeout=timeout
     )
 
 
-def stopPacemaker(node, quiet=False, force=True):
+def stopPacemaker(node_list, force=True, repeat_if_timeout=0):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
     return stopCluster(
-        node, pacemaker=True, corosync=False, quiet=quiet, force=force
+        node_list,
+        pacemaker=True,
+        corosync=False,
+        force=force,
+        repeat_if_timeout=repeat_if_timeout,
     )
 
 
-def stopCorosync(node, quiet=False, force=True):
+def stopCorosync(node_list, force=True):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    return stopCluster(
-        node, pacemaker=False, corosync=True, quiet=quiet, force=force
-    )
+    return stopCluster(node_list, pacemaker=False, corosync=True, force=force)
 
 
-def stopCluster(node, quiet=False, pacemaker=True, corosync=True, force=True):
+def stopCluster(
+    node_list, pacemaker=True, corosync=True, force=True, repeat_if_timeout=0
+):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
+
+    repeat_if_timeout -- how many times to resend the request to nodes which
+        did not respond in time
     """
     data = {}
     timeout = None
@@ -446,59 +454,66 @@ def stopCluster(node, quiet=False, pacemaker=True, corosync=True, force=True):
         data["component"] = "corosync"
     if force:
         data["force"] = 1
-    data = urlencode(data)
-    return sendHTTPRequest(
-        node,
+    return send_http_request_to_nodes(
+        node_list,
         "remote/cluster_stop",
-        data,
-        printResult=False,
-        printSuccess=not quiet,
+        urlencode(data),
         timeout=timeout,
+        repeat_if_timeout=repeat_if_timeout,
     )
 
 
-def enableCluster(node):
+def enableCluster(node_list):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    return sendHTTPRequest(node, "remote/cluster_enable", None, False, True)
+    return send_http_request_to_nodes(
+        node_list, "remote/cluster_enable", print_response=True
+    )
 
 
-def disableCluster(node):
+def disableCluster(node_list):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    return sendHTTPRequest(node, "remote/cluster_disable", None, False, True)
+    return send_http_request_to_nodes(
+        node_list, "remote/cluster_disable", print_response=True
+    )
 
 
-def destroyCluster(node, quiet=False):
+def destroyCluster(node_list):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    return sendHTTPRequest(
-        node, "remote/cluster_destroy", None, not quiet, not quiet
-    )
+    return send_http_request_to_nodes(node_list, "remote/cluster_destroy")
 
 
-def restoreConfig(node, tarball_data):
+def restoreConfig(node_list, tarball_data):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    data = urlencode({"tarball": tarball_data})
-    return sendHTTPRequest(node, "remote/config_restore", data, False, True)
+    return send_http_request_to_nodes(
+        node_list,
+        "remote/config_restore",
+        urlencode({"tarball": tarball_data}),
+        print_response=True,
+    )
 
 
-def pauseConfigSyncing(node, delay_seconds=300):
+def pauseConfigSyncing(node_list, delay_seconds=300):
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    data = urlencode({"sync_thread_pause": delay_seconds})
-    return sendHTTPRequest(node, "remote/set_sync_options", data, False, False)
+    return send_http_request_to_nodes(
+        node_list,
+        "remote/set_sync_options",
+        urlencode({"sync_thread_pause": delay_seconds}),
+    )
 
 
 def resumeConfigSyncing(node):
@@ -608,51 +623,218 @@ def sendHTTPRequest(
                 )
             )
 
-        if response_code == 401:
-            output = (
-                3,
-                (
-                    "Unable to authenticate to {node} - (HTTP error: {code}), "
-                    "try running 'pcs host auth {node}'"
-                ).format(node=host, code=response_code),
-            )
-        elif response_code == 403:
-            output = (
-                4,
-                "{node}: Permission denied - (HTTP error: {code})".format(
-                    node=host, code=response_code
-                ),
-            )
-        elif response_code >= 400:
-            output = (
-                1,
-                "Error connecting to {node} - (HTTP error: {code})".format(
-                    node=host, code=response_code
-                ),
-            )
-        else:
-            output = (0, response_data)
-
+        output = _get_http_response_result(host, response_code, response_data)
         if printResult and output[0] != 0:
             print_to_stderr(output[1])
 
         return output
     except pycurl.error as e:
-        if is_proxy_set(os.environ):
-            reports_output.warn(
-                "Proxy is set in environment variables, try disabling it"
-            )
         # pylint: disable=unbalanced-tuple-unpacking
         dummy_errno, reason = e.args
         if "--debug" in pcs_options:
             print_to_stderr(f"Response Reason: {reason}")
-        msg = (
-            "Unable to connect to {host}, check if pcsd is running there or try "
-            "setting higher timeout with --request-timeout option ({reason})"
-        ).format(host=host, reason=reason)
+        output = _get_http_connection_failure_result(host, reason)
         if printResult:
-            print_to_stderr(msg)
-        return (2, msg)
+            print_to_stderr(output[1])
+        return output
+
+
+def _get_http_response_result(host, response_code, response_data):
+    """
+    Commandline options: no options
+    """
+    if response_code == 401:
+        return (
+            3,
+            (
+                "Unable to authenticate to {node} - (HTTP error: {code}), "
+                "try running 'pcs host auth {node}'"
+            ).format(node=host, code=response_code),
+        )
+    if response_code == 403:
+        return (
+            4,
+            "{node}: Permission denied - (HTTP error: {code})".format(
+                node=host, code=response_code
+            ),
+        )
+    if response_code >= 400:
+        return (
+            1,
+            "Error connecting to {node} - (HTTP error: {code})".format(
+                node=host, code=response_code
+            ),
+        )
+    return (0, response_data)
+
+
+def _get_http_connection_failure_result(host, reason):
+    """
+    Commandline options: no options
+    """
+    if is_proxy_set(os.environ):
+        reports_output.warn(
+            "Proxy is set in environment variables, try disabling it"
+        )
+    return (
+        2,
+        (
+            "Unable to connect to {host}, check if pcsd is running there or "
+            "try setting higher timeout with --request-timeout option "
+            "({reason})"
+        ).format(host=host, reason=reason),
+    )
+
+
+@lru_cache()
+def _get_node_communicator_factory():
+    """
+    Commandline options:
+      * --debug
+    """
+    user, groups = get_cib_user_groups()
+    return NodeCommunicatorFactory(
+        LibCommunicatorLogger(logging.getLogger("pcs"), get_report_processor()),
+        user,
+        groups,
+        settings.default_request_timeout,
+        ConnectionPool(),
+    )
+
+
+def send_http_request_to_nodes(
+    node_list,
+    request,
+    data=None,
+    timeout=None,
+    repeat_if_timeout=0,
+    print_response=False,
+):
+    """
+    Send an HTTP request to all the nodes at once, return a dict mapping each
+    node to a tuple (status, data) with the same meaning as in sendHTTPRequest
+
+    Commandline options:
+      * --request-timeout - timeout for HTTP requests
+      * --debug
+
+    iterable node_list -- names of the nodes to send the request to
+    string request -- url path of the request
+    string data -- urlencoded data to send
+    int timeout -- request timeout, overridden by --request-timeout
+    int repeat_if_timeout -- how many times to resend the request to nodes
+        which did not respond in time
+    bool print_response -- print "node: response" once a node responds
+    """
+    known_hosts = read_known_hosts_file()
+    timeout = pcs_options.get(
+        "--request-timeout", timeout or settings.default_request_timeout
+    )
+    result_dict = {}
+    pending_list = list(dict.fromkeys(node_list))
+    repeats_left = repeat_if_timeout
+    while pending_list:
+        communicator = _get_node_communicator_factory().get_communicator(
+            request_timeout=timeout
+        )
+        communicator.add_requests(
+            [
+                _get_node_request(known_hosts, node, request, data)
+                for node in pending_list
+            ]
+        )
+        timed_out_list = []
+        for response in communicator.start_loop():
+            node = response.request.host_label
+            if response.was_connected:
+                if print_response:
+                    print_to_stderr(f"{node}: {response.data.strip()}")
+                result_dict[node] = _get_http_response_result(
+                    node, response.response_code, response.data
+                )
+                continue
+            result_dict[node] = _get_http_connection_failure_result(
+                node, response.error_msg
+            )
+            if repeats_left > 0 and "Operation timed out" in str(
+                response.error_msg
+            ):
+                if "--debug" in pcs_options:
+                    print_to_stderr(
+                        f"{node}: {result_dict[node][1]}, trying again..."
+                    )
+                timed_out_list.append(node)
+        pending_list = timed_out_list
+        repeats_left -= 1
+    return result_dict
+
+
+def poll_http_request_to_nodes(
+    node_list, request, get_data, process_result, interval, timeout=None
+):
+    """
+    Send an HTTP request to all the nodes at once and send it to each node
+    again as soon as the node responds, until its response is accepted
+
+    Commandline options:
+      * --request-timeout - timeout for HTTP requests
+      * --debug
+
+    iterable node_list -- names of the nodes to send the request to
+    string request -- url path of the request
+    callable get_data -- returns urlencoded data of the next request to send
+    callable process_result -- takes a node and a tuple (status, data) with
+        the same meaning as in sendHTTPRequest, returns True to accept it
+    interval -- minimal number of seconds between two requests to one node
+    int timeout -- request timeout, overridden by --request-timeout
+    """
+    known_hosts = read_known_hosts_file()
+    timeout = pcs_options.get(
+        "--request-timeout", timeout or settings.default_request_timeout
+    )
+    communicator = _get_node_communicator_factory().get_communicator(
+        request_timeout=timeout
+    )
+    requested_at = {}
+
+    def add_request(node):
+        requested_at[node] = time.monotonic()
+        communicator.add_requests(
+            [_get_node_request(known_hosts, node, request, get_data())]
+        )
+
+    for node in dict.fromkeys(node_list):
+        add_request(node)
+    # Requests added while the loop is running are sent right away, so a node
+    # does not wait for the responses of other nodes.
+    for response in communicator.start_loop():
+        node = response.request.host_label
+        if response.was_connected:
+            result = _get_http_response_result(
+                node, response.response_code, response.data
+            )
+        else:
+            result = _get_http_connection_failure_result(
+                node, response.error_msg
+            )
+        if process_result(node, result):
+            continue
+        time.sleep(max(0, interval - (time.monotonic() - requested_at[node])))
+        add_request(node)
+
+
+def _get_node_request(known_hosts, node, request, data):
+    """
+    Commandline options: no options
+    """
+    return Request(
+        (
+            RequestTarget.from_known_host(known_hosts[node])
+            if node in known_hosts
+            else RequestTarget(node)
+        ),
+        RequestData(request, data=data),
+    )
 
 
 def __get_cookie_list(token):
@@ -1093,72 +1275,24 @@ def call_local_pcsd(argv, options, std_in=None):
         return [["Unable to communicate with pcsd"], 1, "", ""]
 
 
-def map_for_error_list(callab, iterab):
-    """
-    Commandline options: no options
-    NOTE: callback 'callab' may use some options
-    """
-    error_list = []
-    for item in iterab:
-        retval, error = callab(item)
-        if retval != 0:
-            error_list.append(error)
-    return error_list
-
-
-def run_parallel(worker_list, wait_seconds=1):
-    """
-    Commandline options: no options
-    """
-    thread_list = []
-    for worker in worker_list:
-        thread = threading.Thread(target=worker)
-        thread.daemon = True
-        thread.start()
-        thread_list.append(thread)
-
-    while thread_list:
-        for thread in thread_list:
-            thread.join(wait_seconds)
-            if not thread.is_alive():
-                thread_list.remove(thread)
-
-
-def create_task(report, action, node, *args, **kwargs):
-    """
-    Commandline options: no options
-    """
-
-    def worker():
-        returncode, output = action(node, *args, **kwargs)
-        report(node, returncode, output)
-
-    return worker
-
-
-def create_task_list(report, action, node_list, *args, **kwargs):
-    """
-    Commandline options: no options
-    """
-    return [
-        create_task(report, action, node, *args, **kwargs) for node in node_list
-    ]
-
-
 def parallel_for_nodes(action, node_list, *args, **kwargs):
     """
     Commandline options: no options
     NOTE: callback 'action' may use some cmd options
+
+    action -- callable taking a list of nodes and returning a dict mapping the
+        nodes to (returncode, output) tuples
     """
     node_errors = {}
-
-    def report(node, returncode, output):
+    result_dict = action(node_list, *args, **kwargs)
+    for node in node_list:
+        if node not in result_dict:
+            continue
+        returncode, output = result_dict[node]
         message = "{0}: {1}".format(node, output.strip())
         print_to_stderr(message)
         if returncode != 0:
             node_errors[node] = message
-
-    run_parallel(create_task_list(report, action, node_list, *args, **kwargs))
     return node_errors
 
 
@@ -1633,11 +1767,48 @@ def get_cib_xpath(xpath_query):
     return output
 
 
+def shared_cib():
+    """
+    Load the CIB only once in the context, see pcs.cli.common.shared_cib
+
+    Commandline options:
+      * -f - CIB file
+    """
+    return pcs.cli.common.shared_cib.shared_cib(_load_cib_xml)
+
+
+def _load_cib_xml(cib_file):
+    """
+    Commandline options: no options
+    """
+    output, retval = run(
+        ["cibadmin", "-l", "-Q"],
+        env_extend=({"CIB_file": cib_file} if cib_file else None),
+    )
+    if retval != 0:
+        err("unable to get cib")
+    return output
+
+
+def _get_shared_cib():
+    """
+    Commandline options:
+      * -f - CIB file
+    """
+    return pcs.cli.common.shared_cib.get_shared_cib(
+        filename if usefile else None
+    )
+
+
 def get_cib(scope=None):
     """
     Commandline options:
       * -f - CIB file
     """
+    if not scope:
+        cib = _get_shared_cib()
+        if cib is not None:
+            return cib.xml
     command = ["cibadmin", "-l", "-Q"]
     if scope:
         command.append("--scope=%s" % scope)
@@ -1657,6 +1828,12 @@ def get_cib_dom(cib_xml=None):
     """
     # pylint: disable=bare-except
     if cib_xml is None:
+        cib = _get_shared_cib()
+        if cib is not None:
+            try:
+                return cib.get_dom()
+            except:
+                return err("unable to get cib")
         cib_xml = get_cib()
     try:
         dom = parseString(cib_xml)
@@ -1672,6 +1849,12 @@ def get_cib_etree(cib_xml=None):
     """
     # pylint: disable=bare-except
     if cib_xml is None:
+        cib = _get_shared_cib()
+        if cib is not None:
+            try:
+                return cib.get_etree()
+            except:
+                return err("unable to get cib")
         cib_xml = get_cib()
     try:
         root = ET.fromstring(cib_xml)
@@ -2915,12 +3098,19 @@ def get_set_properties(prop_name=None, defaults=None):
       * -f - CIB file
     """
     properties = {} if defaults is None else dict(defaults)
-    (output, retVal) = run(["cibadmin", "-Q", "--scope", "crm_config"])
-    if retVal != 0:
-        err("unable to get crm_config\n" + output)
-    dom = parseString(output)
-    de = dom.documentElement
-    crm_config_properties = de.getElementsByTagName("nvpair")
+    if _get_shared_cib() is not None:
+        crm_config_properties = [
+            nvpair
+            for crm_config in get_cib_dom().getElementsByTagName("crm_config")
+            for nvpair in crm_config.getElementsByTagName("nvpair")
+        ]
+    else:
+        (output, retVal) = run(["cibadmin", "-Q", "--scope", "crm_config"])
+        if retVal != 0:
+            err("unable to get crm_config\n" + output)
+        dom = parseString(output)
+        de = dom.documentElement
+        crm_config_properties = de.getElementsByTagName("nvpair")
     for prop in crm_config_properties:
         if prop_name is None or (prop_name == prop.getAttribute("name")):
             properties[prop.getAttribute("name")] = prop.getAttribute("value")
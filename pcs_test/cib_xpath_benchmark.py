@@ -0,0 +1,141 @@
+# This module compares XPath queries passed to the xpath method of elements,
+# which compiles them on every call, with queries compiled once in
+# pcs.lib.cib.xpath. Each query is run once for every resource of a big CIB,
+# the same way library commands check resources in loops.
+#
+# usage: python3 pcs_test/cib_xpath_benchmark.py [resources]
+
+# pylint: disable=wrong-import-position
+
+import os.path
+import sys
+import time
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PACKAGE_DIR)
+
+from lxml import etree
+
+from pcs.lib.cib import xpath
+
+
+def fixture_cib(resource_count):
+    cib = etree.Element("cib")
+    configuration = etree.SubElement(cib, "configuration")
+    resources = etree.SubElement(configuration, "resources")
+    constraints = etree.SubElement(configuration, "constraints")
+    for index in range(resource_count):
+        primitive = etree.SubElement(
+            resources, "primitive", id=f"R{index}", type="Dummy"
+        )
+        meta = etree.SubElement(
+            primitive, "meta_attributes", id=f"R{index}-meta_attributes"
+        )
+        etree.SubElement(
+            meta,
+            "nvpair",
+            id=f"R{index}-meta_attributes-target-role",
+            name="target-role",
+            value="Started",
+        )
+        if index:
+            etree.SubElement(
+                constraints,
+                "rsc_order",
+                id=f"order-R{index - 1}-R{index}",
+                first=f"R{index - 1}",
+                then=f"R{index}",
+            )
+    etree.SubElement(cib, "status")
+    return cib
+
+
+def measure(label, run_inline, run_compiled, resource_count):
+    result_list = []
+    for run in (run_inline, run_compiled):
+        start = time.monotonic()
+        result = [run(index) for index in range(resource_count)]
+        result_list.append((time.monotonic() - start, result))
+    (inline_time, inline_result), (compiled_time, compiled_result) = result_list
+    if inline_result != compiled_result:
+        raise AssertionError(f"{label}: results differ")
+    print(
+        f"{label}: inline {inline_time * 1000:.0f} ms, "
+        f"compiled {compiled_time * 1000:.0f} ms"
+    )
+
+
+def main():
+    resource_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    cib = fixture_cib(resource_count)
+    resources = cib.find("configuration/resources")
+    constraints = cib.find("configuration/constraints")
+    primitives = list(resources)
+    print(f"resources: {resource_count}")
+
+    order_expression = """
+        .//rsc_order[
+            not (descendant::resource_set)
+            and
+            (@first=$resource_id or @then=$resource_id)
+        ]
+    """
+    measure(
+        "order constraints of a resource",
+        lambda index: len(
+            constraints.xpath(order_expression, resource_id=f"R{index}")
+        ),
+        lambda index: len(
+            xpath.get_xpath(order_expression)(
+                constraints, resource_id=f"R{index}"
+            )
+        ),
+        resource_count,
+    )
+
+    nvpair_expression = """
+        ./*[local-name()=$tag_name]
+        /nvpair[
+            @name=$name and string-length(@value) > 0
+        ]
+        /@value
+    """
+    measure(
+        "meta attribute of a resource",
+        lambda index: list(
+            primitives[index].xpath(
+                nvpair_expression,
+                tag_name="meta_attributes",
+                name="target-role",
+            )
+        ),
+        lambda index: list(
+            xpath.NVSET_VALUES_BY_NAME(
+                primitives[index],
+                tag_name="meta_attributes",
+                name="target-role",
+            )
+        ),
+        resource_count,
+    )
+
+    measure(
+        "resource element by id",
+        lambda index: len(
+            resources.xpath(
+                ".//*[local-name()=$tag_name and @id=$element_id]",
+                tag_name="primitive",
+                element_id=f"R{index}",
+            )
+        ),
+        lambda index: len(
+            xpath.DESCENDANTS_BY_TAG_AND_ID(
+                resources, tag_name="primitive", element_id=f"R{index}"
+            )
+        ),
+        resource_count,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# This module compares converting DTOs to and from dicts by inspecting their
+# types for every value, which is how pcs.common.interface.dto used to do it,
+# with the codecs it compiles once for each DTO class. It converts a list of
+# resource operations and a list of reports, both containing thousands of
+# DTOs.
+#
+# usage: python3 pcs_test/dto_codec_benchmark.py [operations] [rounds]
+
+# pylint: disable=wrong-import-position
+
+import os.path
+import sys
+import time
+from dataclasses import asdict
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PACKAGE_DIR)
+
+import dacite
+
+from pcs.common import reports
+from pcs.common.interface import dto
+from pcs.common.pacemaker.nvset import (
+    CibNvpairDto,
+    CibNvsetDto,
+)
+from pcs.common.pacemaker.resource.operations import (
+    CibResourceOperationDto,
+    ListCibResourceOperationDto,
+)
+from pcs.common.reports.dto import ReportItemDto
+
+
+def fixture_nvset(nvset_id, pair_count):
+    return CibNvsetDto(
+        id=nvset_id,
+        options={"score": "10"},
+        rule=None,
+        nvpairs=[
+            CibNvpairDto(
+                id=f"{nvset_id}-pair{index}",
+                name=f"name{index}",
+                value=f"value{index}",
+            )
+            for index in range(pair_count)
+        ],
+    )
+
+
+def fixture_operations(operation_count):
+    return ListCibResourceOperationDto(
+        operations=[
+            CibResourceOperationDto(
+                id=f"op{index}",
+                name="monitor",
+                interval="10s",
+                description=None,
+                start_delay=None,
+                interval_origin=None,
+                timeout="20s",
+                enabled=True,
+                record_pending=None,
+                role=None,
+                on_fail=None,
+                meta_attributes=[fixture_nvset(f"op{index}-meta", 2)],
+                instance_attributes=[fixture_nvset(f"op{index}-inst", 3)],
+            )
+            for index in range(operation_count)
+        ]
+    )
+
+
+def fixture_reports(report_count):
+    return [
+        reports.ReportItem.error(
+            reports.messages.IdNotFound(f"R{index}", ["primitive"])
+        ).to_dto()
+        for index in range(report_count)
+    ]
+
+
+def generic_to_dict(obj):
+    # pylint: disable=protected-access
+    return dto._convert_dict(obj.__class__, asdict(obj))
+
+
+def generic_from_dict(cls, data):
+    # pylint: disable=protected-access
+    return dacite.from_dict(
+        data_class=cls,
+        data=dto._convert_payload(cls, data),
+        config=dacite.Config(cast=list(dto._CAST_TYPES)),
+    )
+
+
+def measure(function, *args):
+    start = time.monotonic()
+    function(*args)
+    return time.monotonic() - start
+
+
+def run_round(operations, report_list, to_dict, from_dict):
+    def run_operations():
+        from_dict(ListCibResourceOperationDto, to_dict(operations))
+
+    def run_reports():
+        for report_dto in report_list:
+            from_dict(ReportItemDto, to_dict(report_dto))
+
+    return measure(run_operations), measure(run_reports)
+
+
+def main():
+    operation_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    operations = fixture_operations(operation_count)
+    report_list = fixture_reports(operation_count)
+    # each operation contains two nvsets with five nvpairs in total
+    print(
+        f"operations: {operation_count} "
+        f"({operation_count * 8} DTOs), reports: {operation_count}"
+    )
+    assert dto.to_dict(operations) == generic_to_dict(operations)
+    assert (
+        dto.from_dict(ListCibResourceOperationDto, dto.to_dict(operations))
+        == operations
+    )
+    for round_number in range(rounds):
+        generic = run_round(
+            operations, report_list, generic_to_dict, generic_from_dict
+        )
+        compiled = run_round(
+            operations, report_list, dto.to_dict, dto.from_dict
+        )
+        print(
+            f"round {round_number + 1}: "
+            f"operations {generic[0] * 1000:.0f} ms -> "
+            f"{compiled[0] * 1000:.0f} ms, "
+            f"reports {generic[1] * 1000:.0f} ms -> "
+            f"{compiled[1] * 1000:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
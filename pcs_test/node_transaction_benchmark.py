@@ -0,0 +1,216 @@
+# This module compares preparing nodes for a cluster setup step by step, which
+# waits for all nodes after each step, with sending all the steps to each node
+# in one remote/run_transaction request. The nodes are emulated by local
+# stand-in pcsd servers, each of them responding after its own delay.
+#
+# usage: python3 pcs_test/node_transaction_benchmark.py [nodes] [rounds]
+
+# pylint: disable=wrong-import-position
+
+import asyncio
+import json
+import os.path
+import sys
+import threading
+import time
+from tempfile import TemporaryDirectory
+from urllib.parse import parse_qs
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PACKAGE_DIR)
+
+from tornado.httpserver import HTTPServer
+from tornado.ioloop import IOLoop
+from tornado.netutil import bind_sockets
+from tornado.web import (
+    Application,
+    RequestHandler,
+)
+
+from pcs.common import ssl
+from pcs.common.host import Destination
+from pcs.common.node_communicator import (
+    CommunicatorLoggerInterface,
+    ConnectionPool,
+    NodeCommunicatorFactory,
+    RequestTarget,
+)
+from pcs.common.reports.processor import ReportProcessor
+from pcs.lib import node_communication_format
+from pcs.lib.communication.cluster import Destroy
+from pcs.lib.communication.nodes import (
+    DistributeFilesWithoutForces,
+    RemoveFilesWithoutForces,
+    RunTransaction,
+    UpdateKnownHosts,
+)
+from pcs.lib.communication.tools import run_and_raise
+
+# time a node spends running one action
+ACTION_DELAY = 0.005
+
+
+def action_output(action, params):
+    if action not in ("put_file", "remove_file"):
+        return ""
+    code = "written" if action == "put_file" else "deleted"
+    return json.dumps(
+        dict(
+            files={
+                key: dict(code=code, message="")
+                for key in json.loads(params["data_json"][0])
+            }
+        )
+    )
+
+
+class NodeHandler(RequestHandler):
+    # pylint: disable=abstract-method
+    def initialize(self, delay):
+        # pylint: disable=arguments-differ
+        self.delay = delay
+
+    async def post(self, action):
+        params = parse_qs(self.request.body.decode())
+        await asyncio.sleep(self.delay)
+        if action != "run_transaction":
+            await asyncio.sleep(ACTION_DELAY)
+            self.write(action_output(action, params))
+            return
+        result_list = []
+        for item in json.loads(params["data_json"][0])["actions"]:
+            await asyncio.sleep(ACTION_DELAY)
+            result_list.append(
+                dict(
+                    action=item["action"],
+                    code=200,
+                    output=action_output(
+                        item["action"], parse_qs(item["data"])
+                    ),
+                )
+            )
+        self.write(json.dumps(dict(results=result_list)))
+
+    get = post
+
+
+class NullLogger(CommunicatorLoggerInterface):
+    def log_request_start(self, request):
+        pass
+
+    def log_response(self, response):
+        pass
+
+    def log_retry(self, response, previous_dest):
+        pass
+
+    def log_no_more_addresses(self, response):
+        pass
+
+
+class NullReportProcessor(ReportProcessor):
+    def _do_report(self, report_item):
+        pass
+
+
+def start_nodes(node_delays, tmp_dir):
+    key = ssl.generate_key(2048)
+    cert_path = os.path.join(tmp_dir, "cert.pem")
+    key_path = os.path.join(tmp_dir, "key.pem")
+    with open(cert_path, "wb") as cert_file:
+        cert_file.write(ssl.dump_cert(ssl.generate_cert(key, "localhost")))
+    with open(key_path, "wb") as key_file:
+        key_file.write(ssl.dump_key(key))
+
+    port_list = []
+    started = threading.Event()
+
+    def run_loop():
+        for delay in node_delays:
+            socket_list = bind_sockets(0, "127.0.0.1")
+            port_list.append(socket_list[0].getsockname()[1])
+            server = HTTPServer(
+                Application(
+                    [(r"/remote/(.*)", NodeHandler, dict(delay=delay))],
+                ),
+                ssl_options=dict(certfile=cert_path, keyfile=key_path),
+            )
+            server.add_sockets(socket_list)
+        IOLoop.current().add_callback(started.set)
+        IOLoop.current().start()
+
+    threading.Thread(target=run_loop, daemon=True).start()
+    started.wait()
+    return port_list
+
+
+def prepare_commands(report_processor, target_list):
+    authkey = node_communication_format.corosync_authkey_file(b"key")
+    command_list = [
+        Destroy(report_processor),
+        UpdateKnownHosts(
+            report_processor,
+            known_hosts_to_add=[],
+            known_hosts_to_remove=[],
+        ),
+        RemoveFilesWithoutForces(
+            report_processor,
+            {"pcsd settings": {"type": "pcsd_settings"}},
+        ),
+        DistributeFilesWithoutForces(report_processor, authkey),
+    ]
+    for command in command_list:
+        command.set_targets(target_list)
+    return command_list
+
+
+def run_round(factory, target_list, use_transaction):
+    report_processor = NullReportProcessor()
+    command_list = prepare_commands(report_processor, target_list)
+    start = time.monotonic()
+    if use_transaction:
+        run_and_raise(
+            factory.get_communicator(),
+            RunTransaction(report_processor, command_list),
+        )
+    else:
+        for command in command_list:
+            run_and_raise(factory.get_communicator(), command)
+    return time.monotonic() - start
+
+
+def main():
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    # spread latencies of the nodes between 10ms and 100ms
+    node_delays = [
+        0.01 + 0.09 * index / max(1, node_count - 1)
+        for index in range(node_count)
+    ]
+    with TemporaryDirectory() as tmp_dir:
+        port_list = start_nodes(node_delays, tmp_dir)
+        target_list = [
+            RequestTarget(
+                f"node{index}", dest_list=[Destination("127.0.0.1", port)]
+            )
+            for index, port in enumerate(port_list)
+        ]
+        factory = NodeCommunicatorFactory(
+            NullLogger(), None, None, 10, ConnectionPool()
+        )
+        print(
+            f"nodes: {node_count}, "
+            f"slowest node latency: {max(node_delays) * 1000:.0f} ms"
+        )
+        for round_number in range(rounds):
+            step_by_step = run_round(factory, target_list, False)
+            transaction = run_round(factory, target_list, True)
+            print(
+                f"round {round_number + 1}: "
+                f"step by step {step_by_step * 1000:.0f} ms, "
+                f"transaction {transaction * 1000:.0f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -168,6 +168,8 @@ def main():
         from pcs import settings
 
         settings.pcs_data_dir = os.path.join(PACKAGE_DIR, "data")
+    # tests must not be affected by agents metadata cached on the machine
+    settings.resource_agent_metadata_cache_dir = None
 
     run_concurrently = can_concurrency and "--no-parallel" not in sys.argv
 
@@ -0,0 +1,171 @@
+import json
+import os.path
+import stat
+from tempfile import TemporaryDirectory
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs import settings
+from pcs.cli.common.cib_id_cache import (
+    CibIdCache,
+    get_cib_id_cache,
+)
+
+_CONFIGURATION = b"""
+    <configuration>
+        <crm_config/>
+        <nodes>
+            <node id="1" uname="node1"/>
+            <node id="2" uname="node2"/>
+        </nodes>
+        <resources>
+            <primitive id="S1" class="stonith" type="fence_xvm"/>
+            <group id="G1">
+                <primitive id="R2" class="ocf" provider="pacemaker" type="Dummy"/>
+                <primitive id="R1" class="ocf" provider="pacemaker" type="Dummy"/>
+            </group>
+            <clone id="C1">
+                <primitive id="R3" class="ocf" provider="pacemaker" type="Dummy"/>
+            </clone>
+        </resources>
+        <constraints>
+            <rsc_location id="L1" rsc="R1" node="node1" score="INFINITY"/>
+            <rsc_order id="O1" first="R1" then="R2"/>
+        </constraints>
+        <tags>
+            <tag id="T1">
+                <obj_ref id="R1"/>
+            </tag>
+        </tags>
+    </configuration>
+"""
+
+
+@mock.patch("pcs.cli.common.cib_id_cache._run_cibadmin")
+class CibIdCacheTest(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cib_dir = os.path.join(self.tmp_dir.name, "cib")
+        self.cache_path = os.path.join(self.tmp_dir.name, "cache", "ids.json")
+        os.makedirs(self.cib_dir)
+        self.write_cib("<cib/>")
+        patcher = mock.patch.object(settings, "cib_dir", self.cib_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_cib(self, content):
+        with open(os.path.join(self.cib_dir, "cib.xml"), "w") as cib_file:
+            cib_file.write(content)
+
+    def test_ids_by_type(self, mock_cibadmin):
+        mock_cibadmin.return_value = _CONFIGURATION
+        cache = CibIdCache(self.cache_path)
+        self.assertEqual(
+            ["C1", "G1", "R1", "R2", "R3"], cache.get_ids("resource")
+        )
+        self.assertEqual(["S1"], cache.get_ids("stonith"))
+        self.assertEqual(["L1", "O1"], cache.get_ids("constraint"))
+        self.assertEqual(["T1"], cache.get_ids("tag"))
+        self.assertEqual(["node1", "node2"], cache.get_ids("node"))
+        self.assertEqual([], cache.get_ids("unknown"))
+        mock_cibadmin.assert_called_once_with(
+            ["--query", "--scope", "configuration"]
+        )
+
+    def test_cache_readable_by_owner_only(self, mock_cibadmin):
+        mock_cibadmin.return_value = _CONFIGURATION
+        CibIdCache(self.cache_path).get_ids("resource")
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_path).st_mode), 0o600)
+
+    def test_cib_read_again_when_changed(self, mock_cibadmin):
+        mock_cibadmin.return_value = _CONFIGURATION
+        self.assertEqual(["T1"], CibIdCache(self.cache_path).get_ids("tag"))
+
+        mock_cibadmin.return_value = b"<configuration><tags/></configuration>"
+        self.assertEqual(["T1"], CibIdCache(self.cache_path).get_ids("tag"))
+        self.assertEqual(1, mock_cibadmin.call_count)
+
+        self.write_cib("<cib epoch='2'/>")
+        self.assertEqual([], CibIdCache(self.cache_path).get_ids("tag"))
+        self.assertEqual(2, mock_cibadmin.call_count)
+
+    def test_version_from_cibadmin(self, mock_cibadmin):
+        os.remove(os.path.join(self.cib_dir, "cib.xml"))
+        mock_cibadmin.side_effect = [
+            b'<cib admin_epoch="0" epoch="5" num_updates="1"/>',
+            _CONFIGURATION,
+            b'<cib admin_epoch="0" epoch="5" num_updates="2"/>',
+        ]
+        self.assertEqual(["T1"], CibIdCache(self.cache_path).get_ids("tag"))
+        self.assertEqual(["T1"], CibIdCache(self.cache_path).get_ids("tag"))
+        mock_cibadmin.assert_has_calls(
+            [
+                mock.call(["--query", "--xpath", "/cib", "--no-children"]),
+                mock.call(["--query", "--scope", "configuration"]),
+                mock.call(["--query", "--xpath", "/cib", "--no-children"]),
+            ]
+        )
+        with open(self.cache_path) as cache_file:
+            self.assertEqual(
+                ["version", "0", "5"], json.load(cache_file)["key"]
+            )
+
+    def test_cib_not_available(self, mock_cibadmin):
+        mock_cibadmin.return_value = None
+        self.assertEqual([], CibIdCache(self.cache_path).get_ids("resource"))
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_broken_cache(self, mock_cibadmin):
+        mock_cibadmin.return_value = _CONFIGURATION
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, "w") as cache_file:
+            cache_file.write("not json")
+        self.assertEqual(["T1"], CibIdCache(self.cache_path).get_ids("tag"))
+
+    def test_cache_disabled(self, mock_cibadmin):
+        mock_cibadmin.return_value = _CONFIGURATION
+        self.assertEqual(["T1"], CibIdCache(None).get_ids("tag"))
+        self.assertEqual(["T1"], CibIdCache(None).get_ids("tag"))
+        self.assertEqual(2, mock_cibadmin.call_count)
+
+    @mock.patch.object(
+        settings, "completion_cib_id_cache_file", "pcs/completion-ids.json"
+    )
+    def test_cache_of_user_xdg(self, mock_cibadmin):
+        mock_cibadmin.return_value = _CONFIGURATION
+        cache_home = os.path.join(self.tmp_dir.name, "xdg")
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_home}):
+            self.assertEqual(["T1"], get_cib_id_cache().get_ids("tag"))
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(cache_home, "pcs", "completion-ids.json")
+            )
+        )
+
+    @mock.patch.object(
+        settings, "completion_cib_id_cache_file", "pcs/completion-ids.json"
+    )
+    def test_cache_of_user_home(self, mock_cibadmin):
+        mock_cibadmin.return_value = _CONFIGURATION
+        home = os.path.join(self.tmp_dir.name, "home")
+        with mock.patch.dict(
+            os.environ, {"XDG_CACHE_HOME": "relative", "HOME": home}
+        ):
+            self.assertEqual(["T1"], get_cib_id_cache().get_ids("tag"))
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(home, ".cache", "pcs", "completion-ids.json")
+            )
+        )
+        self.assertFalse(os.path.exists("relative"))
+
+    @mock.patch.object(settings, "completion_cib_id_cache_file", None)
+    def test_cache_of_user_disabled(self, mock_cibadmin):
+        mock_cibadmin.return_value = _CONFIGURATION
+        cache_home = os.path.join(self.tmp_dir.name, "xdg")
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_home}):
+            self.assertEqual(["T1"], get_cib_id_cache().get_ids("tag"))
+        self.assertFalse(os.path.exists(cache_home))
@@ -20,6 +20,12 @@ tree = {
         "auth": {},
         "cib": {},
     },
+    "constraint": {
+        "location": {
+            "add": {},
+            "delete": {},
+        },
+    },
 }
 
 
@@ -162,3 +168,53 @@ class SplitWordsTest(TestCase):
             EnvironmentError,
             lambda: _split_words("pcs resource op a ", ["3", "8", "2", "1"]),
         )
+
+
+class IdSuggestionTest(TestCase):
+    @staticmethod
+    def get_ids(id_type):
+        return {
+            "resource": ["R2", "R1", "S1"],
+            "constraint": ["L1"],
+        }.get(id_type, [])
+
+    def assert_suggestions(self, expected, typed_word_list):
+        self.assertEqual(
+            expected,
+            _find_suggestions(
+                tree, typed_word_list, len(typed_word_list) - 1, self.get_ids
+            ),
+        )
+
+    def test_suggest_ids(self):
+        self.assert_suggestions(["R1", "R2"], ["pcs", "resource", "clone", "R"])
+        self.assert_suggestions(
+            ["R1", "R2", "S1"], ["pcs", "resource", "clone", ""]
+        )
+
+    def test_suggest_ids_for_next_arguments(self):
+        self.assert_suggestions(
+            ["R1"], ["pcs", "resource", "clone", "R2", "R1"]
+        )
+
+    def test_suggest_ids_with_subcommands(self):
+        self.assert_suggestions(
+            ["add", "delete", "R1", "R2", "S1"],
+            ["pcs", "constraint", "location", ""],
+        )
+        self.assert_suggestions(
+            ["R1", "R2"], ["pcs", "constraint", "location", "R"]
+        )
+
+    def test_longest_command_wins(self):
+        self.assert_suggestions(
+            ["L1"], ["pcs", "constraint", "location", "delete", ""]
+        )
+
+    def test_no_ids_for_unknown_command(self):
+        self.assert_suggestions([], ["pcs", "cluster", "cib", ""])
+
+    def test_no_ids_without_getter(self):
+        self.assertEqual(
+            [], _find_suggestions(tree, ["pcs", "resource", "clone", "R"], 3)
+        )
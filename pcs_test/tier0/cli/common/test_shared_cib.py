@@ -0,0 +1,127 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.cli.common import middleware
+from pcs.cli.common.shared_cib import (
+    SharedCib,
+    get_shared_cib,
+    shared_cib,
+)
+
+CIB_XML = """
+    <cib>
+        <configuration>
+            <crm_config/>
+            <resources><primitive id="R"/></resources>
+        </configuration>
+    </cib>
+"""
+
+
+def load_cib_xml(cib_file):
+    del cib_file
+    return CIB_XML
+
+
+class SharedCibViews(TestCase):
+    def setUp(self):
+        self.cib = SharedCib(CIB_XML)
+
+    def test_xml(self):
+        self.assertEqual(self.cib.xml, CIB_XML)
+
+    def test_tree(self):
+        self.assertIs(self.cib.get_tree(), self.cib.get_tree())
+        self.assertEqual(
+            self.cib.get_tree().find(".//primitive").get("id"), "R"
+        )
+
+    def test_copy(self):
+        copy = self.cib.get_copy()
+        self.assertIsNot(copy, self.cib.get_tree())
+        self.assertIsNot(copy, self.cib.get_copy())
+        self.assertEqual(copy.find(".//primitive").get("id"), "R")
+
+    def test_etree(self):
+        self.assertIs(self.cib.get_etree(), self.cib.get_etree())
+        self.assertEqual(
+            self.cib.get_etree().find(".//primitive").get("id"), "R"
+        )
+
+    def test_dom(self):
+        self.assertIs(self.cib.get_dom(), self.cib.get_dom())
+        self.assertEqual(
+            self.cib.get_dom()
+            .getElementsByTagName("primitive")[0]
+            .getAttribute("id"),
+            "R",
+        )
+
+
+class SharedCibContext(TestCase):
+    def setUp(self):
+        self.loader = mock.Mock(side_effect=load_cib_xml)
+
+    def test_not_shared(self):
+        self.assertIsNone(get_shared_cib(None))
+        self.assertIsNone(get_shared_cib("file.xml"))
+
+    def test_loaded_once_per_source(self):
+        with shared_cib(self.loader):
+            live_cib = get_shared_cib(None)
+            file_cib = get_shared_cib("file.xml")
+            self.assertIs(live_cib, get_shared_cib(None))
+            self.assertIs(file_cib, get_shared_cib("file.xml"))
+            self.assertIsNot(live_cib, file_cib)
+        self.assertEqual(
+            self.loader.mock_calls, [mock.call(None), mock.call("file.xml")]
+        )
+        self.assertIsNone(get_shared_cib(None))
+
+    def test_nested(self):
+        inner_loader = mock.Mock(side_effect=load_cib_xml)
+        with shared_cib(self.loader):
+            live_cib = get_shared_cib(None)
+            with shared_cib(inner_loader):
+                self.assertIs(live_cib, get_shared_cib(None))
+            self.assertIs(live_cib, get_shared_cib(None))
+        inner_loader.assert_not_called()
+        self.loader.assert_called_once_with(None)
+
+    def test_new_cib_loaded_in_next_context(self):
+        with shared_cib(self.loader):
+            live_cib = get_shared_cib(None)
+        with shared_cib(self.loader):
+            self.assertIsNot(live_cib, get_shared_cib(None))
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_cleared_on_error(self):
+        with self.assertRaises(ValueError):
+            with shared_cib(self.loader):
+                get_shared_cib(None)
+                raise ValueError()
+        self.assertIsNone(get_shared_cib(None))
+
+
+class CibMiddleware(TestCase):
+    def setUp(self):
+        self.env = mock.Mock(spec_set=["cib_data", "cib_snapshot"])
+        self.env.cib_snapshot = None
+        self.snapshot_list = []
+
+    def command(self, env):
+        self.snapshot_list.append(env.cib_snapshot)
+
+    def test_not_shared(self):
+        middleware.cib(None, mock.Mock())(self.command, self.env)
+        self.assertEqual(self.snapshot_list, [None])
+        self.assertIsNone(self.env.cib_snapshot)
+
+    def test_shared(self):
+        with shared_cib(load_cib_xml):
+            middleware.cib(None, mock.Mock())(self.command, self.env)
+            self.assertEqual(self.snapshot_list, [get_shared_cib(None)])
+        self.assertIsNotNone(self.snapshot_list[0])
+        self.assertIsNone(self.env.cib_snapshot)
@@ -0,0 +1,116 @@
+from unittest import TestCase
+
+from pcs.cli.cib_diff import configuration_diff_dto_to_lines
+from pcs.common.pacemaker.cib_diff import (
+    CibConfigurationDiffDto,
+    CibElementChangeDto,
+    CibElementDto,
+)
+
+
+def _element(
+    element_id, tag, section, parent_id, attributes=None, members=None
+):
+    return CibElementDto(
+        element_id, tag, section, parent_id, attributes or {}, members or []
+    )
+
+
+class ConfigurationDiffDtoToLines(TestCase):
+    def test_no_difference(self):
+        self.assertEqual(
+            configuration_diff_dto_to_lines(
+                CibConfigurationDiffDto([], [], [])
+            ),
+            ["No differences"],
+        )
+
+    def test_difference(self):
+        self.assertEqual(
+            configuration_diff_dto_to_lines(
+                CibConfigurationDiffDto(
+                    added=[
+                        _element(
+                            "C",
+                            "primitive",
+                            "resources",
+                            "resources",
+                            {"type": "Dummy"},
+                        ),
+                        _element("C-meta", "meta_attributes", "resources", "C"),
+                        _element(
+                            "C-meta-t",
+                            "nvpair",
+                            "resources",
+                            "C-meta",
+                            {"name": "t", "value": "a b"},
+                        ),
+                    ],
+                    removed=[
+                        _element(
+                            "L",
+                            "rsc_location",
+                            "constraints",
+                            "constraints",
+                            {"rsc": "B"},
+                        ),
+                        _element(
+                            "B", "primitive", "resources", "G", {"type": "D"}
+                        ),
+                    ],
+                    changed=[
+                        CibElementChangeDto(
+                            _element(
+                                "o",
+                                "nvpair",
+                                "crm_config",
+                                "opts",
+                                {"name": "n", "value": "1"},
+                            ),
+                            _element(
+                                "o",
+                                "nvpair",
+                                "crm_config",
+                                "opts",
+                                {"name": "n", "value": "2", "new": "x"},
+                            ),
+                        ),
+                        CibElementChangeDto(
+                            _element(
+                                "G",
+                                "group",
+                                "resources",
+                                "resources",
+                                {"description": "d"},
+                                ["A", "B"],
+                            ),
+                            _element(
+                                "G",
+                                "group",
+                                "resources",
+                                "R",
+                                {},
+                                ["A"],
+                            ),
+                        ),
+                    ],
+                )
+            ),
+            [
+                "Cluster Properties:",
+                "  ~ nvpair o: name=n",
+                "      value: 1 -> 2",
+                "      new: (unset) -> x",
+                "Resources:",
+                "  - primitive B: type=D",
+                "  + primitive C: type=Dummy",
+                "    + meta_attributes C-meta",
+                '      + nvpair C-meta-t: name=t value="a b"',
+                "  ~ group G",
+                "      parent: resources -> R",
+                "      description: d -> (unset)",
+                "      members: A B -> A",
+                "Constraints:",
+                "  - rsc_location L: rsc=B",
+            ],
+        )
@@ -7,10 +7,15 @@ from dataclasses import (
 from typing import (
     Any,
     List,
+    Mapping,
+    Optional,
 )
 from unittest import TestCase
 
+import dacite
+
 import pcs
+from pcs.common import types
 from pcs.common.interface.dto import (
     DataTransferObject,
     from_dict,
@@ -125,3 +130,75 @@ class UnexpectedTypes(TestCase):
         self.assertEqual(
             dict(field_a="a", field_b={1: "1", 2: "2"}), to_dict(dto)
         )
+
+
+@dataclass
+class DtoWithOptional(DataTransferObject):
+    field_a: Optional[MyDto1] = field(metadata=meta(name="field-a"))
+    field_b: Mapping[str, MyDto1] = field(metadata=meta(name="field-b"))
+    field_c: Optional[types.DrRole]
+
+
+@dataclass
+class DtoFailingInit(DataTransferObject):
+    field_a: int
+    init_calls = 0
+
+    def __post_init__(self):
+        DtoFailingInit.init_calls += 1
+        raise RuntimeError("failed")
+
+
+class CompiledCodecs(TestCase):
+    dto = DtoWithOptional(
+        MyDto1(1, 2, 3), {"key": MyDto1(4, 5, 6)}, types.DrRole.PRIMARY
+    )
+    # keys of DTOs in Optional are not renamed
+    payload = {
+        "field-a": {"field_a": 1, "field_b": 2, "field_c": 3},
+        "field-b": {"key": {"field_a": 4, "field-b": 5, "field_c": 6}},
+        "field_c": "PRIMARY",
+    }
+
+    def test_to_dict(self):
+        self.assertEqual(self.payload, to_dict(self.dto))
+
+    def test_from_dict(self):
+        self.assertEqual(self.dto, from_dict(DtoWithOptional, self.payload))
+
+    def test_from_dict_none(self):
+        self.assertEqual(
+            DtoWithOptional(None, {}, None),
+            from_dict(
+                DtoWithOptional,
+                {"field-a": None, "field-b": {}, "field_c": None},
+            ),
+        )
+
+    def test_from_dict_wrong_type(self):
+        with self.assertRaises(dacite.WrongTypeError):
+            from_dict(MyDto1, {"field_a": "1", "field-b": 2, "field_c": 3})
+
+    def test_from_dict_missing_key(self):
+        with self.assertRaises(KeyError):
+            from_dict(MyDto1, {"field_a": 1, "field_c": 3})
+
+    def test_from_dict_bad_enum_value(self):
+        with self.assertRaises(ValueError):
+            from_dict(
+                DtoWithOptional,
+                dict(self.payload, field_c="UNKNOWN"),
+            )
+
+    def test_from_dict_error_not_retried(self):
+        DtoFailingInit.init_calls = 0
+        with self.assertRaises(RuntimeError):
+            from_dict(DtoFailingInit, {"field_a": 1})
+        self.assertEqual(1, DtoFailingInit.init_calls)
+
+    def test_to_dict_copies_values(self):
+        dto = DtoWithAny("a", [[1], {"b": [2]}])
+        payload = to_dict(dto)
+        self.assertEqual(dict(field_a="a", field_b=[[1], {"b": [2]}]), payload)
+        self.assertIsNot(dto.field_b[0], payload["field_b"][0])
+        self.assertIsNot(dto.field_b[1]["b"], payload["field_b"][1]["b"])
@@ -6,7 +6,10 @@ from unittest import (
 from pcs.common.services import errors
 from pcs.common.services.drivers import SystemdDriver
 from pcs.common.services.interfaces import ExecutorInterface
-from pcs.common.services.types import ExecutorResult
+from pcs.common.services.types import (
+    ExecutorResult,
+    ServiceState,
+)
 
 
 def service_name(service, instance=None):
@@ -190,6 +193,83 @@ class IsRunningTest(Base):
         )
 
 
+class GetStatesTest(Base):
+    def test_success(self):
+        self.mock_executor.run.return_value = ExecutorResult(
+            0,
+            (
+                "ActiveState=active\nUnitFileState=enabled\n\n"
+                "UnitFileState=disabled\nActiveState=reloading\n\n"
+                "ActiveState=inactive\nUnitFileState=static\n\n"
+                "ActiveState=inactive\nUnitFileState=\n\n"
+                "ActiveState=active\nUnitFileState=transient\n"
+            ),
+            "",
+        )
+        self.assertEqual(
+            self.driver.get_states(["s1", "s2", "s3", "s4", "s5"]),
+            {
+                "s1": ServiceState(enabled=True, running=True),
+                "s2": ServiceState(enabled=False, running=True),
+                "s3": ServiceState(enabled=True, running=False),
+                "s4": ServiceState(enabled=False, running=False),
+                "s5": ServiceState(enabled=True, running=True),
+            },
+        )
+        self.mock_executor.run.assert_called_once_with(
+            [
+                self.binary,
+                "show",
+                "--property=ActiveState,UnitFileState",
+                service_name("s1"),
+                service_name("s2"),
+                service_name("s3"),
+                service_name("s4"),
+                service_name("s5"),
+            ]
+        )
+
+    def test_no_services(self):
+        self.assertEqual(self.driver.get_states([]), {})
+        self.mock_executor.run.assert_not_called()
+
+    def _assert_fallback(self, show_result):
+        self.mock_executor.run.side_effect = [
+            show_result,
+            ExecutorResult(0, "enabled", ""),
+            ExecutorResult(3, "inactive", ""),
+        ]
+        self.assertEqual(
+            self.driver.get_states([self.service]),
+            {self.service: ServiceState(enabled=True, running=False)},
+        )
+        self.assertEqual(
+            self.mock_executor.run.mock_calls,
+            [
+                mock.call(
+                    [
+                        self.binary,
+                        "show",
+                        "--property=ActiveState,UnitFileState",
+                        service_name(self.service),
+                    ]
+                ),
+                mock.call(
+                    [self.binary, "is-enabled", service_name(self.service)]
+                ),
+                mock.call(
+                    [self.binary, "is-active", service_name(self.service)]
+                ),
+            ],
+        )
+
+    def test_failure(self):
+        self._assert_fallback(ExecutorResult(1, "", "error"))
+
+    def test_unexpected_output(self):
+        self._assert_fallback(ExecutorResult(0, "", ""))
+
+
 class IsInstalledTest(Base):
     def test_installed(self):
         output = (
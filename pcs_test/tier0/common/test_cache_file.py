@@ -0,0 +1,39 @@
+import json
+import os
+import os.path
+import stat
+from unittest import TestCase
+
+from pcs.common.cache_file import write_json_cache_file
+
+from pcs_test.tools.misc import get_tmp_dir
+
+
+class WriteJsonCacheFile(TestCase):
+    def setUp(self):
+        self.tmp_dir = get_tmp_dir("tier0_common_cache_file")
+        self.path = os.path.join(self.tmp_dir.name, "cache", "file.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_success(self):
+        self.assertTrue(write_json_cache_file(self.path, {"a": [1, 2]}))
+        with open(self.path, encoding="utf-8") as cache_file:
+            self.assertEqual(json.load(cache_file), {"a": [1, 2]})
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["file.json"])
+
+    def test_readable_by_owner_only(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as cache_file:
+            cache_file.write("old")
+        os.chmod(self.path, 0o644)
+        self.assertTrue(write_json_cache_file(self.path, "new"))
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        with open(self.path, encoding="utf-8") as cache_file:
+            self.assertEqual(json.load(cache_file), "new")
+
+    def test_cannot_write(self):
+        os.makedirs(self.path)
+        self.assertFalse(write_json_cache_file(self.path, "data"))
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["file.json"])
@@ -1,5 +1,8 @@
 import io
+import select
+import socket
 from unittest import (
+    IsolatedAsyncioTestCase,
     TestCase,
     mock,
 )
@@ -417,6 +420,86 @@ class CommunicatorSimpleTest(CommunicatorBaseTest):
         self.assertEqual(expected_reason, response.error_msg)
 
 
+@mock.patch(
+    "pcs.common.node_communicator.pycurl.CurlMulti",
+    side_effect=lambda: MockCurlMulti([1]),
+)
+@mock.patch("pcs.common.node_communicator._create_request_handle")
+class CommunicatorConnectionPoolTest(CommunicatorBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.pool = lib.ConnectionPool()
+
+    def run_request(self, mock_create_handle, handle):
+        handle.request_obj = fixture_request()
+        mock_create_handle.return_value = handle
+        com = lib.Communicator(
+            self.mock_com_log, None, None, connection_pool=self.pool
+        )
+        com.add_requests([handle.request_obj])
+        return list(com.start_loop())
+
+    def test_handles_share_connections(self, mock_create_handle, _):
+        handle_list = [
+            MockCurl({pycurl.NUM_CONNECTS: 1}),
+            MockCurl({pycurl.NUM_CONNECTS: 0}),
+        ]
+        for handle in handle_list:
+            self.run_request(mock_create_handle, handle)
+        # pylint: disable=protected-access
+        self.assertIs(handle_list[0].opts[pycurl.SHARE], self.pool._share)
+        self.assertIs(handle_list[1].opts[pycurl.SHARE], self.pool._share)
+        self.assertEqual(self.pool.stats.requests, 2)
+        self.assertEqual(self.pool.stats.connections, 1)
+        self.assertEqual(self.pool.stats.reused_connections, 1)
+
+    def test_failed_requests_not_counted(self, mock_create_handle, _):
+        self.run_request(
+            mock_create_handle, MockCurl(error=(pycurl.E_SEND_ERROR, "reason"))
+        )
+        self.assertEqual(self.pool.stats.requests, 0)
+        self.assertEqual(self.pool.stats.reused_connections, 0)
+
+    def test_no_pool(self, mock_create_handle, _):
+        handle = MockCurl()
+        handle.request_obj = fixture_request()
+        mock_create_handle.return_value = handle
+        com = self.get_communicator()
+        com.add_requests([handle.request_obj])
+        list(com.start_loop())
+        self.assertNotIn(pycurl.SHARE, handle.opts)
+
+
+class CommunicatorCurlCallbacksTest(CommunicatorBaseTest):
+    # pylint: disable=protected-access
+    def setUp(self):
+        super().setUp()
+        self.com = self.get_communicator()
+        self.sock_read, self.sock_write = socket.socketpair()
+        self.addCleanup(self.sock_read.close)
+        self.addCleanup(self.sock_write.close)
+
+    def test_socket_watched(self):
+        fd = self.sock_read.fileno()
+        self.com._socket_callback(pycurl.POLL_IN, fd, None, None)
+        self.assertEqual(self.com._poll.poll(0), [])
+        self.sock_write.send(b"x")
+        self.assertEqual(self.com._poll.poll(0), [(fd, select.POLLIN)])
+        self.com._socket_callback(pycurl.POLL_REMOVE, fd, None, None)
+        self.assertEqual(self.com._poll.poll(0), [])
+
+    def test_remove_unknown_socket(self):
+        self.com._socket_callback(
+            pycurl.POLL_REMOVE, self.sock_read.fileno(), None, None
+        )
+
+    def test_timer(self):
+        self.com._timer_callback(0)
+        self.assertIsNotNone(self.com._timer_deadline)
+        self.com._timer_callback(-1)
+        self.assertIsNone(self.com._timer_deadline)
+
+
 class CommunicatorMultiTest(CommunicatorBaseTest):
     @mock.patch("pcs.common.node_communicator._create_request_handle")
     @mock.patch(
@@ -487,6 +570,50 @@ class CommunicatorMultiTest(CommunicatorBaseTest):
         com._multi_handle.assert_no_handle_left()
 
 
+@mock.patch(
+    "pcs.common.node_communicator.pycurl.CurlMulti",
+    side_effect=lambda: MockCurlMulti([2, 0, 1]),
+)
+class AsyncCommunicatorTest(CommunicatorBaseTest, IsolatedAsyncioTestCase):
+    async def test_multiple(self, _):
+        com = lib.AsyncCommunicator(self.mock_com_log, None, None)
+        request_list = [fixture_request(i) for i in range(3)]
+        handle_list = [MockCurl(request=request) for request in request_list]
+        handle_list[1] = MockCurl(
+            request=request_list[1], error=(pycurl.E_SEND_ERROR, "reason")
+        )
+        with mock.patch(
+            "pcs.common.node_communicator._create_request_handle",
+            side_effect=handle_list,
+        ):
+            com.add_requests(request_list[:2])
+            response_list = []
+            async for response in com.start_loop():
+                if not response_list:
+                    com.add_requests(request_list[2:])
+                response_list.append(response)
+        self.assertEqual(request_list, [r.request for r in response_list])
+        self.assertEqual(
+            [True, False, True], [r.was_connected for r in response_list]
+        )
+        # pylint: disable=no-member, protected-access
+        com._multi_handle.assert_no_handle_left()
+        self.assertFalse(com._is_running)
+
+    async def test_call_start_loop_multiple_times(self, _):
+        com = lib.AsyncCommunicator(self.mock_com_log, None, None)
+        with mock.patch(
+            "pcs.common.node_communicator._create_request_handle",
+            side_effect=lambda request, _, __: MockCurl(request=request),
+        ):
+            com.add_requests([fixture_request(i) for i in range(2)])
+        loop = com.start_loop()
+        await loop.__anext__()
+        with self.assertRaises(AssertionError):
+            await com.start_loop().__anext__()
+        await loop.aclose()
+
+
 def fixture_logger_request_retry_calls(response, hostname):
     return [
         mock.call.log_request_start(response.request),
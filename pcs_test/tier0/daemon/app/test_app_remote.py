@@ -1,3 +1,4 @@
+import json
 import logging
 from unittest import mock
 from urllib.parse import urlencode
@@ -51,6 +52,70 @@ class SetCerts(AppTest):
         self.https_server_manage.reload_certs.assert_not_called()
 
 
+class PacemakerStatusWrapper(fixtures_app.RubyPcsdWrapper):
+    def __init__(self, request_type, status_list):
+        super().__init__(request_type)
+        self.status_list = list(status_list)
+        self.call_count = 0
+
+    async def run_ruby(self, request_type, http_request=None, payload=None):
+        self.call_count += 1
+        if len(self.status_list) > 1:
+            self.body = json.dumps(self.status_list.pop(0)).encode()
+        else:
+            self.body = json.dumps(self.status_list[0]).encode()
+        return await super().run_ruby(request_type, http_request, payload)
+
+
+@mock.patch.object(sinatra_remote, "PACEMAKER_STATUS_INTERVAL", 0)
+class PacemakerNodeStatus(AppTest):
+    not_started = dict(online=False, pending=True)
+    started = dict(online=True, pending=False)
+
+    def get_routes(self):
+        self.wrapper = PacemakerStatusWrapper(
+            ruby_pcsd.SINATRA_REMOTE,
+            [self.not_started, self.not_started, self.started],
+        )
+        return super().get_routes()
+
+    def test_no_wait(self):
+        self.assert_wrappers_response(
+            self.post("/remote/pacemaker_node_status", body={})
+        )
+        self.assertEqual(self.wrapper.call_count, 1)
+        self.assertEqual(json.loads(self.wrapper.body), self.not_started)
+
+    def test_invalid_wait(self):
+        self.assert_wrappers_response(
+            self.post("/remote/pacemaker_node_status", body={"wait": "x"})
+        )
+        self.assertEqual(self.wrapper.call_count, 1)
+
+    def test_wait_until_started(self):
+        self.assert_wrappers_response(
+            self.post("/remote/pacemaker_node_status", body={"wait": "10"})
+        )
+        self.assertEqual(self.wrapper.call_count, 3)
+        self.assertEqual(json.loads(self.wrapper.body), self.started)
+
+    def test_wait_error(self):
+        self.wrapper.status_code = 400
+        self.assert_wrappers_response(
+            self.post("/remote/pacemaker_node_status", body={"wait": "10"})
+        )
+        self.assertEqual(self.wrapper.call_count, 1)
+
+    @mock.patch.object(sinatra_remote, "monotonic")
+    def test_wait_timed_out(self, mock_monotonic):
+        mock_monotonic.side_effect = [0, 0.5, 2]
+        self.assert_wrappers_response(
+            self.post("/remote/pacemaker_node_status", body={"wait": "1"})
+        )
+        self.assertEqual(self.wrapper.call_count, 2)
+        self.assertEqual(json.loads(self.wrapper.body), self.not_started)
+
+
 class Auth(
     AppTest,
     create_setup_patch_mixin(sinatra_remote),
@@ -146,3 +211,56 @@ class SyncConfigMutualExclusive(AppTest):
 
     def test_post_locked(self):
         self.check_locked("POST")
+
+
+class RunTransaction(AppTest):
+    def test_it_asks_for_cert_reload_if_certs_set(self):
+        self.wrapper.status_code = 200
+        self.wrapper.body = json.dumps(
+            {
+                "results": [
+                    {"action": "cluster_destroy", "code": 200, "output": ""},
+                    {"action": "set_certs", "code": 200, "output": "success"},
+                ]
+            }
+        ).encode()
+        self.assert_wrappers_response(
+            self.post("/remote/run_transaction", body={})
+        )
+        self.https_server_manage.reload_certs.assert_called_once()
+
+    def test_it_not_asks_for_cert_reload_if_certs_not_set(self):
+        self.wrapper.status_code = 200
+        self.wrapper.body = json.dumps(
+            {
+                "results": [
+                    {"action": "cluster_destroy", "code": 400, "output": ""},
+                ]
+            }
+        ).encode()
+        self.assert_wrappers_response(
+            self.post("/remote/run_transaction", body={})
+        )
+        self.https_server_manage.reload_certs.assert_not_called()
+
+    def test_it_not_asks_for_cert_reload_if_setting_certs_failed(self):
+        self.wrapper.status_code = 200
+        self.wrapper.body = json.dumps(
+            {
+                "results": [
+                    {"action": "set_certs", "code": 400, "output": "error"},
+                ]
+            }
+        ).encode()
+        self.assert_wrappers_response(
+            self.post("/remote/run_transaction", body={})
+        )
+        self.https_server_manage.reload_certs.assert_not_called()
+
+    def test_it_not_asks_for_cert_reload_if_ruby_fail(self):
+        self.wrapper.status_code = 400
+        self.wrapper.body = b"Invalid input data format"
+        self.assert_wrappers_response(
+            self.post("/remote/run_transaction", body={})
+        )
+        self.https_server_manage.reload_certs.assert_not_called()
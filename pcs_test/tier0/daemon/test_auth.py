@@ -1,5 +1,16 @@
 import logging
-from unittest import TestCase
+import os
+from tempfile import TemporaryDirectory
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from tornado.concurrent import Future
+from tornado.testing import (
+    AsyncTestCase,
+    gen_test,
+)
 
 from pcs.daemon import auth
 
@@ -39,3 +50,111 @@ class AuthorizeUserSync(TestCase, create_setup_patch_mixin(auth)):
         user_auth_info = auth.authorize_user_sync(USER, PASSWORD)
         self.assertEqual(user_auth_info.name, USER)
         self.assertFalse(user_auth_info.is_authorized)
+
+
+def get_pid():
+    return os.getpid()
+
+
+def exit_once(marker_path):
+    if not os.path.exists(marker_path):
+        with open(marker_path, "w"):
+            pass
+        os._exit(1)  # pylint: disable=protected-access
+    return os.getpid()
+
+
+class AuthWorkerPool(AsyncTestCase):
+    @gen_test
+    def test_workers_reused(self):
+        pool = auth.AuthWorkerPool(1, 0)
+        self.addCleanup(pool.recycle)
+        pid_list = []
+        for dummy_i in range(3):
+            pid_list.append((yield pool.run(get_pid)))
+        self.assertEqual(len(set(pid_list)), 1)
+        self.assertNotEqual(pid_list[0], os.getpid())
+
+    @gen_test
+    def test_workers_recycled(self):
+        pool = auth.AuthWorkerPool(1, 2)
+        self.addCleanup(pool.recycle)
+        pid_list = []
+        for dummy_i in range(3):
+            pid_list.append((yield pool.run(get_pid)))
+        self.assertEqual(pid_list[0], pid_list[1])
+        self.assertNotEqual(pid_list[1], pid_list[2])
+
+    @gen_test
+    def test_broken_workers_replaced(self):
+        pool = auth.AuthWorkerPool(1, 0)
+        self.addCleanup(pool.recycle)
+        with TemporaryDirectory() as tmp_dir:
+            pid = yield pool.run(exit_once, os.path.join(tmp_dir, "marker"))
+        self.assertNotEqual(pid, os.getpid())
+
+
+class UserGroupsCache(TestCase, create_setup_patch_mixin(auth)):
+    def setUp(self):
+        self.monotonic = self.setup_patch("monotonic", return_value=100)
+        self.user = auth.UserAuthInfo(USER, [auth.HA_ADM_GROUP], True)
+
+    def test_not_cached(self):
+        self.assertIsNone(auth.UserGroupsCache(5).get(USER))
+
+    def test_cached(self):
+        cache = auth.UserGroupsCache(5)
+        cache.put(self.user)
+        self.monotonic.return_value = 104
+        self.assertEqual(cache.get(USER), self.user)
+
+    def test_expired(self):
+        cache = auth.UserGroupsCache(5)
+        cache.put(self.user)
+        self.monotonic.return_value = 105
+        self.assertIsNone(cache.get(USER))
+
+    def test_disabled(self):
+        cache = auth.UserGroupsCache(0)
+        cache.put(self.user)
+        self.assertIsNone(cache.get(USER))
+
+
+class CheckUserGroups(AsyncTestCase, create_setup_patch_mixin(auth)):
+    def setUp(self):
+        super().setUp()
+        self.setup_patch("_groups_cache", auth.UserGroupsCache(5))
+        self.user = auth.UserAuthInfo(USER, [auth.HA_ADM_GROUP], True)
+        self.run_in_process = self.setup_patch("run_in_process")
+        self.run_in_process.side_effect = self.run_sync
+
+    def run_sync(self, *args):
+        future = Future()
+        future.set_result(self.user)
+        return future
+
+    @gen_test
+    def test_groups_cached(self):
+        for dummy_i in range(2):
+            user = yield auth.check_user_groups(USER)
+            self.assertEqual(user, self.user)
+        self.run_in_process.assert_called_once_with(
+            auth.check_user_groups_sync, USER, mock.ANY
+        )
+
+    @gen_test
+    def test_authorized_user_cached(self):
+        user = yield auth.authorize_user(USER, PASSWORD)
+        self.assertEqual(user, self.user)
+        user = yield auth.check_user_groups(USER)
+        self.assertEqual(user, self.user)
+        self.run_in_process.assert_called_once_with(
+            auth.authorize_user_sync, USER, PASSWORD
+        )
+
+    @gen_test
+    def test_unauthorized_user_not_cached(self):
+        self.user = auth.UserAuthInfo(USER, [], False)
+        yield auth.authorize_user(USER, PASSWORD)
+        yield auth.check_user_groups(USER)
+        self.assertEqual(self.run_in_process.call_count, 2)
@@ -41,6 +41,14 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             env.PCSD_DEBUG: False,
             env.PCSD_DISABLE_GUI: False,
             env.PCSD_SESSION_LIFETIME: settings.gui_session_lifetime_seconds,
+            env.PCSD_AUTH_WORKERS: settings.pcsd_auth_workers,
+            env.PCSD_AUTH_WORKER_MAX_REQUESTS: (
+                settings.pcsd_auth_worker_max_requests
+            ),
+            env.PCSD_AUTH_GROUPS_CACHE_TTL: (
+                settings.pcsd_auth_groups_cache_ttl_seconds
+            ),
+            env.PCSD_INTERNAL_WORKERS: settings.pcsd_internal_workers,
             env.PCSD_STATIC_FILES_DIR: pcsd_dir(env.PCSD_STATIC_FILES_DIR_NAME),
             env.PCSD_DEV: False,
             "has_errors": False,
@@ -71,6 +79,10 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             env.PCSD_DEBUG: "true",
             env.PCSD_DISABLE_GUI: "true",
             env.PCSD_SESSION_LIFETIME: str(session_lifetime),
+            env.PCSD_AUTH_WORKERS: "4",
+            env.PCSD_AUTH_WORKER_MAX_REQUESTS: "0",
+            env.PCSD_AUTH_GROUPS_CACHE_TTL: "30",
+            env.PCSD_INTERNAL_WORKERS: "0",
             env.PCSD_DEV: "true",
         }
         self.assert_environ_produces_modified_pcsd_env(
@@ -84,6 +96,10 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
                 env.PCSD_DEBUG: True,
                 env.PCSD_DISABLE_GUI: True,
                 env.PCSD_SESSION_LIFETIME: session_lifetime,
+                env.PCSD_AUTH_WORKERS: 4,
+                env.PCSD_AUTH_WORKER_MAX_REQUESTS: 0,
+                env.PCSD_AUTH_GROUPS_CACHE_TTL: 30,
+                env.PCSD_INTERNAL_WORKERS: 0,
                 env.PCSD_STATIC_FILES_DIR: pcsd_dir(
                     env.PCSD_STATIC_FILES_DIR_NAME
                 ),
@@ -102,6 +118,42 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             ],
         )
 
+    def test_error_on_invalid_auth_workers(self):
+        for value in ("invalid", "0"):
+            with self.subTest(value=value):
+                self.logger = Logger()
+                environ = {env.PCSD_AUTH_WORKERS: value}
+                self.assert_environ_produces_modified_pcsd_env(
+                    environ,
+                    specific_env_values={**environ, "has_errors": True},
+                    errors=[
+                        f"Invalid PCSD_AUTH_WORKERS value '{value}'"
+                        " (it must be an integer greater than or equal to 1)"
+                    ],
+                )
+
+    def test_error_on_negative_auth_groups_cache_ttl(self):
+        environ = {env.PCSD_AUTH_GROUPS_CACHE_TTL: "-1"}
+        self.assert_environ_produces_modified_pcsd_env(
+            environ,
+            specific_env_values={**environ, "has_errors": True},
+            errors=[
+                "Invalid PCSD_AUTH_GROUPS_CACHE_TTL value '-1'"
+                " (it must be an integer greater than or equal to 0)"
+            ],
+        )
+
+    def test_error_on_invalid_internal_workers(self):
+        environ = {env.PCSD_INTERNAL_WORKERS: "many"}
+        self.assert_environ_produces_modified_pcsd_env(
+            environ,
+            specific_env_values={**environ, "has_errors": True},
+            errors=[
+                "Invalid PCSD_INTERNAL_WORKERS value 'many'"
+                " (it must be an integer greater than or equal to 0)"
+            ],
+        )
+
     def test_report_invalid_ssl_ciphers(self):
         environ = {env.PCSD_SSL_CIPHERS: "invalid ;@{}+ ciphers"}
         self.assert_environ_produces_modified_pcsd_env(
@@ -0,0 +1,241 @@
+import datetime
+import os.path
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from lxml import etree
+
+from pcs import settings
+from pcs.common.types import CibRuleInEffectStatus
+from pcs.lib.cib.rule.in_effect import RuleInEffectEvalAllAtOnce
+from pcs.lib.external import CommandRunner
+
+NOW = datetime.datetime(2021, 6, 15, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+class RuleInEffectEvalAllAtOnceTest(TestCase):
+    def setUp(self):
+        self.runner = mock.Mock(spec_set=CommandRunner)
+        self.runner.run.return_value = ("", "", 110)
+
+    def get_status(self, rule_xml, rule_id="r"):
+        cib = etree.fromstring(
+            f"""
+            <cib>
+                <configuration>
+                    <rsc_defaults>
+                        <meta_attributes id="m">{rule_xml}</meta_attributes>
+                    </rsc_defaults>
+                </configuration>
+            </cib>
+            """
+        )
+        return RuleInEffectEvalAllAtOnce(cib, self.runner, NOW).get_rule_status(
+            rule_id
+        )
+
+    def assert_status(self, rule_xml, status):
+        self.assertEqual(self.get_status(rule_xml), status)
+        self.runner.run.assert_not_called()
+
+    def assert_fallback(self, rule_xml, rule_id="r"):
+        self.assertEqual(
+            self.get_status(rule_xml, rule_id), CibRuleInEffectStatus.EXPIRED
+        )
+        self.runner.run.assert_called_once_with(
+            [
+                os.path.join(settings.pacemaker_binaries, "crm_rule"),
+                "--check",
+                "--rule",
+                rule_id,
+                "--xml-text",
+                "-",
+            ],
+            stdin_string=mock.ANY,
+        )
+
+    def test_no_date_expression(self):
+        self.assert_status(
+            """
+            <rule id="r">
+                <rsc_expression id="r-e" class="ocf" type="Dummy"/>
+            </rule>
+            """,
+            CibRuleInEffectStatus.UNKNOWN,
+        )
+
+    def test_gt(self):
+        self.assert_status(
+            """
+            <rule id="r">
+                <date_expression id="r-e" operation="gt" start="2021-06-01"/>
+            </rule>
+            """,
+            CibRuleInEffectStatus.IN_EFFECT,
+        )
+        self.assert_status(
+            """
+            <rule id="r">
+                <date_expression id="r-e" operation="gt"
+                    start="2021-06-15T13:00:00Z"
+                />
+            </rule>
+            """,
+            CibRuleInEffectStatus.NOT_YET_IN_EFFECT,
+        )
+
+    def test_lt(self):
+        self.assert_status(
+            """
+            <rule id="r">
+                <date_expression id="r-e" operation="lt" end="2021-07-01"/>
+            </rule>
+            """,
+            CibRuleInEffectStatus.IN_EFFECT,
+        )
+        self.assert_status(
+            """
+            <rule id="r">
+                <date_expression id="r-e" operation="lt"
+                    end="2021-06-15T11:00:00+00:00"
+                />
+            </rule>
+            """,
+            CibRuleInEffectStatus.EXPIRED,
+        )
+
+    def test_in_range(self):
+        self.assert_status(
+            """
+            <rule id="r">
+                <date_expression id="r-e" operation="in_range"
+                    start="2021-06-01" end="2021-07-01"
+                />
+            </rule>
+            """,
+            CibRuleInEffectStatus.IN_EFFECT,
+        )
+        self.assert_status(
+            """
+            <rule id="r">
+                <date_expression id="r-e" operation="in_range"
+                    start="2021-07-01" end="2021-08-01"
+                />
+            </rule>
+            """,
+            CibRuleInEffectStatus.NOT_YET_IN_EFFECT,
+        )
+        self.assert_status(
+            """
+            <rule id="r">
+                <date_expression id="r-e" operation="in_range"
+                    end="2021-06-01"
+                />
+            </rule>
+            """,
+            CibRuleInEffectStatus.EXPIRED,
+        )
+
+    def test_in_range_duration(self):
+        self.assert_status(
+            """
+            <rule id="r">
+                <date_expression id="r-e" operation="in_range"
+                    start="2021-05-01"
+                >
+                    <duration id="r-e-d" months="1" days="10"/>
+                </date_expression>
+            </rule>
+            """,
+            CibRuleInEffectStatus.EXPIRED,
+        )
+
+    def test_nested_rule(self):
+        self.assert_status(
+            """
+            <rule id="r" boolean-op="and">
+                <rsc_expression id="r-e" class="ocf" type="Dummy"/>
+                <rule id="r-r">
+                    <date_expression id="r-r-e" operation="lt"
+                        end="2021-06-01"
+                    />
+                </rule>
+            </rule>
+            """,
+            CibRuleInEffectStatus.EXPIRED,
+        )
+
+    def test_date_spec_years(self):
+        for years, status in (
+            ("2021", CibRuleInEffectStatus.IN_EFFECT),
+            ("2019-2020", CibRuleInEffectStatus.EXPIRED),
+            ("2022-", CibRuleInEffectStatus.NOT_YET_IN_EFFECT),
+            ("-2021", CibRuleInEffectStatus.IN_EFFECT),
+        ):
+            with self.subTest(years=years):
+                self.assert_status(
+                    f"""
+                    <rule id="r">
+                        <date_expression id="r-e" operation="date_spec">
+                            <date_spec id="r-e-ds" years="{years}"/>
+                        </date_expression>
+                    </rule>
+                    """,
+                    status,
+                )
+
+    def test_fallback_date_spec(self):
+        self.assert_fallback(
+            """
+            <rule id="r">
+                <date_expression id="r-e" operation="date_spec">
+                    <date_spec id="r-e-ds" years="2021" months="1-6"/>
+                </date_expression>
+            </rule>
+            """
+        )
+
+    def test_fallback_more_date_expressions(self):
+        self.assert_fallback(
+            """
+            <rule id="r" boolean-op="or">
+                <date_expression id="r-e" operation="lt" end="2021-06-01"/>
+                <date_expression id="r-e-1" operation="gt" start="2021-07-01"/>
+            </rule>
+            """
+        )
+
+    def test_fallback_bad_date(self):
+        self.assert_fallback(
+            """
+            <rule id="r">
+                <date_expression id="r-e" operation="lt" end="not a date"/>
+            </rule>
+            """
+        )
+
+    def test_fallback_rule_not_found(self):
+        self.assert_fallback("", rule_id="missing")
+
+    def test_status_cached(self):
+        cib = etree.fromstring(
+            """
+            <rsc_defaults>
+                <meta_attributes id="m">
+                    <rule id="r">
+                        <date_expression id="r-e" operation="date_spec">
+                            <date_spec id="r-e-ds" weekdays="1-5"/>
+                        </date_expression>
+                    </rule>
+                </meta_attributes>
+            </rsc_defaults>
+            """
+        )
+        evaluator = RuleInEffectEvalAllAtOnce(cib, self.runner, NOW)
+        for dummy_i in range(2):
+            self.assertEqual(
+                evaluator.get_rule_status("r"), CibRuleInEffectStatus.EXPIRED
+            )
+        self.assertEqual(self.runner.run.call_count, 1)
@@ -0,0 +1,157 @@
+import json
+import os
+import stat
+from unittest import TestCase
+
+from pcs.lib.cib.checkpoint_index import (
+    CheckpointIndex,
+    get_changed_resources,
+)
+
+from pcs_test.tools.misc import get_tmp_dir
+
+
+def _cib(epoch, resources):
+    return (
+        f'<cib admin_epoch="0" epoch="{epoch}" num_updates="3">'
+        f"<configuration><resources>{resources}</resources></configuration>"
+        "<status/></cib>"
+    )
+
+
+class CheckpointIndexTest(TestCase):
+    def setUp(self):
+        self.tmp_dir = get_tmp_dir("tier0_lib_cib_checkpoint_index")
+        self.cib_dir = os.path.join(self.tmp_dir.name, "cib")
+        os.mkdir(self.cib_dir)
+        self.index_path = os.path.join(self.tmp_dir.name, "cache", "index")
+        self.index = CheckpointIndex(self.index_path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_checkpoint(self, name, content, mtime):
+        path = os.path.join(self.cib_dir, name)
+        with open(path, "w", encoding="utf-8") as checkpoint_file:
+            checkpoint_file.write(content)
+        os.utime(path, (mtime, mtime))
+
+    def read_index(self):
+        with open(self.index_path, encoding="utf-8") as index_file:
+            return json.load(index_file)
+
+    def write_index(self, data):
+        with open(self.index_path, "w", encoding="utf-8") as index_file:
+            json.dump(data, index_file)
+
+    def test_empty_dir(self):
+        self.assertEqual(self.index.update(self.cib_dir), [])
+
+    def test_checkpoints_sorted_by_mtime(self):
+        self.write_checkpoint("cib-1.raw", _cib(5, ""), 2000)
+        self.write_checkpoint("cib-2.raw", _cib(3, ""), 1000)
+        self.write_checkpoint("cib.last", "2", 3000)
+        self.write_checkpoint("cib-3.raw.sig", "", 3000)
+        checkpoint_list = self.index.update(self.cib_dir)
+        self.assertEqual(
+            [
+                (info.number, info.mtime, info.epoch, info.num_updates)
+                for info in checkpoint_list
+            ],
+            [("2", 1000, 3, 3), ("1", 2000, 5, 3)],
+        )
+        self.assertEqual(
+            [item["name"] for item in self.read_index()["checkpoints"]],
+            ["cib-2.raw", "cib-1.raw"],
+        )
+
+    def test_index_readable_by_owner_only(self):
+        self.write_checkpoint("cib-1.raw", _cib(1, ""), 1000)
+        self.index.update(self.cib_dir)
+        self.assertEqual(stat.S_IMODE(os.stat(self.index_path).st_mode), 0o600)
+
+    def test_unchanged_checkpoints_not_read(self):
+        self.write_checkpoint("cib-1.raw", _cib(1, '<primitive id="A"/>'), 1000)
+        self.index.update(self.cib_dir)
+        data = self.read_index()
+        data["checkpoints"][0]["epoch"] = 42
+        self.write_index(data)
+        self.assertEqual(self.index.update(self.cib_dir)[0].epoch, 42)
+
+    def test_changed_checkpoints_read(self):
+        self.write_checkpoint("cib-1.raw", _cib(1, ""), 1000)
+        self.index.update(self.cib_dir)
+        self.write_checkpoint("cib-1.raw", _cib(2, ""), 2000)
+        self.assertEqual(self.index.update(self.cib_dir)[0].epoch, 2)
+
+    def test_removed_checkpoints_removed_from_index(self):
+        self.write_checkpoint("cib-1.raw", _cib(1, ""), 1000)
+        self.write_checkpoint("cib-2.raw", _cib(2, ""), 2000)
+        self.index.update(self.cib_dir)
+        os.remove(os.path.join(self.cib_dir, "cib-1.raw"))
+        self.assertEqual(
+            [info.number for info in self.index.update(self.cib_dir)], ["2"]
+        )
+        self.assertEqual(
+            [item["name"] for item in self.read_index()["checkpoints"]],
+            ["cib-2.raw"],
+        )
+
+    def test_broken_index_rebuilt(self):
+        self.write_checkpoint("cib-1.raw", _cib(1, ""), 1000)
+        os.makedirs(os.path.dirname(self.index_path))
+        with open(self.index_path, "w", encoding="utf-8") as index_file:
+            index_file.write("not json")
+        self.assertEqual(self.index.update(self.cib_dir)[0].epoch, 1)
+        self.assertEqual(len(self.read_index()["checkpoints"]), 1)
+
+    def test_broken_checkpoint(self):
+        self.write_checkpoint("cib-1.raw", "<cib", 1000)
+        info = self.index.update(self.cib_dir)[0]
+        self.assertIsNone(info.epoch)
+        self.assertEqual(info.resource_digests, {})
+
+    def test_index_disabled(self):
+        self.write_checkpoint("cib-1.raw", _cib(1, ""), 1000)
+        self.assertEqual(CheckpointIndex(None).update(self.cib_dir)[0].epoch, 1)
+        self.assertFalse(os.path.exists(self.index_path))
+
+
+class GetChangedResources(TestCase):
+    def setUp(self):
+        self.tmp_dir = get_tmp_dir("tier0_lib_cib_checkpoint_index")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_changed_resources(self):
+        cib_list = [
+            _cib(
+                1,
+                """
+                <group id="G"><primitive id="A" type="Dummy"/></group>
+                <primitive id="B" type="Dummy"/>
+                <primitive id="C" type="Dummy"/>
+                """,
+            ),
+            _cib(
+                2,
+                """
+                <group id="G"><primitive id="A" type="Stateful"/></group>
+                <primitive id="C" type="Dummy"/>
+                <primitive id="D" type="Dummy"/>
+                """,
+            ),
+        ]
+        for number, cib in enumerate(cib_list):
+            path = os.path.join(self.tmp_dir.name, f"cib-{number}.raw")
+            with open(path, "w", encoding="utf-8") as checkpoint_file:
+                checkpoint_file.write(cib)
+            os.utime(path, (number, number))
+        first, second = CheckpointIndex(None).update(self.tmp_dir.name)
+        self.assertEqual(
+            get_changed_resources(None, first), {"G", "A", "B", "C"}
+        )
+        self.assertEqual(
+            get_changed_resources(first, second), {"G", "A", "B", "D"}
+        )
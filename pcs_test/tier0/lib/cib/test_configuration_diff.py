@@ -0,0 +1,221 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.common.pacemaker.cib_diff import (
+    CibConfigurationDiffDto,
+    CibElementChangeDto,
+    CibElementDto,
+)
+from pcs.lib.cib.configuration_diff import (
+    diff_configuration,
+    index_configuration,
+)
+
+
+def _cib(resources="", constraints="", tags=""):
+    return etree.fromstring(
+        f"""
+        <cib epoch="1">
+            <configuration>
+                <crm_config/>
+                <resources>{resources}</resources>
+                <constraints>{constraints}</constraints>
+                <tags>{tags}</tags>
+            </configuration>
+            <status><node_state id="1"/></status>
+        </cib>
+        """
+    )
+
+
+def _element(
+    element_id, tag, section, parent_id, attributes=None, members=None
+):
+    return CibElementDto(
+        element_id, tag, section, parent_id, attributes or {}, members or []
+    )
+
+
+class IndexConfiguration(TestCase):
+    def test_no_configuration(self):
+        self.assertEqual(index_configuration(etree.fromstring("<cib/>")), {})
+
+    def test_index(self):
+        index = index_configuration(
+            _cib(
+                resources="""
+                    <group id="G">
+                        <meta_attributes id="G-meta"/>
+                        <primitive id="A" class="ocf" type="Dummy"/>
+                        <primitive id="B" class="ocf" type="Dummy"/>
+                    </group>
+                """,
+                tags="""
+                    <!-- comment -->
+                    <tag id="T"><obj_ref id="A"/><obj_ref id="B"/></tag>
+                """,
+            )
+        )
+        self.assertEqual(
+            list(index.values()),
+            [
+                _element("crm_config", "crm_config", "crm_config", None),
+                _element("resources", "resources", "resources", None),
+                _element(
+                    "G",
+                    "group",
+                    "resources",
+                    "resources",
+                    members=["A", "B"],
+                ),
+                _element("G-meta", "meta_attributes", "resources", "G"),
+                _element(
+                    "A",
+                    "primitive",
+                    "resources",
+                    "G",
+                    {"class": "ocf", "type": "Dummy"},
+                ),
+                _element(
+                    "B",
+                    "primitive",
+                    "resources",
+                    "G",
+                    {"class": "ocf", "type": "Dummy"},
+                ),
+                _element("constraints", "constraints", "constraints", None),
+                _element("tags", "tags", "tags", None),
+                _element("T", "tag", "tags", "tags"),
+                _element("T/obj_ref[0]", "obj_ref", "tags", "T", {"id": "A"}),
+                _element("T/obj_ref[1]", "obj_ref", "tags", "T", {"id": "B"}),
+            ],
+        )
+
+
+class DiffConfiguration(TestCase):
+    def test_no_difference(self):
+        self.assertEqual(
+            diff_configuration(
+                _cib(resources='<primitive id="A" type="Dummy"/>'),
+                _cib(resources='<primitive id="A" type="Dummy"/>'),
+            ),
+            CibConfigurationDiffDto([], [], []),
+        )
+
+    def test_added_removed_changed(self):
+        self.assertEqual(
+            diff_configuration(
+                _cib(
+                    resources="""
+                        <primitive id="A" type="Dummy"/>
+                        <primitive id="B" type="Dummy"/>
+                    """,
+                    constraints='<rsc_location id="L" rsc="A" score="1"/>',
+                ),
+                _cib(
+                    resources="""
+                        <primitive id="A" type="Stateful"/>
+                        <primitive id="C" type="Dummy">
+                            <meta_attributes id="C-meta">
+                                <nvpair id="C-meta-t" name="t" value="v"/>
+                            </meta_attributes>
+                        </primitive>
+                    """,
+                    constraints='<rsc_location id="L" rsc="A" score="1"/>',
+                ),
+            ),
+            CibConfigurationDiffDto(
+                added=[
+                    _element(
+                        "C",
+                        "primitive",
+                        "resources",
+                        "resources",
+                        {"type": "Dummy"},
+                    ),
+                    _element("C-meta", "meta_attributes", "resources", "C"),
+                    _element(
+                        "C-meta-t",
+                        "nvpair",
+                        "resources",
+                        "C-meta",
+                        {"name": "t", "value": "v"},
+                    ),
+                ],
+                removed=[
+                    _element(
+                        "B",
+                        "primitive",
+                        "resources",
+                        "resources",
+                        {"type": "Dummy"},
+                    ),
+                ],
+                changed=[
+                    CibElementChangeDto(
+                        _element(
+                            "A",
+                            "primitive",
+                            "resources",
+                            "resources",
+                            {"type": "Dummy"},
+                        ),
+                        _element(
+                            "A",
+                            "primitive",
+                            "resources",
+                            "resources",
+                            {"type": "Stateful"},
+                        ),
+                    ),
+                ],
+            ),
+        )
+
+    def test_moved_and_reordered(self):
+        diff = diff_configuration(
+            _cib(
+                resources="""
+                    <group id="G">
+                        <primitive id="A"/><primitive id="B"/>
+                    </group>
+                    <primitive id="C"/>
+                """
+            ),
+            _cib(
+                resources="""
+                    <group id="G">
+                        <primitive id="B"/><primitive id="C"/>
+                        <primitive id="A"/>
+                    </group>
+                """
+            ),
+        )
+        self.assertEqual(diff.added, [])
+        self.assertEqual(diff.removed, [])
+        self.assertEqual(
+            [(change.before, change.after) for change in diff.changed],
+            [
+                (
+                    _element(
+                        "G",
+                        "group",
+                        "resources",
+                        "resources",
+                        members=["A", "B"],
+                    ),
+                    _element(
+                        "G",
+                        "group",
+                        "resources",
+                        "resources",
+                        members=["B", "C", "A"],
+                    ),
+                ),
+                (
+                    _element("C", "primitive", "resources", "resources"),
+                    _element("C", "primitive", "resources", "G"),
+                ),
+            ],
+        )
@@ -231,10 +231,9 @@ class CreateIdTest(TestCase):
         mock_find_id.assert_called_once_with("cib", "PREFIX_set_AABBCC")
 
 
-def fixture_constraint_section(return_value):
-    constraint_section = mock.MagicMock()
-    constraint_section.xpath = mock.MagicMock()
-    constraint_section.xpath.return_value = return_value
+def fixture_constraint_section(element_list):
+    constraint_section = etree.Element("constraints")
+    constraint_section.extend(element_list)
     return constraint_section
 
 
@@ -248,7 +247,11 @@ class CheckIsWithoutDuplicationTest(TestCase):
             lambda: constraint.check_is_without_duplication(
                 report_processor,
                 fixture_constraint_section(
-                    [etree.Element("tag", {"id": "duplicate_element"})]
+                    [
+                        etree.Element(
+                            "constraint_type", {"id": "duplicate_element"}
+                        )
+                    ]
                 ),
                 element,
                 are_duplicate=lambda e1, e2: True,
@@ -305,7 +308,7 @@ class CheckIsWithoutDuplicationTest(TestCase):
         constraint.check_is_without_duplication(
             report_processor,
             fixture_constraint_section(
-                [etree.Element("tag", {"id": "duplicate_element"})]
+                [etree.Element("constraint_type", {"id": "duplicate_element"})]
             ),
             element,
             are_duplicate=lambda e1, e2: True,
@@ -0,0 +1,148 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.lib.cib.constraint_graph import ConstraintGraph
+
+
+def _ids(element_list):
+    return [element.get("id") for element in element_list]
+
+
+class ConstraintGraphTest(TestCase):
+    def setUp(self):
+        self.graph = ConstraintGraph(
+            etree.fromstring(
+                """
+                <constraints>
+                    <rsc_order id="o1" first="A" then="B"/>
+                    <rsc_colocation id="c1" rsc="B" with-rsc="A"/>
+                    <rsc_order id="o2">
+                        <resource_set id="o2-set">
+                            <resource_ref id="A"/>
+                            <resource_ref id="C"/>
+                        </resource_set>
+                    </rsc_order>
+                    <rsc_location id="l1" rsc="A" node="node1" score="10"/>
+                    <rsc_ticket id="t1" ticket="T">
+                        <resource_set id="t1-set">
+                            <resource_ref id="A"/>
+                        </resource_set>
+                    </rsc_ticket>
+                    <rsc_order id="o3" first="A" then="A"/>
+                    <rsc_location id="l2" rsc-pattern="A" node="node1"/>
+                </constraints>
+                """
+            )
+        )
+
+    def test_plain_constraints(self):
+        self.assertEqual(
+            ["o1", "c1", "l1", "o3"],
+            _ids(self.graph.get_plain_constraints("A")),
+        )
+        self.assertEqual(
+            ["o1", "c1"], _ids(self.graph.get_plain_constraints("B"))
+        )
+        self.assertEqual([], _ids(self.graph.get_plain_constraints("C")))
+
+    def test_set_constraints(self):
+        self.assertEqual(
+            ["o2", "t1"], _ids(self.graph.get_set_constraints("A"))
+        )
+        self.assertEqual(["o2"], _ids(self.graph.get_set_constraints("C")))
+        self.assertEqual([], _ids(self.graph.get_set_constraints("B")))
+
+    def test_all_constraints_in_document_order(self):
+        self.assertEqual(
+            ["o1", "c1", "o2", "l1", "t1", "o3"],
+            _ids(self.graph.get_constraints("A")),
+        )
+
+    def test_filter_constraint_tags(self):
+        self.assertEqual(
+            ["o1", "o3"],
+            _ids(self.graph.get_plain_constraints("A", ["rsc_order"])),
+        )
+        self.assertEqual(
+            ["o2"], _ids(self.graph.get_set_constraints("A", ["rsc_order"]))
+        )
+        self.assertEqual(
+            ["c1", "l1", "t1"],
+            _ids(
+                self.graph.get_constraints(
+                    "A", ["rsc_colocation", "rsc_location", "rsc_ticket"]
+                )
+            ),
+        )
+
+    def test_unknown_element(self):
+        self.assertEqual([], self.graph.get_constraints("X"))
+
+
+class TagsAndResourcesTest(TestCase):
+    def setUp(self):
+        self.graph = ConstraintGraph(
+            tags_section=etree.fromstring(
+                """
+                <tags>
+                    <tag id="T1">
+                        <obj_ref id="A"/>
+                        <obj_ref id="G"/>
+                    </tag>
+                    <tag id="T2">
+                        <obj_ref id="A"/>
+                        <obj_ref id="A"/>
+                    </tag>
+                </tags>
+                """
+            ),
+            resources_section=etree.fromstring(
+                """
+                <resources>
+                    <primitive id="A"/>
+                    <clone id="C">
+                        <group id="G">
+                            <meta_attributes id="G-meta"/>
+                            <primitive id="G1"/>
+                            <primitive id="G2"/>
+                        </group>
+                    </clone>
+                    <bundle id="B">
+                        <docker image="image"/>
+                        <primitive id="B1"/>
+                    </bundle>
+                </resources>
+                """
+            ),
+        )
+
+    def test_tags(self):
+        self.assertEqual("T1", self.graph.get_tag("T1").get("id"))
+        self.assertIsNone(self.graph.get_tag("A"))
+        self.assertEqual(["T1", "T2"], _ids(self.graph.get_tags("A")))
+        self.assertEqual(["T1"], _ids(self.graph.get_tags("G")))
+        self.assertEqual([], _ids(self.graph.get_tags("C")))
+
+    def test_resources(self):
+        self.assertEqual("G1", self.graph.get_resource("G1").get("id"))
+        self.assertIsNone(self.graph.get_resource("G-meta"))
+        self.assertIsNone(self.graph.get_resource("T1"))
+
+    def test_parent_resources(self):
+        self.assertIsNone(self.graph.get_parent_resource("A"))
+        self.assertIsNone(self.graph.get_parent_resource("C"))
+        self.assertEqual("C", self.graph.get_parent_resource("G").get("id"))
+        self.assertEqual("G", self.graph.get_parent_resource("G2").get("id"))
+        self.assertEqual("B", self.graph.get_parent_resource("B1").get("id"))
+
+    def test_inner_resources(self):
+        self.assertEqual([], _ids(self.graph.get_inner_resources("A")))
+        self.assertEqual(["G"], _ids(self.graph.get_inner_resources("C")))
+        self.assertEqual(
+            ["G1", "G2"], _ids(self.graph.get_inner_resources("G"))
+        )
+        self.assertEqual(["B1"], _ids(self.graph.get_inner_resources("B")))
+
+    def test_no_constraints(self):
+        self.assertEqual([], self.graph.get_constraints("A"))
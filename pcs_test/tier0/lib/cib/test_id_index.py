@@ -0,0 +1,154 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.lib.cib import tools
+from pcs.lib.cib.id_index import (
+    CibIdIndex,
+    get_id_index,
+)
+
+
+def fixture_cib():
+    return etree.fromstring(
+        """
+        <cib>
+            <configuration>
+                <resources>
+                    <primitive id="R1">
+                        <meta_attributes id="R1-meta">
+                            <nvpair id="R1-meta-remote" name="remote-node"
+                                value="node-R1"
+                            />
+                        </meta_attributes>
+                    </primitive>
+                    <primitive id="R2"/>
+                </resources>
+                <acls>
+                    <acl_target id="target"/>
+                </acls>
+            </configuration>
+            <status>
+                <node_state id="state"/>
+            </status>
+        </cib>
+        """
+    )
+
+
+class CibIdIndexTest(TestCase):
+    def setUp(self):
+        self.cib = fixture_cib()
+        self.index = CibIdIndex(self.cib)
+
+    def assert_ids(self, element_list, expected_ids):
+        self.assertEqual(
+            [element.get("id") for element in element_list], expected_ids
+        )
+
+    def test_get_elements(self):
+        self.assert_ids(self.index.get_elements("R1"), ["R1"])
+        self.assert_ids(
+            self.index.get_elements("R1-meta-remote"), ["R1-meta-remote"]
+        )
+        self.assert_ids(self.index.get_elements("node-R1"), ["R1"])
+        self.assert_ids(self.index.get_elements("missing"), [])
+
+    def test_not_configuration_ids(self):
+        self.assertFalse(self.index.is_id_used("target"))
+        self.assertFalse(self.index.is_id_used("state"))
+
+    def test_removed_element(self):
+        self.assertTrue(self.index.is_id_used("R2"))
+        primitive = self.index.get_elements("R2")[0]
+        primitive.getparent().remove(primitive)
+        self.assert_ids(self.index.get_elements("R2"), [])
+        self.assertFalse(self.index.is_id_used("R2"))
+
+    def test_changed_id(self):
+        self.index.register_id("R3")
+        self.index.get_elements("R2")[0].set("id", "R3")
+        self.assert_ids(self.index.get_elements("R2"), [])
+        self.assert_ids(self.index.get_elements("R3"), ["R3"])
+
+    def test_removed_remote_node(self):
+        self.assertTrue(self.index.is_id_used("node-R1"))
+        self.cib.find(".//nvpair").set("name", "target-role")
+        self.assertFalse(self.index.is_id_used("node-R1"))
+
+    def test_moved_to_status(self):
+        primitive = self.index.get_elements("R2")[0]
+        self.cib.find("status").append(primitive)
+        self.assert_ids(self.index.get_elements("R2"), [])
+
+    def test_added_element_registered_id(self):
+        self.assertFalse(self.index.is_id_used("R3"))
+        self.index.register_id("R3")
+        self.assertFalse(self.index.is_id_used("R3"))
+        etree.SubElement(self.cib.find(".//resources"), "primitive", id="R3")
+        self.assertTrue(self.index.is_id_used("R3"))
+        self.assert_ids(self.index.get_elements("R3"), ["R3"])
+
+    def test_added_element_booked_id(self):
+        self.index.book_id("R3")
+        self.assertTrue(self.index.is_id_used("R3"))
+        self.assert_ids(self.index.get_elements("R3"), [])
+        etree.SubElement(self.cib.find(".//resources"), "primitive", id="R3")
+        self.assert_ids(self.index.get_elements("R3"), ["R3"])
+
+    def test_added_element_put_to_index(self):
+        self.assertFalse(self.index.is_id_used("R3"))
+        element = etree.SubElement(
+            self.cib.find(".//resources"), "primitive", id="R3"
+        )
+        self.index.add_element(element)
+        self.assert_ids(self.index.get_elements("R3"), ["R3"])
+
+    def test_added_element_not_known(self):
+        # misses of ids not registered are not searched for in the CIB
+        self.assertFalse(self.index.is_id_used("R3"))
+        etree.SubElement(self.cib.find(".//resources"), "primitive", id="R3")
+        self.assertFalse(self.index.is_id_used("R3"))
+
+
+class GetIdIndex(TestCase):
+    def test_one_index_per_cib(self):
+        cib = fixture_cib()
+        index = get_id_index(cib)
+        self.assertIs(index, get_id_index(cib.find(".//resources")))
+        self.assertIs(index, get_id_index(cib.getroottree()))
+        self.assertIsNot(index, get_id_index(fixture_cib()))
+
+
+class IdsCreatedBetweenAllocations(TestCase):
+    def setUp(self):
+        self.cib = fixture_cib()
+        self.resources = self.cib.find(".//resources")
+
+    def test_id_found_by_find_unique_id(self):
+        id_provider = tools.IdProvider(self.cib)
+        self.assertEqual(id_provider.allocate_id("R2"), "R2-1")
+        new_id = tools.find_unique_id(self.cib, "R2")
+        self.assertEqual(new_id, "R2-2")
+        etree.SubElement(self.resources, "primitive", id=new_id)
+        self.assertEqual(id_provider.allocate_id("R2"), "R2-3")
+
+    def test_id_checked_by_does_id_exist(self):
+        id_provider = tools.IdProvider(self.cib)
+        self.assertEqual(id_provider.allocate_id("R2"), "R2-1")
+        self.assertFalse(tools.does_id_exist(self.cib, "R2-2"))
+        etree.SubElement(self.resources, "primitive", id="R2-2")
+        self.assertEqual(id_provider.allocate_id("R2"), "R2-3")
+
+    def test_checked_id_not_used(self):
+        id_provider = tools.IdProvider(self.cib)
+        self.assertFalse(tools.does_id_exist(self.cib, "R3"))
+        self.assertFalse(tools.does_id_exist(self.cib, "R3"))
+        self.assertEqual(id_provider.book_ids("R3"), [])
+
+    def test_booked_by_another_provider(self):
+        self.assertEqual(tools.IdProvider(self.cib).book_ids("R3"), [])
+        self.assertEqual(
+            tools.IdProvider(self.cib).allocate_id("R3"),
+            "R3-1",
+        )
@@ -0,0 +1,236 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.lib.cib import patchset
+
+from pcs_test.tools.assertions import assert_xml_equal
+from pcs_test.tools.misc import read_test_resource as rc_read
+from pcs_test.tools.xml import etree_to_str
+
+CIB = """
+    <cib epoch="5" num_updates="1" admin_epoch="0" validate-with="pacemaker-3.5">
+        <configuration>
+            <crm_config/>
+            <nodes/>
+            <resources>
+                <primitive id="A" class="ocf" provider="pacemaker" type="Dummy">
+                    <instance_attributes id="A-ia">
+                        <nvpair id="A-ia-a" name="a" value="1"/>
+                    </instance_attributes>
+                </primitive>
+                <primitive id="B" class="ocf" provider="pacemaker" type="Dummy"/>
+                <primitive id="C" class="ocf" provider="pacemaker" type="Dummy"/>
+            </resources>
+            <constraints/>
+        </configuration>
+        <status/>
+    </cib>
+"""
+
+
+class CreatePatchset(TestCase):
+    def setUp(self):
+        self.cib_old = etree.fromstring(CIB)
+        self.cib_new = etree.fromstring(CIB)
+        self.resources = self.cib_new.find("configuration/resources")
+
+    def assert_patchset(self, expected_xml):
+        assert_xml_equal(
+            expected_xml,
+            etree_to_str(patchset.create_patchset(self.cib_old, self.cib_new)),
+        )
+
+    def assert_patchset_applies(self):
+        patchset.apply_patchset(
+            self.cib_old, patchset.create_patchset(self.cib_old, self.cib_new)
+        )
+        self.assertIsNone(patchset.create_patchset(self.cib_old, self.cib_new))
+
+    def test_no_change(self):
+        self.assertIsNone(patchset.create_patchset(self.cib_old, self.cib_new))
+
+    def test_version_change_ignored(self):
+        self.cib_new.set("epoch", "10")
+        self.cib_new.set("num_updates", "0")
+        self.assertIsNone(patchset.create_patchset(self.cib_old, self.cib_new))
+
+    def test_modify_attributes(self):
+        nvpair = self.resources.find(".//nvpair")
+        nvpair.set("value", "2")
+        self.resources.find("primitive").set("description", "desc")
+        del self.resources.find("primitive").attrib["provider"]
+        self.assert_patchset(
+            """
+            <diff format="2">
+                <change operation="modify"
+                    path="/cib/configuration/resources/primitive[@id='A']"
+                >
+                    <change-list>
+                        <change-attr name="description" operation="set"
+                            value="desc"
+                        />
+                        <change-attr name="provider" operation="unset"/>
+                    </change-list>
+                    <change-result>
+                        <primitive id="A" class="ocf" type="Dummy"
+                            description="desc"
+                        />
+                    </change-result>
+                </change>
+                <change operation="modify"
+                    path="/cib/configuration/resources/primitive[@id='A']/instance_attributes[@id='A-ia']/nvpair[@id='A-ia-a']"
+                >
+                    <change-list>
+                        <change-attr name="value" operation="set" value="2"/>
+                    </change-list>
+                    <change-result>
+                        <nvpair id="A-ia-a" name="a" value="2"/>
+                    </change-result>
+                </change>
+            </diff>
+            """
+        )
+        self.assert_patchset_applies()
+
+    def test_modify_root_without_version(self):
+        self.cib_new.set("epoch", "10")
+        self.cib_new.set("validate-with", "pacemaker-3.7")
+        self.assert_patchset(
+            """
+            <diff format="2">
+                <change operation="modify" path="/cib">
+                    <change-list>
+                        <change-attr name="validate-with" operation="set"
+                            value="pacemaker-3.7"
+                        />
+                    </change-list>
+                    <change-result>
+                        <cib validate-with="pacemaker-3.7"/>
+                    </change-result>
+                </change>
+            </diff>
+            """
+        )
+        self.assert_patchset_applies()
+        self.assertEqual(self.cib_old.get("epoch"), "5")
+        self.assertEqual(self.cib_old.get("num_updates"), "1")
+
+    def test_create_and_delete(self):
+        self.resources.remove(self.resources.find("primitive[@id='B']"))
+        etree.SubElement(self.resources, "group", id="G")
+        self.resources.insert(0, etree.Element("primitive", id="D"))
+        self.assert_patchset(
+            """
+            <diff format="2">
+                <change operation="delete"
+                    path="/cib/configuration/resources/primitive[@id='B']"
+                />
+                <change operation="create"
+                    path="/cib/configuration/resources" position="0"
+                >
+                    <primitive id="D"/>
+                </change>
+                <change operation="create"
+                    path="/cib/configuration/resources" position="3"
+                >
+                    <group id="G"/>
+                </change>
+            </diff>
+            """
+        )
+        self.assert_patchset_applies()
+
+    def test_move(self):
+        self.resources.append(self.resources.find("primitive[@id='A']"))
+        self.assert_patchset(
+            """
+            <diff format="2">
+                <change operation="delete"
+                    path="/cib/configuration/resources/primitive[@id='A']"
+                />
+                <change operation="create"
+                    path="/cib/configuration/resources" position="2"
+                >
+                    <primitive id="A" class="ocf" provider="pacemaker"
+                        type="Dummy"
+                    >
+                        <instance_attributes id="A-ia">
+                            <nvpair id="A-ia-a" name="a" value="1"/>
+                        </instance_attributes>
+                    </primitive>
+                </change>
+            </diff>
+            """
+        )
+        self.assert_patchset_applies()
+
+    def test_large_cib_reorder_and_wrap(self):
+        self.cib_old = etree.fromstring(rc_read("cib-large.xml"))
+        self.cib_new = etree.fromstring(rc_read("cib-large.xml"))
+        resources = self.cib_new.find("configuration/resources")
+        primitive_list = resources.findall("primitive")
+        group = etree.SubElement(resources, "group", id="new-group")
+        group.extend(primitive_list[2:5])
+        resources.insert(0, primitive_list[-1])
+        self.assert_patchset_applies()
+
+    def test_ambiguous_siblings_not_supported(self):
+        etree.SubElement(self.resources, "primitive")
+        etree.SubElement(self.resources, "primitive")
+        with self.assertRaises(patchset.PatchsetNotSupported):
+            patchset.create_patchset(self.cib_old, self.cib_new)
+
+    def test_comment_change_not_supported(self):
+        self.resources.append(etree.Comment("comment"))
+        with self.assertRaises(patchset.PatchsetNotSupported):
+            patchset.create_patchset(self.cib_old, self.cib_new)
+
+    def test_unchanged_comments_supported(self):
+        self.cib_old.find("configuration/resources").insert(
+            1, etree.Comment("comment")
+        )
+        self.resources.insert(1, etree.Comment("comment"))
+        self.resources.find(".//nvpair").set("value", "2")
+        self.assert_patchset_applies()
+
+
+class CreatePatchsetXml(TestCase):
+    def test_no_change(self):
+        self.assertEqual(
+            "",
+            patchset.create_patchset_xml(
+                etree.fromstring(CIB), etree.fromstring(CIB)
+            ),
+        )
+
+    def test_verified(self):
+        cib_new = etree.fromstring(CIB)
+        cib_new.find("configuration/nodes").append(
+            etree.Element("node", id="1", uname="node1")
+        )
+        assert_xml_equal(
+            """
+            <diff format="2">
+                <change operation="create"
+                    path="/cib/configuration/nodes" position="0"
+                >
+                    <node id="1" uname="node1"/>
+                </change>
+            </diff>
+            """,
+            patchset.create_patchset_xml(etree.fromstring(CIB), cib_new),
+        )
+
+    def test_verification_fails(self):
+        # An element without an id is addressed by its tag only. If a sibling
+        # with the same tag and an id precedes it, pacemaker would modify the
+        # sibling instead.
+        cib_old = etree.fromstring(CIB)
+        etree.SubElement(
+            cib_old.find("configuration/resources"), "primitive", type="X"
+        )
+        cib_new = etree.fromstring(etree_to_str(cib_old))
+        cib_new.find("configuration/resources")[-1].set("type", "Y")
+        with self.assertRaises(patchset.PatchsetNotSupported):
+            patchset.create_patchset_xml(cib_old, cib_new)
@@ -150,6 +150,19 @@ class IdProviderAllocate(IdProviderTest):
         assert_report_item_list_equal(self.provider.book_ids("myId-1"), [])
         self.assertEqual("myId-2", self.provider.allocate_id("myId"))
 
+    def test_allocated_by_another_provider(self):
+        self.assertEqual("myId", self.provider.allocate_id("myId"))
+        self.fixture_add_primitive_with_id("myId")
+        self.assertEqual(
+            "myId-1", lib.IdProvider(self.cib.tree).allocate_id("myId")
+        )
+
+    def test_added_after_first_allocation(self):
+        self.assertEqual("myId", self.provider.allocate_id("myId"))
+        self.assertFalse(lib.does_id_exist(self.cib.tree, "otherId"))
+        self.fixture_add_primitive_with_id("otherId")
+        self.assertEqual("otherId-1", self.provider.allocate_id("otherId"))
+
 
 class DoesIdExistTest(CibToolsTest):
     def test_existing_id(self):
@@ -728,6 +741,34 @@ class ElementSearcher(TestCase):
         self.assertEqual("a", searcher.get_element().attrib["id"])
         self.assert_get_errors_raises(searcher)
 
+    def test_element_outside_context_not_found(self):
+        tree = etree.fromstring(
+            """
+            <cib>
+                <configuration>
+                    <resources/>
+                    <tags><tag id="a"/></tags>
+                </configuration>
+            </cib>
+            """
+        )
+        searcher = lib.ElementSearcher("tag", "a", tree.find(".//resources"))
+        self.assertFalse(searcher.element_found())
+
+    def test_element_added_after_previous_search(self):
+        tree = etree.fromstring(
+            '<cib><resources><group id="a"/></resources></cib>'
+        )
+        resources = tree.find(".//resources")
+        self.assertTrue(
+            lib.ElementSearcher("group", "a", resources).element_found()
+        )
+        self.assertEqual(lib.IdProvider(tree).book_ids("b"), [])
+        etree.SubElement(resources, "group", id="b")
+        searcher = lib.ElementSearcher("group", "b", resources)
+        self.assertTrue(searcher.element_found())
+        self.assertEqual("b", searcher.get_element().attrib["id"])
+
     def test_id_found_for_another_tag(self):
         tree = etree.fromstring(
             '<cib><resources><primitive id="a"/></resources></cib>'
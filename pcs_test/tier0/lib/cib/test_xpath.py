@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.lib.cib import xpath
+
+
+class GetXpath(TestCase):
+    def test_compiled_once(self):
+        expression = "fencing-level[@index=$var_level]"
+        self.assertIs(xpath.get_xpath(expression), xpath.get_xpath(expression))
+
+    def test_variables(self):
+        tree = etree.fromstring(
+            """
+            <fencing-topology>
+                <fencing-level id="fl1" index="1" />
+                <fencing-level id="fl2" index="2" />
+            </fencing-topology>
+            """
+        )
+        query = xpath.get_xpath("fencing-level[@index=$var_level]")
+        self.assertEqual(
+            [element.get("id") for element in query(tree, var_level="2")],
+            ["fl2"],
+        )
+
+
+class CompiledQueries(TestCase):
+    def test_ids_skip_status_and_references(self):
+        cib = etree.fromstring(
+            """
+            <cib>
+                <configuration>
+                    <resources>
+                        <primitive id="A1" />
+                    </resources>
+                    <tags>
+                        <tag id="A2"><obj_ref id="A1" /></tag>
+                    </tags>
+                </configuration>
+                <status>
+                    <lrm_resource id="A3" />
+                </status>
+            </cib>
+            """
+        )
+        self.assertEqual(
+            sorted(element.get("id") for element in xpath.ID_ELEMENTS(cib)),
+            ["A1", "A2"],
+        )
@@ -389,16 +389,19 @@ class LocalConfig:
             ]
         )
 
-    def get_host_info(self, node_labels):
+    def get_host_info(self, node_labels, pcsd_capabilities=None):
+        output_data = dict(
+            services={
+                service: dict(installed=True, enabled=False, running=False)
+                for service in ("corosync", "pacemaker", "pcsd")
+            },
+            cluster_configuration_exists=False,
+        )
+        if pcsd_capabilities is not None:
+            output_data["pcsd_capabilities"] = pcsd_capabilities
         self.config.http.host.get_host_info(
             node_labels=node_labels,
-            output_data=dict(
-                services={
-                    service: dict(installed=True, enabled=False, running=False)
-                    for service in ("corosync", "pacemaker", "pcsd")
-                },
-                cluster_configuration_exists=False,
-            ),
+            output_data=output_data,
             name="local.get_host_info.http.host.get_host_info",
         )
 
@@ -1044,6 +1047,85 @@ class AddNodesSuccessMinimal(TestCase):
         self._test_enable_start_wait(3, 3)
 
 
+class AddNodesSuccessTransaction(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.existing_nodes, self.new_nodes = generate_nodes(1, 2)
+        patch_getaddrinfo(self, self.new_nodes)
+        self.expected_reports = []
+        self.config.env.set_known_nodes(self.new_nodes + self.existing_nodes)
+        self.config.local.set_expected_reports_list(self.expected_reports)
+        corosync_set_name = (
+            "local.distribute_and_reload_corosync_conf."
+            "http.corosync.set_corosync_conf"
+        )
+        (
+            self.config.services.is_enabled("sbd", return_value=False)
+            .corosync_conf.load_content(
+                corosync_conf_fixture(
+                    [node_fixture(self.existing_nodes[0], 1)],
+                    get_two_node(1),
+                )
+            )
+            .runner.cib.load()
+            .http.host.check_auth(node_labels=self.existing_nodes)
+            .local.get_host_info(
+                self.new_nodes, pcsd_capabilities=["pcs.remote.transaction"]
+            )
+            .local.pcsd_ssl_cert_sync_disabled()
+            .http.host.update_known_hosts(
+                node_labels=self.new_nodes,
+                to_add_hosts=self.existing_nodes + self.new_nodes,
+            )
+            .local.disable_sbd(self.new_nodes)
+            .fs.isdir(settings.booth_config_dir, return_value=False)
+            .local.no_file_sync()
+            .local.distribute_and_reload_corosync_conf(
+                corosync_conf_fixture(
+                    [
+                        node_fixture(node, i)
+                        for i, node in enumerate(
+                            self.existing_nodes + self.new_nodes, 1
+                        )
+                    ],
+                    get_two_node(3),
+                ),
+                self.existing_nodes,
+                self.new_nodes,
+            )
+            # the new nodes are changed in one request before corosync.conf
+            # is distributed
+            .http.transaction(
+                "http.transaction.new_nodes",
+                [
+                    "http.host.update_known_hosts",
+                    "local.disable_sbd.http.sbd.disable_sbd",
+                ],
+                before=f"{corosync_set_name}_requests",
+            )
+        )
+        self.expected_reports.extend(
+            [
+                fixture.info(
+                    reports.codes.USING_DEFAULT_ADDRESS_FOR_HOST,
+                    host_name=node,
+                    address=node,
+                    address_source=(
+                        reports.const.DEFAULT_ADDRESS_SOURCE_KNOWN_HOSTS
+                    ),
+                )
+                for node in self.new_nodes
+            ]
+        )
+
+    def test_success(self):
+        cluster.add_nodes(
+            self.env_assist.get_env(),
+            [{"name": node} for node in self.new_nodes],
+        )
+        self.env_assist.assert_reports(self.expected_reports)
+
+
 def _get_watchdog(node):
     return f"/dev/watchdog-{node}"
 
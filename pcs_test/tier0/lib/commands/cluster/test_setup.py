@@ -215,6 +215,7 @@ def config_success_minimal_fixture(
     node_labels=None,
     communication_list=None,
     known_hosts=None,
+    pcsd_capabilities=None,
 ):
     if node_labels is None and communication_list is None:
         node_labels = NODE_LIST
@@ -242,6 +243,11 @@ def config_success_minimal_fixture(
             output_data=dict(
                 services=services_status,
                 cluster_configuration_exists=False,
+                **(
+                    dict(pcsd_capabilities=pcsd_capabilities)
+                    if pcsd_capabilities is not None
+                    else {}
+                ),
             ),
             communication_list=communication_list,
         )
@@ -605,6 +611,228 @@ class SetupSuccessMinimal(TestCase):
         )
 
 
+PREPARE_CALL_LIST = [
+    "http.host.cluster_destroy",
+    "http.host.update_known_hosts",
+    "http.files.remove_files",
+    "http.files.put_files",
+]
+
+
+@mock.patch("pcs.lib.commands.cluster.generate_uuid", lambda: CLUSTER_UUID)
+@mock.patch(
+    "pcs.lib.commands.cluster.generate_binary_key",
+    lambda random_bytes_count: RANDOM_KEY,
+)
+class SetupSuccessTransaction(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.config.env.set_known_nodes(NODE_LIST + ["random_node"])
+        patch_getaddrinfo(self, NODE_LIST)
+        config_success_minimal_fixture(
+            self.config,
+            corosync_conf=corosync_conf_fixture(COROSYNC_NODE_LIST),
+            pcsd_capabilities=["pcs.remote.transaction"],
+        )
+        self.config.http.transaction(
+            "http.transaction.prepare", PREPARE_CALL_LIST
+        )
+
+    def test_minimal(self):
+        self.config.http.transaction(
+            "http.transaction.commit", ["distribute_corosync_conf"]
+        )
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+        )
+        self.env_assist.assert_reports(reports_success_minimal_fixture())
+
+    def test_enable_start(self):
+        (
+            self.config.http.host.enable_cluster(NODE_LIST)
+            .http.transaction(
+                "http.transaction.commit",
+                ["distribute_corosync_conf", "http.host.enable_cluster"],
+            )
+            .http.host.start_cluster(NODE_LIST)
+        )
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+            enable=True,
+            start=True,
+        )
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_ENABLE_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                ),
+                fixture.info(
+                    reports.codes.CLUSTER_START_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                ),
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_ENABLE_SUCCESS, node=node)
+                for node in NODE_LIST
+            ]
+        )
+
+    def test_prepare_failure(self):
+        self.config.calls.remove("http.transaction.prepare_requests")
+        self.config.calls.remove("http.transaction.prepare_responses")
+        self.config.calls.remove("distribute_corosync_conf_requests")
+        self.config.calls.remove("distribute_corosync_conf_responses")
+        (
+            self.config.http.host.cluster_destroy(
+                communication_list=[
+                    dict(label=NODE_LIST[0], response_code=400, output=REASON)
+                ]
+                + [dict(label=node) for node in NODE_LIST[1:]],
+            )
+            .http.host.update_known_hosts(
+                node_labels=NODE_LIST,
+                to_add_hosts=NODE_LIST,
+            )
+            .http.files.remove_files(node_labels=NODE_LIST, pcsd_settings=True)
+            .http.files.put_files(
+                node_labels=NODE_LIST,
+                pcmk_authkey=RANDOM_KEY,
+                corosync_authkey=RANDOM_KEY,
+            )
+            .http.transaction("http.transaction.prepare", PREPARE_CALL_LIST)
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: cluster.setup(
+                self.env_assist.get_env(),
+                CLUSTER_NAME,
+                COMMAND_NODE_LIST,
+            ),
+            [],
+        )
+        succeeded_nodes = NODE_LIST[1:]
+        self.env_assist.assert_reports(
+            [
+                fixture.info(
+                    reports.codes.USING_DEFAULT_ADDRESS_FOR_HOST,
+                    host_name=node,
+                    address=node,
+                    address_source=(
+                        reports.const.DEFAULT_ADDRESS_SOURCE_KNOWN_HOSTS
+                    ),
+                )
+                for node in NODE_LIST
+            ]
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_DESTROY_STARTED,
+                    host_name_list=NODE_LIST,
+                ),
+                fixture.error(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node=NODE_LIST[0],
+                    command="remote/cluster_destroy",
+                    reason=REASON,
+                ),
+                fixture.info(
+                    reports.codes.FILES_REMOVE_FROM_NODES_STARTED,
+                    file_list=["pcsd settings"],
+                    node_list=NODE_LIST,
+                ),
+                fixture.info(
+                    reports.codes.FILES_DISTRIBUTION_STARTED,
+                    file_list=["corosync authkey", "pacemaker authkey"],
+                    node_list=NODE_LIST,
+                ),
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_DESTROY_SUCCESS, node=node)
+                for node in succeeded_nodes
+            ]
+            + [
+                fixture.info(
+                    reports.codes.FILE_REMOVE_FROM_NODE_SUCCESS,
+                    node=node,
+                    file_description="pcsd settings",
+                )
+                for node in succeeded_nodes
+            ]
+            + [
+                fixture.info(
+                    reports.codes.FILE_DISTRIBUTION_SUCCESS,
+                    node=node,
+                    file_description=file,
+                )
+                for node in succeeded_nodes
+                for file in ["corosync authkey", "pacemaker authkey"]
+            ]
+        )
+
+    def test_not_supported_on_all_nodes(self):
+        self.config.calls.remove("http.host.get_host_info_requests")
+        self.config.calls.remove("http.host.get_host_info_responses")
+        self.config.calls.remove("http.transaction.prepare_requests")
+        self.config.calls.remove("http.transaction.prepare_responses")
+        self.config.calls.remove("distribute_corosync_conf_requests")
+        self.config.calls.remove("distribute_corosync_conf_responses")
+        services_status = {
+            service: dict(
+                installed=True, enabled=False, running=False, version="1.0"
+            )
+            for service in SERVICE_LIST
+        }
+        (
+            self.config.http.place_multinode_call(
+                "http.host.get_host_info",
+                communication_list=[
+                    dict(
+                        label=node,
+                        output=json.dumps(
+                            dict(
+                                services=services_status,
+                                cluster_configuration_exists=False,
+                                pcsd_capabilities=capabilities,
+                            )
+                        ),
+                    )
+                    for node, capabilities in zip(
+                        NODE_LIST,
+                        [["pcs.remote.transaction"], [], ["other"]],
+                    )
+                ],
+                action="remote/check_host",
+                before="fs.isfile.pcsd_config",
+            )
+            .http.host.cluster_destroy(node_labels=NODE_LIST)
+            .http.host.update_known_hosts(
+                node_labels=NODE_LIST,
+                to_add_hosts=NODE_LIST,
+            )
+            .http.files.remove_files(node_labels=NODE_LIST, pcsd_settings=True)
+            .http.files.put_files(
+                node_labels=NODE_LIST,
+                pcmk_authkey=RANDOM_KEY,
+                corosync_authkey=RANDOM_KEY,
+            )
+            .http.files.put_files(
+                node_labels=NODE_LIST,
+                corosync_conf=corosync_conf_fixture(COROSYNC_NODE_LIST),
+                name="distribute_corosync_conf",
+            )
+        )
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+        )
+        self.env_assist.assert_reports(reports_success_minimal_fixture())
+
+
 @mock.patch("pcs.lib.commands.cluster.generate_uuid", lambda: CLUSTER_UUID)
 @mock.patch(
     "pcs.lib.commands.cluster.generate_binary_key",
@@ -2573,6 +2801,139 @@ class SetupWithWait(TestCase):
         )
 
 
+def _pcmk_status_fixture(label, started=True, **kwargs):
+    return dict(
+        label=label,
+        output=json.dumps(dict(pending=not started, online=started)),
+        **kwargs,
+    )
+
+
+@mock.patch("pcs.lib.commands.cluster.generate_uuid", lambda: CLUSTER_UUID)
+@mock.patch(
+    "pcs.lib.commands.cluster.generate_binary_key",
+    lambda random_bytes_count: RANDOM_KEY,
+)
+@mock.patch("time.sleep", lambda secs: None)
+class SetupWithWaitLongPoll(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.config.env.set_known_nodes(NODE_LIST)
+        patch_getaddrinfo(self, NODE_LIST)
+        config_success_minimal_fixture(
+            self.config,
+            corosync_conf=corosync_conf_fixture(COROSYNC_NODE_LIST),
+            pcsd_capabilities=["pcs.remote.pacemaker-node-status.wait"],
+        )
+        self.config.http.host.start_cluster(NODE_LIST)
+
+    def _setup(self, wait):
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+            start=True,
+            wait=wait,
+        )
+
+    def _reports_fixture(self):
+        return reports_success_minimal_fixture() + [
+            fixture.info(
+                reports.codes.CLUSTER_START_STARTED,
+                host_name_list=sorted(NODE_LIST),
+            ),
+            fixture.info(
+                reports.codes.WAIT_FOR_NODE_STARTUP_STARTED,
+                node_name_list=NODE_LIST,
+            ),
+        ]
+
+    @mock.patch("time.time", get_time_mock())
+    def test_nodes_asked_again_right_away(self):
+        self.config.http.host.check_pacemaker_started(
+            communication_list=[
+                [
+                    _pcmk_status_fixture(NODE_LIST[0]),
+                    _pcmk_status_fixture(NODE_LIST[1], started=False),
+                    _pcmk_status_fixture(NODE_LIST[2], started=False),
+                ],
+                [_pcmk_status_fixture(NODE_LIST[1], started=False)],
+                [_pcmk_status_fixture(NODE_LIST[2])],
+                [_pcmk_status_fixture(NODE_LIST[1])],
+            ],
+            param_list=[("wait", 30)],
+        )
+        self._setup(60)
+        self.env_assist.assert_reports(
+            self._reports_fixture()
+            + [
+                fixture.info(reports.codes.CLUSTER_START_SUCCESS, node=node)
+                for node in NODE_LIST
+            ]
+        )
+
+    @mock.patch("time.time", get_time_mock())
+    def test_unreachable_node_asked_again_later(self):
+        (
+            self.config.http.host.check_pacemaker_started(
+                communication_list=[
+                    dict(
+                        label=NODE_LIST[0],
+                        was_connected=False,
+                        error_msg="error",
+                    ),
+                    _pcmk_status_fixture(NODE_LIST[1]),
+                    _pcmk_status_fixture(NODE_LIST[2]),
+                ],
+                param_list=[("wait", 30)],
+            ).http.host.check_pacemaker_started(
+                communication_list=[_pcmk_status_fixture(NODE_LIST[0])],
+                param_list=[("wait", 30)],
+                name="pcmk_status_check_2",
+            )
+        )
+        self._setup(60)
+        self.env_assist.assert_reports(
+            self._reports_fixture()
+            + [
+                fixture.warn(
+                    reports.codes.NODE_COMMUNICATION_ERROR_UNABLE_TO_CONNECT,
+                    node=NODE_LIST[0],
+                    command="remote/pacemaker_node_status",
+                    reason="error",
+                ),
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_START_SUCCESS, node=node)
+                for node in NODE_LIST
+            ]
+        )
+
+    @mock.patch("time.time", get_time_mock())
+    def test_timed_out(self):
+        self.config.http.host.check_pacemaker_started(
+            communication_list=[
+                _pcmk_status_fixture(NODE_LIST[0]),
+                _pcmk_status_fixture(NODE_LIST[1], started=False),
+                _pcmk_status_fixture(NODE_LIST[2]),
+            ],
+            # no time left, nodes respond right away
+            param_list=[("wait", 0)],
+        )
+        self.env_assist.assert_raise_library_error(lambda: self._setup(1))
+        self.env_assist.assert_reports(
+            self._reports_fixture()
+            + [
+                fixture.info(reports.codes.CLUSTER_START_SUCCESS, node=node)
+                for node in (NODE_LIST[0], NODE_LIST[2])
+            ]
+            + [
+                fixture.error(reports.codes.WAIT_FOR_NODE_STARTUP_TIMED_OUT),
+                fixture.error(reports.codes.WAIT_FOR_NODE_STARTUP_ERROR),
+            ]
+        )
+
+
 REASON = "error msg"
 
 
@@ -817,15 +817,22 @@ class DefaultsConfigMixin:
             ]
         )
 
-    def _setup_rule_in_effect(self, crm_rule_check=True, crm_rule_present=True):
+    def _setup_rule_in_effect(
+        self,
+        crm_rule_check=True,
+        crm_rule_present=True,
+        rule_expressions="""
+            <expression
+                id="my-id-rule-expr"
+                operation="defined" attribute="attr1"
+            />
+        """,
+    ):
         defaults_xml = f"""
             <{self.tag}>
                 <meta_attributes id="my-id">
                     <rule id="my-id-rule" boolean-op="and">
-                        <expression
-                            id="my-id-rule-expr"
-                            operation="defined" attribute="attr1"
-                        />
+                        {rule_expressions}
                     </rule>
                     <nvpair id="my-id-pair1" name="name1" value="value1" />
                 </meta_attributes>
@@ -840,6 +847,93 @@ class DefaultsConfigMixin:
                 return_value=crm_rule_present,
             )
 
+    @staticmethod
+    def fixture_date_expr_dto(expr_id, attrs, expr_str):
+        return CibRuleExpressionDto(
+            expr_id,
+            CibRuleExpressionType.DATE_EXPRESSION,
+            CibRuleInEffectStatus.UNKNOWN,
+            attrs,
+            None,
+            None,
+            [],
+            expr_str,
+        )
+
+    def fixture_date_dto(self, expired, operation, date):
+        date_attr = "end" if operation == "lt" else "start"
+        return CibNvsetDto(
+            "my-id",
+            {},
+            CibRuleExpressionDto(
+                "my-id-rule",
+                CibRuleExpressionType.RULE,
+                expired,
+                {"boolean-op": "and"},
+                None,
+                None,
+                [
+                    self.fixture_date_expr_dto(
+                        "my-id-rule-expr",
+                        {"operation": operation, date_attr: date},
+                        f"date {operation} {date}",
+                    ),
+                ],
+                f"date {operation} {date}",
+            ),
+            [CibNvpairDto("my-id-pair1", "name1", "value1")],
+        )
+
+    def fixture_two_dates_dto(self, expired):
+        return CibNvsetDto(
+            "my-id",
+            {},
+            CibRuleExpressionDto(
+                "my-id-rule",
+                CibRuleExpressionType.RULE,
+                expired,
+                {"boolean-op": "and"},
+                None,
+                None,
+                [
+                    self.fixture_date_expr_dto(
+                        "my-id-rule-expr",
+                        {"operation": "gt", "start": "2000-01-01"},
+                        "date gt 2000-01-01",
+                    ),
+                    self.fixture_date_expr_dto(
+                        "my-id-rule-expr-1",
+                        {"operation": "lt", "end": "3000-01-01"},
+                        "date lt 3000-01-01",
+                    ),
+                ],
+                "date gt 2000-01-01 and date lt 3000-01-01",
+            ),
+            [CibNvpairDto("my-id-pair1", "name1", "value1")],
+        )
+
+    def _setup_date_rule(self, operation, date):
+        date_attr = "end" if operation == "lt" else "start"
+        self._setup_rule_in_effect(
+            rule_expressions=f"""
+                <date_expression id="my-id-rule-expr"
+                    operation="{operation}" {date_attr}="{date}"
+                />
+            """
+        )
+
+    def _setup_two_dates_rule(self):
+        self._setup_rule_in_effect(
+            rule_expressions="""
+                <date_expression id="my-id-rule-expr"
+                    operation="gt" start="2000-01-01"
+                />
+                <date_expression id="my-id-rule-expr-1"
+                    operation="lt" end="3000-01-01"
+                />
+            """
+        )
+
     def test_crm_rule_missing(self):
         self._setup_rule_in_effect(crm_rule_present=False)
         self.assertEqual(
@@ -871,8 +965,64 @@ class DefaultsConfigMixin:
             self.command(self.env_assist.get_env(), False),
         )
 
-    def test_expired(self):
+    def test_no_date_expression(self):
         self._setup_rule_in_effect()
+        self.assertEqual(
+            CibDefaultsDto(
+                meta_attributes=[
+                    self.fixture_expired_dto(CibRuleInEffectStatus.UNKNOWN)
+                ],
+                instance_attributes=[],
+            ),
+            self.command(self.env_assist.get_env(), True),
+        )
+
+    def test_expired(self):
+        self._setup_date_rule("lt", "2000-01-01")
+        self.assertEqual(
+            CibDefaultsDto(
+                meta_attributes=[
+                    self.fixture_date_dto(
+                        CibRuleInEffectStatus.EXPIRED, "lt", "2000-01-01"
+                    )
+                ],
+                instance_attributes=[],
+            ),
+            self.command(self.env_assist.get_env(), True),
+        )
+
+    def test_not_yet_in_effect(self):
+        self._setup_date_rule("gt", "3000-01-01")
+        self.assertEqual(
+            CibDefaultsDto(
+                meta_attributes=[
+                    self.fixture_date_dto(
+                        CibRuleInEffectStatus.NOT_YET_IN_EFFECT,
+                        "gt",
+                        "3000-01-01",
+                    )
+                ],
+                instance_attributes=[],
+            ),
+            self.command(self.env_assist.get_env(), True),
+        )
+
+    def test_in_effect(self):
+        self._setup_date_rule("gt", "2000-01-01")
+        self.assertEqual(
+            CibDefaultsDto(
+                meta_attributes=[
+                    self.fixture_date_dto(
+                        CibRuleInEffectStatus.IN_EFFECT, "gt", "2000-01-01"
+                    )
+                ],
+                instance_attributes=[],
+            ),
+            self.command(self.env_assist.get_env(), True),
+        )
+
+    def test_crm_rule_expired(self):
+        self._setup_two_dates_rule()
         self.config.runner.pcmk.get_rule_in_effect_status(
             "my-id-rule",
             RULE_EXPIRED_RETURNCODE,
@@ -880,15 +1030,15 @@ class DefaultsConfigMixin:
         self.assertEqual(
             CibDefaultsDto(
                 meta_attributes=[
-                    self.fixture_expired_dto(CibRuleInEffectStatus.EXPIRED)
+                    self.fixture_two_dates_dto(CibRuleInEffectStatus.EXPIRED)
                 ],
                 instance_attributes=[],
             ),
             self.command(self.env_assist.get_env(), True),
         )
 
-    def test_not_yet_in_effect(self):
-        self._setup_rule_in_effect()
+    def test_crm_rule_not_yet_in_effect(self):
+        self._setup_two_dates_rule()
         self.config.runner.pcmk.get_rule_in_effect_status(
             "my-id-rule",
             RULE_NOT_YET_IN_EFFECT_RETURNCODE,
@@ -896,7 +1046,7 @@ class DefaultsConfigMixin:
         self.assertEqual(
             CibDefaultsDto(
                 meta_attributes=[
-                    self.fixture_expired_dto(
+                    self.fixture_two_dates_dto(
                         CibRuleInEffectStatus.NOT_YET_IN_EFFECT
                     )
                 ],
@@ -905,8 +1055,8 @@ class DefaultsConfigMixin:
             self.command(self.env_assist.get_env(), True),
         )
 
-    def test_in_effect(self):
-        self._setup_rule_in_effect()
+    def test_crm_rule_in_effect(self):
+        self._setup_two_dates_rule()
         self.config.runner.pcmk.get_rule_in_effect_status(
             "my-id-rule",
             RULE_IN_EFFECT_RETURNCODE,
@@ -914,15 +1064,15 @@ class DefaultsConfigMixin:
         self.assertEqual(
             CibDefaultsDto(
                 meta_attributes=[
-                    self.fixture_expired_dto(CibRuleInEffectStatus.IN_EFFECT)
+                    self.fixture_two_dates_dto(CibRuleInEffectStatus.IN_EFFECT)
                 ],
                 instance_attributes=[],
             ),
             self.command(self.env_assist.get_env(), True),
         )
 
-    def test_expired_error(self):
-        self._setup_rule_in_effect()
+    def test_crm_rule_error(self):
+        self._setup_two_dates_rule()
         self.config.runner.pcmk.get_rule_in_effect_status(
             "my-id-rule",
             2,  # unexpected return code
@@ -930,7 +1080,7 @@ class DefaultsConfigMixin:
         self.assertEqual(
             CibDefaultsDto(
                 meta_attributes=[
-                    self.fixture_expired_dto(CibRuleInEffectStatus.UNKNOWN)
+                    self.fixture_two_dates_dto(CibRuleInEffectStatus.UNKNOWN)
                 ],
                 instance_attributes=[],
             ),
@@ -90,9 +90,6 @@ class FullClusterStatusPlaintext(TestCase):
                 </resources>
             """
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
 
     def _fixture_config_live_remote_minimal(self):
@@ -109,9 +106,6 @@ class FullClusterStatusPlaintext(TestCase):
                 </resources>
             """,
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
 
     def _fixture_config_local_daemons(
@@ -128,57 +122,17 @@ class FullClusterStatusPlaintext(TestCase):
         sbd_active=False,
     ):
         # pylint: disable=too-many-arguments
-        (
-            self.config.services.is_enabled(
-                "corosync",
-                name="services.is_enabled.corosync",
-                return_value=corosync_enabled,
-            )
-            .services.is_running(
-                "corosync",
-                name="services.is_running.corosync",
-                return_value=corosync_active,
-            )
-            .services.is_enabled(
-                "pacemaker",
-                name="services.is_enabled.pacemaker",
-                return_value=pacemaker_enabled,
-            )
-            .services.is_running(
-                "pacemaker",
-                name="services.is_running.pacemaker",
-                return_value=pacemaker_active,
-            )
-            .services.is_enabled(
-                "pacemaker_remote",
-                name="services.is_enabled.pacemaker_remote",
-                return_value=pacemaker_remote_enabled,
-            )
-            .services.is_running(
-                "pacemaker_remote",
-                name="services.is_running.pacemaker_remote",
-                return_value=pacemaker_remote_active,
-            )
-            .services.is_enabled(
-                "pcsd",
-                name="services.is_enabled.pcsd",
-                return_value=pcsd_enabled,
-            )
-            .services.is_running(
-                "pcsd",
-                name="services.is_running.pcsd",
-                return_value=pcsd_active,
-            )
-            .services.is_enabled(
-                "sbd",
-                name="services.is_enabled.sbd_2",
-                return_value=sbd_enabled,
-            )
-            .services.is_running(
-                "sbd",
-                name="services.is_running.sbd_2",
-                return_value=sbd_active,
-            )
+        self.config.services.get_states(
+            {
+                "corosync": (corosync_enabled, corosync_active),
+                "pacemaker": (pacemaker_enabled, pacemaker_active),
+                "pacemaker_remote": (
+                    pacemaker_remote_enabled,
+                    pacemaker_remote_active,
+                ),
+                "pcsd": (pcsd_enabled, pcsd_active),
+                "sbd": (sbd_enabled, sbd_active),
+            }
         )
 
     def test_life_cib_mocked_corosync(self):
@@ -314,9 +268,6 @@ class FullClusterStatusPlaintext(TestCase):
             """
             )
             .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
         self._fixture_config_local_daemons()
         (
@@ -393,9 +344,6 @@ class FullClusterStatusPlaintext(TestCase):
             """,
             )
             .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
         self._fixture_config_local_daemons(
             corosync_enabled=False,
@@ -515,9 +463,6 @@ class FullClusterStatusPlaintext(TestCase):
             """
             )
             .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
         self._fixture_config_local_daemons()
         (
@@ -572,9 +517,6 @@ class FullClusterStatusPlaintext(TestCase):
             .runner.pcmk.load_ticket_state_plaintext(
                 stdout="ticket stdout", stderr=stderr, returncode=1
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
         self._fixture_config_local_daemons()
         (
@@ -624,9 +566,6 @@ class FullClusterStatusPlaintext(TestCase):
             .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load()
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
         self._fixture_config_local_daemons()
 
@@ -656,11 +595,8 @@ class FullClusterStatusPlaintext(TestCase):
             .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load()
-            .services.is_running(
-                "sbd", return_value=True, name="services.is_running.sbd"
-            )
         )
-        self._fixture_config_local_daemons()
+        self._fixture_config_local_daemons(sbd_active=True)
 
         self.assertEqual(
             status.full_cluster_status_plaintext(self.env_assist.get_env()),
@@ -672,7 +608,8 @@ class FullClusterStatusPlaintext(TestCase):
                 Daemon Status:
                   corosync: active/enabled
                   pacemaker: active/enabled
-                  pcsd: active/enabled"""
+                  pcsd: active/enabled
+                  sbd: active/disabled"""
             ),
         )
 
@@ -706,9 +643,6 @@ class FullClusterStatusPlaintext(TestCase):
                 </resources>
             """
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
         self._fixture_config_local_daemons()
 
@@ -752,9 +686,6 @@ class FullClusterStatusPlaintext(TestCase):
             """
             )
             .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
         self._fixture_config_local_daemons()
         (
@@ -840,6 +771,47 @@ class FullClusterStatusPlaintext(TestCase):
             ),
         )
 
+    def test_daemon_status_batch_failure(self):
+        self._fixture_config_live_minimal()
+        states = {
+            "corosync": (True, True),
+            "pacemaker": (True, False),
+            "pacemaker_remote": (True, True),
+            "pcsd": (False, True),
+            "sbd": (False, False),
+        }
+        self.config.services.get_states(states, exception=LibraryError())
+        for service, (enabled, running) in states.items():
+            if service == "pacemaker_remote":
+                self.config.services.is_enabled(
+                    service,
+                    exception=LibraryError(),
+                    name=f"services.is_enabled.{service}",
+                )
+                continue
+            self.config.services.is_enabled(
+                service,
+                return_value=enabled,
+                name=f"services.is_enabled.{service}",
+            )
+            self.config.services.is_running(
+                service,
+                return_value=running,
+                name=f"services.is_running.{service}",
+            )
+        self.assertEqual(
+            status.full_cluster_status_plaintext(self.env_assist.get_env()),
+            dedent(
+                """                Cluster name: test99
+                crm_mon cluster status
+
+                Daemon Status:
+                  corosync: active/enabled
+                  pacemaker: inactive/enabled
+                  pcsd: active/disabled"""
+            ),
+        )
+
     def test_daemon_status_all_off(self):
         self._fixture_config_live_minimal()
         self._fixture_config_local_daemons(
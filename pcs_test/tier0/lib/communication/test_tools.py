@@ -0,0 +1,115 @@
+from unittest import (
+    IsolatedAsyncioTestCase,
+    mock,
+)
+
+from pcs.common import reports
+from pcs.common.node_communicator import (
+    Request,
+    RequestData,
+    RequestTarget,
+)
+from pcs.common.reports.item import ReportItem
+from pcs.lib.communication.tools import (
+    AllAtOnceStrategyMixin,
+    OneByOneStrategyMixin,
+    RunRemotelyBase,
+    iter_responses_async,
+    run_and_raise_async,
+    run_async,
+)
+from pcs.lib.errors import LibraryError
+
+
+class FakeAsyncCommunicator:
+    """
+    Responds to requests in the order they were added
+    """
+
+    def __init__(self):
+        self._queue = []
+        self.request_list = []
+
+    def add_requests(self, request_list):
+        self._queue.extend(request_list)
+
+    async def start_loop(self):
+        while self._queue:
+            request = self._queue.pop(0)
+            self.request_list.append(request)
+            yield mock.Mock(request=request)
+
+
+def fixture_request(index):
+    return Request(RequestTarget(f"node{index}"), RequestData("action"))
+
+
+class RunRemotely(RunRemotelyBase):
+    def __init__(self, fail_on=None):
+        super().__init__(mock.Mock())
+        self.processed = []
+        self._fail_on = fail_on
+
+    def _process_response(self, response):
+        self.processed.append(response.request.target.label)
+        if response.request.target.label == self._fail_on:
+            self._report(
+                ReportItem.error(
+                    reports.messages.UnableToPerformOperationOnAnyNode()
+                )
+            )
+
+    def on_complete(self):
+        return self.processed
+
+
+class RequestsMixin:
+    # pylint: disable=no-self-use
+    def _prepare_initial_requests(self):
+        return [fixture_request(index) for index in range(3)]
+
+
+class AllAtOnce(RequestsMixin, AllAtOnceStrategyMixin, RunRemotely):
+    pass
+
+
+class OneByOne(RequestsMixin, OneByOneStrategyMixin, RunRemotely):
+    def _process_response(self, response):
+        super()._process_response(response)
+        return self._get_next_list()
+
+
+class RunAsync(IsolatedAsyncioTestCase):
+    async def test_all_at_once(self):
+        communicator = FakeAsyncCommunicator()
+        cmd = AllAtOnce()
+        self.assertEqual(
+            await run_async(communicator, cmd), ["node0", "node1", "node2"]
+        )
+
+    async def test_one_by_one(self):
+        communicator = FakeAsyncCommunicator()
+        cmd = OneByOne()
+        response_list = []
+        async for response in iter_responses_async(communicator, cmd):
+            # the next request is sent only after a response is processed
+            self.assertEqual(
+                len(communicator.request_list), len(response_list) + 1
+            )
+            response_list.append(response)
+        self.assertEqual(
+            [response.request.target.label for response in response_list],
+            ["node0", "node1", "node2"],
+        )
+
+    async def test_raise_on_errors(self):
+        cmd = AllAtOnce(fail_on="node1")
+        with self.assertRaises(LibraryError):
+            await run_and_raise_async(FakeAsyncCommunicator(), cmd)
+        self.assertEqual(len(cmd.processed), 3)
+
+    async def test_no_errors(self):
+        self.assertEqual(
+            len(await run_and_raise_async(FakeAsyncCommunicator(), OneByOne())),
+            3,
+        )
@@ -138,39 +138,21 @@ class WorkWithClusterStatusSummaryTest(TestCase):
 
 
 class GetPrimitiveRolesWithNodes(TestCase):
+    @staticmethod
+    def fixture_primitive(role, node_names):
+        return state.PrimitiveInstance(
+            "A", role, False, False, False, node_names, 0
+        )
+
     def test_success(self):
-        primitives_xml = [
-            """
-                <resource id="A" role="Started">
-                    <node name="node1" id="1"/>
-                </resource>
-            """,
-            """
-                <resource id="A" role="Master">
-                    <node name="node2" id="2"/>
-                </resource>
-            """,
-            """
-                <resource id="A" role="Slave">
-                    <node name="node4" id="4"/>
-                </resource>
-            """,
-            """
-                <resource id="A" role="Slave">
-                    <node name="node3" id="3"/>
-                </resource>
-            """,
-            """
-                <resource id="A" role="Stopped">
-                </resource>
-            """,
-            """
-                <resource id="A" role="Started">
-                    <node name="node5" id="5"/>
-                </resource>
-            """,
+        primitives = [
+            self.fixture_primitive("Started", ["node1"]),
+            self.fixture_primitive("Master", ["node2"]),
+            self.fixture_primitive("Slave", ["node4"]),
+            self.fixture_primitive("Slave", ["node3"]),
+            self.fixture_primitive("Stopped", []),
+            self.fixture_primitive("Started", ["node5"]),
         ]
-        primitives = [etree.fromstring(xml) for xml in primitives_xml]
 
         self.assertEqual(
             state._get_primitive_roles_with_nodes(primitives),
@@ -329,8 +311,8 @@ class GetPrimitivesForStateCheck(TestCase):
     def assert_primitives(self, resource_id, primitive_ids, expected_running):
         self.assertEqual(
             [
-                elem.attrib["id"]
-                for elem in state._get_primitives_for_state_check(
+                primitive.id
+                for primitive in state._get_primitives_for_state_check(
                     self.status, resource_id, expected_running
                 )
             ],
@@ -944,3 +926,43 @@ class IsResourceManaged(TestCase):
         self.assert_managed("R46", False)
         self.assert_managed("R47", False)
         self.assert_managed("R48", False)
+
+
+class ClusterStateIndexTest(TestCase):
+    status_xml = """
+        <resources>
+            <resource id="R01" role="Started">
+                <node name="node1" id="1" />
+            </resource>
+            <clone id="C1">
+                <resource id="R02" role="Started">
+                    <node name="node1" id="1" />
+                </resource>
+                <resource id="R02" role="Started">
+                    <node name="node2" id="2" />
+                </resource>
+            </clone>
+            <resource id="R03" role="Stopped" />
+        </resources>
+    """
+
+    def test_node_primitives(self):
+        index = state.ClusterStateIndex(etree.fromstring(self.status_xml))
+        self.assertEqual(
+            [
+                (primitive.id, primitive.position)
+                for primitive in index.get_node_primitives("node1")
+            ],
+            [("R01", 0), ("R02", 1)],
+        )
+        self.assertEqual(
+            [primitive.id for primitive in index.get_node_primitives("node2")],
+            ["R02"],
+        )
+        self.assertEqual(index.get_node_primitives("node3"), [])
+
+    def test_index_passed_through(self):
+        status = etree.fromstring(self.status_xml)
+        index = state.get_cluster_state_index(status)
+        self.assertIs(index, state.get_cluster_state_index(index))
+        self.assertIsNot(index, state.get_cluster_state_index(status))
@@ -0,0 +1,275 @@
+import os
+import os.path
+from tempfile import TemporaryDirectory
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from lxml import etree
+
+from pcs import settings
+from pcs.lib import resource_agent as ra
+
+from pcs_test.tools.assertions import assert_xml_equal
+from pcs_test.tools.command_env import get_env_tools
+from pcs_test.tools.xml import etree_to_str
+
+_AGENT_XML = """
+    <resource-agent name="Dummy">
+        <parameters>
+            <parameter name="fake"/>
+        </parameters>
+    </resource-agent>
+"""
+
+
+class ResourceAgentMetadataCache(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.ocf_root = os.path.join(self.tmp_dir.name, "ocf")
+        self.fence_dir = os.path.join(self.tmp_dir.name, "sbin")
+        self.crm_resource = os.path.join(self.tmp_dir.name, "crm_resource")
+        os.makedirs(os.path.join(self.ocf_root, "resource.d", "heartbeat"))
+        os.makedirs(self.fence_dir)
+        self.write_file(self.crm_resource, "crm_resource")
+        self.write_agent("Dummy", "agent v1")
+        patcher_list = [
+            mock.patch.object(settings, "ocf_root", self.ocf_root),
+            mock.patch.object(settings, "fence_agent_binaries", self.fence_dir),
+            mock.patch.object(
+                settings, "crm_resource_binary", self.crm_resource
+            ),
+        ]
+        for patcher in patcher_list:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.name = ra.ResourceAgentName("ocf", "heartbeat", "Dummy")
+        self.cache = ra.ResourceAgentMetadataCache(self.cache_dir, 2)
+        self.metadata = etree.fromstring(_AGENT_XML)
+
+    @staticmethod
+    def write_file(path, content, mtime_ns=None):
+        with open(path, "w") as a_file:
+            a_file.write(content)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def write_agent(self, agent_type, content):
+        self.write_file(
+            os.path.join(self.ocf_root, "resource.d", "heartbeat", agent_type),
+            content,
+        )
+
+    def assert_cached(self, cache, name, expected_xml=_AGENT_XML):
+        cached = cache.get(name)
+        self.assertIsNotNone(cached)
+        assert_xml_equal(expected_xml, etree_to_str(cached))
+
+    def test_not_cached(self):
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_put_and_get(self):
+        self.cache.put(self.name, self.metadata)
+        self.assert_cached(self.cache, self.name)
+
+    def test_stored_on_disk(self):
+        self.cache.put(self.name, self.metadata)
+        self.assert_cached(
+            ra.ResourceAgentMetadataCache(self.cache_dir, 2), self.name
+        )
+
+    def test_agent_changed(self):
+        self.cache.put(self.name, self.metadata)
+        self.write_agent("Dummy", "agent v2 is longer")
+        self.assertIsNone(self.cache.get(self.name))
+        self.assertIsNone(
+            ra.ResourceAgentMetadataCache(self.cache_dir, 2).get(self.name)
+        )
+
+    def test_crm_resource_changed(self):
+        self.cache.put(self.name, self.metadata)
+        self.write_file(self.crm_resource, "crm_resource", mtime_ns=10**9)
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_agent_without_executable_not_cached(self):
+        for name in (
+            ra.ResourceAgentName("ocf", "heartbeat", "Missing"),
+            ra.ResourceAgentName("systemd", None, "chronyd"),
+            ra.ResourceAgentName("ocf", "heartbeat", "../heartbeat/Dummy"),
+        ):
+            with self.subTest(name=name):
+                self.cache.put(name, self.metadata)
+                self.assertIsNone(self.cache.get(name))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_stonith(self):
+        name = ra.ResourceAgentName("stonith", None, "fence_xvm")
+        self.write_file(os.path.join(self.fence_dir, "fence_xvm"), "fence")
+        self.cache.put(name, self.metadata)
+        self.assert_cached(
+            ra.ResourceAgentMetadataCache(self.cache_dir, 2), name
+        )
+
+    def test_size_bound(self):
+        name_list = []
+        for index in range(3):
+            self.write_agent(f"Dummy{index}", "agent")
+            name = ra.ResourceAgentName("ocf", "heartbeat", f"Dummy{index}")
+            name_list.append(name)
+            self.cache.put(name, self.metadata)
+            # make sure the files are distinguishable by their mtime
+            for file_name in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, file_name)
+                mtime_ns = os.stat(path).st_mtime_ns - 10**9
+                os.utime(path, ns=(mtime_ns, mtime_ns))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+        new_cache = ra.ResourceAgentMetadataCache(self.cache_dir, 2)
+        self.assertIsNone(new_cache.get(name_list[0]))
+        self.assert_cached(new_cache, name_list[1])
+        self.assert_cached(new_cache, name_list[2])
+
+    def test_broken_file_ignored(self):
+        self.cache.put(self.name, self.metadata)
+        for file_name in os.listdir(self.cache_dir):
+            self.write_file(os.path.join(self.cache_dir, file_name), "{")
+        self.assertIsNone(
+            ra.ResourceAgentMetadataCache(self.cache_dir, 2).get(self.name)
+        )
+
+    def test_clear(self):
+        self.cache.put(self.name, self.metadata)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(self.name))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_disabled(self):
+        cache = ra.ResourceAgentMetadataCache(None, 2)
+        cache.put(self.name, self.metadata)
+        self.assertIsNone(cache.get(self.name))
+
+
+class ResourceAgentIndexCache(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.ocf_root = os.path.join(self.tmp_dir.name, "ocf")
+        self.fence_dir = os.path.join(self.tmp_dir.name, "sbin")
+        self.lsb_dir = os.path.join(self.tmp_dir.name, "init.d")
+        self.unit_dir = os.path.join(self.tmp_dir.name, "system")
+        self.crm_resource = os.path.join(self.tmp_dir.name, "crm_resource")
+        os.makedirs(os.path.join(self.ocf_root, "resource.d", "heartbeat"))
+        os.makedirs(self.fence_dir)
+        os.makedirs(self.lsb_dir)
+        os.makedirs(self.unit_dir)
+        with open(self.crm_resource, "w") as a_file:
+            a_file.write("crm_resource")
+        patcher_list = [
+            mock.patch.object(settings, "ocf_root", self.ocf_root),
+            mock.patch.object(settings, "fence_agent_binaries", self.fence_dir),
+            mock.patch.object(settings, "lsb_init_dir", self.lsb_dir),
+            mock.patch.object(settings, "systemd_unit_path", [self.unit_dir]),
+            mock.patch.object(
+                settings, "crm_resource_binary", self.crm_resource
+            ),
+        ]
+        for patcher in patcher_list:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.cache = ra.ResourceAgentIndexCache(self.cache_dir)
+        self.agent_names = [
+            ra.ResourceAgentName("ocf", "heartbeat", "Dummy"),
+            ra.ResourceAgentName("stonith", None, "fence_xvm"),
+            ra.ResourceAgentName("systemd", None, "chronyd"),
+        ]
+
+    @staticmethod
+    def touch_dir(path):
+        mtime_ns = os.stat(path).st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_not_cached(self):
+        self.assertIsNone(self.cache.get())
+
+    def test_put_and_get(self):
+        self.cache.put(self.cache.get_key(), self.agent_names)
+        self.assertEqual(
+            ra.ResourceAgentIndexCache(self.cache_dir).get(), self.agent_names
+        )
+
+    def test_agents_dir_changed(self):
+        for path in (
+            self.fence_dir,
+            os.path.join(self.ocf_root, "resource.d"),
+            os.path.join(self.ocf_root, "resource.d", "heartbeat"),
+            self.lsb_dir,
+            self.unit_dir,
+        ):
+            with self.subTest(path=path):
+                self.cache.put(self.cache.get_key(), self.agent_names)
+                self.touch_dir(path)
+                self.assertIsNone(self.cache.get())
+
+    def test_changed_while_listing(self):
+        key = self.cache.get_key()
+        self.touch_dir(self.fence_dir)
+        self.cache.put(key, self.agent_names)
+        self.assertIsNone(self.cache.get())
+
+    def test_unknown_standard_not_cached(self):
+        self.cache.put(
+            self.cache.get_key(),
+            self.agent_names + [ra.ResourceAgentName("nagios", None, "check")],
+        )
+        self.assertIsNone(self.cache.get())
+
+    def test_clear(self):
+        self.cache.put(self.cache.get_key(), self.agent_names)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get())
+
+    def test_disabled(self):
+        cache = ra.ResourceAgentIndexCache(None)
+        self.assertIsNone(cache.get_key())
+        cache.put(cache.get_key(), self.agent_names)
+        self.assertIsNone(cache.get())
+
+
+class FacadeFactoryWithCache(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.cache = mock.Mock(spec_set=ra.ResourceAgentMetadataCache)
+        self.name = ra.ResourceAgentName("ocf", "heartbeat", "Dummy")
+
+    def get_facade(self):
+        env = self.env_assist.get_env()
+        return ra.ResourceAgentFacadeFactory(
+            env.cmd_runner(), env.report_processor, self.cache
+        ).facade_from_parsed_name(self.name)
+
+    def assert_metadata(self, facade):
+        self.assertEqual(facade.metadata.name, self.name)
+        self.assertIn(
+            "fake", [param.name for param in facade.metadata.parameters]
+        )
+
+    def test_not_cached(self):
+        self.cache.get.return_value = None
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:heartbeat:Dummy", stdout=_AGENT_XML
+        )
+        self.assert_metadata(self.get_facade())
+        self.cache.get.assert_called_once_with(self.name)
+        self.cache.put.assert_called_once_with(self.name, mock.ANY)
+        assert_xml_equal(
+            _AGENT_XML, etree_to_str(self.cache.put.call_args[0][1])
+        )
+
+    def test_cached(self):
+        self.cache.get.return_value = etree.fromstring(_AGENT_XML)
+        self.assert_metadata(self.get_facade())
+        self.cache.get.assert_called_once_with(self.name)
+        self.cache.put.assert_not_called()
@@ -374,3 +374,51 @@ class FindOneResourceAgentByType(TestCase):
                 env.cmd_runner(), env.report_processor, "missing"
             )
         self.assertEqual(cm.exception.agent_name, "missing")
+
+
+@mock.patch("pcs.lib.resource_agent.list.get_index_cache")
+class ListAllResourceAgents(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.index_cache = mock.Mock(
+            spec_set=["get", "get_key", "put", "clear"]
+        )
+        self.agent_names = [
+            ResourceAgentName("ocf", "heartbeat", "Dummy"),
+            ResourceAgentName("stonith", None, "fence_xvm"),
+        ]
+
+    def test_cached(self, mock_get_index_cache):
+        mock_get_index_cache.return_value = self.index_cache
+        self.index_cache.get.return_value = self.agent_names
+        env = self.env_assist.get_env()
+        self.assertEqual(
+            ra_list.list_all_resource_agents(env.cmd_runner()),
+            self.agent_names,
+        )
+        self.index_cache.put.assert_not_called()
+
+    def test_not_cached(self, mock_get_index_cache):
+        mock_get_index_cache.return_value = self.index_cache
+        self.index_cache.get.return_value = None
+        self.index_cache.get_key.return_value = "key"
+        self.config.runner.pcmk.list_agents_standards(
+            "\n".join(["ocf", "stonith"])
+        )
+        self.config.runner.pcmk.list_agents_ocf_providers("heartbeat")
+        self.config.runner.pcmk.list_agents_for_standard_and_provider(
+            "ocf:heartbeat",
+            "Dummy",
+            name="runner.pcmk.list_agents_ocf_providers.heartbeat",
+        )
+        self.config.runner.pcmk.list_agents_for_standard_and_provider(
+            "stonith",
+            "fence_xvm",
+            name="runner.pcmk.list_agents_ocf_providers.stonith",
+        )
+        env = self.env_assist.get_env()
+        self.assertEqual(
+            ra_list.list_all_resource_agents(env.cmd_runner()),
+            self.agent_names,
+        )
+        self.index_cache.put.assert_called_once_with("key", self.agent_names)
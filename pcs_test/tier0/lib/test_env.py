@@ -5,6 +5,8 @@ from unittest import (
     mock,
 )
 
+from lxml import etree
+
 from pcs.common import file_type_codes
 from pcs.common.reports import ReportItemSeverity as severity
 from pcs.common.reports import codes as report_codes
@@ -194,3 +196,66 @@ class EnsureValidWait(TestCase):
         get_valid_timeout.return_value = timeout
         env.ensure_wait_satisfiable(timeout)
         get_valid_timeout.assert_called_once_with(timeout)
+
+
+@patch_env("settings.pacemaker_status_cache_ttl_seconds", 5)
+@patch_env("time")
+@patch_env("get_cluster_status_dom")
+@patch_env_object("cmd_runner", lambda self: "runner")
+class GetClusterState(TestCase):
+    def setUp(self):
+        self.env = LibraryEnvironment(
+            mock.MagicMock(logging.Logger), MockLibraryReportProcessor()
+        )
+
+    def test_status_reused(self, mock_get_status, mock_time):
+        mock_get_status.return_value = "status"
+        mock_time.monotonic.side_effect = [100, 104.9]
+        self.assertEqual("status", self.env.get_cluster_state())
+        self.assertEqual("status", self.env.get_cluster_state())
+        mock_get_status.assert_called_once_with("runner")
+
+    def test_status_expired(self, mock_get_status, mock_time):
+        mock_get_status.side_effect = ["status1", "status2"]
+        mock_time.monotonic.side_effect = [100, 105]
+        self.assertEqual("status1", self.env.get_cluster_state())
+        self.assertEqual("status2", self.env.get_cluster_state())
+        self.assertEqual(2, mock_get_status.call_count)
+
+    def test_status_reloaded_after_wait(self, mock_get_status, mock_time):
+        mock_get_status.side_effect = ["status1", "status2"]
+        mock_time.monotonic.side_effect = [100, 101]
+        self.assertEqual("status1", self.env.get_cluster_state())
+        self.env.wait_for_idle(-1)
+        self.assertEqual("status2", self.env.get_cluster_state())
+        self.assertEqual(2, mock_get_status.call_count)
+
+    def test_index_reused(self, mock_get_status, mock_time):
+        mock_get_status.return_value = etree.fromstring("<crm_mon/>")
+        mock_time.monotonic.side_effect = [100, 101]
+        index = self.env.get_cluster_state_index()
+        self.assertIs(index, self.env.get_cluster_state_index())
+        mock_get_status.assert_called_once_with("runner")
+
+    def test_index_dropped_with_expired_status(
+        self, mock_get_status, mock_time
+    ):
+        mock_get_status.side_effect = [
+            etree.fromstring("<crm_mon/>"),
+            etree.fromstring("<crm_mon/>"),
+        ]
+        mock_time.monotonic.side_effect = [100, 105]
+        index = self.env.get_cluster_state_index()
+        self.assertIsNot(index, self.env.get_cluster_state_index())
+        self.assertEqual(2, mock_get_status.call_count)
+
+    def test_index_dropped_after_wait(self, mock_get_status, mock_time):
+        mock_get_status.side_effect = [
+            etree.fromstring("<crm_mon/>"),
+            etree.fromstring("<crm_mon/>"),
+        ]
+        mock_time.monotonic.side_effect = [100, 101]
+        index = self.env.get_cluster_state_index()
+        self.env.wait_for_idle(-1)
+        self.assertIsNot(index, self.env.get_cluster_state_index())
+        self.assertEqual(2, mock_get_status.call_count)
@@ -8,6 +8,7 @@ from lxml import etree
 
 from pcs.common.reports import codes as report_codes
 from pcs.common.tools import Version
+from pcs.lib.cib.snapshot import CibSnapshot
 from pcs.lib.env import LibraryEnvironment
 
 from pcs_test.tools import fixture
@@ -209,9 +210,126 @@ class GetCib(TestCase, ManageCibAssertionMixin):
         self.assert_raises_cib_already_loaded(env.get_cib)
 
 
+class GetCibFromSnapshot(TestCase):
+    def setUp(self):
+        with open(rc("cib-empty.xml")) as cib_file:
+            self.cib_xml = cib_file.read()
+        self.snapshot = CibSnapshot(self.cib_xml)
+        self.env = LibraryEnvironment(
+            mock.MagicMock(), mock.MagicMock(), cib_snapshot=self.snapshot
+        )
+
+    @mock.patch.object(LibraryEnvironment, "cmd_runner")
+    def test_cib_not_loaded(self, mock_cmd_runner):
+        cib = self.env.get_cib()
+        mock_cmd_runner.assert_not_called()
+        assert_xml_equal(self.cib_xml, etree_to_str(cib))
+
+    def test_snapshot_not_modified(self):
+        self.env.get_cib().find("configuration").clear()
+        self.assertIsNot(self.env.cib, self.snapshot.get_tree())
+        assert_xml_equal(self.cib_xml, etree_to_str(self.snapshot.get_tree()))
+
+
 class PushLoadedCib(TestCase, ManageCibAssertionMixin):
-    # pylint: disable=too-many-public-methods
     wait_timeout = 10
+    cib_diff = """
+        <diff format="2">
+            <change operation="create" path="/cib/configuration/resources"
+                position="0"
+            >
+                <primitive id="R" class="ocf" provider="pacemaker"
+                    type="Dummy"
+                />
+            </change>
+        </diff>
+    """
+
+    def setUp(self):
+        self.load_cib_name = "load_cib"
+        self.env_assist, self.config = get_env_tools(test_case=self)
+
+    @staticmethod
+    def modify_cib(cib):
+        etree.SubElement(
+            cib.find("configuration/resources"),
+            "primitive",
+            id="R",
+            **{"class": "ocf", "provider": "pacemaker", "type": "Dummy"},
+        )
+
+    def config_load_and_push_diff(self):
+        self.config.runner.cib.load(name=self.load_cib_name)
+        self.config.runner.cib.push_diff(cib_diff=self.cib_diff)
+
+    def test_get_and_push(self):
+        self.config_load_and_push_diff()
+        env = self.env_assist.get_env()
+
+        self.modify_cib(env.get_cib())
+        env.push_cib()
+
+    def test_can_get_after_push(self):
+        self.config_load_and_push_diff()
+        self.config.runner.cib.load(name="load_cib_2")
+        env = self.env_assist.get_env()
+
+        self.modify_cib(env.get_cib())
+        env.push_cib()
+        # need to use lambda because env.cib is a property
+        self.assert_raises_cib_not_loaded(lambda: env.cib)
+        env.get_cib()
+
+    def test_not_loaded(self):
+        env = self.env_assist.get_env()
+        self.assert_raises_cib_not_loaded(env.push_cib)
+
+    def test_diff_is_empty(self):
+        self.config.runner.cib.load(name=self.load_cib_name)
+        env = self.env_assist.get_env()
+        env.get_cib()
+        env.push_cib()
+
+    def test_push_diff_fails(self):
+        self.config.runner.cib.load(name=self.load_cib_name)
+        self.config.runner.cib.push_diff(
+            cib_diff=self.cib_diff, stderr="invalid cib", returncode=1
+        )
+        env = self.env_assist.get_env()
+        self.modify_cib(env.get_cib())
+        self.env_assist.assert_raise_library_error(
+            env.push_cib,
+            [
+                fixture.error(
+                    report_codes.CIB_PUSH_ERROR,
+                    reason="invalid cib",
+                    pushed_cib="",
+                )
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_wait(self):
+        self.config_load_and_push_diff()
+        self.config.runner.pcmk.wait(timeout=self.wait_timeout)
+        env = self.env_assist.get_env()
+
+        self.modify_cib(env.get_cib())
+        env.push_cib(wait_timeout=self.wait_timeout)
+        self.env_assist.assert_reports(
+            [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED,
+                    timeout=self.wait_timeout,
+                )
+            ]
+        )
+
+
+class PushLoadedCibCrmDiff(TestCase, ManageCibAssertionMixin):
+    """
+    Changes not supported by the native patchset engine are diffed by crm_diff
+    """
 
     def setUp(self):
         self.tmpfile_old = "old.cib"
@@ -229,66 +347,50 @@ class PushLoadedCib(TestCase, ManageCibAssertionMixin):
         )
         self.env_assist, self.config = get_env_tools(test_case=self)
 
-    def config_load_cib_files(self):
-        self.config.runner.cib.load(name=self.load_cib_name)
+    def get_and_modify_cib(self, env):
+        # comments are not supported by the native patchset engine
+        cib = env.get_cib()
+        cib.find("configuration/resources").append(etree.Comment("comment"))
         loaded_cib = self.config.calls.get(self.load_cib_name).stdout
+        new_cib = etree_to_str(cib).strip()
         self.tmp_file_mock_obj.set_calls(
             [
                 TmpFileCall(self.tmpfile_old, orig_content=loaded_cib),
-                TmpFileCall(self.tmpfile_new, orig_content=loaded_cib),
+                TmpFileCall(self.tmpfile_new, orig_content=new_cib),
             ]
         )
+        return loaded_cib, new_cib
 
-    def config_load_and_push_diff(self):
-        self.config_load_cib_files()
-        self.config.runner.cib.diff(self.tmpfile_old, self.tmpfile_new)
-        self.config.runner.cib.push_diff()
-
-    def push_reports(self, cib_old=None, cib_new=None):
-        # No test changes the CIB between load and push. The point is to test
-        # loading and pushing, not editing the CIB.
-        loaded_cib = self.config.calls.get(self.load_cib_name).stdout
+    @staticmethod
+    def push_reports(cib_old, cib_new):
         return [
             fixture.debug(
                 report_codes.TMP_FILE_WRITE,
-                file_path=self.tmpfile_old,
-                content=(cib_old if cib_old is not None else loaded_cib),
+                file_path="old.cib",
+                content=cib_old,
             ),
             fixture.debug(
                 report_codes.TMP_FILE_WRITE,
-                file_path=self.tmpfile_new,
-                content=(
-                    cib_new if cib_new is not None else loaded_cib
-                ).strip(),
+                file_path="new.cib",
+                content=cib_new,
             ),
         ]
 
     def test_get_and_push(self):
-        self.config_load_and_push_diff()
-        env = self.env_assist.get_env()
-
-        env.get_cib()
-        env.push_cib()
-        self.env_assist.assert_reports(self.push_reports())
-
-    def test_can_get_after_push(self):
-        self.config_load_and_push_diff()
-        self.config.runner.cib.load(name="load_cib_2")
+        self.config.runner.cib.load(name=self.load_cib_name)
+        self.config.runner.cib.diff(self.tmpfile_old, self.tmpfile_new)
+        self.config.runner.cib.push_diff()
         env = self.env_assist.get_env()
 
-        env.get_cib()
+        cib_old, cib_new = self.get_and_modify_cib(env)
         env.push_cib()
-        # need to use lambda because env.cib is a property
-        self.assert_raises_cib_not_loaded(lambda: env.cib)
-        env.get_cib()
-        self.env_assist.assert_reports(self.push_reports())
+        self.env_assist.assert_reports(self.push_reports(cib_old, cib_new))
 
-    def test_not_loaded(self):
+    def test_tmpfile_fails(self):
+        self.config.runner.cib.load(name=self.load_cib_name)
         env = self.env_assist.get_env()
-        self.assert_raises_cib_not_loaded(env.push_cib)
 
-    def test_tmpfile_fails(self):
-        self.config.runner.cib.load()
+        self.get_and_modify_cib(env)
         self.tmp_file_mock_obj.set_calls(
             [
                 TmpFileCall(
@@ -297,9 +399,6 @@ class PushLoadedCib(TestCase, ManageCibAssertionMixin):
                 ),
             ]
         )
-        env = self.env_assist.get_env()
-
-        env.get_cib()
         self.env_assist.assert_raise_library_error(
             env.push_cib,
             [
@@ -312,7 +411,7 @@ class PushLoadedCib(TestCase, ManageCibAssertionMixin):
         )
 
     def test_diff_is_empty(self):
-        self.config_load_cib_files()
+        self.config.runner.cib.load(name=self.load_cib_name)
         self.config.runner.cib.diff(
             self.tmpfile_old,
             self.tmpfile_new,
@@ -321,70 +420,35 @@ class PushLoadedCib(TestCase, ManageCibAssertionMixin):
             returncode=1,
         )
         env = self.env_assist.get_env()
-        env.get_cib()
+
+        cib_old, cib_new = self.get_and_modify_cib(env)
         env.push_cib()
-        self.env_assist.assert_reports(self.push_reports())
+        self.env_assist.assert_reports(self.push_reports(cib_old, cib_new))
 
     def test_diff_fails(self):
-        self.config_load_cib_files()
+        self.config.runner.cib.load(name=self.load_cib_name)
         self.config.runner.cib.diff(
             self.tmpfile_old,
             self.tmpfile_new,
             stderr="invalid cib",
             returncode=65,
         )
-        loaded_cib = self.config.calls.get(self.load_cib_name).stdout
         env = self.env_assist.get_env()
-        env.get_cib()
-        self.env_assist.assert_raise_library_error(
-            env.push_cib,
-            [
-                fixture.error(
-                    report_codes.CIB_DIFF_ERROR,
-                    reason="invalid cib",
-                    cib_old=loaded_cib,
-                    cib_new=loaded_cib.strip(),
-                )
-            ],
-            expected_in_processor=False,
-        )
-        self.env_assist.assert_reports(self.push_reports())
 
-    def test_push_diff_fails(self):
-        self.config_load_cib_files()
-        self.config.runner.cib.diff(self.tmpfile_old, self.tmpfile_new)
-        self.config.runner.cib.push_diff(stderr="invalid cib", returncode=1)
-        env = self.env_assist.get_env()
-        env.get_cib()
+        cib_old, cib_new = self.get_and_modify_cib(env)
         self.env_assist.assert_raise_library_error(
             env.push_cib,
             [
                 fixture.error(
-                    report_codes.CIB_PUSH_ERROR,
+                    report_codes.CIB_DIFF_ERROR,
                     reason="invalid cib",
-                    pushed_cib="",
+                    cib_old=cib_old,
+                    cib_new=cib_new,
                 )
             ],
             expected_in_processor=False,
         )
-        self.env_assist.assert_reports(self.push_reports())
-
-    def test_wait(self):
-        self.config_load_and_push_diff()
-        self.config.runner.pcmk.wait(timeout=self.wait_timeout)
-        env = self.env_assist.get_env()
-
-        env.get_cib()
-        env.push_cib(wait_timeout=self.wait_timeout)
-        self.env_assist.assert_reports(
-            self.push_reports()
-            + [
-                fixture.info(
-                    report_codes.WAIT_FOR_IDLE_STARTED,
-                    timeout=self.wait_timeout,
-                )
-            ]
-        )
+        self.env_assist.assert_reports(self.push_reports(cib_old, cib_new))
 
 
 class PushCustomCib(TestCase, ManageCibAssertionMixin):
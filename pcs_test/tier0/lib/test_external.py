@@ -1,4 +1,5 @@
 import logging
+import tracemalloc
 from subprocess import DEVNULL
 from unittest import (
     TestCase,
@@ -289,6 +290,103 @@ class CommandRunnerTest(TestCase):
             ],
         )
 
+    def _run_with_large_data(self, mock_popen, data_size=10**7):
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = ("o" * data_size, "")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        stdin = "i" * data_size
+        tracemalloc.start()
+        try:
+            runner.run(["a_command"], stdin_string=stdin)
+            dummy_current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    def test_debug_disabled(self, mock_popen):
+        self.mock_logger.isEnabledFor.return_value = False
+        self.mock_reporter = MockLibraryReportProcessor(debug=False)
+        peak = self._run_with_large_data(mock_popen)
+        self.mock_logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        self.mock_logger.debug.assert_not_called()
+        self.assertEqual(self.mock_reporter.report_item_list, [])
+        # no copies of the input and output are made
+        self.assertLess(peak, 10**6)
+
+    def test_debug_enabled_memory(self, mock_popen):
+        # counterpart of test_debug_disabled showing the debug messages cost
+        self.mock_logger.isEnabledFor.return_value = True
+        peak = self._run_with_large_data(mock_popen)
+        self.assertEqual(self.mock_logger.debug.call_count, 2)
+        self.assertGreater(peak, 10**7)
+
+    @mock.patch.object(settings, "external_process_debug_output_max_chars", 5)
+    def test_debug_output_limit(self, mock_popen):
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = ("stdout long", "err")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        self.assertEqual(
+            runner.run(["a_command"], stdin_string="stdin long"),
+            ("stdout long", "err", 0),
+        )
+        self.mock_logger.debug.assert_has_calls(
+            [
+                mock.call(
+                    outdent(
+                        """\
+                        Running: a_command
+                        Environment:
+                        --Debug Input Start--
+                        stdin
+                        ... (5 characters truncated)
+                        --Debug Input End--"""
+                    )
+                ),
+                mock.call(
+                    outdent(
+                        """\
+                        Finished running: a_command
+                        Return value: 0
+                        --Debug Stdout Start--
+                        stdou
+                        ... (6 characters truncated)
+                        --Debug Stdout End--
+                        --Debug Stderr Start--
+                        err
+                        --Debug Stderr End--"""
+                    )
+                ),
+            ]
+        )
+        assert_report_item_list_equal(
+            self.mock_reporter.report_item_list,
+            [
+                (
+                    severity.DEBUG,
+                    report_codes.RUN_EXTERNAL_PROCESS_STARTED,
+                    {
+                        "command": "a_command",
+                        "stdin": "stdin\n... (5 characters truncated)",
+                        "environment": {},
+                    },
+                ),
+                (
+                    severity.DEBUG,
+                    report_codes.RUN_EXTERNAL_PROCESS_FINISHED,
+                    {
+                        "command": "a_command",
+                        "return_value": 0,
+                        "stdout": "stdou\n... (6 characters truncated)",
+                        "stderr": "err",
+                    },
+                ),
+            ],
+        )
+
     def test_popen_error(self, mock_popen):
         expected_error = "expected error"
         command = ["a_command"]
@@ -0,0 +1,170 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from lxml import etree
+
+from pcs.lib.corosync.live import QuorumStatus
+from pcs.snmp.cluster_status import (
+    ClusterStatus,
+    ClusterStatusProvider,
+    build_cluster_status,
+)
+
+CLUSTER_STATE = """
+<pacemaker-result>
+  <nodes>
+    <node name="node1" id="1" online="true" standby="false"
+        standby_onfail="false" maintenance="false" pending="false"
+        unclean="false" shutdown="false" expected_up="true" is_dc="true"
+        resources_running="3" type="member"
+    />
+    <node name="node2" id="2" online="true" standby="true"
+        standby_onfail="false" maintenance="false" pending="false"
+        unclean="false" shutdown="false" expected_up="true" is_dc="false"
+        resources_running="1" type="member"
+    />
+    <node name="node3" id="3" online="false" standby="false"
+        standby_onfail="false" maintenance="false" pending="false"
+        unclean="true" shutdown="false" expected_up="false" is_dc="false"
+        resources_running="0" type="member"
+    />
+    <node name="remote1" id="remote1" online="true" standby="false"
+        standby_onfail="false" maintenance="false" pending="false"
+        unclean="false" shutdown="false" expected_up="false" is_dc="false"
+        resources_running="0" type="remote"
+    />
+  </nodes>
+  <resources>
+    <resource id="R1" resource_agent="ocf::pacemaker:Dummy" role="Started"
+        active="true" orphaned="false" failed="false"
+    />
+    <resource id="R2" resource_agent="ocf::pacemaker:Dummy" role="Stopped"
+        target_role="Stopped" active="false" orphaned="false" failed="false"
+    />
+    <resource id="R3" resource_agent="ocf::pacemaker:Dummy" role="Stopped"
+        active="false" orphaned="false" failed="true"
+    />
+    <resource id="S1" resource_agent="stonith:fence_xvm" role="Started"
+        target_role="Stopped" active="true" orphaned="false" failed="false"
+    />
+    <resource id="Old" resource_agent="ocf::pacemaker:Dummy" role="Started"
+        active="true" orphaned="true" failed="false"
+    />
+    <group id="G" number_resources="1">
+      <resource id="R4" resource_agent="ocf::pacemaker:Dummy" role="Started"
+          active="true" orphaned="false" failed="false"
+      />
+    </group>
+    <clone id="C-clone" multi_state="false" unique="false">
+      <resource id="C:0" resource_agent="ocf::pacemaker:Dummy" role="Stopped"
+          active="false" orphaned="false" failed="true"
+      />
+      <resource id="C:1" resource_agent="ocf::pacemaker:Dummy"
+          role="Started" active="true" orphaned="false" failed="false"
+      />
+    </clone>
+    <bundle id="B" type="podman" image="image">
+      <replica id="0">
+        <resource id="B-podman-0" resource_agent="ocf::heartbeat:podman"
+            role="Started" active="true" orphaned="false" failed="false"
+        />
+      </replica>
+    </bundle>
+  </resources>
+</pacemaker-result>
+"""
+
+QUORUM_STATUS = """\
+Quorum information
+------------------
+Quorate:          Yes
+
+Votequorum information
+----------------------
+Quorum:           2
+
+Membership information
+----------------------
+    Nodeid      Votes    Qdevice Name
+         2          1         NR node2 (local)
+         1          1         NR node1
+"""
+
+
+class BuildClusterStatus(TestCase):
+    def test_all_data(self):
+        self.assertEqual(
+            build_cluster_status(
+                "cluster",
+                ["node1", "node3", "node2"],
+                QuorumStatus.from_string(QUORUM_STATUS),
+                etree.fromstring(CLUSTER_STATE),
+            ),
+            ClusterStatus(
+                cluster_name="cluster",
+                quorate=True,
+                known_nodes=["node1", "node2", "node3"],
+                corosync_nodes_online=["node1", "node2"],
+                corosync_nodes_offline=["node3"],
+                pcmk_nodes_online=["node1"],
+                pcmk_nodes_standby=["node2"],
+                pcmk_nodes_offline=["node3"],
+                all_resources=["R1", "R2", "R3", "S1", "R4", "C"],
+                running_resources=["R1", "S1", "R4", "C"],
+                stopped_resources=["R2"],
+                failed_resources=["R3"],
+            ),
+        )
+
+    def test_cluster_not_running(self):
+        self.assertEqual(
+            build_cluster_status("cluster", ["node2", "node1"], None, None),
+            ClusterStatus(
+                cluster_name="cluster",
+                quorate=False,
+                known_nodes=["node1", "node2"],
+                corosync_nodes_online=[],
+                corosync_nodes_offline=["node1", "node2"],
+                pcmk_nodes_online=[],
+                pcmk_nodes_standby=[],
+                pcmk_nodes_offline=[],
+                all_resources=[],
+                running_resources=[],
+                stopped_resources=[],
+                failed_resources=[],
+            ),
+        )
+
+
+@mock.patch("pcs.snmp.cluster_status.get_cluster_status")
+class ClusterStatusProviderTest(TestCase):
+    def setUp(self):
+        self.runner_factory = mock.Mock()
+        self.clock = mock.Mock()
+        self.provider = ClusterStatusProvider(
+            self.runner_factory, 10, self.clock
+        )
+
+    def test_status_kept_for_ttl(self, mock_get_status):
+        mock_get_status.side_effect = ["status1", "status2"]
+        self.clock.side_effect = [100, 105, 109.9, 110, 115]
+        self.assertEqual(
+            [self.provider.get_status() for _ in range(5)],
+            ["status1", "status1", "status1", "status2", "status2"],
+        )
+        self.assertEqual(
+            mock_get_status.mock_calls,
+            [
+                mock.call(self.runner_factory.return_value),
+                mock.call(self.runner_factory.return_value),
+            ],
+        )
+
+    def test_status_not_kept_on_error(self, mock_get_status):
+        mock_get_status.side_effect = [ValueError(), "status"]
+        self.clock.side_effect = [100, 101]
+        with self.assertRaises(ValueError):
+            self.provider.get_status()
+        self.assertEqual(self.provider.get_status(), "status")
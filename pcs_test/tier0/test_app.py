@@ -0,0 +1,92 @@
+import json
+import subprocess
+import sys
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs import app
+from pcs.cli.common.routing import create_lazy_cmd
+
+from pcs_test import PROJECT_ROOT
+
+
+def get_imported_modules(code):
+    return set(
+        json.loads(
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    f"{code}\n"
+                    "import json, sys\n"
+                    "print(json.dumps(list(sys.modules)))",
+                ],
+                cwd=PROJECT_ROOT,
+                stdout=subprocess.PIPE,
+                check=True,
+            ).stdout
+        )
+    )
+
+
+class LazyImports(TestCase):
+    def assert_not_imported(self, module_list, prefix_list):
+        self.assertEqual(
+            sorted(
+                module
+                for module in module_list
+                if any(module.startswith(prefix) for prefix in prefix_list)
+            ),
+            [],
+        )
+
+    def test_app(self):
+        self.assert_not_imported(
+            get_imported_modules("import pcs.app"),
+            [
+                "pcs.utils",
+                "pcs.cli.routing",
+                "pcs.common.reports.messages",
+                "pcs.lib",
+            ],
+        )
+
+    def test_lib_wrapper(self):
+        self.assert_not_imported(
+            get_imported_modules("import pcs.cli.common.lib_wrapper"),
+            ["pcs.lib.commands"],
+        )
+
+
+class IsVersionQuery(TestCase):
+    # pylint: disable=protected-access
+    def test_version(self):
+        self.assertTrue(app._is_version_query(["--version"]))
+        self.assertTrue(app._is_version_query(["--version", "--full"]))
+        self.assertTrue(app._is_version_query(["--full", "--version"]))
+
+    def test_not_version(self):
+        for argv in (
+            [],
+            ["--full"],
+            ["--version", "--version"],
+            ["--version", "-f", "cib.xml"],
+            ["resource", "--version"],
+        ):
+            with self.subTest(argv=argv):
+                self.assertFalse(app._is_version_query(argv))
+
+
+class CreateLazyCmd(TestCase):
+    @mock.patch("pcs.cli.routing.tag.tag_cmd")
+    def test_run_cmd(self, mock_cmd):
+        mock_cmd.return_value = "result"
+        self.assertEqual(
+            create_lazy_cmd("pcs.cli.routing.tag", "tag_cmd")(
+                "lib", ["argv"], "modifiers"
+            ),
+            "result",
+        )
+        mock_cmd.assert_called_once_with("lib", ["argv"], "modifiers")
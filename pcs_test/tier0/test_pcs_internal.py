@@ -0,0 +1,122 @@
+import json
+import os
+import socket
+import threading
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs import pcs_internal
+from pcs.common import communication
+
+from pcs_test.tools.misc import get_tmp_dir
+
+
+def request(cmd, cmd_data=None):
+    return {
+        "cmd": cmd,
+        "cmd_data": cmd_data or {},
+        "options": {"request_timeout": None},
+    }
+
+
+class RunCommand(TestCase):
+    def test_unknown_command(self):
+        result = pcs_internal.run_command(request("bad.cmd"), None, None)
+        self.assertEqual(
+            result["status"], communication.const.COM_STATUS_UNKNOWN_CMD
+        )
+        self.assertEqual(result["status_msg"], "Unknown command 'bad.cmd'")
+
+    def test_invalid_request(self):
+        result = pcs_internal.run_command(request(1), None, None)
+        self.assertEqual(
+            result["status"], communication.const.COM_STATUS_INPUT_ERROR
+        )
+        self.assertTrue(result["status_msg"].startswith("wrong value type"))
+
+    def test_invalid_cmd_data(self):
+        result = pcs_internal.run_command(
+            request("resource_agent.get_agent_metadata"), None, None
+        )
+        self.assertEqual(
+            result["status"], communication.const.COM_STATUS_INPUT_ERROR
+        )
+        self.assertEqual(result["status_msg"], "'agent_name'")
+
+    @mock.patch("pcs.pcs_internal.Library")
+    def test_user_passed_to_env(self, mock_library):
+        mock_library.return_value.status.full_cluster_status_plaintext = (
+            mock.Mock(return_value="status")
+        )
+        result = pcs_internal.run_command(
+            request("status.full_cluster_status_plaintext"),
+            "user",
+            ["group"],
+        )
+        self.assertEqual(
+            result["status"], communication.const.COM_STATUS_SUCCESS
+        )
+        self.assertEqual(result["data"], "status")
+        env = mock_library.call_args[0][0]
+        self.assertEqual(env.user, "user")
+        self.assertEqual(env.groups, ["group"])
+
+
+class WorkerRequestHandler(TestCase):
+    def setUp(self):
+        # pylint: disable=protected-access
+        self.tmp_dir = get_tmp_dir("tier0_pcs_internal_worker")
+        self.socket_path = os.path.join(self.tmp_dir.name, "socket")
+        self.server = pcs_internal._WorkerServer(
+            self.socket_path, pcs_internal._WorkerRequestHandler
+        )
+        self.thread = threading.Thread(
+            target=self.server.handle_request, daemon=True
+        )
+        self.thread.start()
+
+    def tearDown(self):
+        self.thread.join()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def send(self, message):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            sock.sendall(message)
+            sock.shutdown(socket.SHUT_WR)
+            response = b""
+            while True:
+                data = sock.recv(4096)
+                if not data:
+                    break
+                response += data
+        return json.loads(response)
+
+    def test_run_command(self):
+        result = self.send(
+            json.dumps(
+                {"user": "user", "groups": [], "request": request("bad.cmd")}
+            ).encode("utf-8")
+        )
+        self.assertEqual(
+            result["status"], communication.const.COM_STATUS_UNKNOWN_CMD
+        )
+
+    def test_invalid_json(self):
+        result = self.send(b"{")
+        self.assertEqual(
+            result["status"], communication.const.COM_STATUS_INPUT_ERROR
+        )
+        self.assertTrue(
+            result["status_msg"].startswith("Unable to parse input data")
+        )
+
+    def test_missing_request(self):
+        result = self.send(json.dumps({"user": "user"}).encode("utf-8"))
+        self.assertEqual(
+            result["status"], communication.const.COM_STATUS_INPUT_ERROR
+        )
+        self.assertEqual(result["status_msg"], "Invalid request format")
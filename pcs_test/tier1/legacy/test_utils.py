@@ -3,7 +3,6 @@ import sys
 import xml.dom.minidom
 import xml.etree.ElementTree as ET
 from io import StringIO
-from time import sleep
 from unittest import (
     TestCase,
     mock,
@@ -1853,42 +1852,198 @@ class UtilsTest(TestCase):
             self.assertEqual(node.tagName, tag)
 
 
-class RunParallelTest(TestCase):
-    @staticmethod
-    def fixture_create_worker(log, name, sleepSeconds=0):
-        def worker():
-            sleep(sleepSeconds)
-            log.append(name)
+class ParallelForNodesTest(TestCase):
+    @mock.patch("pcs.utils.print_to_stderr")
+    def test_report_nodes_and_errors(self, mock_print):
+        def action(node_list, arg, kwarg=None):
+            self.assertEqual(["node1", "node2"], node_list)
+            return {
+                "node2": (1, f"{arg}:{kwarg}:error\n"),
+                "node1": (0, f"{arg}:{kwarg}:ok\n"),
+            }
 
-        return worker
+        node_errors = utils.parallel_for_nodes(
+            action, ["node1", "node2"], "arg", kwarg="kwarg"
+        )
 
-    def test_run_all_workers(self):
-        log = []
-        utils.run_parallel(
+        self.assertEqual({"node2": "node2: arg:kwarg:error"}, node_errors)
+        mock_print.assert_has_calls(
             [
-                self.fixture_create_worker(log, "first"),
-                self.fixture_create_worker(log, "second"),
-            ],
-            wait_seconds=0.1,
+                mock.call("node1: arg:kwarg:ok"),
+                mock.call("node2: arg:kwarg:error"),
+            ]
         )
 
-        self.assertEqual(sorted(log), sorted(["first", "second"]))
 
+class FakeCommunicator:
+    def __init__(self, response_map):
+        self.response_map = response_map
+        self.request_list = []
+        self._pending_list = []
 
-class NodeActionTaskTest(TestCase):
-    def test_can_run_action(self):
-        def action(node, arg, kwarg=None):
-            return (0, ":".join([node, arg, kwarg]))
+    def add_requests(self, request_list):
+        self.request_list.extend(request_list)
+        self._pending_list.extend(request_list)
 
-        report_list = []
+    def start_loop(self):
+        while self._pending_list:
+            request = self._pending_list.pop(0)
+            response = self.response_map[request.host_label].pop(0)
+            yield mock.Mock(request=request, **response)
+
+
+class NodeCommunicatorTestBase(TestCase):
+    def setUp(self):
+        self.communicator_list = []
+        self.response_map = {}
+        patcher_known_hosts = mock.patch(
+            "pcs.utils.read_known_hosts_file", lambda: {}
+        )
+        self.addCleanup(patcher_known_hosts.stop)
+        patcher_known_hosts.start()
+        patcher = mock.patch("pcs.utils._get_node_communicator_factory")
+        self.addCleanup(patcher.stop)
+        factory = patcher.start().return_value
+        factory.get_communicator.side_effect = self._get_communicator
+        patcher_options = mock.patch.dict(utils.pcs_options, {}, clear=True)
+        self.addCleanup(patcher_options.stop)
+        patcher_options.start()
 
-        def report(node, returncode, output):
-            report_list.append("|".join([node, str(returncode), output]))
+    def _get_communicator(self, request_timeout=None):
+        del request_timeout
+        communicator = FakeCommunicator(self.response_map)
+        self.communicator_list.append(communicator)
+        return communicator
 
-        task = utils.create_task(report, action, "node", "arg", kwarg="kwarg")
-        task()
+    @staticmethod
+    def fixture_response(code=200, data=""):
+        return dict(was_connected=True, response_code=code, data=data)
+
+    @staticmethod
+    def fixture_failure(error_msg):
+        return dict(was_connected=False, error_msg=error_msg)
+
+
+class SendHttpRequestToNodesTest(NodeCommunicatorTestBase):
+    def test_map_responses(self):
+        self.response_map = {
+            "node1": [self.fixture_response(data="data")],
+            "node2": [self.fixture_response(code=401)],
+            "node3": [self.fixture_response(code=403)],
+            "node4": [self.fixture_response(code=500)],
+            "node5": [self.fixture_failure("Connection refused")],
+        }
+        node_list = list(self.response_map)
+
+        result = utils.send_http_request_to_nodes(
+            node_list, "remote/action", "a=b"
+        )
+
+        self.assertEqual(1, len(self.communicator_list))
+        request_list = self.communicator_list[0].request_list
+        self.assertEqual(
+            node_list, [request.host_label for request in request_list]
+        )
+        for request in request_list:
+            self.assertEqual("remote/action", request.action)
+            self.assertEqual("a=b", request.data)
+        self.assertEqual(
+            {
+                "node1": (0, "data"),
+                "node2": (
+                    3,
+                    "Unable to authenticate to node2 - (HTTP error: 401), "
+                    "try running 'pcs host auth node2'",
+                ),
+                "node3": (4, "node3: Permission denied - (HTTP error: 403)"),
+                "node4": (1, "Error connecting to node4 - (HTTP error: 500)"),
+                "node5": (
+                    2,
+                    "Unable to connect to node5, check if pcsd is running "
+                    "there or try setting higher timeout with "
+                    "--request-timeout option (Connection refused)",
+                ),
+            },
+            result,
+        )
+
+    def test_repeat_timed_out_requests(self):
+        self.response_map = {
+            "node1": [self.fixture_response(data="ok")],
+            "node2": [
+                self.fixture_failure("Operation timed out"),
+                self.fixture_failure("Operation timed out"),
+            ],
+        }
 
-        self.assertEqual(["node|0|node:arg:kwarg"], report_list)
+        result = utils.send_http_request_to_nodes(
+            ["node1", "node2"], "remote/action", repeat_if_timeout=1
+        )
+
+        self.assertEqual(2, len(self.communicator_list))
+        self.assertEqual(
+            ["node2"],
+            [
+                request.host_label
+                for request in self.communicator_list[1].request_list
+            ],
+        )
+        self.assertEqual((0, "ok"), result["node1"])
+        self.assertEqual(2, result["node2"][0])
+
+
+@mock.patch("pcs.utils.time.sleep")
+class PollHttpRequestToNodesTest(NodeCommunicatorTestBase):
+    def test_ask_each_node_again_once_it_responds(self, mock_sleep):
+        self.response_map = {
+            "node1": [
+                self.fixture_response(data="pending"),
+                self.fixture_response(data="pending"),
+                self.fixture_response(data="started"),
+            ],
+            "node2": [self.fixture_response(data="started")],
+            "node3": [self.fixture_response(code=403)],
+        }
+        result_list = []
+        data_counter = iter(range(5))
+
+        def process_result(node, result):
+            result_list.append((node, result))
+            return result[1] != "pending"
+
+        utils.poll_http_request_to_nodes(
+            ["node1", "node2", "node3"],
+            "remote/action",
+            lambda: str(next(data_counter)),
+            process_result,
+            interval=2,
+        )
+
+        self.assertEqual(1, len(self.communicator_list))
+        self.assertEqual(
+            [
+                ("node1", "0"),
+                ("node2", "1"),
+                ("node3", "2"),
+                ("node1", "3"),
+                ("node1", "4"),
+            ],
+            [
+                (request.host_label, request.data)
+                for request in self.communicator_list[0].request_list
+            ],
+        )
+        self.assertEqual(
+            [
+                ("node1", (0, "pending")),
+                ("node2", (0, "started")),
+                ("node3", (4, "node3: Permission denied - (HTTP error: 403)")),
+                ("node1", (0, "pending")),
+                ("node1", (0, "started")),
+            ],
+            result_list,
+        )
+        self.assertEqual(2, mock_sleep.call_count)
 
 
 class TouchCibFile(TestCase):
@@ -10,6 +10,9 @@ from pcs_test.tools.command_env.config_http_sbd import SbdShortcuts
 from pcs_test.tools.command_env.config_http_scsi import ScsiShortcuts
 from pcs_test.tools.command_env.config_http_status import StatusShortcuts
 from pcs_test.tools.command_env.mock_node_communicator import (
+    AddRequestCall,
+    StartLoopCall,
+    create_communication,
     place_communication,
     place_multinode_call,
     place_requests,
@@ -207,3 +210,105 @@ class HttpConfig:
 
     def place_multinode_call(self, *args, **kwargs):
         place_multinode_call(self.__calls, *args, **kwargs)
+
+    def transaction(self, name, call_name_list, before=None):
+        """
+        Replace already configured calls by a call running them in transactions
+
+        The requests of the calls are sent to each node in one request in the
+        order of the calls. A node does not run requests following a failed
+        one, so results of requests following a response with a code other
+        than 200 are left out.
+
+        string name -- the key of the new call
+        list call_name_list -- keys of the calls to replace
+        string before -- key of a call before which the new call is placed,
+            the new call is placed instead of the first replaced call if not
+            specified
+        """
+        action_dict = {}
+        for call_name in call_name_list:
+            request_list = self.__calls.get(
+                f"{call_name}_requests"
+            ).request_list
+            response_list = self.__calls.get(
+                f"{call_name}_responses"
+            ).response_list
+            response_dict = {
+                response.request.target.label: response
+                for response in response_list
+            }
+            for request in request_list:
+                response = response_dict[request.target.label]
+                if not response.was_connected:
+                    raise AssertionError(
+                        "Unconnected responses cannot be run in a transaction"
+                    )
+                action_dict.setdefault(request.target.label, []).append(
+                    (request, response)
+                )
+
+        communication_list = []
+        for label, action_list in action_dict.items():
+            communication_list.append(
+                dict(
+                    label=label,
+                    dest_list=action_list[0][0].target.dest_list,
+                    param_list=[
+                        (
+                            "data_json",
+                            json.dumps(
+                                dict(
+                                    actions=[
+                                        dict(
+                                            action=request.action[
+                                                len("remote/") :
+                                            ],
+                                            data=request.data,
+                                        )
+                                        for request, _ in action_list
+                                    ]
+                                )
+                            ),
+                        )
+                    ],
+                    output=json.dumps(
+                        dict(results=_transaction_results(action_list))
+                    ),
+                )
+            )
+        request_list, response_list = create_communication(
+            communication_list, action="remote/run_transaction"
+        )
+        if before is None:
+            first_name = call_name_list[0]
+            requests_place = dict(instead=f"{first_name}_requests")
+            responses_place = dict(instead=f"{first_name}_responses")
+            removed_call_name_list = call_name_list[1:]
+        else:
+            requests_place = responses_place = dict(before=before)
+            removed_call_name_list = call_name_list
+        for call_name in removed_call_name_list:
+            self.__calls.remove(f"{call_name}_requests")
+            self.__calls.remove(f"{call_name}_responses")
+        self.__calls.place(
+            f"{name}_requests", AddRequestCall(request_list), **requests_place
+        )
+        self.__calls.place(
+            f"{name}_responses", StartLoopCall(response_list), **responses_place
+        )
+
+
+def _transaction_results(action_list):
+    result_list = []
+    for request, response in action_list:
+        result_list.append(
+            dict(
+                action=request.action[len("remote/") :],
+                code=response.response_code,
+                output=response.data,
+            )
+        )
+        if response.response_code != 200:
+            break
+    return result_list
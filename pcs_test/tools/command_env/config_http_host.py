@@ -232,6 +232,7 @@ class HostShortcuts:
         pacemaker_started_node_list=(),
         pacemaker_not_started_node_list=(),
         communication_list=None,
+        param_list=None,
         name="http.host.check_pacemaker_started",
     ):
         """
@@ -242,6 +243,7 @@ class HostShortcuts:
         pacemaker_not_started_node_list list -- listof node names on which
             pacemaker is not fully started yet
         communication_list list -- create custom responses
+        param_list list -- parameters of the requests
         name string -- the key of this call
         """
         if bool(
@@ -282,6 +284,7 @@ class HostShortcuts:
             name,
             communication_list,
             action="remote/pacemaker_node_status",
+            param_list=param_list,
         )
 
     def get_quorum_status(
@@ -1,4 +1,5 @@
 from pcs.common.services import errors
+from pcs.common.services.types import ServiceState
 
 from pcs_test.tools.command_env.mock_service_manager import Call
 
@@ -143,6 +144,7 @@ class ServiceManagerConfig:
         service,
         instance=None,
         return_value=True,
+        exception=None,
         name="services.is_enabled",
         before=None,
         instead=None,
@@ -154,6 +156,7 @@ class ServiceManagerConfig:
                 service=service,
                 instance=instance,
                 return_value=return_value,
+                exception=exception,
             ),
             before=before,
             instead=instead,
@@ -180,6 +183,33 @@ class ServiceManagerConfig:
             instead=instead,
         )
 
+    def get_states(
+        self,
+        states,
+        exception=None,
+        name="services.get_states",
+        before=None,
+        instead=None,
+    ):
+        """
+        dict states -- service name: (enabled, running), in the expected order
+        exception -- an exception raised instead of returning the states
+        """
+        self.__calls.place(
+            name,
+            Call(
+                "get_states",
+                service=list(states),
+                return_value={
+                    service: ServiceState(enabled=enabled, running=running)
+                    for service, (enabled, running) in states.items()
+                },
+                exception=exception,
+            ),
+            before=before,
+            instead=instead,
+        )
+
     def get_available_services(
         self,
         services,
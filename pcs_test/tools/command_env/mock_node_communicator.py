@@ -1,5 +1,8 @@
 import json
-from urllib.parse import parse_qs
+from urllib.parse import (
+    parse_qs,
+    parse_qsl,
+)
 
 from pcs import settings
 from pcs.common import pcs_pycurl as pycurl
@@ -339,9 +342,32 @@ def _compare_request_data(expected, real):
     try:
         expected_data = json.loads(expected[0][1])
         real_data = json.loads(real[0][1])
-        return expected_data == real_data
     except ValueError:
         return False
+    if expected_data == real_data:
+        return True
+    return _compare_transaction_data(expected_data, real_data)
+
+
+def _compare_transaction_data(expected, real):
+    # Actions of remote/run_transaction carry their own urlencoded data which
+    # may contain json as well.
+    try:
+        expected_actions = expected["actions"]
+        real_actions = real["actions"]
+    except (KeyError, TypeError):
+        return False
+    if len(expected_actions) != len(real_actions):
+        return False
+    for expected_action, real_action in zip(expected_actions, real_actions):
+        if expected_action.get("action") != real_action.get("action"):
+            return False
+        if not _compare_request_data(
+            parse_qsl(expected_action.get("data", "")),
+            parse_qsl(real_action.get("data", "")),
+        ):
+            return False
+    return True
 
 
 class NodeCommunicator:
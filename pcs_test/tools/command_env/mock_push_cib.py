@@ -65,6 +65,9 @@ def get_push_cib(call_queue):
 
         if expected_call.exception:
             raise expected_call.exception
+        # the real push_cib makes the environment load the cluster status again
+        # pylint: disable=protected-access
+        lib_env._drop_cluster_state()
 
     return push_cib
 
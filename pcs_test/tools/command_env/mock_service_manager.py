@@ -68,6 +68,9 @@ class ServiceManagerMock(ServiceManagerInterface):
     def is_running(self, service, instance=None):
         return self._assert_call("is_running", service, instance)
 
+    def get_states(self, services):
+        return self._assert_call("get_states", list(services))
+
     def is_installed(self, service):
         return self._assert_call("is_installed", service)
 
@@ -153,6 +153,10 @@ class MockLibraryReportProcessor(ReportProcessor):
         self.debug = debug
         self.items = []
 
+    @property
+    def is_debug_enabled(self):
+        return self.debug
+
     def _do_report(self, report_item):
         if self.debug or report_item.severity != ReportItemSeverity.DEBUG:
             self.items.append(report_item)
@@ -278,6 +282,14 @@ class MockCurlMulti:
             # same error as real CurlMulti object
             raise pycurl.error("curl object already on this multi-stack")
         self._handle_list.append(handle)
+        self._set_timer()
+
+    def _set_timer(self):
+        # same as real CurlMulti object, ask to be woken up while there are
+        # handles to process
+        timer_callback = self._opts.get(pycurl.M_TIMERFUNCTION)
+        if timer_callback:
+            timer_callback(0 if self._handle_list else -1)
 
     def remove_handle(self, handle):
         if handle not in self._handle_list:
@@ -299,6 +311,11 @@ class MockCurlMulti:
         # pylint: disable=no-self-use
         return (0, 0)
 
+    def socket_action(self, sock_fd, event_mask):
+        # pylint: disable=unused-argument
+        self._set_timer()
+        return (0, len(self._handle_list))
+
     def timeout(self):
         # pylint: disable=no-self-use
         return 0
@@ -13,6 +13,7 @@ require 'backports/latest'
 require 'base64'
 require 'ethon'
 require 'openssl'
+require 'socket'
 
 require 'config.rb'
 require 'cfgsync.rb'
@@ -1758,6 +1759,32 @@ def pcs_internal_proxy_old(auth_user, data, cmd)
   return JSON.generate(output)
 end
 
+def run_pcs_internal_worker(auth_user, input_data)
+  # Run a command in the resident pcs_internal worker started by pcsd. Return
+  # nil if the worker is not available.
+  return nil if not File.socket?(PCS_INTERNAL_SOCKET)
+  message = JSON.generate({
+    :user => auth_user[:username],
+    :groups => auth_user[:usergroups] || [],
+    :request => input_data,
+  })
+  $logger.info("Running in pcs_internal worker: #{input_data[:cmd]}")
+  start = Time.now
+  begin
+    output = UNIXSocket.open(PCS_INTERNAL_SOCKET) { |sock|
+      sock.write(message)
+      sock.close_write()
+      sock.read()
+    }
+  rescue SystemCallError, IOError => e
+    $logger.warn("Unable to use pcs_internal worker: #{e}")
+    return nil
+  end
+  $logger.debug(output)
+  $logger.debug("Duration: " + (Time.now - start).to_s + "s")
+  return output
+end
+
 def run_pcs_internal(auth_user, cmd, data, request_timeout=nil)
   input_data = {
     :cmd => cmd,
@@ -1766,18 +1793,22 @@ def run_pcs_internal(auth_user, cmd, data, request_timeout=nil)
       :request_timeout => request_timeout,
     },
   }
-  stdout, stderr, return_val = run_cmd_options(
-    auth_user,
-    {'stdin' => JSON.generate(input_data)},
-    PCS_INTERNAL
-  )
-  if return_val != 0
-    return get_pcs_internal_output_format(
-      'exception', "Command failed: #{stderr.join("\n")}"
+  output = run_pcs_internal_worker(auth_user, input_data)
+  if output.nil?
+    stdout, stderr, return_val = run_cmd_options(
+      auth_user,
+      {'stdin' => JSON.generate(input_data)},
+      PCS_INTERNAL
     )
+    if return_val != 0
+      return get_pcs_internal_output_format(
+        'exception', "Command failed: #{stderr.join("\n")}"
+      )
+    end
+    output = stdout.join("\n")
   end
   begin
-    parsed_output = JSON.parse(stdout.join("\n"), {:symbolize_names => true})
+    parsed_output = JSON.parse(output, {:symbolize_names => true})
     if (
       parsed_output.include?(:report_list) \
       and \
@@ -77,6 +77,7 @@ def remote(params, request, auth_user)
       :put_file => method(:put_file),
       :remove_file => method(:remove_file),
       :manage_services => method(:manage_services),
+      :run_transaction => method(:run_transaction),
       :check_host => method(:check_host),
       :reload_corosync_conf => method(:reload_corosync_conf),
       :remove_nodes_from_cib => method(:remove_nodes_from_cib),
@@ -2317,6 +2318,112 @@ def manage_services(params, request, auth_user)
   end
 end
 
+# Remote actions which can be run in a transaction. They only change the local
+# node and do not need pacemaker to be running.
+def transaction_actions()
+  return {
+    'cluster_destroy' => method(:cluster_destroy),
+    'cluster_enable' => method(:cluster_enable),
+    'known_hosts_change' => method(:known_hosts_change),
+    'manage_services' => method(:manage_services),
+    'put_file' => method(:put_file),
+    'remove_file' => method(:remove_file),
+    'sbd_disable' => method(:sbd_disable),
+    'sbd_enable' => method(:sbd_enable),
+    'set_certs' => method(:set_certs),
+    'set_sbd_config' => method(:set_sbd_config),
+  }
+end
+
+# Results of items of put_file, remove_file and manage_services meaning the
+# item has been processed successfully
+TRANSACTION_ITEM_SUCCESS_CODES = [
+  'written', 'rewritten', 'same_content', 'deleted', 'not_found', 'success'
+]
+
+def transaction_action_failed?(code, output)
+  return true unless code == 200
+  begin
+    data = JSON.parse(output)
+  rescue JSON::ParserError, TypeError
+    return false
+  end
+  return false unless data.is_a?(Hash)
+  ['files', 'actions'].each { |key|
+    next unless data[key].is_a?(Hash)
+    data[key].each { |_id, result|
+      if (
+        result.is_a?(Hash) and
+        not TRANSACTION_ITEM_SUCCESS_CODES.include?(result['code'])
+      )
+        return true
+      end
+    }
+  }
+  return false
+end
+
+# Runs an ordered list of remote actions in one request. Each action is
+# specified by the name of its remote url and by url encoded parameters of the
+# url. The actions are run one by one and the transaction stops at the first
+# failed action. Results of the run actions are returned in the same order.
+def run_transaction(params, request, auth_user)
+  begin
+    check_permissions(auth_user, Permissions::WRITE)
+
+    data = check_request_data_for_json(params, auth_user)
+    PcsdExchangeFormat::validate_item_map_is_Hash('transaction', data)
+    action_list = data[:actions]
+    unless action_list.is_a?(Array)
+      raise PcsdExchangeFormat::Error.new(
+        "actions should be 'Array'. But it is '#{action_list.class}'"
+      )
+    end
+    handlers = transaction_actions()
+    # validate all actions before running any of them
+    action_list.each_with_index { |action, index|
+      PcsdExchangeFormat::validate_item_is_Hash('action', index, action)
+      unless handlers.key?(action[:action])
+        raise PcsdExchangeFormat::Error.for_item(
+          'action',
+          index,
+          "unsupported 'action' ('#{action[:action]}')" +
+          " supported are #{handlers.keys}"
+        )
+      end
+      unless action.fetch(:data, '').is_a?(String)
+        raise PcsdExchangeFormat::Error.for_item(
+          'action', index, "'data' should be 'String'"
+        )
+      end
+    }
+
+    results = []
+    action_list.each { |action|
+      action_params = {}
+      URI.decode_www_form(action.fetch(:data, '')).each { |name, value|
+        action_params[name] = value
+        action_params[name.to_sym] = value
+      }
+      response = handlers[action[:action]].call(
+        action_params, request, auth_user
+      )
+      code, output = response.is_a?(Array) ? response : [200, response]
+      results << {
+        :action => action[:action],
+        :code => code,
+        :output => output.to_s,
+      }
+      break if transaction_action_failed?(code, output.to_s)
+    }
+    return [200, JSON.generate({:results => results})]
+  rescue PcsdRequestException => e
+    return e.code, e.message
+  rescue PcsdExchangeFormat::Error => e
+    return 400, "Invalid input data format: #{e.message}"
+  end
+end
+
 def pcsd_success(msg)
   $logger.info(msg)
   return [200, msg]
@@ -2367,6 +2474,7 @@ def check_host(params, request, auth_user)
     # TODO: add version getters for all services
   }
   output = {
+    :pcsd_capabilities => CAPABILITIES_PCSD,
     :services => {},
     :cluster_configuration_exists => (
       File.exist?(Cfgsync::CorosyncConf.file_path) or File.exist?(CIB_PATH)